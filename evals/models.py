@@ -121,6 +121,12 @@ class EvalReport:
     passed: int
     case_results: list[CaseResult] = field(default_factory=list)
     category_pass_rate: dict[str, str] = field(default_factory=dict)
+    concurrency: int = 1
+    wall_seconds: float = 0.0  # 전체 실행 시간 (동시 실행 시 케이스 합계보다 짧음)
+    # 케이스 레이턴시 n/avg/p50/p95/max
+    latency: dict[str, float] = field(default_factory=dict)
+    # 노드별 레이턴시 요약
+    node_latency: dict[str, dict[str, float]] = field(default_factory=dict)
 
     @property
     def pass_rate(self) -> float:
@@ -133,6 +139,10 @@ class EvalReport:
             "passed": self.passed,
             "pass_rate": round(self.pass_rate, 4),
             "category_pass_rate": self.category_pass_rate,
+            "concurrency": self.concurrency,
+            "wall_seconds": self.wall_seconds,
+            "latency": self.latency,
+            "node_latency": self.node_latency,
             "cases": [c.to_dict() for c in self.case_results],
         }
 
@@ -12,6 +12,7 @@ Eval Harness 러너
     uv run python -m evals.runner --category org_analysis
     uv run python -m evals.runner --verify-refs   # reference만 실행 (LLM 0회)
     uv run python -m evals.runner --baseline evals/baselines/baseline.json
+    uv run python -m evals.runner --concurrency 4   # 케이스 4건 동시 실행
 
 주의: CI pytest에 넣지 않는다 — 라이브 의존 + LLM 비용 + 비결정성.
 """
@@ -37,6 +38,7 @@ from evals.models import (
     GoldenCase,
     load_golden_set,
 )
+from evals.timing import aggregate_node_timings, latency_regressions, summarize_latency
 from src.application.llm import LLMTaskService
 from src.config import get_settings
 from src.graph.pipeline import GraphRAGPipeline
@@ -66,24 +68,32 @@ async def run_case(
     use_judge: bool,
     gateway: AzureOpenAIGateway,
 ) -> CaseResult:
-    """케이스 1건: reference oracle 실행 → 파이프라인 실행 → 채점"""
-    start = time.time()
+    """케이스 1건: reference oracle + 파이프라인 동시 실행 → 채점"""
+    start = time.perf_counter()
 
-    # 1) reference oracle (LLM 미경유 — Neo4j 직접 실행)
-    ref_rows: list[dict[str, Any]] | None = None
-    if case.reference is not None:
+    # 1) reference oracle (LLM 미경유 — Neo4j 직접 실행), 파이프라인과 독립이므로 동시 실행
+    async def run_reference() -> list[dict[str, Any]] | None:
+        if case.reference is None:
+            return None
         try:
-            ref_rows = await neo4j_repo.execute_cypher(case.reference.cypher, {})
+            return await neo4j_repo.execute_cypher(case.reference.cypher, {})
         except Exception as e:
             logger.error(f"[{case.id}] reference 실행 실패: {e}")
-            ref_rows = None  # 채점에서 생략되고 tier0/tier1만 적용됨
+            return None  # 채점에서 생략되고 tier0/tier1만 적용됨
+
+    ref_task = asyncio.create_task(run_reference())
 
     # 2) 파이프라인 실행 (캐시는 Settings 오버라이드로 비활성 — main() 참고)
-    result = await pipeline.run(
-        case.question,
-        session_id=f"eval-{run_ts}-{case.id}",
-        return_full_state=True,
-    )
+    try:
+        result = await pipeline.run(
+            case.question,
+            session_id=f"eval-{run_ts}-{case.id}",
+            return_full_state=True,
+        )
+    except BaseException:
+        ref_task.cancel()
+        raise
+    ref_rows = await ref_task
     metadata: dict[str, Any] = dict(result.get("metadata", {}))
     response: str = result.get("response", "") or ""
     full_state = metadata.pop("_full_state", {}) or {}
@@ -127,7 +137,40 @@ async def run_case(
             "node_timings": metadata.get("node_timings", {}),
             "error": metadata.get("error"),
         },
-        elapsed_seconds=round(time.time() - start, 2),
+        elapsed_seconds=round(time.perf_counter() - start, 2),
+    )
+
+
+async def run_cases(
+    cases: list[GoldenCase],
+    *,
+    concurrency: int,
+    **case_kwargs: Any,
+) -> list[CaseResult]:
+    """
+    케이스를 최대 concurrency건씩 동시 실행 (결과는 입력 순서 유지)
+
+    케이스 단위 예외는 실패 CaseResult로 변환해 다른 케이스에 영향을 주지 않는다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    total = len(cases)
+
+    async def run_one(index: int, case: GoldenCase) -> CaseResult:
+        async with semaphore:
+            print(f"[{index}/{total}] {case.id} ...", flush=True)
+            try:
+                return await run_case(case=case, **case_kwargs)
+            except Exception as e:
+                logger.error(f"[{case.id}] 실행 자체가 실패: {e}")
+                return CaseResult(
+                    case_id=case.id,
+                    category=case.category,
+                    passed=False,
+                    metadata={"error": f"runner exception: {e}"},
+                )
+
+    return list(
+        await asyncio.gather(*(run_one(i, case) for i, case in enumerate(cases, 1)))
     )
 
 
@@ -159,7 +202,13 @@ async def verify_refs(
 # ============================================
 
 
-def build_report(results: list[CaseResult], timestamp: str) -> EvalReport:
+def build_report(
+    results: list[CaseResult],
+    timestamp: str,
+    *,
+    concurrency: int = 1,
+    wall_seconds: float = 0.0,
+) -> EvalReport:
     by_category: dict[str, list[CaseResult]] = {}
     for r in results:
         by_category.setdefault(r.category, []).append(r)
@@ -173,6 +222,14 @@ def build_report(results: list[CaseResult], timestamp: str) -> EvalReport:
         passed=sum(1 for r in results if r.passed),
         case_results=results,
         category_pass_rate=category_rate,
+        concurrency=concurrency,
+        wall_seconds=round(wall_seconds, 2),
+        latency=summarize_latency(
+            [r.elapsed_seconds for r in results if r.elapsed_seconds]
+        ),
+        node_latency=aggregate_node_timings(
+            r.metadata.get("node_timings") for r in results
+        ),
     )
 
 
@@ -202,21 +259,24 @@ def print_report(report: EvalReport) -> None:
         faithful = sum(1 for r in judged if r.judge_result and r.judge_result.faithful)
         print(f"  judge faithful: {faithful}/{len(judged)}")
 
+    # 케이스 레이턴시 요약
+    if report.latency.get("n"):
+        lat = report.latency
+        print(
+            f"\n케이스 레이턴시: p50 {lat['p50']:.2f}s / p95 {lat['p95']:.2f}s / "
+            f"max {lat['max']:.2f}s  (wall {report.wall_seconds:.1f}s, "
+            f"concurrency={report.concurrency})"
+        )
+
     # 노드별 레이턴시 브레이크다운 (계측 데이터가 있는 케이스 기준)
-    node_samples: dict[str, list[float]] = {}
-    for r in report.case_results:
-        for node, sec in (r.metadata.get("node_timings") or {}).items():
-            node_samples.setdefault(node, []).append(sec)
-    if node_samples:
-        print("\n노드별 레이턴시 (avg / max, n=케이스 수):")
+    if report.node_latency:
+        print("\n노드별 레이턴시 (avg / p50 / p95 / max, n=케이스 수):")
         total_avg = 0.0
-        for node, samples in sorted(
-            node_samples.items(), key=lambda kv: -sum(kv[1]) / len(kv[1])
-        ):
-            avg = sum(samples) / len(samples)
-            total_avg += avg
+        for node, s in report.node_latency.items():
+            total_avg += s["avg"]
             print(
-                f"  {node:<28} {avg:6.2f}s / {max(samples):6.2f}s  (n={len(samples)})"
+                f"  {node:<28} {s['avg']:6.2f}s / {s['p50']:6.2f}s / "
+                f"{s['p95']:6.2f}s / {s['max']:6.2f}s  (n={s['n']})"
             )
         print(f"  {'합계(노드 평균의 합)':<27} {total_avg:6.2f}s")
     print(SEP)
@@ -230,10 +290,13 @@ def save_report(report: EvalReport) -> Path:
     return path
 
 
-def diff_against_baseline(report: EvalReport, baseline_path: Path) -> list[str]:
-    """베이스라인 대비 pass→fail 회귀 케이스 id 목록"""
+def load_baseline(baseline_path: Path) -> dict[str, Any]:
     with open(baseline_path, encoding="utf-8") as f:
-        baseline = json.load(f)
+        return json.load(f)
+
+
+def diff_against_baseline(report: EvalReport, baseline: dict[str, Any]) -> list[str]:
+    """베이스라인 대비 pass→fail 회귀 케이스 id 목록"""
     baseline_passed = {
         c["case_id"] for c in baseline.get("cases", []) if c.get("passed")
     }
@@ -277,6 +340,15 @@ async def main() -> int:
     parser.add_argument(
         "--baseline", type=Path, help="회귀 비교할 베이스라인 리포트 JSON"
     )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="동시 실행 케이스 수 (default: 1)"
+    )
+    parser.add_argument(
+        "--latency-tolerance",
+        type=float,
+        default=0.25,
+        help="--baseline 레이턴시 회귀 판정 상대 증가율 (default: 0.25)",
+    )
     args = parser.parse_args()
 
     cases = _select_cases(args)
@@ -309,44 +381,54 @@ async def main() -> int:
         )
 
         run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        print(f"{SEP}\nEval 실행: {len(cases)}케이스 (judge={'on' if args.judge else 'off'})\n{SEP}")
+        print(
+            f"{SEP}\nEval 실행: {len(cases)}케이스 (judge={'on' if args.judge else 'off'}, "
+            f"concurrency={args.concurrency})\n{SEP}"
+        )
 
-        results: list[CaseResult] = []
-        for i, case in enumerate(cases, 1):
-            print(f"[{i}/{len(cases)}] {case.id} ...", flush=True)
-            try:
-                results.append(
-                    await run_case(
-                        pipeline,
-                        neo4j_repo,
-                        case,
-                        run_ts=run_ts,
-                        use_judge=args.judge,
-                        gateway=gateway,
-                    )
-                )
-            except Exception as e:
-                logger.error(f"[{case.id}] 실행 자체가 실패: {e}")
-                results.append(
-                    CaseResult(
-                        case_id=case.id,
-                        category=case.category,
-                        passed=False,
-                        metadata={"error": f"runner exception: {e}"},
-                    )
-                )
+        started = time.perf_counter()
+        results = await run_cases(
+            cases,
+            concurrency=args.concurrency,
+            pipeline=pipeline,
+            neo4j_repo=neo4j_repo,
+            run_ts=run_ts,
+            use_judge=args.judge,
+            gateway=gateway,
+        )
+        wall_seconds = time.perf_counter() - started
 
         await gateway.close()
 
-    report = build_report(results, run_ts)
+    report = build_report(
+        results, run_ts, concurrency=args.concurrency, wall_seconds=wall_seconds
+    )
     print_report(report)
     path = save_report(report)
     print(f"리포트 저장: {path}")
 
     if args.baseline:
-        regressions = diff_against_baseline(report, args.baseline)
+        baseline = load_baseline(args.baseline)
+        regressions = diff_against_baseline(report, baseline)
+        slowdowns = latency_regressions(
+            [r.to_dict() for r in report.case_results],
+            baseline.get("cases", []),
+            rel_tol=args.latency_tolerance,
+        )
+        # concurrency가 다르면 레이턴시는 비교 불가 — 출력만 하고 실패로 보지 않음
+        latency_comparable = baseline.get("concurrency", 1) == report.concurrency
+        if not latency_comparable:
+            print(
+                f"\n⚠️  베이스라인 concurrency={baseline.get('concurrency', 1)} ≠ "
+                f"현재 {report.concurrency} — 레이턴시 비교는 참고용"
+            )
         if regressions:
             print(f"\n🔴 베이스라인 대비 회귀 {len(regressions)}건: {regressions}")
+        if slowdowns:
+            print(f"\n🟠 베이스라인 대비 레이턴시 회귀 {len(slowdowns)}건:")
+            for line in slowdowns:
+                print(f"   {line}")
+        if regressions or (slowdowns and latency_comparable):
             return 1
         print("\n🟢 베이스라인 대비 회귀 없음")
 
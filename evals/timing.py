@@ -0,0 +1,108 @@
+"""
+Eval 레이턴시 집계
+
+케이스별 elapsed_seconds와 node_timings를 p50/p95로 요약하고,
+베이스라인 리포트 대비 레이턴시 회귀를 판정한다.
+순수 함수만 포함 (라이브 의존 없음).
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100). 빈 리스트는 0.0"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_latency(samples: list[float]) -> dict[str, float]:
+    """샘플 요약: n / avg / p50 / p95 / max (초, 소수 3자리)"""
+    if not samples:
+        return {"n": 0, "avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "n": len(samples),
+        "avg": round(sum(samples) / len(samples), 3),
+        "p50": round(percentile(samples, 50), 3),
+        "p95": round(percentile(samples, 95), 3),
+        "max": round(max(samples), 3),
+    }
+
+
+def aggregate_node_timings(
+    node_timings: Iterable[Mapping[str, float] | None],
+) -> dict[str, dict[str, float]]:
+    """케이스별 node_timings를 노드 단위로 모아 요약 (avg 내림차순)"""
+    samples: dict[str, list[float]] = {}
+    for timings in node_timings:
+        for node, seconds in (timings or {}).items():
+            samples.setdefault(node, []).append(float(seconds))
+    summaries = {node: summarize_latency(values) for node, values in samples.items()}
+    return dict(sorted(summaries.items(), key=lambda kv: -kv[1]["avg"]))
+
+
+def _case_samples(
+    cases: Iterable[Mapping[str, Any]],
+) -> tuple[list[float], list[Mapping[str, float] | None]]:
+    """리포트 JSON의 cases에서 (케이스 레이턴시, node_timings) 추출"""
+    elapsed: list[float] = []
+    timings: list[Mapping[str, float] | None] = []
+    for case in cases:
+        if case.get("elapsed_seconds"):
+            elapsed.append(float(case["elapsed_seconds"]))
+        timings.append((case.get("metadata") or {}).get("node_timings"))
+    return elapsed, timings
+
+
+def latency_regressions(
+    current_cases: Iterable[Mapping[str, Any]],
+    baseline_cases: Iterable[Mapping[str, Any]],
+    *,
+    rel_tol: float = 0.25,
+    min_delta_seconds: float = 0.5,
+) -> list[str]:
+    """
+    베이스라인 대비 레이턴시 회귀 목록
+
+    케이스 전체 p50/p95와 노드별 p50을 비교하며, 상대 증가율이 rel_tol을 넘고
+    절대 증가량이 min_delta_seconds 이상인 항목만 회귀로 본다
+    (짧은 노드의 지터를 회귀로 오판하지 않도록).
+    베이스라인은 리포트의 cases에서 다시 계산하므로 이전 형식 리포트와도 비교 가능.
+
+    Returns:
+        "p95: 3.10s → 4.20s (+35%)" 형식의 설명 문자열 리스트
+    """
+    cur_elapsed, cur_timings = _case_samples(current_cases)
+    base_elapsed, base_timings = _case_samples(baseline_cases)
+
+    comparisons: list[tuple[str, float, float]] = []
+    for q in (50, 95):
+        if cur_elapsed and base_elapsed:
+            comparisons.append(
+                (f"case p{q}", percentile(base_elapsed, q), percentile(cur_elapsed, q))
+            )
+
+    cur_nodes = aggregate_node_timings(cur_timings)
+    base_nodes = aggregate_node_timings(base_timings)
+    for node, summary in cur_nodes.items():
+        if node in base_nodes:
+            comparisons.append((f"{node} p50", base_nodes[node]["p50"], summary["p50"]))
+
+    regressions = []
+    for label, before, after in comparisons:
+        delta = after - before
+        if before > 0 and delta >= min_delta_seconds and delta / before > rel_tol:
+            regressions.append(
+                f"{label}: {before:.2f}s → {after:.2f}s (+{delta / before:.0%})"
+            )
+    return regressions
@@ -1,36 +1,93 @@
 """
 CSV 데이터를 Neo4j에 로드하는 스크립트
-LOAD CSV 방식으로 빠르게 데이터 적재
+CSV를 클라이언트에서 읽어 UNWIND 배치로 적재 (Neo4jClient 비동기 드라이버)
 
 파생 필드는 CSV에 사전 계산됨 (scripts/enrich_csv.py).
 이 스크립트는 CSV 컬럼을 그대로 읽어서 Neo4j에 적재만 수행.
 유일한 예외: Employee.availability는 관계 로드 후 post-load로 계산.
+
+적재 순서 (의존 관계가 없는 단계는 동시 실행):
+    제약조건 → Office/Position/Skill/Certificate → Department
+    → Employee/Project → 관계 5종 → availability
+
+실행: python load_to_neo4j.py [--data-dir data/company_realistic] [--batch-size 1000]
 """
 
-from neo4j import GraphDatabase
+import argparse
+import asyncio
+import csv
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure.neo4j_client import Neo4jClient
+
+# Neo4j 연결 설정 (환경변수로 덮어쓰기 가능)
+URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+AUTH = (os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD", "password123"))
 
-# Neo4j 연결 설정
-URI = "bolt://localhost:7687"
-AUTH = ("neo4j", "password123")
+DATA_DIR = Path(__file__).parent / "data" / "company_realistic"
+BATCH_SIZE = 1000
 
 
-def run_query(driver, query, params=None):
-    """Cypher 쿼리 실행"""
-    with driver.session() as session:
-        result = session.run(query, params or {})
-        return result.consume()
+class PhaseTimer:
+    """단계별 소요 시간 기록"""
 
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
 
-def clear_database(driver):
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+
+    def print_summary(self) -> None:
+        print("\n[단계별 소요 시간]")
+        for name, elapsed in self.phases.items():
+            print(f"  {name:<24} {elapsed:7.2f}s")
+        print(f"  --------\n  {'합계':<24} {sum(self.phases.values()):7.2f}s")
+
+
+def read_rows(data_dir: Path, filename: str) -> list[dict[str, Any]]:
+    """CSV 행 읽기 (빈 값은 LOAD CSV와 동일하게 null로 변환)"""
+    with open(data_dir / filename, encoding="utf-8", newline="") as f:
+        return [
+            {key: (value if value != "" else None) for key, value in row.items()}
+            for row in csv.DictReader(f)
+        ]
+
+
+async def load_csv(
+    client: Neo4jClient,
+    data_dir: Path,
+    filename: str,
+    query: str,
+    batch_size: int,
+) -> int:
+    """CSV 파일을 UNWIND $rows 배치 쿼리로 적재"""
+    rows = read_rows(data_dir, filename)
+    for i in range(0, len(rows), batch_size):
+        await client.execute_write(query, {"rows": rows[i : i + batch_size]})
+    print(f"  ✓ {filename}: {len(rows)}행")
+    return len(rows)
+
+
+async def clear_database(client: Neo4jClient):
     """기존 데이터 삭제"""
-    print("\n[0/10] 기존 데이터 삭제 중...")
-    run_query(driver, "MATCH (n) DETACH DELETE n")
+    print("\n[0/6] 기존 데이터 삭제 중...")
+    await client.execute_write("MATCH (n) DETACH DELETE n")
     print("  ✓ 완료")
 
 
-def create_constraints(driver):
-    """인덱스 및 제약조건 생성"""
-    print("\n[1/10] 인덱스 및 제약조건 생성 중...")
+async def create_constraints(client: Neo4jClient):
+    """인덱스 및 제약조건 생성 (데이터 적재 전에 실행 — MATCH 조회가 인덱스를 사용)"""
+    print("\n[1/6] 인덱스 및 제약조건 생성 중...")
 
     constraints = [
         "CREATE CONSTRAINT IF NOT EXISTS FOR (e:Employee) REQUIRE e.id IS UNIQUE",
@@ -44,7 +101,7 @@ def create_constraints(driver):
 
     for constraint in constraints:
         try:
-            run_query(driver, constraint)
+            await client.execute_write(constraint)
         except Exception:
             pass
 
@@ -56,6 +113,14 @@ def create_constraints(driver):
         "CREATE INDEX office_name IF NOT EXISTS FOR (o:Office) ON (o.name)",
         "CREATE INDEX position_name IF NOT EXISTS FOR (pos:Position) ON (pos.name)",
         "CREATE INDEX certificate_name IF NOT EXISTS FOR (cert:Certificate) ON (cert.name)",
+        # name_norm: 대소문자/공백 무시 이름 조회용 (앱 lookup 쿼리가 사용)
+        "CREATE INDEX employee_name_norm_idx IF NOT EXISTS FOR (e:Employee) ON (e.name_norm)",
+        "CREATE INDEX department_name_norm_idx IF NOT EXISTS FOR (d:Department) ON (d.name_norm)",
+        "CREATE INDEX skill_name_norm_idx IF NOT EXISTS FOR (s:Skill) ON (s.name_norm)",
+        "CREATE INDEX project_name_norm_idx IF NOT EXISTS FOR (p:Project) ON (p.name_norm)",
+        "CREATE INDEX office_name_norm_idx IF NOT EXISTS FOR (o:Office) ON (o.name_norm)",
+        "CREATE INDEX position_name_norm_idx IF NOT EXISTS FOR (pos:Position) ON (pos.name_norm)",
+        "CREATE INDEX certificate_name_norm_idx IF NOT EXISTS FOR (cert:Certificate) ON (cert.name_norm)",
         "CREATE INDEX skill_category IF NOT EXISTS FOR (s:Skill) ON (s.category)",
         "CREATE INDEX project_type IF NOT EXISTS FOR (p:Project) ON (p.type)",
         "CREATE INDEX project_status IF NOT EXISTS FOR (p:Project) ON (p.status)",
@@ -63,88 +128,87 @@ def create_constraints(driver):
 
     for idx in indexes:
         try:
-            run_query(driver, idx)
+            await client.execute_write(idx)
         except Exception:
             pass
 
+    # 인덱스가 ONLINE 상태가 된 뒤 적재 시작
+    await client.execute_query("CALL db.awaitIndexes(300)")
     print("  ✓ 완료")
 
 
-def load_nodes(driver):
-    """기본 노드 데이터 로드 (Office, Department, Position, Skill, Certificate)"""
+async def load_nodes(client: Neo4jClient, data_dir: Path, batch_size: int):
+    """기본 노드 데이터 로드 (Office, Position, Skill, Certificate 동시 → Department)"""
+    print("\n[2/6] 기본 노드 로드 중 (Office, Position, Skill, Certificate)...")
 
-    # 1. Office
-    print("\n[2/10] Office 노드 로드 중...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///offices.csv' AS row
+    office = load_csv(client, data_dir, "offices.csv", """
+    UNWIND $rows AS row
     CREATE (o:Office {
-        id: row.id, name: row.name, city: row.city, address: row.address
-    })
-    """)
-    print("  ✓ 완료")
-
-    # 2. Department + Office 관계
-    print("\n[3/10] Department 노드 로드 중...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///departments.csv' AS row
-    CREATE (d:Department {
         id: row.id, name: row.name,
-        head_count: toInteger(row.head_count),
-        budget_billion: toFloat(row.budget_billion)
+        name_norm: replace(toLower(trim(row.name)), ' ', ''),
+        city: row.city, address: row.address
     })
-    WITH d, row
-    MATCH (o:Office {id: row.office_id})
-    CREATE (d)-[:LOCATED_AT]->(o)
-    """)
-    print("  ✓ 완료")
+    """, batch_size)
 
-    # 3. Position
-    print("\n[4/10] Position 노드 로드 중...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///positions.csv' AS row
+    position = load_csv(client, data_dir, "positions.csv", """
+    UNWIND $rows AS row
     CREATE (p:Position {
         id: row.id, name: row.name,
+        name_norm: replace(toLower(trim(row.name)), ' ', ''),
         level: toInteger(row.level),
         min_years: toInteger(row.min_years),
         max_years: toInteger(row.max_years)
     })
-    """)
-    print("  ✓ 완료")
+    """, batch_size)
 
-    # 4. Skill (파생 필드: hourly_rate_min/max, market_demand → CSV에서 직접 읽기)
-    print("\n[5/10] Skill 노드 로드 중...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///skills.csv' AS row
+    # Skill (파생 필드: hourly_rate_min/max, market_demand → CSV에서 직접 읽기)
+    skill = load_csv(client, data_dir, "skills.csv", """
+    UNWIND $rows AS row
     CREATE (s:Skill {
         id: row.id, name: row.name,
+        name_norm: replace(toLower(trim(row.name)), ' ', ''),
         category: row.category, difficulty: row.difficulty,
         hourly_rate_min: toInteger(row.hourly_rate_min),
         hourly_rate_max: toInteger(row.hourly_rate_max),
         market_demand: row.market_demand
     })
-    """)
-    print("  ✓ 완료")
+    """, batch_size)
 
-    # 5. Certificate
-    print("\n[6/10] Certificate 노드 로드 중...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///certificates.csv' AS row
+    certificate = load_csv(client, data_dir, "certificates.csv", """
+    UNWIND $rows AS row
     CREATE (c:Certificate {
         id: row.id, name: row.name,
+        name_norm: replace(toLower(trim(row.name)), ' ', ''),
         issuer: row.issuer, category: row.category
     })
-    """)
-    print("  ✓ 완료")
+    """, batch_size)
 
+    await asyncio.gather(office, position, skill, certificate)
+
+    # Department + Office 관계 (Office 적재 후)
+    print("\n[3/6] Department 노드 로드 중...")
+    await load_csv(client, data_dir, "departments.csv", """
+    UNWIND $rows AS row
+    CREATE (d:Department {
+        id: row.id, name: row.name,
+        name_norm: replace(toLower(trim(row.name)), ' ', ''),
+        head_count: toInteger(row.head_count),
+        budget_billion: toFloat(row.budget_billion)
+    })
+    WITH d, row
+    MATCH (o:Office {id: row.office_id})
+    CREATE (d)-[:LOCATED_AT]->(o)
+    """, batch_size)
 
-def load_employees(driver):
-    """Employee 노드 로드 (파생 필드: hourly_rate, max_projects, department → CSV에서 직접 읽기)"""
-    print("\n[7/10] Employee 노드 로드 중...")
 
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///employees.csv' AS row
+async def load_employees(client: Neo4jClient, data_dir: Path, batch_size: int):
+    """Employee 노드 로드 (파생 필드: hourly_rate, max_projects, department → CSV에서 직접 읽기)"""
+    await load_csv(client, data_dir, "employees.csv", """
+    UNWIND $rows AS row
     CREATE (e:Employee {
-        id: row.id, name: row.name, email: row.email,
+        id: row.id, name: row.name,
+        name_norm: replace(toLower(trim(row.name)), ' ', ''),
+        email: row.email,
         job_type: row.job_type,
         years_experience: toInteger(row.years_experience),
         hire_date: row.hire_date,
@@ -157,18 +221,17 @@ def load_employees(driver):
     MATCH (p:Position {id: row.position_id})
     CREATE (e)-[:BELONGS_TO]->(d)
     CREATE (e)-[:HAS_POSITION]->(p)
-    """)
-    print("  ✓ 완료")
+    """, batch_size)
 
 
-def load_projects(driver):
+async def load_projects(client: Neo4jClient, data_dir: Path, batch_size: int):
     """Project 노드 로드 (파생 필드: budget_allocated/spent, duration 등 → CSV에서 직접 읽기)"""
-    print("\n[8/10] Project 노드 로드 중...")
-
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///projects.csv' AS row
+    await load_csv(client, data_dir, "projects.csv", """
+    UNWIND $rows AS row
     CREATE (p:Project {
-        id: row.id, name: row.name, type: row.type,
+        id: row.id, name: row.name,
+        name_norm: replace(toLower(trim(row.name)), ' ', ''),
+        type: row.type,
         status: row.status, start_date: row.start_date,
         budget_million: toInteger(row.budget_million),
         budget_allocated: toInteger(row.budget_allocated),
@@ -180,18 +243,21 @@ def load_projects(driver):
     WITH p, row
     MATCH (d:Department {id: row.dept_id})
     CREATE (p)-[:OWNED_BY]->(d)
-    """)
-    print("  ✓ 완료")
+    """, batch_size)
 
 
-def load_relationships(driver):
-    """관계 데이터 로드 (파생 필드 모두 CSV에서 직접 읽기)"""
-    print("\n[9/10] 관계 데이터 로드 중...")
+async def load_relationships(client: Neo4jClient, data_dir: Path, batch_size: int):
+    """
+    관계 데이터 로드 (파생 필드 모두 CSV에서 직접 읽기)
+
+    관계 타입별로 동시 실행합니다. 같은 노드를 잠그는 트랜잭션끼리
+    데드락이 나면 드라이버의 managed transaction이 자동 재시도합니다.
+    """
+    print("\n[5/6] 관계 데이터 로드 중...")
 
     # HAS_SKILL (파생: rate_factor, effective_rate)
-    print("  - Employee-Skill 관계...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///employee_skill.csv' AS row
+    has_skill = load_csv(client, data_dir, "employee_skill.csv", """
+    UNWIND $rows AS row
     MATCH (e:Employee {id: row.employee_id})
     MATCH (s:Skill {id: row.skill_id})
     CREATE (e)-[:HAS_SKILL {
@@ -200,12 +266,11 @@ def load_relationships(driver):
         rate_factor: toFloat(row.rate_factor),
         effective_rate: toInteger(row.effective_rate)
     }]->(s)
-    """)
+    """, batch_size)
 
     # WORKS_ON (파생: agreed_rate, allocated_hours, actual_hours)
-    print("  - Employee-Project 관계...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///employee_project.csv' AS row
+    works_on = load_csv(client, data_dir, "employee_project.csv", """
+    UNWIND $rows AS row
     MATCH (e:Employee {id: row.employee_id})
     MATCH (p:Project {id: row.project_id})
     CREATE (e)-[:WORKS_ON {
@@ -215,12 +280,11 @@ def load_relationships(driver):
         allocated_hours: toInteger(row.allocated_hours),
         actual_hours: toInteger(row.actual_hours)
     }]->(p)
-    """)
+    """, batch_size)
 
     # REQUIRES (파생: required_proficiency, required_headcount, max_hourly_rate, priority)
-    print("  - Project-Skill 관계...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///project_skill.csv' AS row
+    requires = load_csv(client, data_dir, "project_skill.csv", """
+    UNWIND $rows AS row
     MATCH (p:Project {id: row.project_id})
     MATCH (s:Skill {id: row.skill_id})
     CREATE (p)-[:REQUIRES {
@@ -230,38 +294,37 @@ def load_relationships(driver):
         max_hourly_rate: toInteger(row.max_hourly_rate),
         priority: toInteger(row.priority)
     }]->(s)
-    """)
+    """, batch_size)
 
     # HAS_CERTIFICATE
-    print("  - Employee-Certificate 관계...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///employee_certificate.csv' AS row
+    has_certificate = load_csv(client, data_dir, "employee_certificate.csv", """
+    UNWIND $rows AS row
     MATCH (e:Employee {id: row.employee_id})
     MATCH (c:Certificate {id: row.certificate_id})
     CREATE (e)-[:HAS_CERTIFICATE {
         acquired_date: row.acquired_date
     }]->(c)
-    """)
+    """, batch_size)
 
     # MENTORS
-    print("  - Mentorship 관계...")
-    run_query(driver, """
-    LOAD CSV WITH HEADERS FROM 'file:///mentorship.csv' AS row
+    mentors = load_csv(client, data_dir, "mentorship.csv", """
+    UNWIND $rows AS row
     MATCH (mentor:Employee {id: row.mentor_id})
     MATCH (mentee:Employee {id: row.mentee_id})
     CREATE (mentor)-[:MENTORS {
         start_date: row.start_date
     }]->(mentee)
-    """)
+    """, batch_size)
 
+    await asyncio.gather(has_skill, works_on, requires, has_certificate, mentors)
     print("  ✓ 모든 관계 로드 완료")
 
 
-def set_employee_availability(driver):
+async def set_employee_availability(client: Neo4jClient):
     """Employee.availability 설정 (활성 프로젝트 수 기반 — 유일한 post-load 계산)"""
-    print("\n[10/10] Employee availability 설정 중...")
+    print("\n[6/6] Employee availability 설정 중...")
 
-    run_query(driver, """
+    await client.execute_write("""
     MATCH (e:Employee)
     OPTIONAL MATCH (e)-[:WORKS_ON]->(p:Project)
     WHERE p.status IN ['진행중', '계획']
@@ -274,139 +337,162 @@ def set_employee_availability(driver):
     print("  ✓ 완료")
 
 
-def verify_data(driver):
+async def verify_data(client: Neo4jClient):
     """데이터 검증"""
     print("\n" + "=" * 60)
     print(" 데이터 검증")
     print("=" * 60)
 
-    with driver.session() as session:
-        result = session.run(
-            "MATCH (n) RETURN labels(n)[0] AS label, count(*) AS count ORDER BY count DESC"
-        )
-        print("\n[노드 통계]")
-        total_nodes = 0
-        for record in result:
-            print(f"  {record['label']}: {record['count']}개")
-            total_nodes += record["count"]
-        print(f"  --------\n  총 노드: {total_nodes}개")
-
-        result = session.run(
-            "MATCH ()-[r]->() RETURN type(r) AS type, count(*) AS count ORDER BY count DESC"
-        )
-        print("\n[관계 통계]")
-        total_edges = 0
-        for record in result:
-            print(f"  {record['type']}: {record['count']}개")
-            total_edges += record["count"]
-        print(f"  --------\n  총 관계: {total_edges}개")
-
-        # hourly_rate 범위
-        record = session.run("""
-            MATCH (e:Employee)
-            RETURN min(e.hourly_rate) AS min_rate,
-                   max(e.hourly_rate) AS max_rate,
-                   avg(e.hourly_rate) AS avg_rate
-        """).single()
-        print("\n[Employee hourly_rate]")
-        print(f"  min: {record['min_rate']:,}원 / max: {record['max_rate']:,}원 / avg: {record['avg_rate']:,.0f}원")
-
-        # effective_rate 범위
-        record = session.run("""
-            MATCH ()-[r:HAS_SKILL]->()
-            RETURN min(r.effective_rate) AS min_rate,
-                   max(r.effective_rate) AS max_rate,
-                   avg(r.effective_rate) AS avg_rate
-        """).single()
-        print("\n[HAS_SKILL effective_rate]")
-        print(f"  min: {record['min_rate']:,}원 / max: {record['max_rate']:,}원 / avg: {record['avg_rate']:,.0f}원")
-
-        # availability 분포
-        result = session.run("""
-            MATCH (e:Employee)
-            RETURN e.availability AS status, count(*) AS count
-            ORDER BY count DESC
-        """)
-        print("\n[Employee availability]")
-        for record in result:
-            print(f"  {record['status']}: {record['count']}명")
-
-
-def sample_queries(driver):
+    result = await client.execute_query(
+        "MATCH (n) RETURN labels(n)[0] AS label, count(*) AS count ORDER BY count DESC"
+    )
+    print("\n[노드 통계]")
+    total_nodes = 0
+    for record in result:
+        print(f"  {record['label']}: {record['count']}개")
+        total_nodes += record["count"]
+    print(f"  --------\n  총 노드: {total_nodes}개")
+
+    result = await client.execute_query(
+        "MATCH ()-[r]->() RETURN type(r) AS type, count(*) AS count ORDER BY count DESC"
+    )
+    print("\n[관계 통계]")
+    total_edges = 0
+    for record in result:
+        print(f"  {record['type']}: {record['count']}개")
+        total_edges += record["count"]
+    print(f"  --------\n  총 관계: {total_edges}개")
+
+    # hourly_rate 범위
+    record = (await client.execute_query("""
+        MATCH (e:Employee)
+        RETURN min(e.hourly_rate) AS min_rate,
+               max(e.hourly_rate) AS max_rate,
+               avg(e.hourly_rate) AS avg_rate
+    """))[0]
+    print("\n[Employee hourly_rate]")
+    print(f"  min: {record['min_rate']:,}원 / max: {record['max_rate']:,}원 / avg: {record['avg_rate']:,.0f}원")
+
+    # effective_rate 범위
+    record = (await client.execute_query("""
+        MATCH ()-[r:HAS_SKILL]->()
+        RETURN min(r.effective_rate) AS min_rate,
+               max(r.effective_rate) AS max_rate,
+               avg(r.effective_rate) AS avg_rate
+    """))[0]
+    print("\n[HAS_SKILL effective_rate]")
+    print(f"  min: {record['min_rate']:,}원 / max: {record['max_rate']:,}원 / avg: {record['avg_rate']:,.0f}원")
+
+    # availability 분포
+    result = await client.execute_query("""
+        MATCH (e:Employee)
+        RETURN e.availability AS status, count(*) AS count
+        ORDER BY count DESC
+    """)
+    print("\n[Employee availability]")
+    for record in result:
+        print(f"  {record['status']}: {record['count']}명")
+
+
+async def sample_queries(client: Neo4jClient):
     """샘플 쿼리 실행"""
     print("\n" + "=" * 60)
     print(" 샘플 쿼리 테스트")
     print("=" * 60)
 
-    with driver.session() as session:
-        print("\n[쿼리 1] Python 전문가 (고급 이상)")
-        for r in session.run("""
-            MATCH (e:Employee)-[r:HAS_SKILL]->(s:Skill {name: 'Python'})
-            WHERE r.proficiency IN ['고급', '전문가']
-            RETURN e.name AS name, e.job_type AS job, r.proficiency AS level
-            LIMIT 5
-        """):
-            print(f"  - {r['name']} ({r['job']}) - {r['level']}")
-
-        print("\n[쿼리 2] Python 고급+ 단가 TOP 5")
-        for r in session.run("""
-            MATCH (e:Employee)-[r:HAS_SKILL]->(s:Skill)
-            WHERE toLower(s.name) = 'python'
-              AND r.proficiency IN ['고급', '전문가']
-              AND e.availability <> 'unavailable'
-            RETURN e.name AS name, e.hourly_rate AS base_rate,
-                   r.effective_rate AS skill_rate, e.availability AS avail
-            ORDER BY r.effective_rate DESC
-            LIMIT 5
-        """):
-            print(f"  - {r['name']}: base={r['base_rate']:,}원, "
-                  f"skill={r['skill_rate']:,}원, avail={r['avail']}")
-
-        print("\n[쿼리 3] 진행중 프로젝트 예산 TOP 3")
-        for r in session.run("""
-            MATCH (p:Project)
-            WHERE p.status = '진행중'
-            RETURN p.name AS project,
-                   p.budget_allocated AS allocated,
-                   p.budget_spent AS spent,
-                   p.required_headcount AS headcount
-            ORDER BY p.budget_allocated DESC
-            LIMIT 3
-        """):
-            print(f"  - {r['project']}: allocated={r['allocated']:,}원, "
-                  f"spent={r['spent']:,}원, headcount={r['headcount']}명")
-
-        print("\n[쿼리 4] 멘토-멘티 관계")
-        for r in session.run("""
-            MATCH (mentor:Employee)-[:MENTORS]->(mentee:Employee)
-            RETURN mentor.name AS mentor, mentee.name AS mentee,
-                   mentor.years_experience AS mentor_exp
-            LIMIT 5
-        """):
-            print(f"  - {r['mentor']}({r['mentor_exp']}년) → {r['mentee']}")
-
-
-def main():
+    print("\n[쿼리 1] Python 전문가 (고급 이상)")
+    for r in await client.execute_query("""
+        MATCH (e:Employee)-[r:HAS_SKILL]->(s:Skill {name: 'Python'})
+        WHERE r.proficiency IN ['고급', '전문가']
+        RETURN e.name AS name, e.job_type AS job, r.proficiency AS level
+        LIMIT 5
+    """):
+        print(f"  - {r['name']} ({r['job']}) - {r['level']}")
+
+    print("\n[쿼리 2] Python 고급+ 단가 TOP 5")
+    for r in await client.execute_query("""
+        MATCH (e:Employee)-[r:HAS_SKILL]->(s:Skill)
+        WHERE toLower(s.name) = 'python'
+          AND r.proficiency IN ['고급', '전문가']
+          AND e.availability <> 'unavailable'
+        RETURN e.name AS name, e.hourly_rate AS base_rate,
+               r.effective_rate AS skill_rate, e.availability AS avail
+        ORDER BY r.effective_rate DESC
+        LIMIT 5
+    """):
+        print(f"  - {r['name']}: base={r['base_rate']:,}원, "
+              f"skill={r['skill_rate']:,}원, avail={r['avail']}")
+
+    print("\n[쿼리 3] 진행중 프로젝트 예산 TOP 3")
+    for r in await client.execute_query("""
+        MATCH (p:Project)
+        WHERE p.status = '진행중'
+        RETURN p.name AS project,
+               p.budget_allocated AS allocated,
+               p.budget_spent AS spent,
+               p.required_headcount AS headcount
+        ORDER BY p.budget_allocated DESC
+        LIMIT 3
+    """):
+        print(f"  - {r['project']}: allocated={r['allocated']:,}원, "
+              f"spent={r['spent']:,}원, headcount={r['headcount']}명")
+
+    print("\n[쿼리 4] 멘토-멘티 관계")
+    for r in await client.execute_query("""
+        MATCH (mentor:Employee)-[:MENTORS]->(mentee:Employee)
+        RETURN mentor.name AS mentor, mentee.name AS mentee,
+               mentor.years_experience AS mentor_exp
+        LIMIT 5
+    """):
+        print(f"  - {r['mentor']}({r['mentor_exp']}년) → {r['mentee']}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="CSV → Neo4j 데이터 로더")
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=DATA_DIR,
+        help=f"CSV 디렉토리 (default: {DATA_DIR})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"UNWIND 배치 크기 (default: {BATCH_SIZE})",
+    )
+    args = parser.parse_args()
+
     print("\n" + "=" * 60)
     print(" CSV → Neo4j 데이터 로더")
     print("=" * 60)
 
-    driver = GraphDatabase.driver(URI, auth=AUTH)
+    client = Neo4jClient(uri=URI, user=AUTH[0], password=AUTH[1])
+    timer = PhaseTimer()
 
     try:
-        driver.verify_connectivity()
+        await client.connect()
         print("\n✓ Neo4j 연결 성공!")
 
-        clear_database(driver)
-        create_constraints(driver)
-        load_nodes(driver)
-        load_employees(driver)
-        load_projects(driver)
-        load_relationships(driver)
-        set_employee_availability(driver)
-
-        verify_data(driver)
-        sample_queries(driver)
+        with timer.phase("clear"):
+            await clear_database(client)
+        with timer.phase("constraints"):
+            await create_constraints(client)
+        with timer.phase("nodes"):
+            await load_nodes(client, args.data_dir, args.batch_size)
+        with timer.phase("employees + projects"):
+            print("\n[4/6] Employee / Project 노드 로드 중...")
+            await asyncio.gather(
+                load_employees(client, args.data_dir, args.batch_size),
+                load_projects(client, args.data_dir, args.batch_size),
+            )
+        with timer.phase("relationships"):
+            await load_relationships(client, args.data_dir, args.batch_size)
+        with timer.phase("availability"):
+            await set_employee_availability(client)
+
+        await verify_data(client)
+        await sample_queries(client)
 
         print("\n" + "=" * 60)
         print(" 로드 완료!")
@@ -416,8 +502,9 @@ def main():
     except Exception as e:
         print(f"\n❌ 오류 발생: {e}")
     finally:
-        driver.close()
+        timer.print_summary()
+        await client.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
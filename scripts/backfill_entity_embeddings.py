@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+엔티티 임베딩 백필 스크립트
+
+Employee/Skill/Project/Department 노드의 name(+ 핵심 속성) 임베딩을 생성하고
+레이블별 벡터 인덱스를 만듭니다. 엔티티 해석 벡터 폴백
+(ENTITY_VECTOR_FALLBACK_ENABLED=true)을 켜기 전에 실행합니다.
+
+임베딩이 없거나 임베딩 텍스트가 바뀐 노드만 처리하므로 중단 후 재실행하면
+남은 노드부터 이어서 처리합니다.
+
+사용법:
+    python scripts/backfill_entity_embeddings.py --dry-run   # 레이블별 대상 노드 수
+    python scripts/backfill_entity_embeddings.py             # 인덱스 생성 + 백필
+    python scripts/backfill_entity_embeddings.py --labels Skill --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+
+from src.config import Settings
+from src.domain.constants import ENTITY_EMBEDDING_LABELS
+from src.infrastructure.llm import AzureOpenAIGateway
+from src.infrastructure.neo4j_client import Neo4jClient
+from src.repositories.neo4j_repository import Neo4jRepository
+from src.services.entity_embedding_service import EntityEmbeddingService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def backfill(
+    service: EntityEmbeddingService,
+    labels: tuple[str, ...],
+    batch_size: int,
+    max_batches: int | None,
+    dry_run: bool,
+) -> None:
+    """인덱스 생성 후 레이블별 백필 실행"""
+    logger.info("=" * 60)
+    logger.info(" 엔티티 임베딩 백필 시작")
+    logger.info("=" * 60)
+    logger.info(f"Labels: {', '.join(labels)} / Dry run: {dry_run}")
+
+    if dry_run:
+        for label, pending in (await service.count_pending(labels)).items():
+            logger.info(f"  [DRY RUN] {label}: {pending}개 노드 임베딩 예정")
+        return
+
+    logger.info("\n[1/2] 벡터 인덱스 생성 중...")
+    for index_name in await service.ensure_indexes(labels):
+        logger.info(f"  ✓ {index_name}")
+
+    logger.info("\n[2/2] 임베딩 백필 중...")
+    result = await service.backfill(labels, batch_size, max_batches)
+    for label, updated in result.updated_by_label.items():
+        logger.info(f"  ✓ {label}: {updated}개 노드 갱신")
+
+    logger.info("=" * 60)
+    logger.info(
+        f" 백필 완료: 총 {result.total_updated}개 노드, "
+        f"{result.batches}개 배치 ({result.duration_seconds}s)"
+    )
+    logger.info("=" * 60)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="엔티티 임베딩/벡터 인덱스 백필")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="실제 DB 변경 없이 대상 노드 수만 출력",
+    )
+    parser.add_argument(
+        "--labels",
+        nargs="+",
+        default=list(ENTITY_EMBEDDING_LABELS),
+        choices=list(ENTITY_EMBEDDING_LABELS),
+        help="대상 레이블 (default: Employee Skill Project Department)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="배치당 노드 수 (default: 500)",
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="이번 실행의 최대 배치 수 (재실행 시 이어서 처리)",
+    )
+
+    args = parser.parse_args()
+
+    load_dotenv()
+    settings = Settings()
+    client = Neo4jClient(
+        uri=settings.neo4j_uri,
+        user=settings.neo4j_user,
+        password=settings.neo4j_password,
+        database=settings.neo4j_database,
+    )
+    llm_gateway = AzureOpenAIGateway(settings)
+
+    try:
+        await client.connect()
+        logger.info(f"✓ Neo4j 연결 성공: {settings.neo4j_uri}")
+        service = EntityEmbeddingService(
+            Neo4jRepository(client),
+            llm_gateway,
+            dimensions=settings.embedding_dimensions,
+        )
+        await backfill(
+            service,
+            tuple(args.labels),
+            args.batch_size,
+            args.max_batches,
+            args.dry_run,
+        )
+    except Exception as e:
+        logger.error(f"❌ 오류: {e}")
+        sys.exit(1)
+    finally:
+        await llm_gateway.close()
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
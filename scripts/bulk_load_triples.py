@@ -3,9 +3,12 @@
 트리플 벌크 로딩 CLI
 
 정규화된 트리플을 Neo4j에 벌크 로딩합니다.
+입력 파일은 스트리밍으로 읽으며(JSON/JSONL), 쓰기 배치는 --parallel 개의
+세션에서 동시에 실행됩니다.
 
 사용법:
     python scripts/bulk_load_triples.py --triples normalized_triples.json
+    python scripts/bulk_load_triples.py --triples triples.jsonl --parallel 8
     python scripts/bulk_load_triples.py --triples triples.json --batch-size 500
     python scripts/bulk_load_triples.py --triples triples.json --dry-run
 
@@ -17,17 +20,24 @@ import argparse
 import asyncio
 import json
 import logging
+import random
+import re
 import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
+from neo4j.exceptions import TransientError
 
 from src.bootstrap.models import Triple
 from src.bootstrap.utils import normalize_relation_type
+from src.domain.constants import NAME_NORM_PROPERTY, name_norm_expr
 from src.infrastructure.neo4j_client import Neo4jClient
 
 logging.basicConfig(
@@ -36,78 +46,202 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 스트리밍 JSON 파서 읽기 단위 (문자 수)
+_READ_SIZE = 1 << 16
 
-def load_triples(input_path: str) -> list[Triple]:
-    """트리플 JSON 파일 로드"""
-    with open(input_path, encoding="utf-8") as f:
-        data = json.load(f)
+# 일시적 오류(데드락 등) 재시도 설정
+MAX_WRITE_RETRIES = 5
+RETRY_BASE_DELAY_SECONDS = 0.2
 
-    triples = []
-    for item in data.get("triples", []):
-        triples.append(Triple.from_dict(item))
 
-    return triples
+def _iter_json_array(f: TextIO, key: str) -> Iterator[Any]:
+    """
+    최상위 객체의 배열 필드를 항목 단위로 스트리밍 파싱
+
+    파일 전체를 json.load 하지 않고 버퍼 단위로 읽으며
+    JSONDecoder.raw_decode로 항목을 하나씩 디코딩합니다.
+    """
+    decoder = json.JSONDecoder()
+    key_pattern = re.compile(rf'"{re.escape(key)}"\s*:\s*\[')
+    buf = ""
+    pos = 0
+
+    def fill() -> bool:
+        nonlocal buf, pos
+        chunk = f.read(_READ_SIZE)
+        if not chunk:
+            return False
+        # 이미 소비한 앞부분은 버림 (버퍼 크기 유지)
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    # 배열 시작 위치 탐색
+    while (match := key_pattern.search(buf)) is None:
+        if not fill():
+            return
+    pos = match.end()
+
+    while True:
+        # 공백/구분자 건너뛰기
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) or not fill():
+                break
+        if pos >= len(buf):
+            raise ValueError(f"Unterminated '{key}' array")
+        if buf[pos] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # 항목이 버퍼 경계에 걸린 경우 더 읽고 재시도
+            if fill():
+                continue
+            raise
+        delim = end
+        while delim < len(buf) and buf[delim] in " \t\r\n":
+            delim += 1
+        if (delim == len(buf) or buf[delim] not in ",]") and fill():
+            # 숫자처럼 끝 구분자가 없는 값은 버퍼 경계에서 일부만 디코딩될 수 있으므로
+            # 뒤따르는 구분자(, 또는 ])가 보일 때까지 더 읽고 같은 위치부터 다시 디코딩
+            continue
+        pos = end
+        yield item
+
+
+def iter_triples(input_path: str | Path) -> Iterator[Triple]:
+    """
+    트리플 파일 스트리밍 로드
+
+    - .jsonl / .ndjson: 한 줄에 트리플 하나
+    - 그 외: {"triples": [...]} 형식의 JSON (save_triples_to_file 출력)
+    """
+    path = Path(input_path)
+    with open(path, encoding="utf-8") as f:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            for line in f:
+                if line.strip():
+                    yield Triple.from_dict(json.loads(line))
+        else:
+            for item in _iter_json_array(f, "triples"):
+                yield Triple.from_dict(item)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """데드락 등 재시도 가능한 Neo4j 오류 여부 (DatabaseError로 래핑된 경우 포함)"""
+    while error is not None:
+        if isinstance(error, TransientError):
+            return True
+        error = error.__cause__
+    return False
+
+
+@dataclass
+class _WriteBatch:
+    """쓰기 워커가 처리할 배치 단위"""
+
+    label: str
+    query: str
+    parameters: dict[str, Any]
+    rows: int
 
 
 class BulkLoader:
-    """Neo4j 벌크 로더"""
+    """
+    Neo4j 벌크 로더
+
+    입력 파일을 두 번 스트리밍합니다.
+    1) 고유 엔티티 집계 → 노드 배치 쓰기
+    2) 관계 타입별 버퍼링 → 배치가 찰 때마다 쓰기 큐로 전달
+
+    쓰기는 parallel 개의 워커(각자 별도 세션)가 bounded 큐에서 배치를 꺼내
+    동시에 실행하며, 데드락 등 일시적 오류는 지수 백오프로 재시도합니다.
+    """
 
     def __init__(
         self,
         neo4j_client: Neo4jClient,
         dry_run: bool = False,
+        parallel: int = 1,
     ):
         self._client = neo4j_client
         self._dry_run = dry_run
-        self._stats = {
+        self._parallel = max(1, parallel)
+        self._stats: dict[str, Any] = {
+            "triples": 0,
             "nodes_created": 0,
             "relationships_created": 0,
+            "retries": 0,
+            "throughput": {},
             "errors": [],
         }
 
     async def load_triples(
         self,
-        triples: list[Triple],
+        input_path: str | Path,
         batch_size: int = 1000,
     ) -> dict[str, Any]:
         """
-        트리플을 Neo4j에 벌크 로딩
+        트리플 파일을 Neo4j에 벌크 로딩
 
         Args:
-            triples: 로딩할 트리플 목록
+            input_path: 트리플 JSON/JSONL 파일 경로
             batch_size: 배치 크기
 
         Returns:
             로딩 통계
         """
-        logger.info(f"총 {len(triples)}개 트리플 로딩 시작")
-        logger.info(f"배치 크기: {batch_size}, Dry run: {self._dry_run}")
+        logger.info(
+            f"배치 크기: {batch_size}, 동시 세션: {self._parallel}, "
+            f"Dry run: {self._dry_run}"
+        )
+
+        # 1차 스트리밍: 고유 엔티티 및 관계 타입 집계
+        entities, relations = self._extract_entities(iter_triples(input_path))
+        self._stats["triples"] = sum(relations.values())
+        logger.info(f"총 {self._stats['triples']}개 트리플 스캔 완료")
 
         if self._dry_run:
-            return await self._dry_run_analysis(triples)
+            return self._dry_run_analysis(entities, relations)
+
+        if not self._stats["triples"]:
+            return self._stats
 
         # 1. 인덱스 생성
         await self._create_indexes()
 
-        # 2. 고유 엔티티 추출 및 노드 생성
-        entities = self._extract_entities(triples)
-        await self._batch_create_nodes(entities, batch_size)
+        # 2. 노드 생성
+        logger.info(f"\n[2/3] 노드 생성 중... ({len(entities)}개)")
+        await self._run_stage(
+            "nodes",
+            "nodes_created",
+            self._node_batches(entities, batch_size),
+        )
+        logger.info(f"  ✓ {self._stats['nodes_created']}개 노드 생성됨")
 
-        # 3. 관계 생성
-        await self._batch_create_relationships(triples, batch_size)
+        # 3. 관계 생성 (2차 스트리밍)
+        logger.info(f"\n[3/3] 관계 생성 중... ({self._stats['triples']}개)")
+        await self._run_stage(
+            "relationships",
+            "relationships_created",
+            self._relationship_batches(iter_triples(input_path), batch_size),
+        )
+        logger.info(f"  ✓ {self._stats['relationships_created']}개 관계 생성됨")
 
         return self._stats
 
-    async def _dry_run_analysis(self, triples: list[Triple]) -> dict[str, Any]:
+    def _dry_run_analysis(
+        self,
+        entities: dict[str, dict[str, Any]],
+        relations: dict[str, int],
+    ) -> dict[str, Any]:
         """Dry run 분석"""
-        entities = self._extract_entities(triples)
-        relations = {}
-        for t in triples:
-            relations[t.relation] = relations.get(t.relation, 0) + 1
-
         logger.info("\n[DRY RUN] 분석 결과:")
         logger.info(f"  고유 엔티티: {len(entities)}개")
-        logger.info(f"  관계: {len(triples)}개")
+        logger.info(f"  관계: {self._stats['triples']}개")
         logger.info(f"  고유 관계 타입: {len(relations)}개")
 
         logger.info("\n  관계 타입별 수:")
@@ -115,8 +249,9 @@ class BulkLoader:
             logger.info(f"    - {rel}: {count}개")
 
         return {
+            "triples": self._stats["triples"],
             "nodes_created": len(entities),
-            "relationships_created": len(triples),
+            "relationships_created": self._stats["triples"],
             "dry_run": True,
         }
 
@@ -130,6 +265,11 @@ class BulkLoader:
             CREATE INDEX entity_name_idx IF NOT EXISTS
             FOR (e:Entity) ON (e.name)
             """,
+            # Entity name_norm 인덱스 (대소문자/공백 무시 검색)
+            f"""
+            CREATE INDEX entity_name_norm_idx IF NOT EXISTS
+            FOR (e:Entity) ON (e.{NAME_NORM_PROPERTY})
+            """,
             # Entity type 인덱스
             """
             CREATE INDEX entity_type_idx IF NOT EXISTS
@@ -151,11 +291,16 @@ class BulkLoader:
 
         logger.info("  ✓ 인덱스 생성 완료")
 
-    def _extract_entities(self, triples: list[Triple]) -> dict[str, dict[str, Any]]:
-        """트리플에서 고유 엔티티 추출"""
+    def _extract_entities(
+        self, triples: Iterable[Triple]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, int]]:
+        """트리플 스트림에서 고유 엔티티와 관계 타입별 수 집계"""
         entities: dict[str, dict[str, Any]] = {}
+        relations: dict[str, int] = {}
 
         for triple in triples:
+            relations[triple.relation] = relations.get(triple.relation, 0) + 1
+
             # Subject 엔티티
             subj_key = triple.subject.lower()
             if subj_key not in entities:
@@ -176,108 +321,173 @@ class BulkLoader:
                 }
             entities[obj_key]["mention_count"] += 1
 
-        return entities
+        return entities, relations
 
-    async def _batch_create_nodes(
+    def _node_batches(
         self,
         entities: dict[str, dict[str, Any]],
         batch_size: int,
-    ) -> None:
+    ) -> Iterator[_WriteBatch]:
         """엔티티 노드 배치 생성"""
-        logger.info(f"\n[2/3] 노드 생성 중... ({len(entities)}개)")
+        query = f"""
+        UNWIND $entities AS e
+        MERGE (n:Entity {{name: e.name}})
+        ON CREATE SET
+            n.{NAME_NORM_PROPERTY} = {name_norm_expr("e.name")},
+            n.type = e.type,
+            n.mention_count = e.mention_count,
+            n.created_at = datetime(),
+            n.source = 'bootstrap'
+        ON MATCH SET
+            n.mention_count = n.mention_count + e.mention_count,
+            n.updated_at = datetime()
+        RETURN count(n) as created
+        """
 
         entity_list = list(entities.values())
-
         for i in range(0, len(entity_list), batch_size):
             batch = entity_list[i : i + batch_size]
-
-            query = """
-            UNWIND $entities AS e
-            MERGE (n:Entity {name: e.name})
-            ON CREATE SET
-                n.type = e.type,
-                n.mention_count = e.mention_count,
-                n.created_at = datetime(),
-                n.source = 'bootstrap'
-            ON MATCH SET
-                n.mention_count = n.mention_count + e.mention_count,
-                n.updated_at = datetime()
-            RETURN count(n) as created
-            """
-
-            try:
-                result = await self._client.execute_write(query, {"entities": batch})
-                created = result[0]["created"] if result else 0
-                self._stats["nodes_created"] += created
-            except Exception as e:
-                logger.error(f"  배치 {i // batch_size + 1} 실패: {e}")
-                self._stats["errors"].append(str(e))
-
-        logger.info(f"  ✓ {self._stats['nodes_created']}개 노드 생성됨")
-
-    async def _batch_create_relationships(
+            yield _WriteBatch(
+                label=f"노드 배치 {i // batch_size + 1}",
+                query=query,
+                parameters={"entities": batch},
+                rows=len(batch),
+            )
+
+    def _relationship_batches(
         self,
-        triples: list[Triple],
+        triples: Iterable[Triple],
         batch_size: int,
-    ) -> None:
-        """관계 배치 생성"""
-        logger.info(f"\n[3/3] 관계 생성 중... ({len(triples)}개)")
+    ) -> Iterator[_WriteBatch]:
+        """관계 타입별로 버퍼링하다가 batch_size가 차면 배치 생성"""
+        buffers: dict[str, list[dict[str, Any]]] = {}
+        # 관계 타입 → 정규화된 타입 (유효하지 않으면 None)
+        safe_types: dict[str, str | None] = {}
 
-        # 관계 타입별 그룹화
-        by_type: dict[str, list[dict[str, Any]]] = {}
         for triple in triples:
             rel_type = triple.relation
-            if rel_type not in by_type:
-                by_type[rel_type] = []
-
-            by_type[rel_type].append({
-                "subject": triple.subject,
-                "object": triple.object,
-                "confidence": triple.confidence,
-                "source_text": triple.source_text[:200] if triple.source_text else "",
-            })
-
-        # 타입별 배치 생성
-        for rel_type, rel_data in by_type.items():
-            # 관계 타입 정규화 (SCREAMING_SNAKE_CASE with validation)
-            try:
-                safe_rel_type = normalize_relation_type(rel_type)
-            except ValueError as e:
-                logger.warning(f"  Skipping invalid relation type '{rel_type}': {e}")
+            if rel_type not in safe_types:
+                # 관계 타입 정규화 (SCREAMING_SNAKE_CASE with validation)
+                try:
+                    safe_types[rel_type] = normalize_relation_type(rel_type)
+                except ValueError as e:
+                    logger.warning(f"  Skipping invalid relation type '{rel_type}': {e}")
+                    safe_types[rel_type] = None
+            if safe_types[rel_type] is None:
                 continue
 
-            for i in range(0, len(rel_data), batch_size):
-                batch = rel_data[i : i + batch_size]
-
-                query = f"""
-                UNWIND $relations AS r
-                MATCH (a:Entity {{name: r.subject}})
-                MATCH (b:Entity {{name: r.object}})
-                MERGE (a)-[rel:{safe_rel_type}]->(b)
-                ON CREATE SET
-                    rel.confidence = r.confidence,
-                    rel.source_text = r.source_text,
-                    rel.created_at = datetime()
-                ON MATCH SET
-                    rel.confidence = CASE
-                        WHEN r.confidence > rel.confidence THEN r.confidence
-                        ELSE rel.confidence
-                    END,
-                    rel.updated_at = datetime()
-                RETURN count(rel) as created
-                """
+            buffer = buffers.setdefault(rel_type, [])
+            buffer.append(
+                {
+                    "subject": triple.subject,
+                    "object": triple.object,
+                    "confidence": triple.confidence,
+                    "source_text": triple.source_text[:200]
+                    if triple.source_text
+                    else "",
+                }
+            )
+            if len(buffer) >= batch_size:
+                yield self._relationship_batch(rel_type, safe_types[rel_type], buffer)
+                buffers[rel_type] = []
+
+        # 남은 버퍼 flush
+        for rel_type, buffer in buffers.items():
+            if buffer:
+                yield self._relationship_batch(rel_type, safe_types[rel_type], buffer)
+
+    def _relationship_batch(
+        self,
+        rel_type: str,
+        safe_rel_type: str | None,
+        relations: list[dict[str, Any]],
+    ) -> _WriteBatch:
+        """관계 타입 하나에 대한 쓰기 배치"""
+        query = f"""
+        UNWIND $relations AS r
+        MATCH (a:Entity {{name: r.subject}})
+        MATCH (b:Entity {{name: r.object}})
+        MERGE (a)-[rel:{safe_rel_type}]->(b)
+        ON CREATE SET
+            rel.confidence = r.confidence,
+            rel.source_text = r.source_text,
+            rel.created_at = datetime()
+        ON MATCH SET
+            rel.confidence = CASE
+                WHEN r.confidence > rel.confidence THEN r.confidence
+                ELSE rel.confidence
+            END,
+            rel.updated_at = datetime()
+        RETURN count(rel) as created
+        """
+        return _WriteBatch(
+            label=f"{rel_type} 배치",
+            query=query,
+            parameters={"relations": relations},
+            rows=len(relations),
+        )
+
+    async def _run_stage(
+        self,
+        stage: str,
+        stat_key: str,
+        batches: Iterable[_WriteBatch],
+    ) -> None:
+        """
+        배치를 parallel 개의 워커로 동시에 쓰기
+
+        큐 크기를 워커 수의 2배로 제한해 입력 스트리밍이
+        쓰기 속도보다 앞서 메모리에 쌓이지 않도록 합니다.
+        """
+        queue: asyncio.Queue[_WriteBatch | None] = asyncio.Queue(
+            maxsize=self._parallel * 2
+        )
+        rows_written = 0
+        started = time.perf_counter()
 
+        async def worker() -> None:
+            nonlocal rows_written
+            while (batch := await queue.get()) is not None:
                 try:
-                    result = await self._client.execute_write(
-                        query, {"relations": batch}
-                    )
-                    created = result[0]["created"] if result else 0
-                    self._stats["relationships_created"] += created
+                    result = await self._write_with_retry(batch)
+                    self._stats[stat_key] += result[0]["created"] if result else 0
+                    rows_written += batch.rows
                 except Exception as e:
-                    logger.error(f"  {rel_type} 배치 실패: {e}")
+                    logger.error(f"  {batch.label} 실패: {e}")
                     self._stats["errors"].append(str(e))
 
-        logger.info(f"  ✓ {self._stats['relationships_created']}개 관계 생성됨")
+        workers = [asyncio.create_task(worker()) for _ in range(self._parallel)]
+        try:
+            for batch in batches:
+                await queue.put(batch)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        elapsed = time.perf_counter() - started
+        rate = rows_written / elapsed if elapsed > 0 else 0.0
+        self._stats["throughput"][stage] = round(rate, 1)
+        logger.info(
+            f"  ⏱ {stage}: {rows_written}행 / {elapsed:.1f}s ({rate:,.0f} rows/s)"
+        )
+
+    async def _write_with_retry(self, batch: _WriteBatch) -> list[dict[str, Any]]:
+        """데드락 등 일시적 오류 시 지수 백오프(+jitter)로 재시도"""
+        attempt = 0
+        while True:
+            try:
+                return await self._client.execute_write(batch.query, batch.parameters)
+            except Exception as e:
+                if attempt >= MAX_WRITE_RETRIES or not _is_transient(e):
+                    raise
+                delay = RETRY_BASE_DELAY_SECONDS * (2**attempt)
+                attempt += 1
+                self._stats["retries"] += 1
+                logger.debug(f"  {batch.label} 재시도 {attempt}: {e}")
+                await asyncio.sleep(delay + random.uniform(0, delay))
 
 
 async def verify_load(client: Neo4jClient) -> None:
@@ -320,6 +530,9 @@ async def main():
   # 배치 크기 조정
   python scripts/bulk_load_triples.py --triples triples.json --batch-size 500
 
+  # 8개 세션으로 동시 쓰기 (JSONL 입력)
+  python scripts/bulk_load_triples.py --triples triples.jsonl --parallel 8
+
   # Dry run (실제 로딩 없이 분석만)
   python scripts/bulk_load_triples.py --triples triples.json --dry-run
         """,
@@ -328,7 +541,7 @@ async def main():
     parser.add_argument(
         "--triples",
         required=True,
-        help="입력 트리플 JSON 파일",
+        help="입력 트리플 파일 (JSON 또는 JSONL)",
     )
     parser.add_argument(
         "--batch-size",
@@ -336,6 +549,12 @@ async def main():
         default=1000,
         help="배치 크기 (default: 1000)",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="동시 쓰기 세션 수 (default: 1)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -390,26 +609,31 @@ async def main():
     logger.info(" 트리플 벌크 로딩")
     logger.info("=" * 60)
 
-    # 트리플 로드
+    # 입력 파일 확인 (트리플은 로딩 중 스트리밍으로 읽음)
     logger.info(f"\n입력 파일: {args.triples}")
-    triples = load_triples(args.triples)
-
-    if not triples:
-        logger.error("트리플을 찾을 수 없습니다.")
+    if not Path(args.triples).is_file():
+        logger.error("트리플 파일을 찾을 수 없습니다.")
         sys.exit(1)
 
-    logger.info(f"  ✓ {len(triples)}개 트리플 로드됨")
-
-    # Neo4j 연결
-    client = Neo4jClient(uri=uri, user=user, password=password)
+    # Neo4j 연결 (동시 세션 수만큼 커넥션 풀 확보)
+    client = Neo4jClient(
+        uri=uri,
+        user=user,
+        password=password,
+        max_connection_pool_size=max(50, args.parallel),
+    )
 
     try:
         await client.connect()
         logger.info(f"  ✓ Neo4j 연결 성공: {uri}")
 
         # 벌크 로딩
-        loader = BulkLoader(client, dry_run=args.dry_run)
-        stats = await loader.load_triples(triples, batch_size=args.batch_size)
+        loader = BulkLoader(client, dry_run=args.dry_run, parallel=args.parallel)
+        stats = await loader.load_triples(args.triples, batch_size=args.batch_size)
+
+        if not stats.get("triples"):
+            logger.error("트리플을 찾을 수 없습니다.")
+            sys.exit(1)
 
         # 검증
         if not args.dry_run:
@@ -421,6 +645,11 @@ async def main():
         logger.info("=" * 60)
         logger.info(f"  노드 생성: {stats.get('nodes_created', 0)}개")
         logger.info(f"  관계 생성: {stats.get('relationships_created', 0)}개")
+        for stage, rate in stats.get("throughput", {}).items():
+            logger.info(f"  처리량 ({stage}): {rate:,.0f} rows/s")
+
+        if stats.get("retries"):
+            logger.info(f"  일시적 오류 재시도: {stats['retries']}건")
 
         if stats.get("errors"):
             logger.warning(f"  에러: {len(stats['errors'])}건")
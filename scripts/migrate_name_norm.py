@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+name_norm 백필 마이그레이션 스크립트
+
+이름 조회 쿼리가 사용하는 name_norm 속성(소문자 + 공백 제거)과
+레이블별 range 인덱스를 기존 데이터에 적용합니다.
+누락/불일치 노드만 갱신하므로 여러 번 실행해도 안전합니다.
+
+사용법:
+    python scripts/migrate_name_norm.py --dry-run   # 레이블별 대상 노드 수 미리보기
+    python scripts/migrate_name_norm.py             # 인덱스 생성 + 백필
+    python scripts/migrate_name_norm.py --labels Employee Skill --batch-size 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.domain.constants import (
+    NAME_NORM_INDEXED_LABELS,
+    NAME_NORM_PROPERTY,
+    name_norm_expr,
+)
+from src.infrastructure.neo4j_client import Neo4jClient
+from src.repositories.neo4j_schema_repository import Neo4jSchemaRepository
+from src.repositories.neo4j_validators import validate_identifier
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def count_pending(client: Neo4jClient, label: str) -> int:
+    """name_norm이 누락되었거나 name과 불일치하는 노드 수"""
+    validated_label = validate_identifier(label, "label")
+    results = await client.execute_query(
+        f"""
+        MATCH (n:{validated_label})
+        WHERE n.name IS NOT NULL
+          AND coalesce(n.{NAME_NORM_PROPERTY}, '') <> {name_norm_expr("n.name")}
+        RETURN count(n) AS pending
+        """
+    )
+    return results[0]["pending"] if results else 0
+
+
+async def migrate(
+    client: Neo4jClient,
+    labels: tuple[str, ...],
+    batch_size: int,
+    dry_run: bool,
+) -> dict[str, int]:
+    """인덱스 생성 후 레이블별 백필 실행"""
+    schema_repo = Neo4jSchemaRepository(client)
+    stats: dict[str, int] = {}
+
+    logger.info("=" * 60)
+    logger.info(" name_norm 마이그레이션 시작")
+    logger.info("=" * 60)
+    logger.info(f"Labels: {', '.join(labels)} / Dry run: {dry_run}")
+
+    if dry_run:
+        for label in labels:
+            stats[label] = await count_pending(client, label)
+            logger.info(f"  [DRY RUN] {label}: {stats[label]}개 노드 갱신 예정")
+        return stats
+
+    logger.info("\n[1/2] 인덱스 생성 중...")
+    await schema_repo.ensure_name_norm_indexes(labels)
+    logger.info("  ✓ 인덱스 생성 완료")
+
+    logger.info("\n[2/2] name_norm 백필 중...")
+    for label in labels:
+        stats[label] = await schema_repo.backfill_name_norm(label, batch_size)
+        logger.info(f"  ✓ {label}: {stats[label]}개 노드 갱신")
+    # 앱 기동 시 1회 백필(backfill_name_norm_once)이 같은 레이블을 다시 스캔하지 않도록 기록
+    await schema_repo.mark_name_norm_backfilled(labels)
+
+    logger.info("=" * 60)
+    logger.info(f" 마이그레이션 완료: 총 {sum(stats.values())}개 노드")
+    logger.info("=" * 60)
+    return stats
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="name_norm 속성/인덱스 백필")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="실제 DB 변경 없이 대상 노드 수만 출력",
+    )
+    parser.add_argument(
+        "--labels",
+        nargs="+",
+        default=list(NAME_NORM_INDEXED_LABELS),
+        help="대상 레이블 (default: 도메인 레이블 + Concept + Entity)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10000,
+        help="트랜잭션당 갱신 노드 수 (default: 10000)",
+    )
+    parser.add_argument(
+        "--uri",
+        default="bolt://localhost:7687",
+        help="Neo4j URI (default: bolt://localhost:7687)",
+    )
+    parser.add_argument(
+        "--user",
+        default="neo4j",
+        help="Neo4j 사용자 (default: neo4j)",
+    )
+    parser.add_argument(
+        "--password",
+        default="password123",
+        help="Neo4j 비밀번호",
+    )
+
+    args = parser.parse_args()
+
+    client = Neo4jClient(
+        uri=args.uri,
+        user=args.user,
+        password=args.password,
+    )
+
+    try:
+        await client.connect()
+        logger.info(f"✓ Neo4j 연결 성공: {args.uri}")
+        await migrate(client, tuple(args.labels), args.batch_size, args.dry_run)
+    except Exception as e:
+        logger.error(f"❌ 오류: {e}")
+        sys.exit(1)
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -26,6 +26,7 @@ from typing import Any
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.domain.constants import NAME_NORM_PROPERTY, name_norm_expr
 from src.domain.ontology.loader import OntologyLoader
 from src.infrastructure.neo4j_client import Neo4jClient
 
@@ -109,6 +110,11 @@ class OntologyMigrator:
             CREATE INDEX concept_name_idx IF NOT EXISTS
             FOR (c:Concept) ON (c.name)
             """,
+            # name_norm 검색용 인덱스 (대소문자/공백 무시 조회)
+            f"""
+            CREATE INDEX concept_name_norm_idx IF NOT EXISTS
+            FOR (c:Concept) ON (c.{NAME_NORM_PROPERTY})
+            """,
             # type별 필터링 인덱스
             """
             CREATE INDEX concept_type_idx IF NOT EXISTS
@@ -273,9 +279,9 @@ class OntologyMigrator:
         if not concepts:
             return
 
-        query = """
+        query = f"""
         UNWIND $concepts AS c
-        MERGE (concept:Concept {name: c.name, type: c.type})
+        MERGE (concept:Concept {{name: c.name, type: c.type}})
         ON CREATE SET
             concept.description = c.description,
             concept.is_canonical = c.is_canonical,
@@ -283,6 +289,7 @@ class OntologyMigrator:
             concept.source = 'yaml_migration'
         ON MATCH SET
             concept.updated_at = datetime()
+        SET concept.{NAME_NORM_PROPERTY} = {name_norm_expr("c.name")}
         RETURN count(concept) as created
         """
 
@@ -27,7 +27,7 @@ async def run_verification():
 
     # Mock Neo4j
     mock_neo4j = MagicMock(spec=Neo4jRepository)
-    mock_neo4j.find_entities_by_name = AsyncMock(return_value=[])
+    mock_neo4j.find_entities_by_names = AsyncMock(return_value={})
     mock_neo4j.execute_cypher = AsyncMock(return_value=[])
 
     # 스키마 사전 로드 (파이프라인 초기화 전)
@@ -1,15 +1,42 @@
 """
 Job Store
 
-비동기 작업 상태를 관리하는 인메모리 저장소
+비동기 작업 상태 저장소
+
+- JobStore: 저장소 백엔드 인터페이스
+- InMemoryJobStore: 프로세스 로컬 (단일 워커/테스트용)
+- SQLiteJobStore: SQLite(WAL) 파일 공유 — 같은 호스트의 여러 워커가 동일 상태 조회,
+  재시작 후에도 작업 이력 유지
+- JobProgressReporter: 배치 단위 진행 카운터를 모아 일정 주기로만 저장소에 반영
+
+완료/실패 작업은 보존 기간(retention)과 최대 개수를 넘으면 생성 시점에 정리됩니다.
+진행 중 상태로 stale_seconds 이상 갱신이 없는 작업(워커 종료로 버려진 작업)은
+같은 시점에 실패로 전환됩니다.
 """
 
+import asyncio
+import sqlite3
+import time
 import uuid
+from abc import ABC, abstractmethod
+from contextlib import closing
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
+from pathlib import Path
 from threading import Lock
-from typing import ClassVar
+from typing import Any
+
+from src.config import Settings, get_settings
+
+# 정리 대상 상태 (진행 중인 작업은 보존)
+FINISHED_STATUSES = ("completed", "failed")
+# 갱신이 끊기면 실패로 전환하는 상태
+ACTIVE_STATUSES = ("pending", "running")
+
+DEFAULT_RETENTION_SECONDS = 86400
+DEFAULT_MAX_FINISHED_JOBS = 1000
+DEFAULT_STALE_SECONDS = 3600
 
 
 class JobStatus(str, Enum):
@@ -38,27 +65,108 @@ class JobState:
     updated_at: datetime = field(default_factory=datetime.now)
 
 
-class JobStore:
+class JobStore(ABC):
+    """
+    Job 저장소 인터페이스
+
+    update_job은 None이 아닌 필드만 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        stale_seconds: float = DEFAULT_STALE_SECONDS,
+    ) -> None:
+        self._retention_seconds = retention_seconds
+        self._max_finished_jobs = max_finished_jobs
+        self._stale_seconds = stale_seconds
+
+    @abstractmethod
+    def create_job(self) -> str:
+        """새 작업 생성 및 job_id 반환"""
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> JobState | None:
+        """작업 상태 조회"""
+
+    @abstractmethod
+    def update_job(
+        self,
+        job_id: str,
+        status: JobStatus | None = None,
+        progress: float | None = None,
+        total_documents: int | None = None,
+        total_nodes: int | None = None,
+        total_edges: int | None = None,
+        failed_documents: int | None = None,
+        duration_seconds: float | None = None,
+        error: str | None = None,
+    ) -> None:
+        """작업 상태 업데이트"""
+
+    @abstractmethod
+    def delete_job(self, job_id: str) -> None:
+        """작업 삭제"""
+
+    @abstractmethod
+    def list_jobs(self, limit: int = 100) -> list[JobState]:
+        """최근 작업 목록 조회"""
+
+    @abstractmethod
+    def evict_finished(self) -> int:
+        """
+        보존 기간이 지났거나 최대 개수를 넘은 완료/실패 작업 삭제
+
+        삭제 전에 갱신이 끊긴 대기/진행 중 작업을 실패로 전환합니다.
+
+        Returns:
+            삭제된 작업 수
+        """
+
+    @abstractmethod
+    def fail_stale(self) -> int:
+        """
+        stale_seconds 동안 갱신이 없는 대기/진행 중 작업을 실패로 전환
+
+        Returns:
+            실패 처리된 작업 수
+        """
+
+    def _retention_cutoff(self) -> datetime:
+        return datetime.now() - timedelta(seconds=self._retention_seconds)
+
+    def _stale_cutoff(self) -> datetime:
+        return datetime.now() - timedelta(seconds=self._stale_seconds)
+
+    def _stale_error(self) -> str:
+        return (
+            f"Job abandoned: no progress for {self._stale_seconds:g}s "
+            "(worker stopped or restarted)"
+        )
+
+
+class InMemoryJobStore(JobStore):
     """
     인메모리 Job 저장소
 
     Note:
-        프로덕션에서는 Redis 또는 DB로 대체 필요
-        멀티 워커 환경에서는 공유 저장소 필요
+        프로세스 로컬 — 재시작 시 유실되고 멀티 워커 간 공유되지 않음
     """
 
-    _instance: ClassVar["JobStore | None"] = None
-    _jobs: ClassVar[dict[str, JobState]] = {}
-    _lock: ClassVar[Lock] = Lock()
-
-    def __new__(cls) -> "JobStore":
-        """싱글톤 패턴"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def __init__(
+        self,
+        retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        stale_seconds: float = DEFAULT_STALE_SECONDS,
+    ) -> None:
+        super().__init__(retention_seconds, max_finished_jobs, stale_seconds)
+        self._jobs: dict[str, JobState] = {}
+        self._lock = Lock()
 
     def create_job(self) -> str:
         """새 작업 생성 및 job_id 반환"""
+        self.evict_finished()
         job_id = str(uuid.uuid4())
         with self._lock:
             self._jobs[job_id] = JobState(job_id=job_id)
@@ -121,6 +229,305 @@ class JobStore:
             )
             return jobs[:limit]
 
+    def evict_finished(self) -> int:
+        """보존 기간/최대 개수 초과 완료 작업 삭제"""
+        self.fail_stale()
+        cutoff = self._retention_cutoff()
+        with self._lock:
+            finished = sorted(
+                (j for j in self._jobs.values() if j.status.value in FINISHED_STATUSES),
+                key=lambda j: j.created_at,
+                reverse=True,
+            )
+            evict = [
+                j.job_id
+                for i, j in enumerate(finished)
+                if j.updated_at < cutoff or i >= self._max_finished_jobs
+            ]
+            for job_id in evict:
+                del self._jobs[job_id]
+        return len(evict)
+
+    def fail_stale(self) -> int:
+        """갱신이 끊긴 대기/진행 중 작업을 실패로 전환"""
+        cutoff = self._stale_cutoff()
+        now = datetime.now()
+        with self._lock:
+            stale = [
+                j
+                for j in self._jobs.values()
+                if j.status.value in ACTIVE_STATUSES and j.updated_at < cutoff
+            ]
+            for job in stale:
+                job.status = JobStatus.FAILED
+                job.error = self._stale_error()
+                job.updated_at = now
+        return len(stale)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    SQLite(WAL) Job 저장소
+
+    작업마다 짧은 커넥션을 열어 사용하므로 여러 uvicorn 워커가
+    같은 파일을 안전하게 공유합니다 (WAL: 읽기는 쓰기를 막지 않음).
+    기동 시 이전 프로세스에서 버려진 작업을 실패로 전환합니다.
+    """
+
+    _COLUMNS = (
+        "job_id, status, progress, total_documents, total_nodes, total_edges, "
+        "failed_documents, duration_seconds, error, created_at, updated_at"
+    )
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        busy_timeout_seconds: float = 5.0,
+        stale_seconds: float = DEFAULT_STALE_SECONDS,
+    ) -> None:
+        super().__init__(retention_seconds, max_finished_jobs, stale_seconds)
+        self._db_path = str(db_path)
+        self._busy_timeout = busy_timeout_seconds
+        self._setup()
+        self.fail_stale()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=self._busy_timeout)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _setup(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            # journal_mode는 DB 파일에 영속되므로 최초 1회 설정으로 충분
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingest_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    progress REAL NOT NULL DEFAULT 0,
+                    total_documents INTEGER NOT NULL DEFAULT 0,
+                    total_nodes INTEGER NOT NULL DEFAULT 0,
+                    total_edges INTEGER NOT NULL DEFAULT 0,
+                    failed_documents INTEGER NOT NULL DEFAULT 0,
+                    duration_seconds REAL NOT NULL DEFAULT 0,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ingest_jobs_created_at "
+                "ON ingest_jobs (created_at)"
+            )
+
+    @staticmethod
+    def _row_to_state(row: tuple[Any, ...]) -> JobState:
+        return JobState(
+            job_id=row[0],
+            status=JobStatus(row[1]),
+            progress=row[2],
+            total_documents=row[3],
+            total_nodes=row[4],
+            total_edges=row[5],
+            failed_documents=row[6],
+            duration_seconds=row[7],
+            error=row[8],
+            created_at=datetime.fromisoformat(row[9]),
+            updated_at=datetime.fromisoformat(row[10]),
+        )
+
+    def create_job(self) -> str:
+        """새 작업 생성 및 job_id 반환"""
+        self.evict_finished()
+        job_id = str(uuid.uuid4())
+        now = datetime.now().isoformat()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO ingest_jobs (job_id, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (job_id, JobStatus.PENDING.value, now, now),
+            )
+        return job_id
+
+    def get_job(self, job_id: str) -> JobState | None:
+        """작업 상태 조회"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT {self._COLUMNS} FROM ingest_jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        return self._row_to_state(row) if row else None
+
+    def update_job(
+        self,
+        job_id: str,
+        status: JobStatus | None = None,
+        progress: float | None = None,
+        total_documents: int | None = None,
+        total_nodes: int | None = None,
+        total_edges: int | None = None,
+        failed_documents: int | None = None,
+        duration_seconds: float | None = None,
+        error: str | None = None,
+    ) -> None:
+        """작업 상태 업데이트 (None이 아닌 필드만 단일 UPDATE로 반영)"""
+        fields: dict[str, Any] = {
+            "status": status.value if status is not None else None,
+            "progress": progress,
+            "total_documents": total_documents,
+            "total_nodes": total_nodes,
+            "total_edges": total_edges,
+            "failed_documents": failed_documents,
+            "duration_seconds": duration_seconds,
+            "error": error,
+        }
+        updates = {k: v for k, v in fields.items() if v is not None}
+        updates["updated_at"] = datetime.now().isoformat()
+
+        assignments = ", ".join(f"{column} = ?" for column in updates)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"UPDATE ingest_jobs SET {assignments} WHERE job_id = ?",
+                (*updates.values(), job_id),
+            )
+
+    def delete_job(self, job_id: str) -> None:
+        """작업 삭제"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM ingest_jobs WHERE job_id = ?", (job_id,))
+
+    def list_jobs(self, limit: int = 100) -> list[JobState]:
+        """최근 작업 목록 조회"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT {self._COLUMNS} FROM ingest_jobs "
+                "ORDER BY created_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [self._row_to_state(row) for row in rows]
+
+    def evict_finished(self) -> int:
+        """보존 기간/최대 개수 초과 완료 작업 삭제"""
+        self.fail_stale()
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        with closing(self._connect()) as conn, conn:
+            expired = conn.execute(
+                f"DELETE FROM ingest_jobs WHERE status IN ({placeholders}) "
+                "AND updated_at < ?",
+                (*FINISHED_STATUSES, self._retention_cutoff().isoformat()),
+            ).rowcount
+            overflow = conn.execute(
+                f"""
+                DELETE FROM ingest_jobs WHERE job_id IN (
+                    SELECT job_id FROM ingest_jobs
+                    WHERE status IN ({placeholders})
+                    ORDER BY created_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (*FINISHED_STATUSES, self._max_finished_jobs),
+            ).rowcount
+        return expired + overflow
+
+    def fail_stale(self) -> int:
+        """갱신이 끊긴 대기/진행 중 작업을 실패로 전환"""
+        placeholders = ", ".join("?" for _ in ACTIVE_STATUSES)
+        with closing(self._connect()) as conn, conn:
+            return conn.execute(
+                "UPDATE ingest_jobs SET status = ?, error = ?, updated_at = ? "
+                f"WHERE status IN ({placeholders}) AND updated_at < ?",
+                (
+                    JobStatus.FAILED.value,
+                    self._stale_error(),
+                    datetime.now().isoformat(),
+                    *ACTIVE_STATUSES,
+                    self._stale_cutoff().isoformat(),
+                ),
+            ).rowcount
+
+
+class JobProgressReporter:
+    """
+    배치 진행 카운터 누적기
+
+    파이프라인 배치마다 record()로 카운터를 누적하고, 마지막 반영 후
+    flush_interval_seconds가 지났을 때만 저장소에 한 번 씁니다.
+    종료 시 flush()로 남은 값을 반영합니다. 저장소 쓰기(SQLite)는
+    이벤트 루프를 막지 않도록 스레드에서 수행합니다.
+
+    Example:
+        reporter = JobProgressReporter(job_store, job_id, flush_interval_seconds=2)
+        await pipeline.run(loader, on_batch=reporter.record)
+        await reporter.flush()
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        job_id: str,
+        flush_interval_seconds: float = 2.0,
+    ) -> None:
+        self._store = store
+        self._job_id = job_id
+        self._interval = flush_interval_seconds
+        self._counters = {
+            "total_documents": 0,
+            "total_nodes": 0,
+            "total_edges": 0,
+            "failed_documents": 0,
+        }
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    @property
+    def counters(self) -> dict[str, int]:
+        return dict(self._counters)
+
+    async def record(self, batch_stats: dict[str, int]) -> None:
+        """배치 통계 누적 (필요 시 저장소 반영)"""
+        self._counters["total_documents"] += batch_stats.get("docs", 0)
+        self._counters["total_nodes"] += batch_stats.get("total_nodes", 0)
+        self._counters["total_edges"] += batch_stats.get("total_edges", 0)
+        self._counters["failed_documents"] += batch_stats.get("failed_docs", 0)
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self._interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """누적 카운터를 저장소에 반영"""
+        if not self._dirty:
+            return
+        await asyncio.to_thread(
+            self._store.update_job,
+            self._job_id,
+            total_documents=self._counters["total_documents"],
+            total_nodes=self._counters["total_nodes"],
+            total_edges=self._counters["total_edges"],
+            failed_documents=self._counters["failed_documents"],
+        )
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+
+def create_job_store(settings: Settings) -> JobStore:
+    """설정에 따른 Job 저장소 생성 (memory | sqlite)"""
+    if settings.job_store_backend == "sqlite":
+        return SQLiteJobStore(
+            settings.job_store_db_path,
+            retention_seconds=settings.job_store_retention_seconds,
+            max_finished_jobs=settings.job_store_max_finished_jobs,
+            stale_seconds=settings.job_store_stale_seconds,
+        )
+    return InMemoryJobStore(
+        retention_seconds=settings.job_store_retention_seconds,
+        max_finished_jobs=settings.job_store_max_finished_jobs,
+        stale_seconds=settings.job_store_stale_seconds,
+    )
+
 
 # 글로벌 인스턴스
-job_store = JobStore()
+job_store: JobStore = create_job_store(get_settings())
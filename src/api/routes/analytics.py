@@ -330,7 +330,7 @@ async def recommend_team(
             TeamMember(
                 name=m["name"],
                 job_type=m.get("job_type"),
-                community_id=m.get("communityId"),
+                community_id=m.get("community_id"),
                 matched_skills=m.get("matchedSkills", []),
                 skill_count=m.get("skillCount", 0),
             )
@@ -39,10 +39,13 @@ async def refresh_communities(
     3. 커뮤니티 탐지 (Leiden/Louvain)
     4. CommunityMeta 노드에 메타데이터 기록
     5. 프로젝션 정리 (메모리 해제)
+
+    mode=incremental이면 마지막 리프레시 이후 스킬이 바뀐 직원만
+    유사도를 재계산하고 기존 communityId를 시드로 탐지합니다.
     """
     logger.info(
         f"Community refresh request: algorithm={request.algorithm}, "
-        f"gamma={request.gamma}"
+        f"gamma={request.gamma}, mode={request.mode}"
     )
 
     try:
@@ -50,6 +53,7 @@ async def refresh_communities(
             algorithm=request.algorithm,
             gamma=request.gamma,
             min_shared_skills=request.min_shared_skills,
+            mode=request.mode,
         )
 
         return CommunityRefreshResponse(
@@ -59,6 +63,8 @@ async def refresh_communities(
             modularity=result.modularity,
             node_count=result.node_count,
             duration_seconds=result.duration_seconds,
+            mode=result.mode,
+            changed_employee_count=result.changed_employee_count,
         )
 
     except ConcurrentRefreshError as e:
@@ -4,6 +4,7 @@ Ingestion API Routes
 데이터 적재 관련 API 엔드포인트 (비동기 Job 방식)
 """
 
+import asyncio
 import logging
 import re
 import shutil
@@ -13,7 +14,7 @@ from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks, File, HTTPException, UploadFile, status
 
-from src.api.job_store import JobStatus, job_store
+from src.api.job_store import JobProgressReporter, JobStatus, job_store
 from src.api.schemas import (
     FileUploadResponse,
     IngestRequest,
@@ -22,6 +23,12 @@ from src.api.schemas import (
     IngestStatusResponse,
     SourceType,
 )
+from src.config import get_settings
+from src.ingestion.extraction_cache import (
+    ExtractionCache,
+    IngestionCheckpoint,
+    source_key_for_file,
+)
 from src.ingestion.loaders.base import BaseLoader
 from src.ingestion.loaders.csv_loader import CSVLoader
 from src.ingestion.loaders.excel_loader import ExcelLoader
@@ -84,9 +91,25 @@ async def _run_ingestion_job(
     """
     logger.info(f"[Job {job_id}] Starting ingestion...")
 
-    job_store.update_job(job_id, status=JobStatus.RUNNING, progress=0.1)
+    # 작업 저장소(SQLite 가능) I/O는 이벤트 루프를 막지 않도록 스레드에서 수행
+    await asyncio.to_thread(
+        job_store.update_job, job_id, status=JobStatus.RUNNING, progress=0.1
+    )
+
+    settings = get_settings()
+    extraction_cache: ExtractionCache | None = None
+    checkpoint: IngestionCheckpoint | None = None
+    resume_key: str | None = None
+    succeeded = False
 
     try:
+        # 추출 캐시 / 재개 체크포인트 (로컬 SQLite)
+        if settings.extraction_cache_enabled:
+            extraction_cache = ExtractionCache(settings.extraction_cache_path)
+        if settings.ingest_resume_enabled:
+            checkpoint = IngestionCheckpoint(settings.extraction_cache_path)
+            resume_key = source_key_for_file(file_path)
+
         # 로더 생성 (BaseLoader 타입으로 명시하여 mypy 에러 방지)
         loader: BaseLoader
         if request.source_type == SourceType.CSV:
@@ -102,19 +125,36 @@ async def _run_ingestion_job(
         pipeline = IngestionPipeline(
             batch_size=request.batch_size,
             concurrency=request.concurrency,
+            extraction_cache=extraction_cache,
+            checkpoint=checkpoint,
         )
 
         start_time = time.time()
-        job_store.update_job(job_id, progress=0.3)
+        await asyncio.to_thread(job_store.update_job, job_id, progress=0.3)
 
-        stats = await pipeline.run(loader)
+        # 배치별 진행 카운터는 누적 후 주기적으로만 저장소에 반영
+        reporter = JobProgressReporter(
+            job_store,
+            job_id,
+            flush_interval_seconds=settings.job_progress_flush_interval_seconds,
+        )
+        try:
+            stats = await pipeline.run(
+                loader, on_batch=reporter.record, resume_key=resume_key
+            )
+        finally:
+            # 실패해도 누적된 진행 카운터를 종료 상태 기록 전에 반영
+            await reporter.flush()
         duration = time.time() - start_time
+        succeeded = True
 
         # 완료 상태 업데이트
-        job_store.update_job(
+        await asyncio.to_thread(
+            job_store.update_job,
             job_id,
             status=JobStatus.COMPLETED,
             progress=1.0,
+            total_documents=stats["total_docs"] + stats["skipped_docs"],
             total_nodes=stats["total_nodes"],
             total_edges=stats["total_edges"],
             failed_documents=stats["failed_docs"],
@@ -128,14 +168,26 @@ async def _run_ingestion_job(
 
     except Exception as e:
         logger.error(f"[Job {job_id}] Failed: {e}")
-        job_store.update_job(
+        await asyncio.to_thread(
+            job_store.update_job,
             job_id,
             status=JobStatus.FAILED,
             error=str(e),
         )
     finally:
+        for store in (extraction_cache, checkpoint):
+            if store is not None:
+                store.close()
+
+        # 재개 가능하면 실패한 파일은 남겨 동일 경로 재요청 시 이어서 적재
+        keep_for_resume = not succeeded and resume_key is not None
+        if keep_for_resume:
+            logger.info(
+                f"[Job {job_id}] Keeping {file_path} for resume "
+                "(re-submit the same file_path to continue)"
+            )
         # Ingestion 완료/실패 후 업로드된 임시 파일 삭제
-        if file_path.exists() and UPLOAD_DIR in file_path.parents:
+        elif file_path.exists() and UPLOAD_DIR in file_path.parents:
             try:
                 file_path.unlink()
                 logger.info(f"[Job {job_id}] Deleted processed file: {file_path}")
@@ -190,7 +242,7 @@ async def ingest(
         )
 
     # Job 생성
-    job_id = job_store.create_job()
+    job_id = await asyncio.to_thread(job_store.create_job)
     logger.info(f"Created job: {job_id}")
 
     # 백그라운드 태스크 등록
@@ -221,7 +273,7 @@ async def get_ingest_status(job_id: str) -> IngestStatusResponse:
     Returns:
         작업 상태 및 통계
     """
-    job = job_store.get_job(job_id)
+    job = await asyncio.to_thread(job_store.get_job, job_id)
 
     if not job:
         raise HTTPException(
@@ -255,7 +307,7 @@ async def list_ingest_jobs(limit: int = 20) -> list[IngestStatusResponse]:
     Returns:
         최근 작업 목록
     """
-    jobs = job_store.list_jobs(limit=limit)
+    jobs = await asyncio.to_thread(job_store.list_jobs, limit)
 
     return [
         IngestStatusResponse(
@@ -26,6 +26,7 @@ from src.api.schemas.visualization import (
 )
 from src.api.utils.graph_utils import get_node_style, sanitize_props
 from src.dependencies import get_graph_pipeline, get_neo4j_repository
+from src.domain.constants import NAME_NORM_PROPERTY, name_norm_expr, name_norm_match
 from src.domain.validators import validate_cypher_identifier, validate_read_only_cypher
 from src.graph.pipeline import GraphRAGPipeline
 from src.repositories.neo4j_repository import Neo4jRepository
@@ -82,7 +83,7 @@ async def get_subgraph(
             )
             center_query = f"""
             MATCH (n{label_filter})
-            WHERE toLower(n.name) = toLower($node_name)
+            WHERE {name_norm_match("n", "node_name")}
             RETURN elementId(n) as node_id, labels(n) as labels, properties(n) as props
             LIMIT 1
             """
@@ -650,7 +651,7 @@ def _build_path_visualization_query(
     # 노드와 관계를 모두 추출하는 쿼리 (SIMILAR 제외, 시각화용 제한)
     query = f"""
     MATCH (start)
-    WHERE ANY(name IN $start_names WHERE toLower(start.name) = toLower(name))
+    WHERE start.{NAME_NORM_PROPERTY} IN [name IN $start_names | {name_norm_expr("name")}]
     CALL {{
         WITH start
         MATCH path = (start)-[*1..{hop_count}]-(connected)
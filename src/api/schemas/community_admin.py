@@ -28,6 +28,10 @@ class CommunityRefreshRequest(BaseModel):
         le=10,
         description="유사도 계산 시 최소 공유 스킬 수",
     )
+    mode: Literal["full", "incremental"] = Field(
+        default="full",
+        description="full: 전체 재구축, incremental: 변경 직원만 유사도 재계산",
+    )
 
 
 class CommunityRefreshResponse(BaseModel):
@@ -39,6 +43,8 @@ class CommunityRefreshResponse(BaseModel):
     modularity: float = Field(description="모듈성 점수 (0~1, 높을수록 좋음)")
     node_count: int = Field(description="communityId가 부여된 노드 수")
     duration_seconds: float = Field(description="실행 시간 (초)")
+    mode: str = Field(description="실제 실행 모드 (증분 불가 시 full)")
+    changed_employee_count: int = Field(description="유사도를 재계산한 직원 수")
 
 
 class CommunityStatusResponse(BaseModel):
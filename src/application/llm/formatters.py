@@ -142,7 +142,7 @@ def format_results(results: list[dict[str, Any]]) -> str:
 
     MAX_PAIR_ROWS = 60  # row 단위로 직접 보여줄 최대 개수
     MAX_PROP_DISPLAY = 6  # 한 노드의 표시 속성 수
-    SKIP_PROPS = {"embedding", "vector", "id"}
+    SKIP_PROPS = {"embedding", "embedding_text", "vector", "id"}
 
     def _is_node(value: Any) -> bool:
         return (
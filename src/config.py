@@ -171,6 +171,22 @@ class Settings(BaseSettings):
         ge=1.0,
         description="Neo4j 연결 타임아웃 (초)",
     )
+    gds_algorithm_workers: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="GDS 알고리즘(프로젝션/커뮤니티 탐지) 전용 스레드 수",
+    )
+    gds_read_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="GDS 읽기 쿼리 스레드 수 (비동기 Neo4j 클라이언트 미사용 시)",
+    )
+    schema_snapshot_path: str | None = Field(
+        default=None,
+        description="그래프 스키마 스냅샷 파일 경로 (설정 시 스냅샷으로 즉시 기동 후 백그라운드 갱신)",
+    )
 
     # ============================================
     # Azure OpenAI 설정 (모델 버전 비의존적)
@@ -225,6 +241,26 @@ class Settings(BaseSettings):
         le=3072,
         description="Embedding 벡터 차원",
     )
+    embedding_batch_size: int = Field(
+        default=256,
+        ge=1,
+        le=2048,
+        description="Embedding API 요청당 최대 입력 텍스트 수",
+    )
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        description="내용 해시 기반 임베딩 캐시 활성화 여부",
+    )
+    embedding_cache_max_entries: int = Field(
+        default=4096,
+        ge=1,
+        le=1000000,
+        description="임베딩 메모리 LRU 최대 항목 수",
+    )
+    embedding_cache_db_path: str | None = Field(
+        default=None,
+        description="임베딩 디스크 캐시 SQLite 경로 (None이면 메모리 캐시만 사용)",
+    )
 
     # ============================================
     # Vector Search 설정
@@ -235,16 +271,76 @@ class Settings(BaseSettings):
         le=1.0,
         description="Vector Search 유사도 임계값",
     )
+    entity_vector_fallback_enabled: bool = Field(
+        default=False,
+        description="엔티티 해석 문자열 매칭 실패 시 벡터 유사도 폴백 (임베딩 백필 필요)",
+    )
+    entity_vector_match_threshold: float = Field(
+        default=0.88,
+        ge=0.0,
+        le=1.0,
+        description="엔티티 벡터 폴백 최소 유사도",
+    )
     query_cache_ttl_hours: int = Field(
         default=24,
         ge=1,
         le=168,
         description="질문-Cypher 캐시 TTL (시간)",
     )
+    result_cache_enabled: bool = Field(
+        default=True,
+        description="Cypher 결과 캐시 활성화 여부 (그래프 버전 변경 시 무효화)",
+    )
+    result_cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        le=100000,
+        description="Cypher 결과 캐시 최대 항목 수 (LRU 퇴출)",
+    )
+    result_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=1,
+        le=86400,
+        description="Cypher 결과 캐시 TTL (초, 다른 프로세스의 쓰기 반영 최대 지연)",
+    )
+    result_cache_max_rows: int = Field(
+        default=1000,
+        ge=1,
+        le=100000,
+        description="결과 캐시에 저장할 최대 결과 행 수 (초과 시 캐시하지 않음)",
+    )
+    skill_matrix_max_age_seconds: int = Field(
+        default=300,
+        ge=1,
+        le=86400,
+        description="직원×스킬 인메모리 행렬 최대 사용 시간 (초, 지나면 전체 재적재 — 다른 프로세스의 쓰기 반영 최대 지연)",
+    )
+    query_cache_maintenance_interval_seconds: int = Field(
+        default=60,
+        ge=1,
+        le=3600,
+        description="질문 캐시 히트 카운트 반영 + 만료 정리 주기 (초)",
+    )
     vector_search_enabled: bool = Field(
         default=True,
         description="Vector Search 기능 활성화 여부",
     )
+    query_cache_local_enabled: bool = Field(
+        default=True,
+        description="프로세스 내 L1 질문 캐시 활성화 여부 (Neo4j 캐시 앞단)",
+    )
+    query_cache_local_max_entries: int = Field(
+        default=512,
+        ge=1,
+        le=100000,
+        description="L1 질문 캐시 최대 항목 수 (LRU 퇴출)",
+    )
+    query_cache_local_ttl_seconds: int = Field(
+        default=600,
+        ge=1,
+        le=86400,
+        description="L1 질문 캐시 TTL (초, 워커 간 무효화 미전파 시 최대 지연)",
+    )
 
     # ============================================
     # Cypher Self-Correction 설정
@@ -260,6 +356,20 @@ class Settings(BaseSettings):
         description="Cypher 재생성 최대 횟수 (재시도당 HEAVY 호출 +1)",
     )
 
+    # ============================================
+    # Multi-hop 병렬 실행 설정
+    # ============================================
+    multi_hop_parallel_enabled: bool = Field(
+        default=True,
+        description="독립 홉으로 분해된 질문의 홉별 Cypher 생성/실행 동시 수행",
+    )
+    multi_hop_max_concurrency: int = Field(
+        default=3,
+        ge=1,
+        le=10,
+        description="동시에 처리할 홉 수 상한 (홉당 HEAVY 호출 1회)",
+    )
+
     # ============================================
     # 온톨로지 설정
     # ============================================
@@ -267,6 +377,10 @@ class Settings(BaseSettings):
         default="yaml",
         description="온톨로지 로더 모드 (yaml: YAML 파일, neo4j: Neo4j DB, hybrid: Neo4j 우선 + YAML 폴백)",
     )
+    ontology_snapshot_enabled: bool = Field(
+        default=True,
+        description="neo4j/hybrid 모드에서 Concept 그래프를 메모리 스냅샷으로 적재하여 조회",
+    )
 
     # 채팅 온톨로지 업데이트 설정
     chat_auto_approve_enabled: bool = Field(
@@ -341,6 +455,76 @@ class Settings(BaseSettings):
         default="checkpoints.db",
         description="SQLite checkpointer DB 경로 (':memory:'면 MemorySaver 사용)",
     )
+    checkpointer_message_window: int = Field(
+        default=20,
+        ge=0,
+        le=500,
+        description="세션별 체크포인트에 유지할 최근 메시지 수 (0이면 제한 없음)",
+    )
+    checkpointer_summarize_trimmed: bool = Field(
+        default=True,
+        description="윈도우 밖 메시지를 사용자 질문 요약 메시지로 남길지 여부",
+    )
+    checkpointer_thread_ttl_seconds: int = Field(
+        default=86400,
+        ge=0,
+        description="마지막 사용 후 세션(thread) 체크포인트 보존 시간 (초, 0이면 정리 안 함)",
+    )
+    checkpointer_prune_interval_seconds: int = Field(
+        default=600,
+        ge=10,
+        le=86400,
+        description="만료 세션 체크포인트 정리 주기 (초)",
+    )
+
+    # ============================================
+    # Ingestion Job 저장소 설정
+    # ============================================
+    job_store_backend: Literal["memory", "sqlite"] = Field(
+        default="memory",
+        description="적재 작업 상태 저장소 (memory: 프로세스 로컬, sqlite: 워커 간 공유/영속)",
+    )
+    job_store_db_path: str = Field(
+        default="jobs.db",
+        description="SQLite 작업 저장소 경로 (job_store_backend=sqlite일 때)",
+    )
+    job_store_retention_seconds: int = Field(
+        default=86400,
+        ge=60,
+        description="완료/실패 작업 보존 시간 (초)",
+    )
+    job_store_max_finished_jobs: int = Field(
+        default=1000,
+        ge=1,
+        description="보존할 완료/실패 작업 최대 개수 (초과 시 오래된 순 삭제)",
+    )
+    job_store_stale_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description="대기/진행 중 작업이 이 시간(초) 동안 갱신이 없으면 실패로 전환 (워커 종료 대비)",
+    )
+    job_progress_flush_interval_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=60.0,
+        description="적재 진행 카운터를 작업 저장소에 반영하는 최소 간격 (초)",
+    )
+
+    # ============================================
+    # Ingestion 추출 캐시 / 재개 설정
+    # ============================================
+    extraction_cache_enabled: bool = Field(
+        default=True,
+        description="행 텍스트+프롬프트+모델 해시 기반 LLM 추출 결과 캐시 사용 여부",
+    )
+    extraction_cache_path: str = Field(
+        default="extraction_cache.db",
+        description="추출 캐시/적재 체크포인트 SQLite 파일 경로",
+    )
+    ingest_resume_enabled: bool = Field(
+        default=True,
+        description="실패한 적재 작업을 마지막 커밋 문서 오프셋부터 재개할지 여부",
+    )
 
     # ============================================
     # 로깅 설정
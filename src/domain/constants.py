@@ -56,9 +56,29 @@ PROJECT_STATUS_ACTIVE_LIST = [PROJECT_STATUS_ACTIVE, PROJECT_STATUS_PLANNED]
 # ── Cypher 패턴 헬퍼 ──────────────────────────────────
 
 
-def tolower_match(field: str, param: str) -> str:
-    """toLower(field) = toLower($param) 조건절 생성."""
-    return f"toLower({field}) = toLower(${param})"
+NAME_NORM_PROPERTY = "name_norm"
+
+# name_norm range 인덱스를 유지하는 레이블 (Concept: 온톨로지, Entity: 벌크 트리플)
+NAME_NORM_INDEXED_LABELS: tuple[str, ...] = (
+    *sorted(ALLOWED_LABELS),
+    "Concept",
+    "Entity",
+)
+
+
+def normalize_name(name: str) -> str:
+    """name_norm 정규화 (trim + 소문자 + 공백 제거). name_norm_expr()과 동일 규칙."""
+    return name.strip().lower().replace(" ", "")
+
+
+def name_norm_expr(expr: str) -> str:
+    """normalize_name()과 동일한 규칙의 Cypher 정규화 식."""
+    return f"replace(toLower(trim({expr})), ' ', '')"
+
+
+def name_norm_match(var: str, param: str) -> str:
+    """var.name_norm = normalize($param) 조건절 생성 (name_norm 인덱스 사용)."""
+    return f"{var}.{NAME_NORM_PROPERTY} = {name_norm_expr('$' + param)}"
 
 
 def active_statuses_literal() -> str:
@@ -66,6 +86,37 @@ def active_statuses_literal() -> str:
     return str(PROJECT_STATUS_ACTIVE_LIST).replace('"', "'")
 
 
+# ── 엔티티 임베딩 ──────────────────────────────────
+
+ENTITY_EMBEDDING_PROPERTY = "embedding"
+# 임베딩 생성에 사용한 텍스트 (변경 감지 → 재임베딩 대상 판별)
+ENTITY_EMBEDDING_TEXT_PROPERTY = "embedding_text"
+
+# 임베딩 대상 레이블 → name 뒤에 덧붙일 핵심 속성
+# (Employee는 오타/별칭 매칭이 목적이므로 이름만 사용)
+ENTITY_EMBEDDING_TEXT_PROPERTIES: dict[str, tuple[str, ...]] = {
+    "Employee": (),
+    "Skill": ("category",),
+    "Project": ("type",),
+    "Department": (),
+}
+ENTITY_EMBEDDING_LABELS: tuple[str, ...] = tuple(ENTITY_EMBEDDING_TEXT_PROPERTIES)
+
+
+def entity_embedding_index_name(label: str) -> str:
+    """레이블별 엔티티 벡터 인덱스 이름 (예: Skill → skill_embedding)"""
+    return f"{label.lower()}_{ENTITY_EMBEDDING_PROPERTY}"
+
+
+def entity_embedding_text_expr(var: str, label: str) -> str:
+    """임베딩 텍스트 Cypher 식 (name + ' | ' + 핵심 속성, null 속성은 생략)"""
+    parts = [f"{var}.name"] + [
+        f"coalesce(' | ' + toString({var}.`{prop}`), '')"
+        for prop in ENTITY_EMBEDDING_TEXT_PROPERTIES.get(label, ())
+    ]
+    return " + ".join(parts)
+
+
 INTENT_DESCRIPTIONS: dict[str, str] = {
     "personnel_search": "관련 인력 정보",
     "project_matching": "참여한 프로젝트 정보",
@@ -14,6 +14,7 @@ Phase 3 추가:
 Phase 4 추가 (Neo4j 마이그레이션):
 - Neo4jOntologyLoader: Neo4j 기반 온톨로지 로더 (별도 import 필요)
 - HybridOntologyLoader: YAML/Neo4j 하이브리드 로더 (별도 import 필요)
+- OntologySnapshot: Neo4j Concept 그래프 불변 메모리 인덱스 (snapshot.py)
 
 Neo4j 로더 사용 예:
     from src.domain.ontology.neo4j_loader import Neo4jOntologyLoader
@@ -242,6 +242,67 @@ class HybridOntologyLoader:
         assert self._yaml_loader is not None
         return self._yaml_loader.expand_concept(term, category, config)
 
+    async def expand_concepts(
+        self,
+        terms: list[str],
+        category: str = "skills",
+        config: ExpansionConfig | None = None,
+    ) -> dict[str, list[str]]:
+        """
+        여러 용어 일괄 개념 확장
+
+        neo4j/hybrid 모드에서는 Neo4j 조회 1회로 모든 용어를 확장하며,
+        hybrid 모드는 확장 결과가 없는 용어만 YAML로 폴백합니다.
+
+        Args:
+            terms: 검색어 목록
+            category: 카테고리
+            config: 확장 설정
+
+        Returns:
+            {검색어: 확장된 개념 목록}
+        """
+        if config is None:
+            config = DEFAULT_EXPANSION_CONFIG
+
+        expanded: dict[str, list[str]] = {}
+        if self._mode == "neo4j":
+            assert self._neo4j_loader is not None
+            expanded = await self._neo4j_loader.expand_concepts(terms, category, config)
+            return expanded
+
+        if self._mode == "hybrid":
+            try:
+                assert self._neo4j_loader is not None
+                result = await self._neo4j_loader.expand_concepts(
+                    terms, category, config
+                )
+                # 확장 결과가 있는 용어만 채택
+                expanded = {t: r for t, r in result.items() if len(r) > 1}
+            except Exception as e:
+                logger.warning(
+                    f"Neo4j expand_concepts failed, falling back to YAML: {e}"
+                )
+
+        assert self._yaml_loader is not None
+        for term in terms:
+            if term not in expanded:
+                expanded[term] = self._yaml_loader.expand_concept(
+                    term, category, config
+                )
+        return expanded
+
+    async def load_snapshot(self) -> bool:
+        """
+        Neo4j Concept 그래프 스냅샷 적재/교체 (neo4j/hybrid 모드)
+
+        Returns:
+            True if 스냅샷 적재 성공
+        """
+        if self._neo4j_loader is None:
+            return False
+        return await self._neo4j_loader.load_snapshot() is not None
+
     async def clear_cache(self) -> None:
         """
         내부 캐시 클리어
@@ -11,20 +11,76 @@ Neo4j 기반 온톨로지 로더
     canonical = await loader.get_canonical("파이썬", "skills")  # "Python"
     synonyms = await loader.get_synonyms("Python", "skills")    # ["Python", "파이썬", ...]
     children = await loader.get_children("Backend", "skills")   # ["Python", "Java", ...]
+    expanded = await loader.expand_concepts(["파이썬", "Backend"], "skills")
+
+개념 확장(expand_concept/expand_concepts)은 용어 목록을 쿼리 1회로 조회하고,
+조회 결과를 버전 관리 캐시에 보관합니다 (clear_cache() 시 버전 증가 + 비움).
+
+load_snapshot()으로 Concept 그래프 전체를 OntologySnapshot으로 적재하면
+get_canonical/get_synonyms/get_children/expand_concepts는 DB 접근 없이
+메모리 인덱스만 조회합니다.
 """
 
+import asyncio
 import logging
+from collections import OrderedDict
 from typing import Any
 
+from src.domain.constants import NAME_NORM_PROPERTY, name_norm_expr, name_norm_match
 from src.domain.ontology.loader import (
     DEFAULT_EXPANSION_CONFIG,
     ExpansionConfig,
     OntologyCategory,
 )
+from src.domain.ontology.snapshot import (
+    SNAPSHOT_CONCEPTS_QUERY,
+    SNAPSHOT_RELATIONSHIPS_QUERY,
+    ConceptLookup,
+    OntologySnapshot,
+)
 from src.infrastructure.neo4j_client import Neo4jClient
 
 logger = logging.getLogger(__name__)
 
+# 개념 확장 조회 캐시 최대 항목 수 (용어 단위)
+EXPANSION_CACHE_MAX_ENTRIES = 4096
+
+# 용어 목록 → canonical/동의어/하위 개념 일괄 조회
+# (get_canonical + get_synonyms + get_children 규칙을 쿼리 1회로 통합)
+EXPAND_CONCEPTS_QUERY = f"""
+UNWIND $terms AS term
+
+// canonical 찾기 (alias → canonical, 또는 이미 canonical)
+OPTIONAL MATCH (exact:Concept {{type: 'skill'}})
+WHERE exact.{NAME_NORM_PROPERTY} = {name_norm_expr("term")}
+OPTIONAL MATCH (exact)-[:SAME_AS]->(target:Concept {{is_canonical: true}})
+WITH term, head(collect(
+    CASE
+        WHEN target IS NOT NULL THEN target.name
+        WHEN exact.is_canonical = true THEN exact.name
+    END
+)) AS canonical_name
+WITH term, canonical_name, coalesce(canonical_name, term) AS resolved
+
+// 동의어 (양방향 SAME_AS)
+OPTIONAL MATCH (c:Concept {{type: 'skill'}})
+WHERE c.{NAME_NORM_PROPERTY} = {name_norm_expr("resolved")}
+OPTIONAL MATCH (c)-[:SAME_AS]-(related:Concept {{type: 'skill'}})
+WITH term, canonical_name, resolved,
+     collect(DISTINCT c.name) AS names, collect(DISTINCT related.name) AS aliases
+
+// 하위 개념 (IS_A 1~3단계, 스킬만)
+OPTIONAL MATCH (parent:Concept)
+WHERE parent.{NAME_NORM_PROPERTY} = {name_norm_expr("resolved")}
+OPTIONAL MATCH (child:Concept)-[:IS_A*1..3]->(parent)
+WHERE child.type = 'skill'
+
+RETURN term,
+       canonical_name AS canonical,
+       names + aliases AS synonyms,
+       collect(DISTINCT child.name) AS children
+"""
+
 
 class Neo4jOntologyLoader:
     """
@@ -44,8 +100,53 @@ class Neo4jOntologyLoader:
             neo4j_client: 연결된 Neo4jClient 인스턴스
         """
         self._client = neo4j_client
+
+        # 개념 확장 조회 캐시 (clear_cache()마다 버전 증가)
+        self._expansion_cache: OrderedDict[str, ConceptLookup] = OrderedDict()
+        self._cache_version = 0
+
+        # 불변 메모리 인덱스 (load_snapshot() 후 모든 조회가 메모리에서 처리)
+        self._snapshot: OntologySnapshot | None = None
+
         logger.info("Neo4jOntologyLoader initialized")
 
+    @property
+    def cache_version(self) -> int:
+        """확장 캐시 버전 (clear_cache() 호출마다 증가)"""
+        return self._cache_version
+
+    @property
+    def snapshot(self) -> OntologySnapshot | None:
+        """현재 온톨로지 스냅샷 (없으면 쿼리 기반 조회)"""
+        return self._snapshot
+
+    async def load_snapshot(self) -> OntologySnapshot | None:
+        """
+        Concept 그래프 전체를 읽어 새 스냅샷으로 교체
+
+        새 스냅샷을 완전히 만든 뒤 참조만 교체하므로 진행 중인 조회는
+        이전 스냅샷 또는 새 스냅샷 중 하나만 보게 됩니다.
+        로드 실패 시 스냅샷을 해제하여 쿼리 기반 조회로 전환합니다
+        (갱신 실패 후 오래된 스냅샷을 계속 쓰지 않도록).
+
+        Returns:
+            적재된 스냅샷 또는 None (실패)
+        """
+        try:
+            concepts, relationships = await asyncio.gather(
+                self._client.execute_query(SNAPSHOT_CONCEPTS_QUERY),
+                self._client.execute_query(SNAPSHOT_RELATIONSHIPS_QUERY),
+            )
+            snapshot = OntologySnapshot.from_records(concepts, relationships)
+        except Exception as e:
+            logger.warning(f"Ontology snapshot load failed, using live queries: {e}")
+            self._snapshot = None
+            return None
+
+        self._snapshot = snapshot
+        logger.info(f"Ontology snapshot loaded: {snapshot.get_stats()}")
+        return snapshot
+
     async def get_canonical(
         self,
         term: str,
@@ -68,14 +169,17 @@ class Neo4jOntologyLoader:
         if category != OntologyCategory.SKILLS:
             return term
 
+        if self._snapshot is not None:
+            return self._snapshot.get_canonical(term)
+
         # Case-insensitive 검색
-        query = """
+        query = f"""
         // 먼저 정확한 이름 매칭 시도
-        OPTIONAL MATCH (exact:Concept {type: 'skill'})
-        WHERE toLower(exact.name) = toLower($term)
+        OPTIONAL MATCH (exact:Concept {{type: 'skill'}})
+        WHERE {name_norm_match("exact", "term")}
 
         // SAME_AS 관계로 canonical 찾기
-        OPTIONAL MATCH (exact)-[:SAME_AS]->(canonical:Concept {is_canonical: true})
+        OPTIONAL MATCH (exact)-[:SAME_AS]->(canonical:Concept {{is_canonical: true}})
 
         RETURN
             CASE
@@ -119,16 +223,19 @@ class Neo4jOntologyLoader:
         if category != OntologyCategory.SKILLS:
             return [term]
 
+        if self._snapshot is not None:
+            return self._snapshot.get_synonyms(term)
+
         # 먼저 canonical 찾기
         canonical = await self.get_canonical(term, category)
 
         # canonical과 연결된 모든 동의어 조회 (양방향)
-        query = """
-        MATCH (c:Concept {type: 'skill'})
-        WHERE toLower(c.name) = toLower($canonical)
+        query = f"""
+        MATCH (c:Concept {{type: 'skill'}})
+        WHERE {name_norm_match("c", "canonical")}
 
         // 양방향 SAME_AS 탐색 (canonical → alias, alias → canonical)
-        OPTIONAL MATCH (c)-[:SAME_AS]-(related:Concept {type: 'skill'})
+        OPTIONAL MATCH (c)-[:SAME_AS]-(related:Concept {{type: 'skill'}})
 
         WITH c, collect(DISTINCT related.name) as aliases
 
@@ -167,10 +274,13 @@ class Neo4jOntologyLoader:
         if category != OntologyCategory.SKILLS:
             return []
 
+        if self._snapshot is not None:
+            return self._snapshot.get_children(concept)
+
         # 재귀적 IS_A 탐색 (최대 3단계)
-        query = """
+        query = f"""
         MATCH (parent:Concept)
-        WHERE toLower(parent.name) = toLower($concept)
+        WHERE {name_norm_match("parent", "concept")}
 
         // 1~3단계 하위 개념 탐색
         OPTIONAL MATCH (child:Concept)-[:IS_A*1..3]->(parent)
@@ -197,7 +307,7 @@ class Neo4jOntologyLoader:
         """
         개념 확장 (동의어 + 하위 개념)
 
-        기존 메서드들을 조합하여 확장 결과를 반환합니다.
+        expand_concepts()의 단일 용어 버전입니다.
 
         Args:
             term: 검색어
@@ -207,42 +317,89 @@ class Neo4jOntologyLoader:
         Returns:
             확장된 개념 목록 (중복 제거, 최대 max_total개)
         """
+        expanded = await self.expand_concepts([term], category, config)
+        return expanded[term]
+
+    async def expand_concepts(
+        self,
+        terms: list[str],
+        category: str = "skills",
+        config: ExpansionConfig | None = None,
+    ) -> dict[str, list[str]]:
+        """
+        여러 용어 일괄 개념 확장
+
+        캐시에 없는 용어만 모아 쿼리 1회(UNWIND)로 canonical/동의어/하위 개념을
+        조회합니다. 조회 실패 시 해당 용어는 원본만 반환하며 캐시하지 않습니다.
+
+        Args:
+            terms: 검색어 목록
+            category: 카테고리
+            config: 확장 설정 (None이면 DEFAULT_EXPANSION_CONFIG 사용)
+
+        Returns:
+            {검색어: 확장된 개념 목록}
+        """
         if config is None:
             config = DEFAULT_EXPANSION_CONFIG
 
         if category != OntologyCategory.SKILLS:
-            return [term]
-
-        result: list[str] = [term]
-        seen: set[str] = {term}
-
+            return {term: [term] for term in terms}
+
+        lookups = await self._lookup_concepts(terms)
+        return {
+            term: lookups[term].expand(term, config) if term in lookups else [term]
+            for term in terms
+        }
+
+    async def _lookup_concepts(self, terms: list[str]) -> dict[str, ConceptLookup]:
+        """스냅샷 → 캐시 → DB 순 조회 (실패 용어는 결과에서 제외)"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return {term: snapshot.lookup(term) for term in terms}
+
+        found: dict[str, ConceptLookup] = {}
+        missing: list[str] = []
+        for term in dict.fromkeys(terms):
+            cached = self._expansion_cache.get(term)
+            if cached is not None:
+                self._expansion_cache.move_to_end(term)
+                found[term] = cached
+            else:
+                missing.append(term)
+
+        if not missing:
+            return found
+
+        # 조회 중 clear_cache()가 호출되면 이전 데이터를 캐시하지 않음
+        version = self._cache_version
         try:
-            # 1. canonical 찾기
-            canonical = await self.get_canonical(term, category)
-            if canonical != term and canonical not in seen:
-                result.append(canonical)
-                seen.add(canonical)
-
-            # 2. 동의어 조회
-            if config.include_synonyms:
-                synonyms = await self.get_synonyms(canonical, category)
-                for syn in synonyms[: config.max_synonyms]:
-                    if syn not in seen:
-                        result.append(syn)
-                        seen.add(syn)
-
-            # 3. 하위 개념 조회
-            if config.include_children:
-                children = await self.get_children(canonical, category)
-                for child in children[: config.max_children]:
-                    if child not in seen:
-                        result.append(child)
-                        seen.add(child)
-
+            results = await self._client.execute_query(
+                EXPAND_CONCEPTS_QUERY, {"terms": missing}
+            )
         except Exception as e:
-            logger.warning(f"expand_concept failed: {e}")
-
-        return result[: config.max_total]
+            logger.warning(f"expand_concepts query failed: {e}")
+            return found
+
+        fetched: dict[str, ConceptLookup] = {}
+        for row in results:
+            term = row["term"]
+            synonyms = [s for s in row.get("synonyms") or [] if s]
+            canonical = row.get("canonical") or term
+            fetched[term] = ConceptLookup(
+                canonical=canonical,
+                synonyms=tuple(dict.fromkeys(synonyms)) or (term,),
+                children=tuple(c for c in row.get("children") or [] if c),
+            )
+
+        if version == self._cache_version:
+            for term, lookup in fetched.items():
+                self._expansion_cache[term] = lookup
+            while len(self._expansion_cache) > EXPANSION_CACHE_MAX_ENTRIES:
+                self._expansion_cache.popitem(last=False)
+
+        found.update(fetched)
+        return found
 
     async def get_all_skills(self) -> list[str]:
         """
@@ -355,6 +512,9 @@ class Neo4jOntologyLoader:
         """
         내부 캐시 클리어
 
-        향후 캐시 추가 시 이 메서드에서 클리어합니다.
+        개념 확장 캐시를 비우고 버전을 올립니다.
+        OntologyRegistry.refresh() → HybridOntologyLoader.clear_cache() 경로로 호출됩니다.
         """
-        pass
+        self._cache_version += 1
+        self._expansion_cache.clear()
+        logger.debug(f"Neo4j ontology cache cleared (version={self._cache_version})")
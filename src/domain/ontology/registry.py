@@ -9,11 +9,14 @@ OntologyRegistry - 온톨로지 로더 생명주기 관리
 - 모드별(yaml/neo4j/hybrid) 로더 초기화
 - Thread-safe 캐시 refresh
 - YAML @lru_cache 및 HybridLoader 내부 캐시 클리어
+- neo4j/hybrid 모드 Concept 그래프 불변 스냅샷 적재 및 refresh 시 교체
 
 사용 패턴:
     # 앱 시작 시 (main.py lifespan)
     registry = OntologyRegistry(neo4j_client, settings)
 
+    await registry.load_snapshot()  # neo4j/hybrid 모드 메모리 인덱스
+
     # Pipeline에 로더 주입
     pipeline = GraphRAGPipeline(..., ontology_loader=registry.get_loader())
 
@@ -79,6 +82,9 @@ class OntologyRegistry:
             self._mode = "yaml"
 
         self._refresh_lock = asyncio.Lock()
+        self._snapshot_enabled = (
+            settings.ontology_snapshot_enabled if settings is not None else True
+        )
 
         # 로더 초기화
         self._loader: OntologyLoader | HybridOntologyLoader
@@ -109,6 +115,22 @@ class OntologyRegistry:
         """
         return self._loader
 
+    async def load_snapshot(self) -> bool:
+        """
+        Concept 그래프 스냅샷 적재 (neo4j/hybrid 모드, 앱 시작 시 1회)
+
+        적재 후 get_canonical/get_synonyms/get_children 조회는 DB 접근 없이
+        메모리 인덱스에서 처리됩니다. 실패 시 기존 쿼리 기반 조회로 동작합니다.
+
+        Returns:
+            True if 스냅샷 적재 성공
+        """
+        if not self._snapshot_enabled or not isinstance(
+            self._loader, HybridOntologyLoader
+        ):
+            return False
+        return await self._loader.load_snapshot()
+
     async def refresh(self) -> bool:
         """
         온톨로지 캐시 새로고침
@@ -168,6 +190,8 @@ class OntologyRegistry:
         HybridOntologyLoader의 내부 캐시를 클리어합니다:
         - YAML 로더 캐시 (hybrid 모드)
         - Neo4j 로더 캐시 (있는 경우)
+
+        스냅샷 사용 시 새 스냅샷을 만든 뒤 참조를 교체합니다.
         """
         try:
             if not isinstance(self._loader, HybridOntologyLoader):
@@ -176,6 +200,8 @@ class OntologyRegistry:
 
             # HybridOntologyLoader의 clear_cache() 메서드 호출
             await self._loader.clear_cache()
+            if self._snapshot_enabled:
+                await self._loader.load_snapshot()
 
             logger.info(f"Hybrid ontology cache refreshed (mode={self._mode})")
             return True
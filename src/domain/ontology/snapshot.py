@@ -0,0 +1,237 @@
+"""
+Ontology Snapshot - Neo4j Concept 그래프의 불변 메모리 인덱스
+
+neo4j/hybrid 모드에서 Concept 노드와 SAME_AS/IS_A 관계 전체를 한 번에 읽어
+조회용 인덱스로 미리 컴파일합니다. 스냅샷은 생성 후 변경되지 않으며,
+갱신은 새 스냅샷을 만들어 참조를 교체하는 방식으로만 이루어집니다.
+
+인덱스 구성:
+- 이름 문자열은 sys.intern()으로 공유
+- alias → canonical 딕셔너리 (name_norm 키)
+- canonical → 동의어 튜플
+- 개념 → 하위 스킬 튜플 (IS_A 역방향 인접 배열로 1~3단계 사전 계산)
+
+조회 규칙은 Neo4jOntologyLoader의 Cypher(get_canonical/get_synonyms/get_children)와 동일합니다.
+"""
+
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.constants import normalize_name
+from src.domain.ontology.loader import ExpansionConfig
+
+# 하위 개념 탐색 최대 깊이 (Cypher IS_A*1..3과 동일)
+MAX_CHILD_DEPTH = 3
+
+# 스냅샷 로드 쿼리
+SNAPSHOT_CONCEPTS_QUERY = """
+MATCH (c:Concept)
+RETURN elementId(c) AS id,
+       c.name AS name,
+       c.type AS type,
+       coalesce(c.is_canonical, false) AS is_canonical
+"""
+
+SNAPSHOT_RELATIONSHIPS_QUERY = """
+MATCH (a:Concept)-[r:SAME_AS|IS_A]->(b:Concept)
+RETURN elementId(a) AS source, type(r) AS rel_type, elementId(b) AS target
+"""
+
+
+@dataclass(frozen=True)
+class ConceptLookup:
+    """용어 1개의 온톨로지 조회 결과 (확장 설정 적용 전 원본)"""
+
+    canonical: str
+    synonyms: tuple[str, ...]
+    children: tuple[str, ...]
+
+    def expand(self, term: str, config: ExpansionConfig) -> list[str]:
+        """확장 설정 적용 (원본 → canonical → 동의어 → 하위 개념 순, 중복 제거)"""
+        result: list[str] = [term]
+        seen: set[str] = {term}
+
+        candidates: list[str] = [self.canonical]
+        if config.include_synonyms:
+            candidates.extend(self.synonyms[: config.max_synonyms])
+        if config.include_children:
+            candidates.extend(self.children[: config.max_children])
+
+        for candidate in candidates:
+            if candidate not in seen:
+                result.append(candidate)
+                seen.add(candidate)
+
+        return result[: config.max_total]
+
+
+class OntologySnapshot:
+    """
+    불변 온톨로지 인덱스
+
+    사용 예시:
+        snapshot = OntologySnapshot.from_records(concepts, relationships)
+        snapshot.get_canonical("파이썬")   # "Python"
+        snapshot.get_synonyms("Python")    # ("Python", "파이썬", ...)
+        snapshot.get_children("Backend")   # ("Python", "Java", ...)
+    """
+
+    __slots__ = (
+        "_canonical_by_norm",
+        "_synonyms_by_norm",
+        "_children_by_norm",
+        "_concept_count",
+        "_relationship_count",
+        "_loaded_at",
+    )
+
+    def __init__(
+        self,
+        canonical_by_norm: dict[str, str],
+        synonyms_by_norm: dict[str, tuple[str, ...]],
+        children_by_norm: dict[str, tuple[str, ...]],
+        concept_count: int = 0,
+        relationship_count: int = 0,
+    ):
+        self._canonical_by_norm = canonical_by_norm
+        self._synonyms_by_norm = synonyms_by_norm
+        self._children_by_norm = children_by_norm
+        self._concept_count = concept_count
+        self._relationship_count = relationship_count
+        self._loaded_at = time.time()
+
+    @classmethod
+    def from_records(
+        cls,
+        concepts: list[dict[str, Any]],
+        relationships: list[dict[str, Any]],
+    ) -> "OntologySnapshot":
+        """
+        Concept/관계 레코드로 스냅샷 컴파일
+
+        Args:
+            concepts: {id, name, type, is_canonical} 목록
+            relationships: {source, rel_type, target} 목록 (elementId 기준)
+        """
+        # 1. 노드 배열 (인덱스 = 정수 ID)
+        index_of: dict[str, int] = {}
+        names: list[str] = []
+        norms: list[str] = []
+        is_skill: list[bool] = []
+        is_canonical: list[bool] = []
+        for record in concepts:
+            name = record.get("name")
+            if not name or record["id"] in index_of:
+                continue
+            index_of[record["id"]] = len(names)
+            names.append(sys.intern(name))
+            norms.append(sys.intern(normalize_name(name)))
+            is_skill.append(record.get("type") == "skill")
+            is_canonical.append(bool(record.get("is_canonical")))
+
+        # 2. 인접 배열 (SAME_AS: 무방향/스킬만, IS_A: 부모 → 자식)
+        same_as: list[list[int]] = [[] for _ in names]
+        canonical_of: dict[int, int] = {}
+        children: list[list[int]] = [[] for _ in names]
+        relationship_count = 0
+        for record in relationships:
+            source = index_of.get(record["source"])
+            target = index_of.get(record["target"])
+            if source is None or target is None:
+                continue
+            relationship_count += 1
+            if record["rel_type"] == "IS_A":
+                children[target].append(source)
+            elif is_skill[source] and is_skill[target]:
+                same_as[source].append(target)
+                same_as[target].append(source)
+                if is_canonical[target]:
+                    canonical_of.setdefault(source, target)
+            elif is_skill[source] and is_canonical[target]:
+                canonical_of.setdefault(source, target)
+
+        # 3. 정규화 이름 → 스킬 노드 (canonical 우선)
+        skill_by_norm: dict[str, int] = {}
+        for idx in sorted(range(len(names)), key=lambda i: not is_canonical[i]):
+            if is_skill[idx]:
+                skill_by_norm.setdefault(norms[idx], idx)
+
+        canonical_by_norm: dict[str, str] = {}
+        synonyms_by_norm: dict[str, tuple[str, ...]] = {}
+        for norm, idx in skill_by_norm.items():
+            if idx in canonical_of:
+                canonical_by_norm[norm] = names[canonical_of[idx]]
+            elif is_canonical[idx]:
+                canonical_by_norm[norm] = names[idx]
+            synonyms_by_norm[norm] = tuple(
+                dict.fromkeys([names[idx], *(names[i] for i in same_as[idx])])
+            )
+
+        # 4. 하위 스킬 사전 계산 (이름이 같은 모든 Concept 기준, 1~3단계)
+        nodes_by_norm: dict[str, list[int]] = {}
+        for idx, norm in enumerate(norms):
+            nodes_by_norm.setdefault(norm, []).append(idx)
+
+        children_by_norm: dict[str, tuple[str, ...]] = {}
+        for norm, roots in nodes_by_norm.items():
+            found: dict[str, None] = {}
+            frontier = [c for root in roots for c in children[root]]
+            visited: set[int] = set(roots)
+            for _ in range(MAX_CHILD_DEPTH):
+                next_frontier: list[int] = []
+                for idx in frontier:
+                    if idx in visited:
+                        continue
+                    visited.add(idx)
+                    if is_skill[idx]:
+                        found[names[idx]] = None
+                    next_frontier.extend(children[idx])
+                frontier = next_frontier
+            if found:
+                children_by_norm[norm] = tuple(found)
+
+        return cls(
+            canonical_by_norm=canonical_by_norm,
+            synonyms_by_norm=synonyms_by_norm,
+            children_by_norm=children_by_norm,
+            concept_count=len(names),
+            relationship_count=relationship_count,
+        )
+
+    # ============================================
+    # 조회 (DB 접근 없음)
+    # ============================================
+
+    def get_canonical(self, term: str) -> str:
+        """canonical 이름 (없으면 원본)"""
+        return self._canonical_by_norm.get(normalize_name(term), term)
+
+    def get_synonyms(self, term: str) -> list[str]:
+        """canonical 기준 동의어 그룹 (canonical 포함, 없으면 [term])"""
+        canonical = self.get_canonical(term)
+        synonyms = self._synonyms_by_norm.get(normalize_name(canonical))
+        return list(synonyms) if synonyms else [term]
+
+    def get_children(self, concept: str) -> list[str]:
+        """하위 스킬 (IS_A 1~3단계)"""
+        return list(self._children_by_norm.get(normalize_name(concept), ()))
+
+    def lookup(self, term: str) -> ConceptLookup:
+        """개념 확장용 조회 결과 (Neo4jOntologyLoader.expand_concepts 규칙과 동일)"""
+        canonical = self.get_canonical(term)
+        norm = normalize_name(canonical)
+        return ConceptLookup(
+            canonical=canonical,
+            synonyms=self._synonyms_by_norm.get(norm, (term,)),
+            children=self._children_by_norm.get(norm, ()),
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "concepts": self._concept_count,
+            "relationships": self._relationship_count,
+            "canonical_terms": len(self._canonical_by_norm),
+            "loaded_at": self._loaded_at,
+        }
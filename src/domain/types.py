@@ -190,6 +190,7 @@ class PipelineMetadata(TypedDict, total=False):
     result_count: int
     execution_path: list[str]
     node_timings: dict[str, float]  # 노드별 소요시간(초) — 관측성/레이턴시 분석
+    result_cache_hit: bool | None  # Cypher 결과 캐시 히트 여부 (None: 미사용)
     query_plan: dict[str, Any] | None
     error: str | None
     _full_state: FullState  # 내부용 상세 상태
@@ -284,6 +285,19 @@ class GraphExecutorUpdate(TypedDict, total=False):
     cypher_error: str | None
     failed_cypher: str | None
     skip_generation: bool  # 캐시 히트 쿼리 실패 시 False로 클리어 (무한루프 방지)
+    result_cache_hit: bool  # 결과 캐시 사용 시에만 세팅
+
+
+class ParallelHopExecutorUpdate(TypedDict, total=False):
+    """ParallelHopExecutor 노드 반환 타입"""
+
+    cypher_query: str  # 홉별 Cypher를 주석 구분으로 연결 (메타데이터/설명용)
+    cypher_parameters: dict[str, Any]
+    graph_results: list[dict[str, Any]]  # 각 행에 _hop(홉 번호) 포함
+    result_count: int
+    node_timings: dict[str, float]  # "parallel_hop_executor.hop_N" 홉별 소요시간
+    execution_path: list[str]
+    error: str | None
 
 
 class ResponseGeneratorUpdate(TypedDict, total=False):
@@ -320,6 +334,7 @@ class QueryHop(TypedDict, total=False):
     relationship: str  # "HAS_SKILL", "MENTORS"
     direction: Literal["outgoing", "incoming", "both"]
     filter_condition: str | None  # "name = 'Python'"
+    sub_question: str | None  # 독립 홉일 때 단독 실행 가능한 하위 질문
 
 
 class QueryPlan(TypedDict, total=False):
@@ -330,6 +345,7 @@ class QueryPlan(TypedDict, total=False):
     hops: list[QueryHop]  # 각 홉 정보
     final_return: str  # 최종 반환 대상 (예: "mentor")
     explanation: str  # 쿼리 해석 설명
+    independent_hops: bool  # 홉 간 의존성 없음 (비교 질문 등) → 홉별 병렬 실행
 
 
 class QueryDecomposerUpdate(TypedDict, total=False):
@@ -359,6 +375,7 @@ class QueryDecompositionResult(TypedDict, total=False):
     hops: list[QueryHop]
     final_return: str
     explanation: str
+    independent_hops: bool
 
 
 # =============================================================================
@@ -1,22 +1,347 @@
 """Checkpointer 팩토리.
 
 설정에 따라 SQLite 영속 또는 MemorySaver를 반환합니다.
+반환된 saver는 CompactCheckpointSaver로 감싸져 체크포인트 크기를 제한합니다:
+- 질문 단위 일시 필드(스키마/결과/임베딩)는 저장하지 않음
+- messages는 최근 N개 윈도우만 유지하고 잘린 부분은 요약 메시지로 압축
+- 일정 기간 사용되지 않은 thread는 백그라운드에서 삭제
 """
 
+import asyncio
+import contextlib
 import logging
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from datetime import datetime
+from typing import Any
 
-from langgraph.checkpoint.base import BaseCheckpointSaver
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
 from langgraph.checkpoint.memory import MemorySaver
 
 logger = logging.getLogger(__name__)
 
+# 질문마다 다시 계산되는 필드 — 세션 간 유지할 필요가 없고 크기가 큼
+TRANSIENT_STATE_KEYS: frozenset[str] = frozenset(
+    {"schema", "graph_results", "question_embedding"}
+)
 
-async def create_checkpointer(db_path: str = ":memory:") -> BaseCheckpointSaver:
+# 잘린 대화를 압축한 요약 메시지 식별자 (윈도우 재적용 시 병합)
+SUMMARY_MESSAGE_ID = "conversation_summary"
+SUMMARY_MAX_LINES = 10
+SUMMARY_LINE_MAX_CHARS = 80
+
+
+def compact_messages(
+    messages: list[BaseMessage], window: int, summarize: bool = True
+) -> list[BaseMessage]:
+    """최근 window개 메시지만 남기고 나머지는 요약 메시지 하나로 압축
+
+    요약은 LLM 호출 없이 잘린 구간의 사용자 질문을 짧게 나열합니다.
+    기존 요약 메시지가 잘린 구간에 있으면 그 내용을 이어 붙입니다.
+
+    Args:
+        messages: 체크포인트의 전체 메시지 리스트
+        window: 유지할 최근 메시지 수 (0 이하면 제한 없음)
+        summarize: False면 잘린 메시지를 요약 없이 버림
+    """
+    if window <= 0:
+        return messages
+
+    summary: BaseMessage | None = None
+    body = messages
+    if messages and messages[0].id == SUMMARY_MESSAGE_ID:
+        summary, body = messages[0], messages[1:]
+
+    if len(body) <= window:
+        return messages
+
+    dropped, kept = body[:-window], body[-window:]
+    if not summarize:
+        return list(kept)
+
+    lines: list[str] = []
+    if summary is not None:
+        lines.extend(str(summary.content).splitlines()[1:])
+    for msg in dropped:
+        if msg.type == "human":
+            lines.append(f"- {str(msg.content)[:SUMMARY_LINE_MAX_CHARS]}")
+    if not lines:
+        return list(kept)
+
+    content = "\n".join(["이전 대화 요약 (사용자 질문):", *lines[-SUMMARY_MAX_LINES:]])
+    return [SystemMessage(content=content, id=SUMMARY_MESSAGE_ID), *kept]
+
+
+class CompactCheckpointSaver(BaseCheckpointSaver):
+    """체크포인트를 작게 유지하는 BaseCheckpointSaver 래퍼
+
+    저장 전에 일시 필드를 제거하고 messages에 윈도우를 적용한 뒤
+    내부 saver(MemorySaver/AsyncSqliteSaver)에 위임합니다.
+    그래프 실행 중 상태는 메모리에 그대로 남으므로 현재 질문 처리에는
+    영향이 없고, 다음 턴이 로드하는 상태만 축소됩니다.
+
+    Example:
+        saver = CompactCheckpointSaver(MemorySaver(), message_window=20)
+        saver.start_pruning(thread_ttl_seconds=86400, interval_seconds=600)
+        await saver.stop_pruning()
+    """
+
+    def __init__(
+        self,
+        saver: BaseCheckpointSaver,
+        *,
+        message_window: int = 0,
+        summarize_trimmed: bool = True,
+        transient_keys: frozenset[str] = TRANSIENT_STATE_KEYS,
+    ):
+        super().__init__(serde=saver.serde)
+        self._saver = saver
+        self._message_window = message_window
+        self._summarize_trimmed = summarize_trimmed
+        self._transient_keys = transient_keys
+        # thread_id → 마지막 저장 시각 (monotonic). None이면 아직 시딩 전
+        self._last_seen: dict[str, float] | None = None
+        self._prune_task: asyncio.Task[None] | None = None
+
+    @property
+    def inner(self) -> BaseCheckpointSaver:
+        """감싸고 있는 실제 saver"""
+        return self._saver
+
+    # ── 슬리밍 ────────────────────────────────────────
+
+    def _compact(self, checkpoint: Checkpoint) -> Checkpoint:
+        values = {
+            k: v
+            for k, v in checkpoint["channel_values"].items()
+            if k not in self._transient_keys
+        }
+        messages = values.get("messages")
+        if isinstance(messages, list):
+            values["messages"] = compact_messages(
+                messages, self._message_window, self._summarize_trimmed
+            )
+        return {**checkpoint, "channel_values": values}
+
+    def _compact_writes(
+        self, writes: Sequence[tuple[str, Any]]
+    ) -> list[tuple[str, Any]]:
+        return [(ch, v) for ch, v in writes if ch not in self._transient_keys]
+
+    def _touch(self, config: RunnableConfig) -> None:
+        if self._last_seen is None:
+            return
+        thread_id = config.get("configurable", {}).get("thread_id")
+        if thread_id is not None:
+            self._last_seen[str(thread_id)] = time.monotonic()
+
+    # ── BaseCheckpointSaver 위임 ─────────────────────
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return self._saver.get_tuple(config)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await self._saver.aget_tuple(config)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        return self._saver.list(config, filter=filter, before=before, limit=limit)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        async for item in self._saver.alist(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield item
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        self._touch(config)
+        return self._saver.put(
+            config, self._compact(checkpoint), metadata, new_versions
+        )
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        self._touch(config)
+        return await self._saver.aput(
+            config, self._compact(checkpoint), metadata, new_versions
+        )
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self._saver.put_writes(config, self._compact_writes(writes), task_id, task_path)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await self._saver.aput_writes(
+            config, self._compact_writes(writes), task_id, task_path
+        )
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._saver.delete_thread(thread_id)
+        if self._last_seen is not None:
+            self._last_seen.pop(thread_id, None)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self._saver.adelete_thread(thread_id)
+        if self._last_seen is not None:
+            self._last_seen.pop(thread_id, None)
+
+    def get_next_version(self, current: Any, channel: Any) -> Any:
+        return self._saver.get_next_version(current, channel)
+
+    # ── TTL 기반 thread 정리 ─────────────────────────
+
+    async def _seed_last_seen(self) -> dict[str, float]:
+        """저장소의 체크포인트 ts로 thread별 마지막 사용 시각 시딩 (최초 1회)"""
+        now_wall, now_mono = time.time(), time.monotonic()
+        latest: dict[str, float] = {}
+        async for item in self._saver.alist(None):
+            thread_id = str(item.config["configurable"]["thread_id"])
+            ts = _parse_ts(item.checkpoint.get("ts"))
+            if ts is not None and ts > latest.get(thread_id, float("-inf")):
+                latest[thread_id] = ts
+        # 벽시계 기준 ts를 monotonic 축으로 변환
+        return {tid: now_mono - (now_wall - ts) for tid, ts in latest.items()}
+
+    async def _stored_last_seen(self, thread_id: str) -> float | None:
+        """저장소의 최신 체크포인트 ts (epoch 초, 다른 워커의 저장 포함)"""
+        item = await self._saver.aget_tuple({"configurable": {"thread_id": thread_id}})
+        if item is None:
+            return None
+        return _parse_ts(item.checkpoint.get("ts"))
+
+    async def prune_threads(self, ttl_seconds: float) -> int:
+        """ttl_seconds 동안 저장이 없던 thread 삭제
+
+        _last_seen은 프로세스 로컬이므로, 삭제 직전에 저장소의 최신 ts를
+        다시 읽어 다른 워커가 이어서 사용 중인 thread는 남깁니다.
+
+        Returns:
+            삭제된 thread 수
+        """
+        if self._last_seen is None:
+            self._last_seen = await self._seed_last_seen()
+
+        now_wall, now_mono = time.time(), time.monotonic()
+        cutoff = now_mono - ttl_seconds
+        candidates = [tid for tid, seen in self._last_seen.items() if seen < cutoff]
+
+        pruned = 0
+        for thread_id in candidates:
+            stored = await self._stored_last_seen(thread_id)
+            if stored is not None and stored >= now_wall - ttl_seconds:
+                self._last_seen[thread_id] = now_mono - (now_wall - stored)
+                continue
+            await self.adelete_thread(thread_id)
+            pruned += 1
+        if pruned:
+            logger.info(f"Pruned {pruned} idle checkpointer threads")
+        return pruned
+
+    def start_pruning(self, thread_ttl_seconds: float, interval_seconds: float) -> None:
+        """만료 thread 정리 백그라운드 태스크 시작 (중복 시작 무시)"""
+        if self._prune_task is not None and not self._prune_task.done():
+            return
+        self._prune_task = asyncio.create_task(
+            self._prune_loop(thread_ttl_seconds, interval_seconds),
+            name="checkpointer_pruning",
+        )
+        logger.info(
+            f"Checkpointer pruning started "
+            f"(ttl={thread_ttl_seconds}s, interval={interval_seconds}s)"
+        )
+
+    async def stop_pruning(self) -> None:
+        """백그라운드 정리 태스크 중지"""
+        if self._prune_task is not None:
+            self._prune_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._prune_task
+            self._prune_task = None
+
+    async def _prune_loop(self, ttl_seconds: float, interval_seconds: float) -> None:
+        while True:
+            try:
+                await self.prune_threads(ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Checkpointer thread pruning failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+
+def _parse_ts(ts: Any) -> float | None:
+    """체크포인트 ts(ISO 8601 문자열)를 epoch 초로 변환"""
+    if not isinstance(ts, str):
+        return None
+    try:
+        return datetime.fromisoformat(ts).timestamp()
+    except ValueError:
+        return None
+
+
+async def create_checkpointer(
+    db_path: str = ":memory:",
+    *,
+    message_window: int = 0,
+    summarize_trimmed: bool = True,
+) -> CompactCheckpointSaver:
     """Checkpointer 인스턴스 생성.
 
     Args:
         db_path: SQLite DB 경로. ':memory:'면 MemorySaver 사용.
+        message_window: 체크포인트에 유지할 최근 메시지 수 (0이면 제한 없음)
+        summarize_trimmed: 윈도우 밖 메시지를 요약 메시지로 남길지 여부
     """
+    saver = await _create_inner_saver(db_path)
+    return CompactCheckpointSaver(
+        saver,
+        message_window=message_window,
+        summarize_trimmed=summarize_trimmed,
+    )
+
+
+async def _create_inner_saver(db_path: str) -> BaseCheckpointSaver:
     if db_path == ":memory:":
         return MemorySaver()
 
@@ -23,6 +23,7 @@ class ResponseMetadataBuilder:
             "result_count": state.get("result_count", 0),
             "execution_path": state.get("execution_path", []),
             "node_timings": state.get("node_timings", {}),
+            "result_cache_hit": state.get("result_cache_hit"),
         }
 
         graph_data = self.build_graph_data(state)
@@ -13,6 +13,7 @@ from src.graph.nodes.entity_resolver import EntityResolverNode
 from src.graph.nodes.graph_executor import GraphExecutorNode
 from src.graph.nodes.intent_entity_extractor import IntentEntityExtractorNode
 from src.graph.nodes.ontology_update_handler import OntologyUpdateHandlerNode
+from src.graph.nodes.parallel_hop_executor import ParallelHopExecutorNode
 from src.graph.nodes.query_decomposer import QueryDecomposerNode
 from src.graph.nodes.response_generator import ResponseGeneratorNode
 
@@ -24,6 +25,7 @@ __all__ = [
     "EntityResolverNode",
     "CypherGeneratorNode",
     "GraphExecutorNode",
+    "ParallelHopExecutorNode",
     "ResponseGeneratorNode",
     "ClarificationHandlerNode",
     "CacheCheckerNode",
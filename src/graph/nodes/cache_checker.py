@@ -3,6 +3,7 @@ Cache Checker Node
 
 질문-Cypher 캐시를 확인하여 유사 질문이 있으면 캐싱된 Cypher 쿼리를 재사용합니다.
 캐시 히트 시 Cypher 생성 단계를 스킵하여 응답 시간을 단축합니다.
+동일 질문은 프로세스 내 L1 캐시에서 임베딩 호출 없이 바로 반환됩니다.
 """
 
 from src.config import Settings
@@ -39,8 +40,9 @@ class CacheCheckerNode(BaseNode[CacheCheckerUpdate]):
         """
         질문에 대한 캐시 확인
 
+        0. L1 정확 일치 조회 (히트 시 임베딩 생성 생략)
         1. 질문 임베딩 생성
-        2. 유사 캐시 조회
+        2. 유사 캐시 조회 (L1 코사인 → Neo4j 벡터 검색)
         3. 캐시 히트 시: 캐싱된 Cypher 쿼리 반환 + skip_generation=True
         4. 캐시 미스 시: 임베딩만 반환 (후속 노드에서 활용)
 
@@ -65,12 +67,29 @@ class CacheCheckerNode(BaseNode[CacheCheckerUpdate]):
             )
 
         try:
+            # 0. 동일 질문 L1 조회 (임베딩 API 호출 생략)
+            exact = self._cache.find_cached_question(question)
+            if exact:
+                exact_hit, embedding = exact
+                self._logger.info(
+                    f"Cache HIT (local exact): '{exact_hit.question[:50]}...'"
+                )
+                return CacheCheckerUpdate(
+                    question_embedding=embedding,
+                    cache_hit=True,
+                    cache_score=exact_hit.score,
+                    skip_generation=True,
+                    cypher_query=exact_hit.cypher_query,
+                    cypher_parameters=exact_hit.cypher_parameters,
+                    execution_path=[f"{self.name}_hit"],
+                )
+
             # 1. 질문 임베딩 생성
             embedding = await self._llm.get_embedding(question)
             self._logger.debug(f"Generated question embedding: dim={len(embedding)}")
 
             # 2. 캐시에서 유사 질문 검색
-            cached = await self._cache.find_similar_query(embedding)
+            cached = await self._cache.find_similar_query(embedding, question=question)
 
             if cached:
                 # 캐시 히트
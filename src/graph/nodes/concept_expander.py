@@ -9,8 +9,9 @@ Concept Expander Node
 
 from __future__ import annotations
 
+import asyncio
 import inspect
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol, cast
 
 from src.domain.ontology.loader import (
     ExpansionConfig,
@@ -26,6 +27,18 @@ from src.graph.state import GraphRAGState
 if TYPE_CHECKING:
     from src.domain.ontology.hybrid_loader import HybridOntologyLoader
 
+
+class BatchConceptExpander(Protocol):
+    """카테고리 내 여러 값을 한 번에 확장하는 비동기 로더 (HybridOntologyLoader)"""
+
+    async def expand_concepts(
+        self,
+        terms: list[str],
+        category: str,
+        config: ExpansionConfig | None = None,
+    ) -> dict[str, list[str]]: ...
+
+
 # 엔티티 타입 → 온톨로지 카테고리 매핑
 ENTITY_TO_CATEGORY: dict[str, str] = {
     "Skill": "skills",
@@ -63,6 +76,12 @@ class ConceptExpanderNode(BaseNode[ConceptExpanderUpdate]):
         self._is_async_loader = inspect.iscoroutinefunction(
             getattr(ontology_loader, "expand_concept", None)
         )
+        # 일괄 확장 지원 로더 (HybridOntologyLoader: 카테고리당 쿼리 1회)
+        self._batch_loader: BatchConceptExpander | None = None
+        if inspect.iscoroutinefunction(
+            getattr(ontology_loader, "expand_concepts", None)
+        ):
+            self._batch_loader = cast(BatchConceptExpander, ontology_loader)
 
     @property
     def name(self) -> str:
@@ -100,6 +119,22 @@ class ConceptExpanderNode(BaseNode[ConceptExpanderUpdate]):
             return await self._ontology.expand_concept(value, category, config)
         return self._ontology.expand_concept(value, category, config)
 
+    async def _expand_values(
+        self,
+        values: list[str],
+        category: str,
+        config: ExpansionConfig,
+    ) -> dict[str, list[str]]:
+        """카테고리 내 값 목록 확장 (일괄 API 우선, 없으면 값별 동시 실행)"""
+        if self._batch_loader is not None:
+            return await self._batch_loader.expand_concepts(values, category, config)
+
+        unique_values = list(dict.fromkeys(values))
+        expanded = await asyncio.gather(
+            *(self._expand_concept(v, category, config) for v in unique_values)
+        )
+        return dict(zip(unique_values, expanded, strict=True))
+
     async def _process(self, state: GraphRAGState) -> ConceptExpanderUpdate:
         """엔티티를 온톨로지 기반으로 확장"""
         original_entities = state.get("entities", {})
@@ -122,18 +157,31 @@ class ConceptExpanderNode(BaseNode[ConceptExpanderUpdate]):
         expanded_by_original: dict[str, dict[str, list[str]]] = {}
         total_expansion_count = 0
 
-        for entity_type, values in original_entities.items():
-            category = ENTITY_TO_CATEGORY.get(entity_type)
+        # 엔티티 타입별 확장을 동시에 실행
+        expandable = {
+            entity_type: category
+            for entity_type in original_entities
+            if (category := ENTITY_TO_CATEGORY.get(entity_type)) is not None
+        }
+        expansions = await asyncio.gather(
+            *(
+                self._expand_values(original_entities[entity_type], category, config)
+                for entity_type, category in expandable.items()
+            )
+        )
+        expanded_by_type = dict(zip(expandable, expansions, strict=True))
 
-            if category is None:
+        for entity_type, values in original_entities.items():
+            if entity_type not in expanded_by_type:
                 expanded_entities[entity_type] = list(values)
                 expanded_by_original[entity_type] = {v: [v] for v in values}
                 continue
 
+            expansion = expanded_by_type[entity_type]
             expanded_values: set[str] = set()
             type_by_original: dict[str, list[str]] = {}
             for value in values:
-                expanded = await self._expand_concept(value, category, config)
+                expanded = expansion[value]
                 expanded_values.update(expanded)
                 type_by_original[value] = expanded
 
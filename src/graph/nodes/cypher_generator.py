@@ -12,6 +12,7 @@ Cypher Generator Node
   (Eval 점수, 응답 시간)에 근거해 재도입
 """
 
+from collections.abc import Callable
 
 from src.application.llm import LLMTaskService
 from src.auth.access_policy import AccessPolicy
@@ -32,6 +33,7 @@ class CypherGeneratorNode(BaseNode[CypherGeneratorUpdate]):
         llm_tasks: LLMTaskService,
         neo4j_repository: Neo4jRepository,
         settings: Settings | None = None,
+        schema_provider: Callable[[], GraphSchema | None] | None = None,
     ):
         super().__init__()
         self._llm = llm_tasks
@@ -41,6 +43,8 @@ class CypherGeneratorNode(BaseNode[CypherGeneratorUpdate]):
         # 호출자(pipeline.py)는 이미 settings=settings로 전달 중.
         self._settings = settings
         self._schema_cache: GraphSchema | None = None
+        # 파이프라인이 보유한 스키마 참조 (state에 복사하지 않아 체크포인트 비대화 방지)
+        self._schema_provider = schema_provider
 
     @property
     def name(self) -> str:
@@ -51,7 +55,11 @@ class CypherGeneratorNode(BaseNode[CypherGeneratorUpdate]):
         return ["question", "entities"]
 
     async def _get_schema(self) -> GraphSchema:
-        """스키마 정보 조회 (캐싱)"""
+        """스키마 정보 조회 (주입된 provider 우선, 없으면 조회 후 캐싱)"""
+        if self._schema_provider is not None:
+            provided = self._schema_provider()
+            if provided:
+                return provided
         if self._schema_cache is None:
             schema_dict = await self._neo4j.get_schema()
             # dict를 GraphSchema TypedDict로 변환
@@ -132,7 +140,7 @@ class CypherGeneratorNode(BaseNode[CypherGeneratorUpdate]):
         self._logger.info(f"Generating Cypher for: {question[:50]}...")
 
         try:
-            # 스키마 정보 조회 (State에 없으면 조회)
+            # 스키마 정보 조회 (State에 없으면 provider/조회)
             schema: GraphSchema
             state_schema = state.get("schema")
             if state_schema:
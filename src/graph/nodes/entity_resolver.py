@@ -2,22 +2,47 @@
 Entity Resolver Node
 
 추출된 엔티티를 Neo4j 그래프의 실제 노드와 매칭합니다.
+
+매칭 tier:
+1. 문자열 매칭 (정확 → 공백 무시 → 접미사, 단일 쿼리)
+2. 벡터 유사도 폴백 (embedder 주입 시, 문자열 매칭 실패 엔티티만)
+   - scripts/backfill_entity_embeddings.py로 생성한 레이블별 벡터 인덱스 사용
 """
 
+import asyncio
 from datetime import UTC, datetime
 
+from src.domain.constants import ENTITY_EMBEDDING_LABELS, entity_embedding_index_name
 from src.domain.types import EntityResolverUpdate, ResolvedEntity, UnresolvedEntity
-from src.graph.nodes.base import DB_TIMEOUT, BaseNode
+from src.graph.nodes.base import DB_TIMEOUT, DEFAULT_TIMEOUT, BaseNode
 from src.graph.state import GraphRAGState
+from src.infrastructure.llm import AzureOpenAIGateway
 from src.repositories.neo4j_repository import Neo4jRepository
+from src.repositories.neo4j_types import NodeResult
+
+# 벡터 폴백 기본 최소 유사도
+DEFAULT_VECTOR_MATCH_THRESHOLD = 0.88
 
 
 class EntityResolverNode(BaseNode[EntityResolverUpdate]):
     """엔티티 해석 노드"""
 
-    def __init__(self, neo4j_repository: Neo4jRepository):
+    def __init__(
+        self,
+        neo4j_repository: Neo4jRepository,
+        embedder: AzureOpenAIGateway | None = None,
+        vector_threshold: float = DEFAULT_VECTOR_MATCH_THRESHOLD,
+    ):
+        """
+        Args:
+            neo4j_repository: Neo4j 레포지토리
+            embedder: 벡터 폴백용 임베딩 게이트웨이 (None이면 문자열 매칭만)
+            vector_threshold: 벡터 폴백 최소 유사도
+        """
         super().__init__()
         self._neo4j = neo4j_repository
+        self._embedder = embedder
+        self._vector_threshold = vector_threshold
 
     @property
     def name(self) -> str:
@@ -25,7 +50,8 @@ class EntityResolverNode(BaseNode[EntityResolverUpdate]):
 
     @property
     def timeout_seconds(self) -> float:
-        return DB_TIMEOUT
+        # 벡터 폴백 시 임베딩 API 호출 포함
+        return DB_TIMEOUT + DEFAULT_TIMEOUT if self._embedder else DB_TIMEOUT
 
     @property
     def input_keys(self) -> list[str]:
@@ -98,53 +124,80 @@ class EntityResolverNode(BaseNode[EntityResolverUpdate]):
         question = state.get("question", "")
         now = datetime.now(UTC).isoformat()
 
-        # 1단계: 엔티티 검색
+        # 1단계: 엔티티 일괄 검색 (모든 값 × 폴백 tier를 단일 쿼리로)
+        # (entity_type, label, value) — "Unknown" 타입은 레이블 필터 없이 검색
+        lookups: list[tuple[str, str | None, str]] = []
         for entity_type, values in entities_map.items():
+            label = entity_type if entity_type and entity_type != "Unknown" else None
             for value in values:
                 value = value.strip()
-                if not value:
-                    continue
+                if value:
+                    lookups.append((entity_type, label, value))
 
-                try:
-                    matches = await self._neo4j.find_entities_by_name(
-                        name=value,
-                        labels=[entity_type]
-                        if entity_type and entity_type != "Unknown"
-                        else None,
-                        limit=3,
-                    )
+        try:
+            matches_by_lookup = await self._neo4j.find_entities_by_names(
+                [(label, value) for _, label, value in lookups],
+                limit=3,
+            )
+        except Exception as e:
+            self._logger.warning(f"Failed to resolve entities: {e}")
+            matches_by_lookup = {}
 
-                    if matches:
-                        best_match = matches[0]
-                        # 중복 방지
-                        existing_ids = {r["id"] for r in resolved}
-                        if best_match.id not in existing_ids:
-                            resolved.append(
-                                {
-                                    "id": best_match.id,
-                                    "labels": best_match.labels,
-                                    "name": best_match.properties.get("name", value),
-                                    "properties": best_match.properties,
-                                    "match_score": 1.0,
-                                    "original_value": value,
-                                }
-                            )
-                        self._logger.debug(
-                            f"Resolved '{value}' to node {best_match.id}"
-                        )
+        existing_ids: set[str] = set()
+
+        def originals_of(entity_type: str, value: str) -> set[str]:
+            if has_expansion:
+                # 확장 맵을 통해 원본별 resolved 처리
+                return expanded_to_originals.get(entity_type, {}).get(value, set())
+            # 개별 처리: 찾은 값만 resolved로 마킹
+            return {value}
 
-                        if has_expansion:
-                            # 확장 맵을 통해 원본별 resolved 처리
-                            for orig in expanded_to_originals.get(entity_type, {}).get(
-                                value, set()
-                            ):
-                                resolved_originals.add((entity_type, orig))
-                        else:
-                            # 개별 처리: 찾은 값만 resolved로 마킹
-                            resolved_originals.add((entity_type, value))
+        def mark_resolved(
+            entity_type: str, value: str, best_match: NodeResult, score: float
+        ) -> None:
+            # 중복 방지
+            if best_match.id not in existing_ids:
+                existing_ids.add(best_match.id)
+                resolved.append(
+                    {
+                        "id": best_match.id,
+                        "labels": best_match.labels,
+                        "name": best_match.properties.get("name", value),
+                        "properties": best_match.properties,
+                        "match_score": score,
+                        "original_value": value,
+                    }
+                )
+            self._logger.debug(f"Resolved '{value}' to node {best_match.id}")
+            for orig in originals_of(entity_type, value):
+                resolved_originals.add((entity_type, orig))
 
-                except Exception as e:
-                    self._logger.warning(f"Failed to resolve entity '{value}': {e}")
+        missed: list[tuple[str, str | None, str]] = []
+        for entity_type, label, value in lookups:
+            matches = matches_by_lookup.get((label, value))
+            if not matches:
+                missed.append((entity_type, label, value))
+                continue
+            mark_resolved(entity_type, value, matches[0], 1.0)
+
+        # 1-1단계: 문자열 매칭에 실패한 원본 엔티티만 벡터 유사도로 재시도
+        if self._embedder is not None:
+            candidates = [
+                (entity_type, label, value)
+                for entity_type, label, value in missed
+                if (entity_type, value) not in resolved_originals
+                and value in originals_of(entity_type, value)
+                and (label is None or label in ENTITY_EMBEDDING_LABELS)
+            ]
+            if candidates:
+                for entity_type, value, match, score in await self._vector_fallback(
+                    candidates
+                ):
+                    self._logger.info(
+                        f"Vector-resolved '{value}' → "
+                        f"'{match.properties.get('name', '')}' (score={score:.3f})"
+                    )
+                    mark_resolved(entity_type, value, match, score)
 
         # 2단계: reference_map 기준으로 unresolved 판단
         for entity_type, ref_values in reference_map.items():
@@ -198,3 +251,64 @@ class EntityResolverNode(BaseNode[EntityResolverUpdate]):
             result["entities"] = corrected_entities
 
         return result
+
+    async def _vector_fallback(
+        self, candidates: list[tuple[str, str | None, str]]
+    ) -> list[tuple[str, str, NodeResult, float]]:
+        """
+        벡터 유사도 폴백 (임베딩 1회 배치 호출 + 레이블 인덱스별 동시 검색)
+
+        "Unknown" 타입(label=None)은 모든 엔티티 임베딩 인덱스를 검색해 최고 점수를 사용합니다.
+        실패 시 빈 리스트를 반환하여 기존 미해결 처리로 이어집니다.
+
+        Returns:
+            [(entity_type, value, 매칭 노드, 유사도), ...]
+        """
+        assert self._embedder is not None
+        values = list(dict.fromkeys(value for _, _, value in candidates))
+        try:
+            vectors = dict(
+                zip(values, await self._embedder.get_embeddings(values), strict=True)
+            )
+        except Exception as e:
+            self._logger.warning(f"Vector fallback embedding failed: {e}")
+            return []
+
+        searches = [
+            (entity_type, value, search_label)
+            for entity_type, label, value in candidates
+            for search_label in ((label,) if label else ENTITY_EMBEDDING_LABELS)
+        ]
+        outcomes = await asyncio.gather(
+            *(
+                self._neo4j.vector_search_nodes(
+                    vectors[value],
+                    entity_embedding_index_name(search_label),
+                    limit=1,
+                    threshold=self._vector_threshold,
+                )
+                for _, value, search_label in searches
+            ),
+            return_exceptions=True,
+        )
+
+        best: dict[tuple[str, str], tuple[NodeResult, float]] = {}
+        for (entity_type, value, search_label), outcome in zip(
+            searches, outcomes, strict=True
+        ):
+            if isinstance(outcome, BaseException):
+                self._logger.warning(
+                    f"Vector fallback search failed on {search_label}: {outcome}"
+                )
+                continue
+            if not outcome:
+                continue
+            node, score = outcome[0]
+            key = (entity_type, value)
+            if key not in best or score > best[key][1]:
+                best[key] = (node, score)
+
+        return [
+            (entity_type, value, node, score)
+            for (entity_type, value), (node, score) in best.items()
+        ]
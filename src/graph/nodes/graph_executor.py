@@ -2,11 +2,15 @@
 Graph Executor Node — Cypher 실행 + 4차원 접근 제어 필터링 (D1~D4)
 
 캐시 저장은 Cypher 실행 성공 후에만 수행합니다 (실패한 Cypher가 캐시되는 것을 방지).
+결과 캐시(QueryResultCache)가 주입되면 동일 쿼리/파라미터/접근 정책의 결과를
+그래프 버전이 바뀔 때까지 재사용합니다.
 """
 
+import hashlib
 from typing import Any
 
 from src.auth.access_policy import ALL_PROPS, AccessPolicy
+from src.auth.models import UserContext
 from src.config import Settings
 from src.domain.types import GraphExecutorUpdate
 from src.domain.validators import validate_read_only_cypher
@@ -14,6 +18,7 @@ from src.graph.nodes.base import DB_TIMEOUT, BaseNode
 from src.graph.state import GraphRAGState
 from src.repositories.neo4j_repository import Neo4jRepository
 from src.repositories.query_cache_repository import QueryCacheRepository
+from src.repositories.query_result_cache import QueryResultCache
 
 # Cypher SyntaxError 판별용 메시지 패턴 (드라이버 예외 타입 접근 실패 시 fallback)
 _SYNTAX_ERROR_PATTERNS = (
@@ -37,6 +42,15 @@ def _is_retryable_syntax_error(e: Exception) -> bool:
     return any(pattern in message for pattern in _SYNTAX_ERROR_PATTERNS)
 
 
+def _policy_fingerprint(user_context: UserContext | None) -> str:
+    """결과 캐시 키용 접근 정책 fingerprint (필터링 결과가 같으면 같은 값)"""
+    if user_context is None or user_context.is_admin:
+        return "unrestricted"
+    policy = user_context.get_access_policy()
+    raw = f"{policy!r}|{user_context.department}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
 def _is_node(value: Any) -> bool:
     """Neo4j 노드인지 판별 (labels 키가 list인 dict)"""
     return isinstance(value, dict) and isinstance(value.get("labels"), list)
@@ -96,11 +110,13 @@ class GraphExecutorNode(BaseNode[GraphExecutorUpdate]):
         neo4j_repository: Neo4jRepository,
         cache_repository: QueryCacheRepository | None = None,
         settings: Settings | None = None,
+        result_cache: QueryResultCache | None = None,
     ):
         super().__init__()
         self._neo4j = neo4j_repository
         self._cache = cache_repository
         self._settings = settings
+        self._result_cache = result_cache
 
     @property
     def name(self) -> str:
@@ -140,6 +156,32 @@ class GraphExecutorNode(BaseNode[GraphExecutorUpdate]):
                 execution_path=[f"{self.name}_blocked"],
             )
 
+        user_context = state.get("user_context")
+        result_cache_key: str | None = None
+        graph_version: int | None = None
+        if self._result_cache is not None:
+            result_cache_key = self._result_cache.make_key(
+                cypher_query, parameters, _policy_fingerprint(user_context)
+            )
+            cached_results = self._result_cache.get(result_cache_key)
+            if cached_results is not None:
+                self._logger.info(
+                    f"Result cache HIT: {len(cached_results)} results "
+                    f"(graph_version={self._result_cache.graph_version})"
+                )
+                if cached_results and not state.get("cache_hit"):
+                    await self._save_to_cache(state, cypher_query, parameters)
+                return GraphExecutorUpdate(
+                    graph_results=cached_results,
+                    result_count=len(cached_results),
+                    execution_path=[self.name],
+                    cypher_error=None,
+                    failed_cypher=None,
+                    result_cache_hit=True,
+                )
+            # 실행 전 버전 기록 (실행 중 그래프 변경 시 저장 생략)
+            graph_version = self._result_cache.graph_version
+
         try:
             results = await self._neo4j.execute_cypher(
                 query=cypher_query,
@@ -149,7 +191,6 @@ class GraphExecutorNode(BaseNode[GraphExecutorUpdate]):
             self._logger.info(f"Query returned {len(results)} results")
 
             # 접근 제어 필터링
-            user_context = state.get("user_context")
             if user_context and not user_context.is_admin:
                 policy = user_context.get_access_policy()
                 original_count = len(results)
@@ -167,7 +208,7 @@ class GraphExecutorNode(BaseNode[GraphExecutorUpdate]):
             if results and not state.get("cache_hit"):
                 await self._save_to_cache(state, cypher_query, parameters)
 
-            return GraphExecutorUpdate(
+            update = GraphExecutorUpdate(
                 graph_results=results,
                 result_count=len(results),
                 execution_path=[self.name],
@@ -175,6 +216,10 @@ class GraphExecutorNode(BaseNode[GraphExecutorUpdate]):
                 cypher_error=None,
                 failed_cypher=None,
             )
+            if self._result_cache is not None and result_cache_key is not None:
+                self._result_cache.put(result_cache_key, results, graph_version)
+                update["result_cache_hit"] = False
+            return update
 
         except Exception as e:
             self._logger.error(f"Query execution failed: {e}")
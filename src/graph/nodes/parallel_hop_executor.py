@@ -0,0 +1,164 @@
+"""
+Parallel Hop Executor Node
+
+QueryDecomposer가 독립 홉(independent_hops)으로 분해한 질문의 홉별
+Cypher 생성 + 실행을 동시에 수행합니다.
+예: "A팀과 B팀의 스킬 비교"
+    → hop1: A팀 구성원의 스킬 (생성 + 실행)
+    → hop2: B팀 구성원의 스킬 (생성 + 실행)   ← hop1과 동시 실행
+
+홉별 처리는 기존 CypherGeneratorNode / GraphExecutorNode를 그대로 재사용하므로
+스키마 접근 제어, 읽기 전용 검증, 결과 캐시, 접근 정책 필터링이 동일하게 적용됩니다.
+"""
+
+import asyncio
+import time
+from typing import Any, cast
+
+from src.domain.types import ParallelHopExecutorUpdate, QueryHop
+from src.graph.nodes.base import DB_TIMEOUT, DEFAULT_TIMEOUT, BaseNode
+from src.graph.nodes.cypher_generator import CypherGeneratorNode
+from src.graph.nodes.graph_executor import GraphExecutorNode
+from src.graph.state import GraphRAGState
+
+# 홉 결과 행에 추가하는 출처 키
+HOP_RESULT_KEY = "_hop"
+
+
+def has_independent_hops(state: GraphRAGState) -> bool:
+    """독립 홉 병렬 실행 대상 여부 (홉 2개 이상 + independent_hops)"""
+    plan = state.get("query_plan") or {}
+    return bool(
+        plan.get("is_multi_hop")
+        and plan.get("independent_hops")
+        and len(plan.get("hops") or []) >= 2
+    )
+
+
+class ParallelHopExecutorNode(BaseNode[ParallelHopExecutorUpdate]):
+    """독립 홉 동시 생성/실행 노드"""
+
+    def __init__(
+        self,
+        cypher_generator: CypherGeneratorNode,
+        graph_executor: GraphExecutorNode,
+        max_concurrency: int = 3,
+        max_retries: int = 0,
+    ):
+        """
+        Args:
+            cypher_generator: 홉별 Cypher 생성에 사용할 노드
+            graph_executor: 홉별 실행 노드 (질문 캐시 저장이 없는 인스턴스)
+            max_concurrency: 동시 처리 홉 수 상한
+            max_retries: 홉별 SyntaxError 재생성 횟수
+        """
+        super().__init__()
+        self._generator = cypher_generator
+        self._executor = graph_executor
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+
+    @property
+    def name(self) -> str:
+        return "parallel_hop_executor"
+
+    @property
+    def timeout_seconds(self) -> float:
+        # 동시 실행이므로 홉 1개(생성 + 실행 + 재시도) 기준
+        return (DEFAULT_TIMEOUT + DB_TIMEOUT) * (self._max_retries + 1)
+
+    @property
+    def input_keys(self) -> list[str]:
+        return ["query_plan", "question", "entities"]
+
+    async def _process(self, state: GraphRAGState) -> ParallelHopExecutorUpdate:
+        hops: list[QueryHop] = list((state.get("query_plan") or {}).get("hops") or [])
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run_hop(index: int, hop: QueryHop) -> dict[str, Any]:
+            async with semaphore:
+                return await self._run_hop(state, index, hop)
+
+        self._logger.info(
+            f"Executing {len(hops)} independent hops "
+            f"(max_concurrency={self._max_concurrency})"
+        )
+        outcomes = await asyncio.gather(
+            *(run_hop(i, hop) for i, hop in enumerate(hops, start=1))
+        )
+
+        graph_results: list[dict[str, Any]] = []
+        queries: list[str] = []
+        hop_timings: dict[str, float] = {}
+        errors: list[str] = []
+        for outcome in outcomes:
+            step = outcome["step"]
+            hop_timings[f"{self.name}.hop_{step}"] = outcome["elapsed"]
+            if outcome.get("cypher"):
+                queries.append(f"// hop {step}\n{outcome['cypher']}")
+            if outcome.get("error"):
+                errors.append(f"hop {step}: {outcome['error']}")
+                continue
+            graph_results.extend(
+                {HOP_RESULT_KEY: step, **row} for row in outcome["results"]
+            )
+
+        self._logger.info(
+            f"Parallel hops finished: {len(graph_results)} results, "
+            f"{len(errors)} failed hops"
+        )
+
+        update = ParallelHopExecutorUpdate(
+            cypher_query="\n".join(queries),
+            cypher_parameters={},
+            graph_results=graph_results,
+            result_count=len(graph_results),
+            node_timings=hop_timings,
+            execution_path=[self.name],
+        )
+        if errors and len(errors) == len(hops):
+            update["error"] = "All hops failed: " + "; ".join(errors)
+            update["execution_path"] = [f"{self.name}_error"]
+        return update
+
+    async def _run_hop(
+        self, state: GraphRAGState, step: int, hop: QueryHop
+    ) -> dict[str, Any]:
+        """홉 1개 생성 + 실행 (SyntaxError 시 max_retries까지 재생성)"""
+        start = time.perf_counter()
+        hop_state: dict[str, Any] = {
+            **state,
+            "question": hop.get("sub_question") or hop.get("description", ""),
+            "query_plan": None,
+            "skip_generation": False,
+            "cypher_query": "",
+            "cypher_parameters": {},
+            "cypher_error": None,
+            "failed_cypher": None,
+            "cypher_retry_count": 0,
+        }
+        outcome: dict[str, Any] = {"step": hop.get("step", step), "results": []}
+
+        for _ in range(self._max_retries + 1):
+            generated = await self._generator(cast(GraphRAGState, dict(hop_state)))
+            hop_state.update(generated)
+            if generated.get("error") or not hop_state.get("cypher_query"):
+                outcome["error"] = generated.get("error") or "Cypher generation failed"
+                break
+
+            executed = await self._executor(cast(GraphRAGState, dict(hop_state)))
+            hop_state.update(executed)
+            outcome["cypher"] = hop_state["cypher_query"]
+            if executed.get("cypher_error"):
+                outcome["error"] = executed["cypher_error"]
+                continue
+            if executed.get("error"):
+                outcome["error"] = executed["error"]
+                break
+
+            outcome.pop("error", None)
+            outcome["results"] = executed.get("graph_results", [])
+            break
+
+        outcome["elapsed"] = round(time.perf_counter() - start, 3)
+        return outcome
@@ -8,8 +8,10 @@ Multi-hop 쿼리를 분해하여 단계별 실행 계획을 생성합니다.
     → hop3: Employee-[:HAS_SKILL]->Skill(AWS)
 """
 
+from collections.abc import Callable
+
 from src.application.llm import LLMTaskService
-from src.domain.types import QueryDecomposerUpdate, QueryPlan
+from src.domain.types import GraphSchema, QueryDecomposerUpdate, QueryPlan
 from src.graph.nodes.base import BaseNode
 from src.graph.state import GraphRAGState
 
@@ -24,9 +26,15 @@ class QueryDecomposerNode(BaseNode[QueryDecomposerUpdate]):
         "mentoring_network",
     ]
 
-    def __init__(self, llm_tasks: LLMTaskService):
+    def __init__(
+        self,
+        llm_tasks: LLMTaskService,
+        schema_provider: Callable[[], GraphSchema | None] | None = None,
+    ):
         super().__init__()
         self._llm = llm_tasks
+        # 파이프라인이 보유한 스키마 참조 (state에 없을 때 사용)
+        self._schema_provider = schema_provider
 
     @property
     def name(self) -> str:
@@ -67,6 +75,8 @@ class QueryDecomposerNode(BaseNode[QueryDecomposerUpdate]):
 
         try:
             schema = state.get("schema")
+            if not schema and self._schema_provider is not None:
+                schema = self._schema_provider()
             result = await self._llm.decompose_query(
                 question=question, schema=dict(schema) if schema else None
             )
@@ -77,11 +87,13 @@ class QueryDecomposerNode(BaseNode[QueryDecomposerUpdate]):
                 hops=result.get("hops", []),
                 final_return=result.get("final_return", ""),
                 explanation=result.get("explanation", ""),
+                independent_hops=bool(result.get("independent_hops", False)),
             )
 
             self._logger.info(
                 f"Query decomposed: {query_plan['hop_count']} hops, "
-                f"multi_hop={query_plan['is_multi_hop']}"
+                f"multi_hop={query_plan['is_multi_hop']}, "
+                f"independent={query_plan['independent_hops']}"
             )
 
             return QueryDecomposerUpdate(
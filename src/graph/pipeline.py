@@ -41,17 +41,21 @@ from src.graph.nodes import (
     GraphExecutorNode,
     IntentEntityExtractorNode,
     OntologyUpdateHandlerNode,
+    ParallelHopExecutorNode,
     QueryDecomposerNode,
     ResponseGeneratorNode,
 )
 from src.graph.nodes.ontology_learner import OntologyLearner
+from src.graph.nodes.parallel_hop_executor import has_independent_hops
 from src.graph.state import AGGREGATE_INTENTS, GraphRAGState
 from src.graph.utils import format_chat_history
 from src.infrastructure.llm import AzureOpenAIGateway
 from src.infrastructure.neo4j_client import Neo4jClient
 from src.repositories.neo4j_repository import Neo4jRepository
 from src.repositories.query_cache_repository import QueryCacheRepository
+from src.repositories.query_result_cache import QueryResultCache
 from src.services.ontology_service import OntologyService
+from src.utils.graph_version import get_graph_version
 
 logger = logging.getLogger(__name__)
 
@@ -172,6 +176,17 @@ class GraphRAGPipeline:
             self._cache_repository = QueryCacheRepository(neo4j_client, settings)
             logger.info("Query cache repository initialized")
 
+        # Cypher 결과 캐시 (그래프 버전 변경 시 무효화)
+        self._result_cache: QueryResultCache | None = None
+        if settings.result_cache_enabled:
+            self._result_cache = QueryResultCache(
+                get_graph_version(),
+                max_entries=settings.result_cache_max_entries,
+                ttl_seconds=settings.result_cache_ttl_seconds,
+                max_rows=settings.result_cache_max_rows,
+            )
+            logger.info("Query result cache initialized")
+
         # 온톨로지 로더 초기화 (개념 확장용)
         self._ontology_loader: OntologyLoader | HybridOntologyLoader
         self._ontology_registry = ontology_registry
@@ -200,22 +215,52 @@ class GraphRAGPipeline:
         # 노드 초기화
         # 통합 Intent + Entity 노드 사용 (Latency Optimization: 2 LLM calls → 1)
         self._intent_entity_extractor = IntentEntityExtractorNode(llm_tasks)
-        self._query_decomposer = QueryDecomposerNode(llm_tasks)
+        # 스키마는 state에 복사하지 않고 참조로 전달 (체크포인트 크기 절감)
+        self._query_decomposer = QueryDecomposerNode(
+            llm_tasks, schema_provider=self._get_graph_schema
+        )
         self._concept_expander = ConceptExpanderNode(self._ontology_loader)
-        self._entity_resolver = EntityResolverNode(neo4j_repository)
+        # 문자열 매칭 실패 시 벡터 유사도 폴백 (엔티티 임베딩 백필 필요)
+        self._entity_resolver = EntityResolverNode(
+            neo4j_repository,
+            embedder=(
+                llm_gateway if settings.entity_vector_fallback_enabled else None
+            ),
+            vector_threshold=settings.entity_vector_match_threshold,
+        )
         self._clarification_handler = ClarificationHandlerNode(llm_tasks)
         self._cypher_generator = CypherGeneratorNode(
             llm_tasks,
             neo4j_repository,
             settings=settings,
+            schema_provider=self._get_graph_schema,
         )
         self._graph_executor = GraphExecutorNode(
             neo4j_repository,
             cache_repository=self._cache_repository,
             settings=settings,
+            result_cache=self._result_cache,
         )
         self._response_generator = ResponseGeneratorNode(llm_tasks)
 
+        # 독립 홉 병렬 실행 노드 (홉 Cypher는 원 질문 임베딩으로 캐싱하지 않음)
+        self._parallel_hop_executor: ParallelHopExecutorNode | None = None
+        if settings.multi_hop_parallel_enabled:
+            self._parallel_hop_executor = ParallelHopExecutorNode(
+                self._cypher_generator,
+                GraphExecutorNode(
+                    neo4j_repository,
+                    settings=settings,
+                    result_cache=self._result_cache,
+                ),
+                max_concurrency=settings.multi_hop_max_concurrency,
+                max_retries=(
+                    settings.cypher_max_retries
+                    if settings.cypher_self_correction_enabled
+                    else 0
+                ),
+            )
+
         # Cache Checker 노드 (Vector Search 활성화 시)
         self._cache_checker: CacheCheckerNode | None = None
         if settings.vector_search_enabled and self._cache_repository:
@@ -271,6 +316,19 @@ class GraphRAGPipeline:
             f"checkpointer: {type(self._checkpointer).__name__})"
         )
 
+    @property
+    def query_cache_repository(self) -> QueryCacheRepository | None:
+        """질문-Cypher 캐시 (그래프 편집 서비스의 무효화 훅 연결용)"""
+        return self._cache_repository
+
+    def _get_graph_schema(self) -> GraphSchema | None:
+        """노드용 스키마 참조 (update_graph_schema 교체가 즉시 반영됨)"""
+        return self._graph_schema
+
+    def update_graph_schema(self, graph_schema: GraphSchema) -> None:
+        """주입된 스키마 교체 (스냅샷으로 기동 후 백그라운드 갱신 결과 반영)"""
+        self._graph_schema = graph_schema
+
     def _build_graph(self) -> CompiledStateGraph:
         """
         LangGraph 워크플로우 구성 (Vector Cache + Checkpointer)
@@ -278,6 +336,7 @@ class GraphRAGPipeline:
         파이프라인 흐름:
             intent_entity_extractor → query_decomposer → [cache_checker] → concept_expander
             → entity_resolver → cypher_generator → graph_executor → response_generator
+            (독립 홉 질문: entity_resolver → parallel_hop_executor → response_generator)
 
         Latency Optimization:
         - IntentEntityExtractor가 intent 분류 + entity 추출을 1회 LLM 호출로 처리
@@ -294,6 +353,10 @@ class GraphRAGPipeline:
         workflow.add_node("graph_executor", self._graph_executor)
         workflow.add_node("response_generator", self._response_generator)
 
+        # 독립 홉 병렬 실행 노드 추가
+        if self._parallel_hop_executor:
+            workflow.add_node("parallel_hop_executor", self._parallel_hop_executor)
+
         # Cache Checker 노드 추가 (Vector Search 활성화 시)
         if self._cache_checker:
             workflow.add_node("cache_checker", self._cache_checker)
@@ -382,25 +445,37 @@ class GraphRAGPipeline:
         # 3. Entity Resolver -> Cypher Generator 또는 Clarification Handler
         def route_after_resolver(
             state: GraphRAGState,
-        ) -> Literal["cypher_generator", "clarification_handler", "response_generator"]:
+        ) -> Literal[
+            "cypher_generator",
+            "parallel_hop_executor",
+            "clarification_handler",
+            "response_generator",
+        ]:
             # 에러가 있는 경우 response_generator로 직접 이동
             if state.get("error"):
                 return "response_generator"
 
+            # 독립 홉 질문은 홉별 생성/실행을 병렬로 처리
+            cypher_target: Literal["cypher_generator", "parallel_hop_executor"] = (
+                "parallel_hop_executor"
+                if self._parallel_hop_executor and has_independent_hops(state)
+                else "cypher_generator"
+            )
+
             unresolved_entities = state.get("unresolved_entities", [])
             resolved_entities = state.get("resolved_entities", [])
 
             if not unresolved_entities:
-                return "cypher_generator"
+                return cypher_target
 
             # resolved 엔티티가 있으면 Cypher 생성으로 진행
             # (미해결 엔티티는 Adaptive Ontology가 백그라운드 학습)
             if resolved_entities:
                 logger.info(
                     f"{len(unresolved_entities)} unresolved entities, "
-                    f"but {len(resolved_entities)} resolved. Proceeding to cypher_generator."
+                    f"but {len(resolved_entities)} resolved. Proceeding to {cypher_target}."
                 )
-                return "cypher_generator"
+                return cypher_target
 
             # 집계/통계 intent는 특정 엔티티 없이도 Cypher 생성 가능
             # (LLM이 속성 필터나 라벨 이름을 잘못 엔티티로 추출한 경우 방어)
@@ -408,9 +483,9 @@ class GraphRAGPipeline:
             if intent in AGGREGATE_INTENTS:
                 logger.info(
                     f"Aggregate intent '{intent}' with {len(unresolved_entities)} "
-                    "unresolved entities. Proceeding to cypher_generator anyway."
+                    f"unresolved entities. Proceeding to {cypher_target} anyway."
                 )
-                return "cypher_generator"
+                return cypher_target
 
             # 모든 엔티티가 미해결인 경우 → 사용자에게 확인 (추가 제안)
             # (프롬프트에서 "새로운 스킬로 추가할까요?" 등 제안)
@@ -433,9 +508,18 @@ class GraphRAGPipeline:
                 "cypher_generator": "cypher_generator",
                 "clarification_handler": "clarification_handler",
                 "response_generator": "response_generator",
+                **(
+                    {"parallel_hop_executor": "parallel_hop_executor"}
+                    if self._parallel_hop_executor
+                    else {}
+                ),
             },
         )
 
+        # 독립 홉 병렬 실행 -> Response Generator
+        if self._parallel_hop_executor:
+            workflow.add_edge("parallel_hop_executor", "response_generator")
+
         # 4. Cypher Generator -> Graph Executor 또는 에러 처리
         def route_after_cypher(
             state: GraphRAGState,
@@ -526,7 +610,7 @@ class GraphRAGPipeline:
         thread_id = session_id or str(uuid4())
         config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
 
-        # 초기 상태 구성 (스키마 포함)
+        # 초기 상태 구성 (스키마는 노드가 참조로 조회)
         initial_state: GraphRAGState = {
             "question": question,
             "session_id": session_id or "",
@@ -541,9 +625,8 @@ class GraphRAGPipeline:
             "cypher_retry_count": 0,
             "cypher_error": None,
             "failed_cypher": None,
+            "result_cache_hit": None,
         }
-        if self._graph_schema:
-            initial_state["schema"] = self._graph_schema
         if user_context is not None:
             initial_state["user_context"] = user_context
 
@@ -573,6 +656,7 @@ class GraphRAGPipeline:
                 "result_count": final_state.get("result_count", 0),
                 "execution_path": final_state.get("execution_path", []),
                 "node_timings": final_state.get("node_timings", {}),
+                "result_cache_hit": final_state.get("result_cache_hit"),
                 "query_plan": query_plan_dict,
                 "error": final_state.get("error"),
             }
@@ -662,7 +746,7 @@ class GraphRAGPipeline:
         thread_id = session_id or str(uuid4())
         config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
 
-        # 초기 상태 구성 (스키마 포함)
+        # 초기 상태 구성 (스키마는 노드가 참조로 조회)
         initial_state: GraphRAGState = {
             "question": question,
             "session_id": session_id or "",
@@ -677,9 +761,8 @@ class GraphRAGPipeline:
             "cypher_retry_count": 0,
             "cypher_error": None,
             "failed_cypher": None,
+            "result_cache_hit": None,
         }
-        if self._graph_schema:
-            initial_state["schema"] = self._graph_schema
         if user_context is not None:
             initial_state["user_context"] = user_context
 
@@ -751,9 +834,8 @@ class GraphRAGPipeline:
             "cypher_retry_count": 0,
             "cypher_error": None,
             "failed_cypher": None,
+            "result_cache_hit": None,
         }
-        if self._graph_schema:
-            initial_state["schema"] = self._graph_schema
         if user_context is not None:
             initial_state["user_context"] = user_context
 
@@ -54,10 +54,10 @@ class GraphRAGState(TypedDict, total=False):
     expansion_strategy: Literal["strict", "normal", "broad"]  # 사용된 확장 전략
 
     # ── 3. Graph Retrieval ─────────────────────────────
-    schema: GraphSchema  # 그래프 스키마 정보
+    schema: GraphSchema  # 그래프 스키마 (노드에 참조로 전달, 체크포인트 제외)
     cypher_query: str
     cypher_parameters: dict[str, Any]
-    graph_results: list[dict[str, Any]]
+    graph_results: list[dict[str, Any]]  # 체크포인트 제외 (질문 단위)
     result_count: int
 
     # ── 3b. Self-Correction (SyntaxError 재생성 루프) ──
@@ -74,10 +74,11 @@ class GraphRAGState(TypedDict, total=False):
     node_timings: Annotated[dict[str, float], operator.or_]  # 노드별 소요시간(초)
 
     # ── 6. Vector Search / Cache ───────────────────────
-    question_embedding: list[float] | None
+    question_embedding: list[float] | None  # 체크포인트 제외 (질문 단위)
     cache_hit: bool
     cache_score: float
     skip_generation: bool  # 캐시 히트 시 Cypher 생성 스킵
+    result_cache_hit: bool | None  # 결과 캐시 히트 여부 (None: 결과 캐시 미사용)
 
     # ── 7. 접근 제어 (Access Control) ──────────────────
     user_context: UserContext | None
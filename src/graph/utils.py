@@ -40,6 +40,10 @@ def format_chat_history(
 
     lines = []
     for msg in target_messages:
+        # system: 체크포인터가 윈도우 밖 대화를 압축한 요약 메시지
+        if msg.type == "system":
+            lines.append(str(msg.content))
+            continue
         role = "User" if msg.type == "human" else "Assistant"
         lines.append(f"{role}: {msg.content}")
 
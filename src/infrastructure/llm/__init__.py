@@ -4,6 +4,7 @@ LLM Infrastructure Package
 Azure OpenAI 전송 계층: 클라이언트 관리, primitive 생성, fallback 정책, 임베딩
 """
 
+from src.infrastructure.llm.embedding_cache import EmbeddingCache
 from src.infrastructure.llm.gateway import (
     FALLBACK_EXCEPTIONS,
     AzureOpenAIGateway,
@@ -13,6 +14,7 @@ from src.infrastructure.llm.gateway import (
 
 __all__ = [
     "AzureOpenAIGateway",
+    "EmbeddingCache",
     "ModelTier",
     "FALLBACK_EXCEPTIONS",
     "classify_api_status_error",
@@ -0,0 +1,159 @@
+"""
+Embedding Cache - 내용 해시 기반 임베딩 캐시
+
+책임:
+- (모델, 차원, 텍스트) SHA-256 키 → 임베딩 벡터 매핑
+- 메모리 LRU (프로세스 내)
+- 선택적 SQLite 디스크 저장소 (프로세스 재시작/워커 간 재사용)
+
+디스크 I/O는 동기 sqlite3로 수행하므로 async 코드에서는
+asyncio.to_thread()로 호출합니다 (AzureOpenAIGateway 참고).
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_cache_key(model: str, dimensions: int, text: str) -> str:
+    """임베딩 캐시 키 (모델/차원이 바뀌면 자연히 무효화)"""
+    raw = f"{model}\x00{dimensions}\x00{text}".encode()
+    return hashlib.sha256(raw).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    임베딩 캐시 (메모리 LRU + 선택적 SQLite)
+
+    사용 예시:
+        cache = EmbeddingCache(max_entries=4096, db_path="embedding_cache.db")
+        found = cache.get_memory(keys)        # {key: vector}
+        found |= cache.get_disk(missing)      # 디스크 히트는 메모리에도 적재
+        cache.put_memory(fetched)
+        cache.put_disk(fetched)
+        cache.close()
+    """
+
+    def __init__(self, max_entries: int = 4096, db_path: str | None = None):
+        self._max_entries = max_entries
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def has_disk_store(self) -> bool:
+        return self._db_path is not None
+
+    # ============================================
+    # 메모리 LRU
+    # ============================================
+
+    def get_memory(self, keys: list[str]) -> dict[str, list[float]]:
+        """메모리 LRU 조회 (히트 항목만 반환)"""
+        found: dict[str, list[float]] = {}
+        for key in keys:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                found[key] = vector
+        self._memory_hits += len(found)
+        return found
+
+    def put_memory(self, items: dict[str, list[float]]) -> None:
+        """메모리 LRU 저장 (초과 시 오래된 항목 퇴출)"""
+        for key, vector in items.items():
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    # ============================================
+    # SQLite 저장소 (동기 — to_thread로 호출)
+    # ============================================
+
+    def get_disk(self, keys: list[str]) -> dict[str, list[float]]:
+        """디스크 조회 (히트 항목은 메모리 LRU로 승격)"""
+        if not keys or not self.has_disk_store:
+            return {}
+
+        found: dict[str, list[float]] = {}
+        with self._db_lock:
+            conn = self._get_conn()
+            # SQLite 변수 개수 제한(기본 999) 이하로 분할 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+
+        self._disk_hits += len(found)
+        self.put_memory(found)
+        return found
+
+    def put_disk(self, items: dict[str, list[float]]) -> None:
+        """디스크 저장 (float32 BLOB)"""
+        if not items or not self.has_disk_store:
+            return
+
+        rows = [(key, array("f", vector).tobytes()) for key, vector in items.items()]
+        with self._db_lock:
+            conn = self._get_conn()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                rows,
+            )
+            conn.commit()
+
+    def record_misses(self, count: int) -> None:
+        self._misses += count
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """SQLite 연결 (lazy, WAL 모드)"""
+        if self._conn is None:
+            assert self._db_path is not None
+            if self._db_path != ":memory:":
+                Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+            logger.info(f"Embedding disk cache ready (path={self._db_path})")
+        return self._conn
+
+    # ============================================
+    # 관리
+    # ============================================
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "memory_size": len(self._memory),
+            "max_entries": self._max_entries,
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+        }
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -6,12 +6,13 @@ Azure OpenAI Gateway - LLM 전송 계층 (infrastructure)
 - 모델 티어(LIGHT/HEAVY) → 배포명 라우팅
 - 텍스트/JSON/스트리밍 생성 primitive
 - HEAVY → LIGHT fallback 정책
-- 임베딩 생성
+- 임베딩 생성 (배치 요청, 내용 해시 캐시, 동시 요청 중복 제거)
 - API 에러 → 도메인 예외 분류
 
 프롬프트 조립/포맷팅은 이 계층의 책임이 아님 (application 계층 담당).
 """
 
+import asyncio
 import json
 import logging
 from collections.abc import AsyncIterator
@@ -27,6 +28,7 @@ from src.domain.exceptions import (
     LLMRateLimitError,
     LLMResponseError,
 )
+from src.infrastructure.llm.embedding_cache import EmbeddingCache, embedding_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +96,9 @@ class AzureOpenAIGateway:
     def __init__(self, settings: Settings):
         self._settings = settings
         self._client: AsyncAzureOpenAI | None = None
+        self._embedding_cache: EmbeddingCache | None = None
+        # 진행 중인 임베딩 요청 (캐시 키 → 결과 Future, 동일 텍스트 동시 요청 공유)
+        self._embedding_inflight: dict[str, asyncio.Future[list[float]]] = {}
 
         logger.info(
             f"AzureOpenAIGateway initialized: light={settings.light_model_deployment}, "
@@ -454,6 +459,17 @@ class AzureOpenAIGateway:
     # Embedding
     # ============================================
 
+    def _get_embedding_cache(self) -> EmbeddingCache | None:
+        """임베딩 캐시 반환 (lazy initialization, 비활성화 시 None)"""
+        if not self._settings.embedding_cache_enabled:
+            return None
+        if self._embedding_cache is None:
+            self._embedding_cache = EmbeddingCache(
+                max_entries=self._settings.embedding_cache_max_entries,
+                db_path=self._settings.embedding_cache_db_path,
+            )
+        return self._embedding_cache
+
     async def get_embedding(self, text: str) -> list[float]:
         """
         Azure OpenAI Embedding API를 통해 텍스트 임베딩 생성
@@ -467,24 +483,138 @@ class AzureOpenAIGateway:
         Raises:
             LLMResponseError: 임베딩 생성 실패 시
         """
+        embeddings = await self.get_embeddings([text])
+        return embeddings[0]
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        여러 텍스트 임베딩 생성 (캐시 → 진행 중 요청 공유 → 배치 API 호출)
+
+        동일 텍스트는 한 번만 요청하며, 다른 코루틴이 같은 텍스트를 이미
+        요청 중이면 그 결과를 기다립니다.
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+
+        Returns:
+            입력 순서와 동일한 임베딩 벡터 목록
+
+        Raises:
+            LLMRateLimitError / LLMConnectionError / LLMResponseError: API 실패 시
+        """
+        if not texts:
+            return []
+
+        deployment = self._settings.embedding_model_deployment
+        dimensions = self._settings.embedding_dimensions
+        keys = [embedding_cache_key(deployment, dimensions, t) for t in texts]
+        unique: dict[str, str] = dict(zip(keys, texts, strict=True))
+
+        # 1. 캐시 조회 (메모리 → 디스크)
+        resolved: dict[str, list[float]] = {}
+        cache = self._get_embedding_cache()
+        if cache is not None:
+            resolved.update(cache.get_memory(list(unique)))
+            pending = [k for k in unique if k not in resolved]
+            if pending and cache.has_disk_store:
+                resolved.update(await asyncio.to_thread(cache.get_disk, pending))
+
+        # 2. 진행 중 요청 공유 / 신규 요청 등록
+        loop = asyncio.get_running_loop()
+        waiting: dict[str, asyncio.Future[list[float]]] = {}
+        owned: dict[str, asyncio.Future[list[float]]] = {}
+        for key in unique:
+            if key in resolved:
+                continue
+            inflight = self._embedding_inflight.get(key)
+            if inflight is not None:
+                waiting[key] = inflight
+            else:
+                owned[key] = loop.create_future()
+                self._embedding_inflight[key] = owned[key]
+
+        # 3. 신규 텍스트만 배치 요청
+        if owned:
+            fetched = await self._fetch_owned_embeddings(unique, owned)
+            resolved.update(fetched)
+            if cache is not None:
+                cache.record_misses(len(fetched))
+                cache.put_memory(fetched)
+                if cache.has_disk_store:
+                    await asyncio.to_thread(cache.put_disk, fetched)
+
+        # 4. 다른 코루틴의 요청 결과 대기 (대기 측 취소가 공유 Future를 취소하지 않도록 shield)
+        for key, future in waiting.items():
+            resolved[key] = await asyncio.shield(future)
+
+        return [resolved[key] for key in keys]
+
+    async def _fetch_owned_embeddings(
+        self,
+        unique: dict[str, str],
+        owned: dict[str, asyncio.Future[list[float]]],
+    ) -> dict[str, list[float]]:
+        """이 호출이 담당한 텍스트를 요청하고 공유 Future에 결과/예외 전달"""
+        owned_keys = list(owned)
+        try:
+            vectors = await self._request_embeddings([unique[k] for k in owned_keys])
+            if len(vectors) != len(owned_keys):
+                raise LLMResponseError(
+                    f"Embedding count mismatch: expected {len(owned_keys)}, "
+                    f"got {len(vectors)}"
+                )
+            fetched = dict(zip(owned_keys, vectors, strict=True))
+            for key, future in owned.items():
+                future.set_result(fetched[key])
+            return fetched
+        except BaseException as e:
+            error = (
+                e
+                if isinstance(e, Exception)
+                else LLMResponseError("Embedding request cancelled")
+            )
+            # 결과를 받지 못한 Future는 모두 예외로 완료 (대기자가 멈추지 않도록)
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(error)
+                    future.exception()  # 대기자가 없어도 미회수 예외 경고 방지
+            raise
+        finally:
+            for key in owned_keys:
+                self._embedding_inflight.pop(key, None)
+
+    async def _request_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embedding API 배치 호출 (embedding_batch_size 단위 분할)
+
+        Returns:
+            입력 순서와 동일한 임베딩 벡터 목록
+        """
         client = self._get_client()
 
         try:
             # text-embedding-3-small/large는 dimensions 파라미터 지원
             deployment = self._settings.embedding_model_deployment
             expected_dims = self._settings.embedding_dimensions
+            batch_size = self._settings.embedding_batch_size
+
+            embeddings: list[list[float]] = []
+            for start in range(0, len(texts), batch_size):
+                batch = texts[start : start + batch_size]
+                response = await client.embeddings.create(
+                    model=deployment,
+                    input=batch,
+                    dimensions=expected_dims,
+                )
+                # 응답 순서는 보장되지 않으므로 index 기준 정렬
+                data = sorted(response.data, key=lambda d: d.index)
+                embeddings.extend(d.embedding for d in data)
 
-            response = await client.embeddings.create(
-                model=deployment,
-                input=text,
-                dimensions=expected_dims,
-            )
-
-            embedding = response.data[0].embedding
             logger.debug(
-                f"Generated embedding: dim={len(embedding)}, text='{text[:50]}...'"
+                f"Generated embeddings: count={len(embeddings)}, "
+                f"requests={-(-len(texts) // batch_size)}"
             )
-            return embedding
+            return embeddings
 
         except RateLimitError as e:
             logger.warning(f"Embedding rate limit exceeded: {e}")
@@ -503,6 +633,8 @@ class AzureOpenAIGateway:
 
     async def close(self) -> None:
         """클라이언트 리소스 정리"""
+        if self._embedding_cache is not None:
+            self._embedding_cache.close()
         if self._client is not None:
             await self._client.close()
             self._client = None
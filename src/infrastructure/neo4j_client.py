@@ -8,8 +8,9 @@ Neo4j 비동기 드라이버 래퍼
 - 리소스 정리 (graceful shutdown)
 """
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import Any
 from urllib.parse import urlparse, urlunparse
@@ -37,8 +38,27 @@ _SCHEMA_EXCLUDED_LABELS: set[str] = {
     "CachedQuery",
     "CommunitySummary",
     "OntologyProposal",
+    "SchemaMigration",
 }
 
+# 스키마 인트로스펙션 동시 실행 쿼리 수 상한 (커넥션 풀 점유 제한)
+SCHEMA_INTROSPECTION_CONCURRENCY = 8
+
+# 속성 키/값 샘플링 시 레이블(관계 타입)당 스캔 상한 (전체 스캔 방지)
+SCHEMA_SAMPLE_SCAN_LIMIT = 1000
+
+# enum 값 샘플링 제외 속성
+_SAMPLE_EXCLUDED_NODE_PROPERTIES = frozenset(
+    {"id", "name", "name_norm", "embedding", "embedding_text"}
+)
+_SAMPLE_EXCLUDED_REL_PROPERTIES = frozenset({"id", "embedding"})
+
+# 벡터 검색 결과에서 기본 제외하는 벡터 속성 (1536 float ≈ 12KB/노드 전송 방지)
+VECTOR_SEARCH_EXCLUDED_PROPERTIES: tuple[str, ...] = ("embedding",)
+
+# 레이블 필터 적용 시 인덱스 후보 배수 (필터 후 limit 확보용, DB 내부에서만 사용)
+VECTOR_LABEL_FILTER_OVERFETCH = 5
+
 
 def _serialize_value(value: Any) -> Any:
     """
@@ -427,13 +447,29 @@ class Neo4jClient:
 
         return result
 
-    async def get_schema_info(self) -> dict[str, Any]:
+    async def get_schema_info(
+        self, max_concurrency: int = SCHEMA_INTROSPECTION_CONCURRENCY
+    ) -> dict[str, Any]:
         """
         데이터베이스 스키마 정보 조회
 
+        기본 조회(레이블/관계 타입/인덱스/제약 조건)와 속성 인트로스펙션 쿼리를
+        세마포어로 동시 실행 수를 제한하여 병렬 실행합니다.
+        속성 목록은 db.schema.nodeTypeProperties()/relTypeProperties()를 우선 사용하고,
+        실패하거나 비어 있으면 LIMIT으로 제한된 샘플 스캔으로 대체합니다.
+
+        Args:
+            max_concurrency: 동시 실행 인트로스펙션 쿼리 수 상한
+
         Returns:
             스키마 정보 (노드 레이블, 관계 타입, 인덱스 등)
         """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(query: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.execute_query(query)
+
         schema_info: dict[str, Any] = {
             "node_labels": [],
             "relationship_types": [],
@@ -442,22 +478,22 @@ class Neo4jClient:
         }
 
         try:
-            # 노드 레이블 조회 (내부 레이블 제외)
-            labels_result = await self.execute_query("CALL db.labels()")
+            labels_result, rel_result, idx_result, const_result = await asyncio.gather(
+                run("CALL db.labels()"),
+                run("CALL db.relationshipTypes()"),
+                run("SHOW INDEXES"),
+                run("SHOW CONSTRAINTS"),
+            )
+
+            # 노드 레이블 (내부 레이블 제외)
             schema_info["node_labels"] = [
                 r.get("label")
                 for r in labels_result
                 if r.get("label") not in _SCHEMA_EXCLUDED_LABELS
             ]
-
-            # 관계 타입 조회
-            rel_result = await self.execute_query("CALL db.relationshipTypes()")
             schema_info["relationship_types"] = [
                 r.get("relationshipType") for r in rel_result
             ]
-
-            # 인덱스 조회
-            idx_result = await self.execute_query("SHOW INDEXES")
             schema_info["indexes"] = [
                 {
                     "name": r.get("name"),
@@ -467,9 +503,6 @@ class Neo4jClient:
                 }
                 for r in idx_result
             ]
-
-            # 제약 조건 조회
-            const_result = await self.execute_query("SHOW CONSTRAINTS")
             schema_info["constraints"] = [
                 {
                     "name": r.get("name"),
@@ -486,71 +519,51 @@ class Neo4jClient:
 
         # 속성 정보 인트로스펙션 (additive — 실패해도 기존 결과 유지)
         try:
-            node_schemas = []
-            for label in schema_info.get("node_labels", []):
-                prop_result = await self.execute_query(
-                    f"MATCH (n:`{label}`) UNWIND keys(n) AS key "
-                    "RETURN DISTINCT key LIMIT 50"
-                )
-                props = [{"name": r["key"]} for r in prop_result if r.get("key")]
-                node_schemas.append({"label": label, "properties": props})
-            if node_schemas:
-                schema_info["nodes"] = node_schemas
+            node_labels = schema_info.get("node_labels", [])
+            rel_types = schema_info.get("relationship_types", [])
+            node_props, rel_props = await asyncio.gather(
+                self._introspect_node_properties(node_labels, run),
+                self._introspect_relationship_properties(rel_types, run),
+            )
+
+            node_schemas = [
+                {"label": label, "properties": [{"name": k} for k in node_props[label]]}
+                for label in node_labels
+            ]
+            rel_schemas = [
+                {"type": t, "properties": [{"name": k} for k in rel_props[t]]}
+                for t in rel_types
+            ]
 
             # enum-like 속성의 DISTINCT 값 샘플링 (카디널리티 ≤ 20인 STRING 속성만)
-            for node_schema in node_schemas:
-                label = node_schema["label"]
-                for prop in node_schema.get("properties", []):
-                    prop_name = prop.get("name", "")
-                    if not prop_name or prop_name in ("id", "name", "embedding"):
-                        continue
-                    try:
-                        distinct_result = await self.execute_query(
-                            f"MATCH (n:`{label}`) WHERE n.`{prop_name}` IS NOT NULL "
-                            f"WITH DISTINCT n.`{prop_name}` AS val "
-                            f"WITH val WHERE val IS :: STRING "
-                            f"RETURN collect(val)[..8] AS vals, count(val) AS cnt"
-                        )
-                        if distinct_result:
-                            row = distinct_result[0]
-                            cnt = row.get("cnt", 0)
-                            vals = row.get("vals", [])
-                            if 2 <= cnt <= 20 and vals:
-                                prop["sample_values"] = vals
-                    except Exception:
-                        pass
-
-            rel_schemas = []
-            for rel_type in schema_info.get("relationship_types", []):
-                prop_result = await self.execute_query(
-                    f"MATCH ()-[r:`{rel_type}`]->() UNWIND keys(r) AS key "
-                    "RETURN DISTINCT key LIMIT 50"
+            sample_tasks = [
+                self._sample_enum_values(
+                    prop,
+                    f"MATCH (n:`{node_schema['label']}`) "
+                    f"WHERE n.`{prop['name']}` IS NOT NULL "
+                    f"WITH n.`{prop['name']}` AS val LIMIT {SCHEMA_SAMPLE_SCAN_LIMIT}",
+                    run,
+                )
+                for node_schema in node_schemas
+                for prop in node_schema["properties"]
+                if prop["name"] not in _SAMPLE_EXCLUDED_NODE_PROPERTIES
+            ]
+            sample_tasks += [
+                self._sample_enum_values(
+                    prop,
+                    f"MATCH ()-[r:`{rel_schema['type']}`]->() "
+                    f"WHERE r.`{prop['name']}` IS NOT NULL "
+                    f"WITH r.`{prop['name']}` AS val LIMIT {SCHEMA_SAMPLE_SCAN_LIMIT}",
+                    run,
                 )
-                props = [{"name": r["key"]} for r in prop_result if r.get("key")]
-                rel_schemas.append({"type": rel_type, "properties": props})
-            # 관계 속성의 enum-like 값 샘플링
-            for rel_schema in rel_schemas:
-                rel_type = rel_schema["type"]
-                for prop in rel_schema.get("properties", []):
-                    prop_name = prop.get("name", "")
-                    if not prop_name or prop_name in ("id", "embedding"):
-                        continue
-                    try:
-                        distinct_result = await self.execute_query(
-                            f"MATCH ()-[r:`{rel_type}`]->() WHERE r.`{prop_name}` IS NOT NULL "
-                            f"WITH DISTINCT r.`{prop_name}` AS val "
-                            f"WITH val WHERE val IS :: STRING "
-                            f"RETURN collect(val)[..8] AS vals, count(val) AS cnt"
-                        )
-                        if distinct_result:
-                            row = distinct_result[0]
-                            cnt = row.get("cnt", 0)
-                            vals = row.get("vals", [])
-                            if 2 <= cnt <= 20 and vals:
-                                prop["sample_values"] = vals
-                    except Exception:
-                        pass
+                for rel_schema in rel_schemas
+                for prop in rel_schema["properties"]
+                if prop["name"] not in _SAMPLE_EXCLUDED_REL_PROPERTIES
+            ]
+            await asyncio.gather(*sample_tasks)
 
+            if node_schemas:
+                schema_info["nodes"] = node_schemas
             if rel_schemas:
                 schema_info["relationships"] = rel_schemas
         except Exception as e:
@@ -558,6 +571,89 @@ class Neo4jClient:
 
         return schema_info
 
+    @staticmethod
+    async def _introspect_node_properties(
+        labels: list[str],
+        run: Callable[[str], Awaitable[list[dict[str, Any]]]],
+    ) -> dict[str, list[str]]:
+        """레이블별 속성 키 (db.schema 프로시저 우선, 없으면 레이블별 샘플 스캔)"""
+        props: dict[str, list[str]] = {label: [] for label in labels}
+        try:
+            for r in await run("CALL db.schema.nodeTypeProperties()"):
+                key = r.get("propertyName")
+                for label in r.get("nodeLabels") or []:
+                    if key and label in props and key not in props[label]:
+                        props[label].append(key)
+        except Exception as e:
+            logger.debug(f"db.schema.nodeTypeProperties unavailable: {e}")
+
+        missing = [label for label in labels if not props[label]]
+        results = await asyncio.gather(
+            *(
+                run(
+                    f"MATCH (n:`{label}`) WITH n LIMIT {SCHEMA_SAMPLE_SCAN_LIMIT} "
+                    "UNWIND keys(n) AS key RETURN DISTINCT key LIMIT 50"
+                )
+                for label in missing
+            )
+        )
+        for label, rows in zip(missing, results, strict=True):
+            props[label] = [r["key"] for r in rows if r.get("key")]
+        return {label: keys[:50] for label, keys in props.items()}
+
+    @staticmethod
+    async def _introspect_relationship_properties(
+        rel_types: list[str],
+        run: Callable[[str], Awaitable[list[dict[str, Any]]]],
+    ) -> dict[str, list[str]]:
+        """관계 타입별 속성 키 (db.schema 프로시저 우선, 없으면 타입별 샘플 스캔)"""
+        props: dict[str, list[str]] = {rel_type: [] for rel_type in rel_types}
+        try:
+            for r in await run("CALL db.schema.relTypeProperties()"):
+                # relType 형식: ":`WORKS_ON`"
+                rel_type = (r.get("relType") or "").lstrip(":").strip("`")
+                key = r.get("propertyName")
+                if key and rel_type in props and key not in props[rel_type]:
+                    props[rel_type].append(key)
+        except Exception as e:
+            logger.debug(f"db.schema.relTypeProperties unavailable: {e}")
+
+        missing = [rel_type for rel_type in rel_types if not props[rel_type]]
+        results = await asyncio.gather(
+            *(
+                run(
+                    f"MATCH ()-[r:`{rel_type}`]->() "
+                    f"WITH r LIMIT {SCHEMA_SAMPLE_SCAN_LIMIT} "
+                    "UNWIND keys(r) AS key RETURN DISTINCT key LIMIT 50"
+                )
+                for rel_type in missing
+            )
+        )
+        for rel_type, rows in zip(missing, results, strict=True):
+            props[rel_type] = [r["key"] for r in rows if r.get("key")]
+        return {rel_type: keys[:50] for rel_type, keys in props.items()}
+
+    @staticmethod
+    async def _sample_enum_values(
+        prop: dict[str, Any],
+        match_clause: str,
+        run: Callable[[str], Awaitable[list[dict[str, Any]]]],
+    ) -> None:
+        """샘플 범위 내 DISTINCT 값이 2~20개인 STRING 속성에 sample_values 추가"""
+        try:
+            rows = await run(
+                f"{match_clause} "
+                "WITH DISTINCT val WHERE val IS :: STRING "
+                "RETURN collect(val)[..8] AS vals, count(val) AS cnt"
+            )
+        except Exception:
+            return
+        if rows:
+            cnt = rows[0].get("cnt", 0)
+            vals = rows[0].get("vals", [])
+            if 2 <= cnt <= 20 and vals:
+                prop["sample_values"] = vals
+
     # ============================================
     # Vector Index 관련 메서드
     # ============================================
@@ -650,6 +746,9 @@ class Neo4jClient:
         embedding: list[float],
         limit: int = 10,
         threshold: float | None = None,
+        labels: list[str] | None = None,
+        properties: list[str] | None = None,
+        exclude_properties: tuple[str, ...] = VECTOR_SEARCH_EXCLUDED_PROPERTIES,
     ) -> list[dict[str, Any]]:
         """
         Vector Index를 사용한 유사도 검색
@@ -659,37 +758,73 @@ class Neo4jClient:
             embedding: 검색 쿼리 임베딩 벡터
             limit: 반환할 최대 결과 수
             threshold: 최소 유사도 점수 (None이면 필터링 없음)
+            labels: 결과 노드 레이블 필터 (하나라도 일치, DB에서 필터링)
+            properties: 반환할 속성 목록 (None이면 exclude_properties 외 전체)
+            exclude_properties: properties 미지정 시 제외할 속성 (기본: 벡터 속성)
 
         Returns:
             검색 결과 리스트 (node, score 포함)
         """
+        # 속성 프로젝션 (벡터 속성은 DB에서 null 처리 후 키 제거)
+        if properties is not None:
+            fields = ", ".join(
+                f".`{validate_cypher_identifier(p, 'property')}`" for p in properties
+            )
+        else:
+            fields = ", ".join(
+                [".*"]
+                + [
+                    f"`{validate_cypher_identifier(p, 'property')}`: null"
+                    for p in exclude_properties
+                ]
+            )
+
+        # 레이블 필터는 인덱스 후보를 넓게 조회한 뒤 DB 내부에서 적용
+        candidate_limit = limit * VECTOR_LABEL_FILTER_OVERFETCH if labels else limit
+        conditions: list[str] = []
+        if threshold is not None:
+            conditions.append("score >= $threshold")
+        if labels:
+            for label in labels:
+                validate_cypher_identifier(label, "label")
+            conditions.append("any(label IN labels(node) WHERE label IN $labels)")
+
         # db.index.vector.queryNodes 사용 (Neo4j 5.11+)
         query = """
-        CALL db.index.vector.queryNodes($index_name, $limit, $embedding)
+        CALL db.index.vector.queryNodes($index_name, $candidate_limit, $embedding)
         YIELD node, score
         """
 
-        if threshold is not None:
-            query += "WHERE score >= $threshold\n"
+        if conditions:
+            query += f"WHERE {' AND '.join(conditions)}\n"
 
-        query += """
+        query += f"""
         RETURN elementId(node) as id,
                labels(node) as labels,
-               properties(node) as properties,
+               node {{{fields}}} as properties,
                score
         ORDER BY score DESC
+        LIMIT $limit
         """
 
         params: dict[str, Any] = {
             "index_name": index_name,
+            "candidate_limit": candidate_limit,
             "limit": limit,
             "embedding": embedding,
         }
         if threshold is not None:
             params["threshold"] = threshold
+        if labels:
+            params["labels"] = list(labels)
 
         try:
             results = await self.execute_query(query, params)
+            if properties is None and exclude_properties:
+                for record in results:
+                    props = record.get("properties") or {}
+                    for key in exclude_properties:
+                        props.pop(key, None)
             logger.debug(
                 f"Vector search on '{index_name}': {len(results)} results (limit={limit})"
             )
@@ -0,0 +1,139 @@
+"""
+Extraction Cache & Ingestion Checkpoint
+
+로컬 SQLite(WAL) 파일에 두 가지 상태를 저장합니다.
+
+- ExtractionCache: 행 텍스트 + 프롬프트 버전 + 모델 배포명 해시를 키로
+  LLM 추출 원본(JSON)을 보관 — 변경되지 않은 행은 재적재 시 LLM 호출 생략
+- IngestionCheckpoint: 소스별로 저장 완료된 문서 오프셋을 기록 —
+  실패한 작업을 처음부터가 아니라 마지막 커밋 지점부터 재개
+"""
+
+import hashlib
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+def extraction_cache_key(text: str, prompt_version: str, model: str) -> str:
+    """추출 캐시 키 (sha256(text, prompt_version, model))"""
+    payload = "\x00".join((prompt_version, model, text))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _SQLiteStore:
+    """단일 커넥션 SQLite 저장소 기반 클래스 (프로세스 내 스레드 공유)"""
+
+    _SCHEMA: str = ""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self._db_path = str(db_path)
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(self._SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ExtractionCache(_SQLiteStore):
+    """
+    내용 주소 기반 LLM 추출 결과 캐시
+
+    Example:
+        cache = ExtractionCache("extraction_cache.db")
+        key = extraction_cache_key(text, prompt_version, deployment)
+        if (raw := cache.get(key)) is None:
+            cache.put(key, graph.model_dump_json())
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS extraction_cache (
+            cache_key TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        super().__init__(db_path)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        """캐시된 추출 JSON 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM extraction_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return str(row[0])
+
+    def put(self, key: str, payload: str) -> None:
+        """추출 JSON 저장 (동일 키는 덮어씀)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extraction_cache (cache_key, payload, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, payload, datetime.now().isoformat()),
+            )
+
+
+class IngestionCheckpoint(_SQLiteStore):
+    """
+    소스별 커밋 완료 문서 오프셋 저장소
+
+    오프셋은 "앞에서부터 연속으로 저장이 끝난 문서 수"이며,
+    재개 시 해당 개수만큼 로더 출력을 건너뜁니다.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS ingest_checkpoints (
+            source_key TEXT PRIMARY KEY,
+            committed_offset INTEGER NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """
+
+    def get_offset(self, source_key: str) -> int:
+        """마지막 커밋 오프셋 (기록 없으면 0)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT committed_offset FROM ingest_checkpoints WHERE source_key = ?",
+                (source_key,),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def save_offset(self, source_key: str, offset: int) -> None:
+        """커밋 오프셋 기록"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingest_checkpoints "
+                "(source_key, committed_offset, updated_at) VALUES (?, ?, ?)",
+                (source_key, offset, datetime.now().isoformat()),
+            )
+
+    def clear(self, source_key: str) -> None:
+        """완료된 소스의 체크포인트 삭제"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM ingest_checkpoints WHERE source_key = ?", (source_key,)
+            )
+
+
+def source_key_for_file(file_path: str | Path) -> str:
+    """파일 경로 + 크기 + 수정 시각 기반 체크포인트 키 (파일이 바뀌면 새 키)"""
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
@@ -5,11 +5,15 @@ LLM을 사용하여 텍스트에서 그래프 구조를 추출합니다.
 Schema Definition에 따른 Strict Validation을 수행합니다.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 
 from openai import AsyncAzureOpenAI
 
 from src.config import get_settings
+from src.ingestion.extraction_cache import ExtractionCache, extraction_cache_key
 from src.ingestion.models import Document, ExtractedGraph, Node, generate_entity_id
 from src.ingestion.schema import NODE_PROPERTIES, VALID_RELATIONS, RelationType
 
@@ -27,9 +31,10 @@ class GraphExtractor:
     1. Schema Awareness: 정의된 Schema만 추출하도록 유도
     2. Post-Validation: 추출된 결과 중 비즈니스 규칙 위반 항목 필터링
     3. Confidence Score: 신뢰도가 낮은 추출 결과 제거
+    4. Extraction Cache: 동일 행 텍스트 + 프롬프트 + 모델이면 LLM 호출 생략 (선택)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache: ExtractionCache | None = None) -> None:
         settings = get_settings()
 
         # Azure OpenAI 클라이언트 직접 생성 (LangChain 제거)
@@ -43,6 +48,15 @@ class GraphExtractor:
         # Pydantic 모델에서 JSON Schema 추출
         self._json_schema = self._build_json_schema()
 
+        self._cache = cache
+        # 프롬프트/스키마가 바뀌면 버전이 달라져 기존 캐시가 자동 무효화됨
+        self.prompt_version = hashlib.sha256(
+            (
+                self._get_system_prompt()
+                + json.dumps(self._json_schema, sort_keys=True)
+            ).encode("utf-8")
+        ).hexdigest()[:16]
+
     def _build_json_schema(self) -> dict:
         """ExtractedGraph의 JSON Schema 생성"""
         schema = ExtractedGraph.model_json_schema()
@@ -52,15 +66,24 @@ class GraphExtractor:
             "schema": schema,
         }
 
-    async def extract(self, document: Document) -> ExtractedGraph:
+    async def extract(
+        self, document: Document, raise_on_llm_error: bool = False
+    ) -> ExtractedGraph:
         """
         문서에서 그래프 구조 추출 및 검증 수행
+
+        Args:
+            document: 추출 대상 문서
+            raise_on_llm_error: True면 LLM 호출 실패를 빈 그래프 대신 예외로 전파
+                (IngestionPipeline이 실패 문서를 재개 대상으로 남기기 위해 사용)
         """
         # 1. Extraction
         try:
-            raw_graph = await self._run_llm(document.page_content)
+            raw_graph = await self._run_llm_cached(document.page_content)
         except Exception as e:
             logger.error(f"LLM Extraction Failed: {e}")
+            if raise_on_llm_error:
+                raise
             return ExtractedGraph(nodes=[], edges=[])
 
         # 2. Post-Processing & Validation
@@ -138,6 +161,23 @@ class GraphExtractor:
 
         return ExtractedGraph(nodes=valid_nodes, edges=valid_edges)
 
+    async def _run_llm_cached(self, text: str) -> ExtractedGraph:
+        """추출 캐시 조회 후 미스일 때만 LLM 호출"""
+        if self._cache is None:
+            return await self._run_llm(text)
+
+        key = extraction_cache_key(text, self.prompt_version, self.deployment_name)
+        # SQLite I/O는 동시 추출 워커의 이벤트 루프를 막지 않도록 스레드에서 수행
+        cached = await asyncio.to_thread(self._cache.get, key)
+        if cached is not None:
+            return ExtractedGraph.model_validate_json(cached)
+
+        raw_graph = await self._run_llm(text)
+        # 빈 결과(컨텐츠 필터 등 일시적 원인 가능)는 캐시하지 않음
+        if raw_graph.nodes or raw_graph.edges:
+            await asyncio.to_thread(self._cache.put, key, raw_graph.model_dump_json())
+        return raw_graph
+
     async def _run_llm(self, text: str) -> ExtractedGraph:
         """Azure OpenAI 직접 호출 (LangChain 제거)"""
         response = await self.client.chat.completions.create(
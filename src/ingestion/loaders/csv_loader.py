@@ -6,9 +6,13 @@ CSV 파일을 읽어 Document 객체로 변환하는 로더 구현체입니다.
 
 import csv
 from collections.abc import Iterator
+from itertools import batched
 from pathlib import Path
 
+import pandas as pd
+
 from src.ingestion.loaders.base import BaseLoader
+from src.ingestion.loaders.serialization import DEFAULT_CHUNK_SIZE, serialize_rows
 from src.ingestion.models import Document
 
 
@@ -18,11 +22,20 @@ class CSVLoader(BaseLoader):
 
     특정 디렉토리 내의 CSV 파일들을 읽어서
     각 행(Row)을 텍스트로 변환하여 Document 객체 생성
+
+    파일을 chunk_size 행 단위로 읽고 청크 단위로 직렬화하므로
+    파일 크기와 무관하게 메모리 사용량이 일정합니다.
     """
 
-    def __init__(self, file_path: str | Path, encoding: str = "utf-8") -> None:
+    def __init__(
+        self,
+        file_path: str | Path,
+        encoding: str = "utf-8",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
         self.file_path = Path(file_path)
         self.encoding = encoding
+        self.chunk_size = chunk_size
 
     def load(self) -> Iterator[Document]:
         """CSV 파일을 읽어 Document 스트림 반환"""
@@ -31,26 +44,33 @@ class CSVLoader(BaseLoader):
 
         # 파일명 기반으로 "데이터 타입" 추론 (예: employees.csv -> employees)
         source_name = self.file_path.stem
+        source_file = str(self.file_path.name)
 
-        with open(self.file_path, encoding=self.encoding) as f:
-            reader = csv.DictReader(f)
+        # csv.DictReader로 원문 문자열을 읽고 chunk_size 행씩 DataFrame으로 직렬화
+        # 필드 수가 헤더와 다른 행: 부족한 필드는 None(제외), 초과 필드는
+        # 기존 출력과 같이 "None: [...]"로 유지 (pandas가 None 컬럼명을 NaN으로
+        # 바꾸지 않도록 restkey는 문자열)
+        with open(self.file_path, encoding=self.encoding, newline="") as f:
+            reader = csv.DictReader(f, restkey="None")
+            offset = 0
+            for rows in batched(reader, self.chunk_size):
+                chunk = pd.DataFrame.from_records(list(rows)).astype(object)
 
-            for i, row in enumerate(reader):
                 # CSV Row를 텍스트로 변환 (Context Serialization)
                 # 예: "name: John, job: Developer"
-                # Note: None과 빈 문자열만 제외, 숫자 0은 유효한 값으로 포함
-                content_parts = [
-                    f"{k}: {v}"
-                    for k, v in row.items()
-                    if v is not None and str(v).strip()
-                ]
-                page_content = ", ".join(content_parts)
-
-                # 메타데이터 생성 (Lineage용)
-                metadata = {
-                    "source": str(self.file_path.name),
-                    "row_index": i + 2,  # Header 제외 1-based index
-                    "source_type": source_name,
-                }
-
-                yield Document(page_content=page_content, metadata=metadata)
+                # Note: "nan" 같은 문자열 값과 값이 모두 빈 행도 원문 그대로 유지
+                contents = serialize_rows(
+                    chunk, strip_values=False, drop_nan_text=False
+                )
+
+                for i, page_content in enumerate(contents.tolist()):
+                    # 메타데이터 생성 (Lineage용)
+                    metadata = {
+                        "source": source_file,
+                        "row_index": offset + i + 2,  # Header 제외 1-based index
+                        "source_type": source_name,
+                    }
+
+                    yield Document(page_content=page_content, metadata=metadata)
+
+                offset += len(chunk)
@@ -1,15 +1,18 @@
 """
 Excel Data Loader Implementation
 
-Excel 파일(.xlsx, .xls)을 읽어 Document 객체로 변환하는 로더 구현체입니다.
+Excel 파일(.xlsx)을 읽어 Document 객체로 변환하는 로더 구현체입니다.
 """
 
 from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 
 from src.ingestion.loaders.base import BaseLoader
+from src.ingestion.loaders.serialization import DEFAULT_CHUNK_SIZE, serialize_rows
 from src.ingestion.models import Document
 
 
@@ -17,8 +20,11 @@ class ExcelLoader(BaseLoader):
     """
     Excel 파일 로더
 
-    Excel 파일(.xlsx, .xls)을 읽어서
+    Excel 파일(.xlsx)을 읽어서
     각 행(Row)을 텍스트로 변환하여 Document 객체 생성
+
+    openpyxl read-only 모드로 시트를 스트리밍하며 chunk_size 행 단위로
+    직렬화하므로, 워크북 전체를 DataFrame으로 올리지 않습니다.
     """
 
     def __init__(
@@ -27,6 +33,7 @@ class ExcelLoader(BaseLoader):
         sheet_name: str | int = 0,
         header_row: int = 0,
         usecols: list[int] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> None:
         """
         Args:
@@ -34,11 +41,13 @@ class ExcelLoader(BaseLoader):
             sheet_name: 읽을 시트 이름 또는 인덱스 (기본: 첫 번째 시트)
             header_row: 헤더 행 인덱스 (0-based)
             usecols: 사용할 컬럼 인덱스 리스트 (None이면 모든 컬럼)
+            chunk_size: 한 번에 직렬화할 행 수
         """
         self.file_path = Path(file_path)
         self.sheet_name = sheet_name
         self.header_row = header_row
         self.usecols = usecols
+        self.chunk_size = chunk_size
 
     def load(self) -> Iterator[Document]:
         """Excel 파일을 읽어 Document 스트림 반환"""
@@ -48,60 +57,86 @@ class ExcelLoader(BaseLoader):
         # 파일명 기반으로 "데이터 타입" 추론
         source_name = self.file_path.stem
 
-        # Excel 파일 읽기
+        # Excel 파일 열기 (read-only: 행 단위 스트리밍)
         try:
-            df = pd.read_excel(
-                self.file_path,
-                sheet_name=self.sheet_name,
-                header=self.header_row,
-                usecols=self.usecols,
-                engine="openpyxl",  # .xlsx 파일용
-            )
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(self.file_path, read_only=True, data_only=True)
         except Exception as e:
             raise ValueError(f"Failed to read Excel file {self.file_path}: {e}") from e
 
-        # NaN을 None으로 변환
-        df = df.where(pd.notna(df), None)
+        try:
+            try:
+                if isinstance(self.sheet_name, int):
+                    worksheet = workbook.worksheets[self.sheet_name]
+                else:
+                    worksheet = workbook[self.sheet_name]
+            except (IndexError, KeyError) as e:
+                raise ValueError(
+                    f"Failed to read Excel file {self.file_path}: "
+                    f"sheet not found ({self.sheet_name})"
+                ) from e
+
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(islice(rows, self.header_row, None), None)
+            if header is None:
+                return
+
+            positions, columns = self._select_columns(header)
+            if not positions:
+                return
+
+            data_index = 0
+            while chunk := list(islice(rows, self.chunk_size)):
+                frame = pd.DataFrame(
+                    [[row[p] if p < len(row) else None for p in positions] for row in chunk],
+                    columns=columns,
+                    dtype=object,
+                )
+                # Excel Row를 텍스트로 변환 (Context Serialization)
+                contents = serialize_rows(frame)
+
+                for i, page_content in enumerate(contents.tolist()):
+                    # 빈 행은 건너뛰기
+                    if not page_content:
+                        continue
+
+                    # 메타데이터 생성 (Lineage용)
+                    # Excel 행 번호 = header_row + data_row_index + 2 (1-based, header 포함)
+                    metadata = {
+                        "source": str(self.file_path.name),
+                        "row_index": data_index + i + self.header_row + 2,
+                        "source_type": source_name,
+                        "sheet_name": str(self.sheet_name),
+                    }
+
+                    yield Document(page_content=page_content, metadata=metadata)
+
+                data_index += len(chunk)
+        finally:
+            workbook.close()
+
+    def _select_columns(self, header: tuple[Any, ...]) -> tuple[list[int], list[str]]:
+        """
+        사용할 컬럼 위치와 정리된 컬럼명 반환
+
+        빈 컬럼명(이름 없는 컬럼)은 제외하고, 이름 있는 컬럼이 하나도 없으면
+        전체 컬럼을 col_{i} 이름으로 사용합니다.
+        """
+        candidates = (
+            [p for p in self.usecols if p < len(header)]
+            if self.usecols is not None
+            else list(range(len(header)))
+        )
 
         # 컬럼명 정리 (공백 제거)
-        clean_columns = []
-        for i, col in enumerate(df.columns):
-            col_str = str(col).strip()
-            # Unnamed 또는 빈 컬럼 처리
-            if col_str.startswith("Unnamed") or not col_str:
-                clean_columns.append(f"col_{i}")
-            else:
-                clean_columns.append(col_str)
-        df.columns = clean_columns
-
-        # Unnamed/빈 컬럼 제거 (col_로 시작하는 컬럼)
-        valid_columns = [col for col in df.columns if not col.startswith("col_")]
-        if valid_columns:
-            df = df[valid_columns]
-
-        for i, row in df.iterrows():
-            # Excel Row를 텍스트로 변환 (Context Serialization)
-            # None, NaN, 빈 문자열만 제외, 숫자 0은 유효한 값으로 포함
-            content_parts = []
-            for k, v in row.items():
-                if v is not None and pd.notna(v):
-                    str_v = str(v).strip()
-                    if str_v and str_v.lower() != "nan":
-                        content_parts.append(f"{k}: {str_v}")
-
-            # 빈 행은 건너뛰기
-            if not content_parts:
-                continue
-
-            page_content = ", ".join(content_parts)
-
-            # 메타데이터 생성 (Lineage용)
-            # Excel 행 번호 = header_row + data_row_index + 2 (1-based, header 포함)
-            metadata = {
-                "source": str(self.file_path.name),
-                "row_index": int(i) + self.header_row + 2,
-                "source_type": source_name,
-                "sheet_name": str(self.sheet_name),
-            }
-
-            yield Document(page_content=page_content, metadata=metadata)
+        named = [
+            (p, str(header[p]).strip())
+            for p in candidates
+            if header[p] is not None and str(header[p]).strip()
+        ]
+        if named:
+            return [p for p, _ in named], [name for _, name in named]
+
+        # Unnamed 컬럼만 있는 경우
+        return candidates, [f"col_{p}" for p in candidates]
@@ -0,0 +1,50 @@
+"""
+Row Serialization
+
+DataFrame 청크의 각 행을 "컬럼: 값, 컬럼: 값" 텍스트로 변환합니다.
+행 단위 Python 루프 대신 컬럼 단위 벡터 연산으로 처리합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+# 청크당 행 수 (메모리 사용량과 벡터화 효율의 균형)
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def serialize_rows(
+    frame: pd.DataFrame,
+    strip_values: bool = True,
+    drop_nan_text: bool = True,
+) -> pd.Series:
+    """
+    청크의 각 행을 LLM 입력용 텍스트로 직렬화 (Context Serialization)
+
+    None, NaN, 빈 문자열(공백만 있는 값 포함)은 제외하고, 숫자 0은 유효한 값으로 포함합니다.
+
+    Args:
+        frame: object dtype DataFrame (컬럼명 = 출력 키)
+        strip_values: True면 값 앞뒤 공백 제거 후 출력
+        drop_nan_text: True면 문자열 "nan"(대소문자 무관)도 빈 값으로 제외
+            (Excel 셀 변환 결과용, CSV는 원문 값을 그대로 유지하도록 False)
+
+    Returns:
+        행별 텍스트 Series (값이 하나도 없는 행은 빈 문자열)
+    """
+    content = pd.Series("", index=frame.index, dtype=object)
+
+    # 중복 컬럼명도 처리할 수 있도록 위치 기반 접근
+    for position, column in enumerate(frame.columns):
+        values = frame.iloc[:, position]
+        text = values.astype(str)
+        stripped = text.str.strip()
+        valid = values.notna().to_numpy() & (stripped != "").to_numpy()
+        if drop_nan_text:
+            valid &= (stripped.str.lower() != "nan").to_numpy()
+        part = f"{column}: " + (stripped if strip_values else text)
+        part = part.where(valid, "")
+
+        separator = np.where((content != "").to_numpy() & valid, ", ", "")
+        content = content + separator + part
+
+    return content
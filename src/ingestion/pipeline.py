@@ -6,20 +6,29 @@ Ingestion Pipeline
 """
 
 import asyncio
+import inspect
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from src.config import get_settings
+from src.domain.constants import NAME_NORM_PROPERTY, name_norm_expr
 from src.infrastructure.neo4j_client import Neo4jClient
+from src.ingestion.extraction_cache import ExtractionCache, IngestionCheckpoint
 from src.ingestion.extractor import GraphExtractor
 from src.ingestion.loaders.base import BaseLoader
 from src.ingestion.models import Document, ExtractedGraph
+from src.utils.graph_version import get_graph_version
 
 logger = logging.getLogger(__name__)
 
 # 배치 처리 설정
-DEFAULT_BATCH_SIZE = 50  # 한 번에 처리할 Document 수
-DEFAULT_CONCURRENCY = 5  # 동시 LLM 호출 수
+DEFAULT_BATCH_SIZE = 50  # 한 번에 저장할 Document 수 (writer 병합 단위)
+DEFAULT_CONCURRENCY = 5  # 동시 LLM 호출 수 (extract 워커 수)
+MAX_WRITE_ITEMS = 5000  # 배치당 노드+엣지 상한 (초과 시 문서 수와 무관하게 저장)
+
+# extract 워커 종료 신호 (추출 실패 None과 구분)
+_STAGE_DONE = object()
 
 
 class IngestionPipeline:
@@ -33,8 +42,9 @@ class IngestionPipeline:
 
     Features:
     - 트랜잭션 기반 저장 (원자성 보장)
-    - 배치 처리 지원 (대용량 데이터 최적화)
+    - 스트리밍 처리 (bounded queue로 추출과 저장을 겹쳐 실행, 메모리 일정)
     - 동시성 제어 (LLM API 호출 제한)
+    - 추출 캐시 (변경 없는 행은 LLM 호출 생략) + 커밋 오프셋 기반 재개 (선택)
     - Label 기반 쿼리 최적화 (Neo4j 인덱스 활용)
     """
 
@@ -42,24 +52,46 @@ class IngestionPipeline:
         self,
         batch_size: int = DEFAULT_BATCH_SIZE,
         concurrency: int = DEFAULT_CONCURRENCY,
+        extraction_cache: ExtractionCache | None = None,
+        checkpoint: IngestionCheckpoint | None = None,
     ) -> None:
         self.settings = get_settings()
-        self.extractor = GraphExtractor()
+        self.extractor = GraphExtractor(cache=extraction_cache)
+        self.extraction_cache = extraction_cache
+        self.checkpoint = checkpoint
         self.batch_size = batch_size
         self.concurrency = concurrency
 
         self.neo4j_uri = self.settings.neo4j_uri
         self.neo4j_auth = (self.settings.neo4j_user, self.settings.neo4j_password)
 
-    async def run(self, loader: BaseLoader) -> dict[str, int]:
+    async def run(
+        self,
+        loader: BaseLoader,
+        on_batch: Callable[[dict[str, int]], Awaitable[None] | None] | None = None,
+        resume_key: str | None = None,
+    ) -> dict[str, int]:
         """
-        파이프라인 실행 (배치 + 동시성 처리)
+        파이프라인 실행 (load → extract → write 스트리밍)
+
+        세 단계가 bounded queue로 연결되어 동시에 진행됩니다.
+        - load: 로더에서 Document를 읽어 추출 큐에 투입 (큐가 차면 대기)
+        - extract: concurrency개 워커가 LLM 추출 수행
+        - write: 단일 writer가 여러 문서의 결과를 모아 큰 UNWIND 배치로 저장
+
+        큐 크기가 고정되어 있으므로 입력 크기와 무관하게 메모리 사용량이 일정하고,
+        Neo4j 저장 중에도 LLM 추출이 계속 진행됩니다.
 
         Args:
             loader: 데이터 로더 (BaseLoader 구현체)
+            on_batch: 배치 저장 완료마다 호출되는 콜백 (코루틴 함수면 await)
+                (배치 통계 {docs, total_nodes, total_edges, failed_docs})
+            resume_key: 체크포인트 키 (checkpoint 주입 시). 이전 실행의 커밋
+                오프셋만큼 문서를 건너뛰고, 성공 완료 시 체크포인트를 삭제
 
         Returns:
-            실행 결과 통계 {total_nodes, total_edges, failed_docs}
+            실행 결과 통계 {total_docs, total_nodes, total_edges, failed_docs,
+            skipped_docs}
         """
         logger.info(f"Starting ingestion from loader: {loader.__class__.__name__}")
 
@@ -71,65 +103,161 @@ class IngestionPipeline:
         )
         await client.connect()
 
-        stats = {"total_nodes": 0, "total_edges": 0, "failed_docs": 0}
+        stats = {"total_docs": 0, "total_nodes": 0, "total_edges": 0, "failed_docs": 0}
 
-        try:
-            # Document를 배치로 그룹화
-            batch = []
-            for doc in loader.load():
-                batch.append(doc)
-
-                if len(batch) >= self.batch_size:
-                    batch_stats = await self._process_batch(client, batch)
-                    self._merge_stats(stats, batch_stats)
-                    batch = []
-
-            # 남은 배치 처리
-            if batch:
-                batch_stats = await self._process_batch(client, batch)
+        # 재개: 앞에서부터 연속으로 커밋된 문서 수만큼 건너뜀
+        checkpoint = self.checkpoint if resume_key else None
+        start_offset = (
+            await asyncio.to_thread(checkpoint.get_offset, resume_key)
+            if checkpoint and resume_key
+            else 0
+        )
+        stats["skipped_docs"] = start_offset
+        if start_offset:
+            logger.info(f"Resuming ingestion from document offset {start_offset}")
+
+        # 단계 간 bounded queue (backpressure)
+        # 문서는 (순번, Document)로 흘러 writer가 커밋 오프셋을 계산
+        doc_queue: asyncio.Queue[tuple[int, Document] | None] = asyncio.Queue(
+            maxsize=self.concurrency * 2
+        )
+        result_queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self.batch_size)
+        # 추출 실패 문서 순번: watermark가 이 지점을 넘지 않아 재개 시 재시도됨
+        failed_seqs: set[int] = set()
+
+        async def produce() -> None:
+            for seq, doc in enumerate(loader.load()):
+                if seq < start_offset:
+                    continue
+                await doc_queue.put((seq, doc))
+            # 워커 수만큼 종료 신호
+            for _ in range(self.concurrency):
+                await doc_queue.put(None)
+
+        async def extract_worker() -> None:
+            while (entry := await doc_queue.get()) is not None:
+                seq, doc = entry
+                await result_queue.put((seq, await self._extract_safe(doc)))
+            await result_queue.put(_STAGE_DONE)
+
+        async def write() -> None:
+            pending: list[ExtractedGraph | None] = []
+            pending_seqs: list[int] = []
+            pending_items = 0
+            finished_workers = 0
+            # 워커 완료 순서가 섞이므로 연속 구간의 끝(watermark)만 체크포인트로 기록
+            watermark = start_offset
+            committed_ahead: set[int] = set()
+
+            async def flush() -> None:
+                nonlocal pending, pending_seqs, pending_items, watermark
+                batch_stats = await self._write_results(client, pending)
                 self._merge_stats(stats, batch_stats)
+                stats["total_docs"] += len(pending)
+                if on_batch is not None:
+                    outcome = on_batch({**batch_stats, "docs": len(pending)})
+                    if inspect.isawaitable(outcome):
+                        await outcome
+
+                if checkpoint is not None and resume_key:
+                    for seq, result in zip(pending_seqs, pending, strict=True):
+                        if result is None:
+                            failed_seqs.add(seq)
+                        else:
+                            committed_ahead.add(seq)
+                    while watermark in committed_ahead:
+                        committed_ahead.remove(watermark)
+                        watermark += 1
+                    await asyncio.to_thread(
+                        checkpoint.save_offset, resume_key, watermark
+                    )
+
+                pending, pending_seqs, pending_items = [], [], 0
+
+            while finished_workers < self.concurrency:
+                item = await result_queue.get()
+                if item is _STAGE_DONE:
+                    finished_workers += 1
+                    continue
+                seq, result = item
+                pending.append(result)
+                pending_seqs.append(seq)
+                if result is not None:
+                    pending_items += len(result.nodes) + len(result.edges)
+                if len(pending) >= self.batch_size or pending_items >= MAX_WRITE_ITEMS:
+                    await flush()
+
+            if pending:
+                await flush()
+
+        tasks = [
+            asyncio.create_task(produce(), name="ingestion_load"),
+            *(
+                asyncio.create_task(extract_worker(), name=f"ingestion_extract_{i}")
+                for i in range(self.concurrency)
+            ),
+            asyncio.create_task(write(), name="ingestion_write"),
+        ]
 
+        try:
+            # 어느 단계든 실패하면 즉시 예외 전파 (나머지는 finally에서 취소)
+            await asyncio.gather(*tasks)
+
+            if checkpoint is not None and resume_key:
+                if failed_seqs:
+                    # 실패 문서가 남아 있으면 체크포인트를 유지해 재실행 시 그 지점부터 재시도
+                    logger.warning(
+                        f"Keeping ingestion checkpoint at offset {min(failed_seqs)}: "
+                        f"{len(failed_seqs)} document(s) failed extraction"
+                    )
+                else:
+                    await asyncio.to_thread(checkpoint.clear, resume_key)
+
+            cache_info = ""
+            if self.extraction_cache is not None:
+                cache_info = (
+                    f", Cache hits: {self.extraction_cache.hits}"
+                    f"/{self.extraction_cache.hits + self.extraction_cache.misses}"
+                )
             logger.info(
                 f"Ingestion completed. "
+                f"Docs: {stats['total_docs']}, "
                 f"Nodes: {stats['total_nodes']}, "
                 f"Edges: {stats['total_edges']}, "
                 f"Failed: {stats['failed_docs']}"
+                f"{cache_info}"
             )
             return stats
 
         finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             await client.close()
 
-    async def _process_batch(
-        self, client: Neo4jClient, docs: list[Document]
+    async def _extract_safe(self, doc: Document) -> ExtractedGraph | None:
+        """단일 문서 추출 (LLM 호출 포함 실패 시 None)"""
+        try:
+            return await self.extractor.extract(doc, raise_on_llm_error=True)
+        except Exception as e:
+            logger.error(f"Extraction failed for {doc.metadata}: {e}")
+            return None
+
+    async def _write_results(
+        self, client: Neo4jClient, results: list[ExtractedGraph | None]
     ) -> dict[str, int]:
         """
-        배치 단위 처리 (동시성 제한 + 트랜잭션 저장)
+        여러 문서의 추출 결과를 하나의 그래프로 병합해 트랜잭션 저장
 
         Args:
             client: Neo4j 클라이언트
-            docs: 처리할 Document 리스트
+            results: 문서별 추출 결과 (None은 추출 실패)
 
         Returns:
             배치 처리 결과 통계
         """
         stats = {"total_nodes": 0, "total_edges": 0, "failed_docs": 0}
 
-        # Semaphore로 동시성 제한 (LLM API Rate Limit 대응)
-        semaphore = asyncio.Semaphore(self.concurrency)
-
-        async def extract_with_limit(doc: Document) -> ExtractedGraph | None:
-            async with semaphore:
-                try:
-                    return await self.extractor.extract(doc)
-                except Exception as e:
-                    logger.error(f"Extraction failed for {doc.metadata}: {e}")
-                    return None
-
-        # 동시에 추출 (Semaphore로 제한)
-        tasks = [extract_with_limit(doc) for doc in docs]
-        results = await asyncio.gather(*tasks)
-
         # 추출 결과를 하나의 그래프로 병합
         merged_graph = ExtractedGraph(nodes=[], edges=[])
         for graph in results:
@@ -144,6 +272,8 @@ class IngestionPipeline:
         # 트랜잭션으로 일괄 저장
         if merged_graph.nodes or merged_graph.edges:
             await self._save_graph_batch(client, merged_graph)
+            # 배치 커밋마다 버전 증가 (적재 중에도 결과 캐시가 stale 데이터를 내지 않도록)
+            get_graph_version().bump("ingestion")
             stats["total_nodes"] += len(merged_graph.nodes)
             stats["total_edges"] += len(merged_graph.edges)
 
@@ -229,6 +359,7 @@ class IngestionPipeline:
             n += node.props,
             n.updated_at = datetime(),
             n.last_source_file = node.source_file
+        SET n.{NAME_NORM_PROPERTY} = {name_norm_expr("n.name")}
         """
 
         await client.execute_write(query, {"nodes": nodes_data})
@@ -50,6 +50,7 @@ from src.services.gds_service import GDSService
 from src.services.graph_edit_service import GraphEditService
 from src.services.ontology_service import OntologyService
 from src.services.project_staffing_service import ProjectStaffingService
+from src.services.skill_matrix import SkillMatrixService
 
 # 로깅 설정
 settings = get_settings()
@@ -83,13 +84,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Neo4j client connected")
 
     # Repository 초기화
-    neo4j_repo = Neo4jRepository(neo4j_client)
+    neo4j_repo = Neo4jRepository(
+        neo4j_client, schema_snapshot_path=settings.schema_snapshot_path
+    )
     llm_gateway = AzureOpenAIGateway(settings)
     llm_tasks = LLMTaskService(llm_gateway)
 
     # 스키마 사전 로드 (파이프라인에 주입)
+    # 스냅샷 파일이 있으면 즉시 기동하고 DB 인트로스펙션은 백그라운드에서 수행
+    graph_schema = await neo4j_repo.load_schema_snapshot()
+    schema_from_snapshot = graph_schema is not None
     try:
-        graph_schema = await neo4j_repo.get_schema()
+        if graph_schema is None:
+            graph_schema = await neo4j_repo.get_schema()
         logger.info(
             f"Schema loaded: "
             f"{len(graph_schema.get('node_labels', []))} labels, "
@@ -104,11 +111,20 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             "Schema loading is required for pipeline initialization"
         ) from e
 
+    # name_norm 인덱스 보장 + 1회 백필 (이름 조회 쿼리용, 실패해도 기동은 계속)
+    # 완료된 레이블은 :SchemaMigration 마커로 건너뛰어 이후 기동에서는 전체 스캔 없음
+    try:
+        await neo4j_repo.ensure_name_norm_indexes()
+        await neo4j_repo.backfill_name_norm_once()
+    except Exception as e:
+        logger.warning(f"Failed to ensure name_norm indexes/backfill: {e}")
+
     # OntologyRegistry 초기화 (Pipeline/OntologyService에 주입)
     ontology_registry = OntologyRegistry(
         neo4j_client=neo4j_client,
         settings=settings,
     )
+    await ontology_registry.load_snapshot()
     logger.info(f"OntologyRegistry initialized (mode={ontology_registry.mode})")
 
     # OntologyService 초기화 (Pipeline에 주입하여 사용자 주도 온톨로지 업데이트 지원)
@@ -119,8 +135,21 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("OntologyService initialized for Pipeline injection")
 
     # Checkpointer 초기화
-    checkpointer = await create_checkpointer(settings.checkpointer_db_path)
-    logger.info(f"Checkpointer initialized: {type(checkpointer).__name__}")
+    checkpointer = await create_checkpointer(
+        settings.checkpointer_db_path,
+        message_window=settings.checkpointer_message_window,
+        summarize_trimmed=settings.checkpointer_summarize_trimmed,
+    )
+    logger.info(
+        f"Checkpointer initialized: {type(checkpointer.inner).__name__} "
+        f"(message window: {settings.checkpointer_message_window})"
+    )
+    # 오래 사용되지 않은 세션 체크포인트 정리
+    if settings.checkpointer_thread_ttl_seconds > 0:
+        checkpointer.start_pruning(
+            settings.checkpointer_thread_ttl_seconds,
+            settings.checkpointer_prune_interval_seconds,
+        )
 
     # Pipeline 초기화 (스키마 + 온톨로지 로더 + 온톨로지 서비스 + checkpointer 주입)
     pipeline = GraphRAGPipeline(
@@ -139,12 +168,31 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         "Pipeline initialized with pre-loaded schema, ontology registry, and ontology service"
     )
 
+    # 스냅샷으로 기동한 경우 DB 기준 스키마를 백그라운드에서 재조회 (변경 시 교체)
+    if schema_from_snapshot:
+        neo4j_repo.refresh_schema_in_background(on_change=pipeline.update_graph_schema)
+
+    # 질문 캐시 유지보수 (히트 카운트 일괄 반영 + 만료 항목 정리)
+    if pipeline.query_cache_repository is not None:
+        pipeline.query_cache_repository.start_maintenance(
+            settings.query_cache_maintenance_interval_seconds
+        )
+
+    # 직원×스킬 인메모리 행렬 (첫 조회 시 적재, 그래프 편집은 증분 반영)
+    skill_matrix = SkillMatrixService(
+        neo4j_repo, max_age_seconds=settings.skill_matrix_max_age_seconds
+    )
+
     # GDS 서비스 초기화
     gds_service = GDSService(
         uri=settings.neo4j_uri,
         user=settings.neo4j_user,
         password=settings.neo4j_password,
         database=settings.neo4j_database,
+        max_workers=settings.gds_algorithm_workers,
+        skill_matrix=skill_matrix,
+        neo4j_repository=neo4j_repo,
+        read_workers=settings.gds_read_workers,
     )
     await gds_service.connect()
     logger.info("GDS service connected")
@@ -162,8 +210,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     explainability_service = ExplainabilityService()
     logger.info("ExplainabilityService initialized")
 
-    # GraphEditService 초기화
-    graph_edit_service = GraphEditService(neo4j_repo)
+    # GraphEditService 초기화 (편집 시 파이프라인 질문 캐시 L1 무효화)
+    graph_edit_service = GraphEditService(
+        neo4j_repo,
+        query_cache=pipeline.query_cache_repository,
+        skill_matrix=skill_matrix,
+    )
     logger.info("GraphEditService initialized")
 
     # ProjectStaffingService 초기화
@@ -196,12 +248,24 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.state.graph_edit_service = graph_edit_service
     app.state.staffing_service = staffing_service
     app.state.auth_service = auth_service
+    app.state.checkpointer = checkpointer
 
     yield
 
     # 종료 시 리소스 정리
     logger.info("Shutting down Graph RAG API...")
 
+    if hasattr(app.state, "neo4j_repo") and app.state.neo4j_repo:
+        await app.state.neo4j_repo.stop_background_schema_refresh()
+
+    if hasattr(app.state, "pipeline") and app.state.pipeline.query_cache_repository:
+        await app.state.pipeline.query_cache_repository.stop_maintenance()
+        logger.info("Query cache maintenance stopped")
+
+    if hasattr(app.state, "checkpointer") and app.state.checkpointer:
+        await app.state.checkpointer.stop_pruning()
+        logger.info("Checkpointer pruning stopped")
+
     if hasattr(app.state, "gds_service") and app.state.gds_service:
         await app.state.gds_service.close()
         logger.info("GDS service closed")
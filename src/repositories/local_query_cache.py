@@ -0,0 +1,259 @@
+"""
+Local Query Cache - 프로세스 내 L1 질문-Cypher 캐시
+
+책임:
+- 질문 텍스트 정확 일치 LRU (임베딩 호출까지 생략)
+- 최근 캐시 임베딩 행렬에 대한 벡터화 코사인 top-1 검색 (Neo4j 벡터 검색 생략)
+- 크기/TTL 기반 퇴출 및 명시적 무효화
+
+Neo4j CachedQuery(L2) 앞단에서만 동작하며, 워커 프로세스별로 독립적입니다.
+다른 워커의 무효화는 전파되지 않으므로 TTL을 짧게 유지합니다.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.repositories.query_cache_repository import CachedQuery
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _LocalEntry:
+    """L1 캐시 항목 (단위 벡터로 정규화된 임베딩 보관)"""
+
+    cached: CachedQuery
+    embedding: list[float]
+    unit_vector: np.ndarray
+    expires_at: float
+    questions: set[str] = dataclasses.field(default_factory=set)
+
+
+def _question_key(question: str) -> str:
+    """정확 일치 키: 연속 공백 축약 + casefold"""
+    return " ".join(question.split()).casefold()
+
+
+class LocalQueryCache:
+    """
+    프로세스 내 L1 질문-Cypher 캐시
+
+    항목은 L2 노드 elementId로 식별되며 LRU 순서로 관리됩니다.
+    임베딩 행렬은 항목 변경 시에만 재구성(lazy)되어 검색은 행렬-벡터 곱 1회입니다.
+
+    사용 예시:
+        l1 = LocalQueryCache(max_entries=512, ttl_seconds=600)
+        l1.put(cached, embedding, question="Python 잘하는 사람?")
+
+        hit = l1.get_exact("python 잘하는 사람?")      # (CachedQuery, embedding)
+        similar = l1.find_similar(embedding, 0.93)     # CachedQuery | None
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 600.0):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._question_index: dict[str, str] = {}
+
+        # 벡터 검색용 행렬 (entries 변경 시 재구성)
+        self._matrix: np.ndarray | None = None
+        self._matrix_ids: list[str] = []
+        self._matrix_dirty = True
+
+        self._exact_hits = 0
+        self._vector_hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ============================================
+    # 조회
+    # ============================================
+
+    def get_exact(self, question: str) -> tuple[CachedQuery, list[float]] | None:
+        """
+        질문 텍스트 정확 일치 조회
+
+        Returns:
+            (캐시 항목, 질문 임베딩) 또는 None
+        """
+        entry_id = self._question_index.get(_question_key(question))
+        entry = self._get_live(entry_id) if entry_id else None
+        if entry is None:
+            return None
+
+        self._exact_hits += 1
+        return dataclasses.replace(entry.cached, score=1.0), entry.embedding
+
+    def find_similar(
+        self,
+        embedding: list[float],
+        threshold: float,
+    ) -> CachedQuery | None:
+        """
+        코사인 유사도 top-1 검색
+
+        Args:
+            embedding: 질문 임베딩
+            threshold: 최소 유사도 (L2 벡터 검색과 동일 기준)
+
+        Returns:
+            임계값 이상인 최상위 항목 (score 갱신본) 또는 None
+        """
+        self._evict_expired()
+        if not self._entries:
+            self._misses += 1
+            return None
+
+        query = self._to_unit_vector(embedding)
+        matrix = self._get_matrix()
+        if query is None or matrix.shape[1] != query.shape[0]:
+            self._misses += 1
+            return None
+
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+        if score < threshold:
+            self._misses += 1
+            return None
+
+        entry_id = self._matrix_ids[best]
+        self._entries.move_to_end(entry_id)
+        self._vector_hits += 1
+        return dataclasses.replace(self._entries[entry_id].cached, score=score)
+
+    # ============================================
+    # 저장 / 무효화
+    # ============================================
+
+    def put(
+        self,
+        cached: CachedQuery,
+        embedding: list[float],
+        question: str | None = None,
+        expires_at: float | None = None,
+    ) -> None:
+        """
+        항목 저장 (이미 있으면 질문 키만 추가하고 LRU 갱신)
+
+        Args:
+            cached: L2 캐시 항목 (id 필수)
+            embedding: 질문 임베딩
+            question: 정확 일치 키로 등록할 질문 (None이면 cached.question)
+            expires_at: 만료 시각 (epoch 초). L1 TTL보다 이르면 이 값을 사용
+        """
+        if not cached.id:
+            return
+
+        unit_vector = self._to_unit_vector(embedding)
+        if unit_vector is None:
+            return
+
+        key = _question_key(question or cached.question)
+        entry = self._entries.get(cached.id)
+        if entry is None:
+            local_expiry = time.time() + self._ttl_seconds
+            entry = _LocalEntry(
+                cached=cached,
+                embedding=list(embedding),
+                unit_vector=unit_vector,
+                expires_at=min(local_expiry, expires_at or local_expiry),
+            )
+            self._entries[cached.id] = entry
+            self._matrix_dirty = True
+        else:
+            self._entries.move_to_end(cached.id)
+
+        entry.questions.add(key)
+        entry.questions.add(_question_key(cached.question))
+        for question_key in entry.questions:
+            self._question_index[question_key] = cached.id
+
+        while len(self._entries) > self._max_entries:
+            oldest_id = next(iter(self._entries))
+            self._remove(oldest_id)
+
+    def discard(self, entry_id: str) -> None:
+        """단일 항목 제거 (L2 삭제와 동기화)"""
+        if entry_id in self._entries:
+            self._remove(entry_id)
+
+    def clear(self) -> int:
+        """전체 무효화
+
+        Returns:
+            제거된 항목 수
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        self._question_index.clear()
+        self._matrix = None
+        self._matrix_ids = []
+        self._matrix_dirty = True
+        if count:
+            logger.debug(f"Local query cache cleared: {count} entries")
+        return count
+
+    def get_stats(self) -> dict[str, int]:
+        """L1 통계"""
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "exact_hits": self._exact_hits,
+            "vector_hits": self._vector_hits,
+            "misses": self._misses,
+        }
+
+    # ============================================
+    # 내부 헬퍼
+    # ============================================
+
+    def _get_live(self, entry_id: str) -> _LocalEntry | None:
+        """만료 확인 후 항목 반환 (LRU 갱신)"""
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            self._remove(entry_id)
+            return None
+        self._entries.move_to_end(entry_id)
+        return entry
+
+    def _evict_expired(self) -> None:
+        now = time.time()
+        expired = [eid for eid, e in self._entries.items() if e.expires_at <= now]
+        for entry_id in expired:
+            self._remove(entry_id)
+
+    def _remove(self, entry_id: str) -> None:
+        entry = self._entries.pop(entry_id)
+        for question_key in entry.questions:
+            if self._question_index.get(question_key) == entry_id:
+                del self._question_index[question_key]
+        self._matrix_dirty = True
+
+    def _get_matrix(self) -> np.ndarray:
+        if self._matrix_dirty or self._matrix is None:
+            self._matrix_ids = list(self._entries)
+            self._matrix = np.vstack([e.unit_vector for e in self._entries.values()])
+            self._matrix_dirty = False
+        return self._matrix
+
+    @staticmethod
+    def _to_unit_vector(embedding: list[float]) -> np.ndarray | None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        return vector / norm
@@ -14,6 +14,13 @@ import logging
 import re
 from typing import Any
 
+from src.domain.constants import (
+    ENTITY_EMBEDDING_PROPERTY,
+    ENTITY_EMBEDDING_TEXT_PROPERTY,
+    NAME_NORM_PROPERTY,
+    name_norm_match,
+    normalize_name,
+)
 from src.domain.exceptions import (
     EntityNotFoundError,
     QueryExecutionError,
@@ -31,6 +38,26 @@ from src.repositories.neo4j_validators import (
 
 logger = logging.getLogger(__name__)
 
+# 조회 결과에서 제외하는 임베딩 속성 (1536 float ≈ 12KB/노드 전송 방지)
+EXCLUDED_NODE_PROPERTIES: tuple[str, ...] = (
+    ENTITY_EMBEDDING_PROPERTY,
+    ENTITY_EMBEDDING_TEXT_PROPERTY,
+)
+
+
+def node_properties_expr(var: str) -> str:
+    """임베딩 속성을 DB에서 null 처리한 노드 속성 맵 프로젝션 Cypher 식"""
+    excluded = ", ".join(f"`{prop}`: null" for prop in EXCLUDED_NODE_PROPERTIES)
+    return f"{var} {{.*, {excluded}}}"
+
+
+def strip_excluded_properties(properties: dict[str, Any] | None) -> dict[str, Any]:
+    """프로젝션에서 null 처리된 임베딩 속성 키 제거"""
+    props = dict(properties or {})
+    for key in EXCLUDED_NODE_PROPERTIES:
+        props.pop(key, None)
+    return props
+
 
 class Neo4jEntityRepository:
     """엔티티 검색/탐색 전담 레포지토리"""
@@ -47,14 +74,17 @@ class Neo4jEntityRepository:
         """
         이름으로 엔티티 검색 (정확 일치 우선)
 
-        3단계 폴백: 정확 일치 → 공백 제거 → 한국어 접미사 제거
+        2단계 폴백: name_norm 일치 (대소문자·공백 무시) → 한국어 접미사 제거
+        같은 name_norm 안에서는 대소문자 무시 정확 일치를 먼저 반환합니다.
         """
         label_filter = build_label_filter(labels)
 
         query = f"""
         MATCH (n{label_filter})
-        WHERE toLower(n.name) = toLower($name)
-        RETURN elementId(n) as id, labels(n) as labels, properties(n) as properties
+        WHERE {name_norm_match("n", "name")}
+        RETURN elementId(n) as id, labels(n) as labels,
+               {node_properties_expr("n")} as properties
+        ORDER BY CASE WHEN toLower(n.name) = toLower($name) THEN 0 ELSE 1 END
         LIMIT $limit
         """
 
@@ -63,33 +93,18 @@ class Neo4jEntityRepository:
                 query, {"name": name, "limit": limit}
             )
 
-            if not results:
-                query_no_space = f"""
-                MATCH (n{label_filter})
-                WHERE replace(toLower(n.name), ' ', '') = replace(toLower($name), ' ', '')
-                RETURN elementId(n) as id, labels(n) as labels, properties(n) as properties
-                LIMIT $limit
-                """
-                results = await self._client.execute_query(
-                    query_no_space, {"name": name, "limit": limit}
-                )
-
             if not results:
                 stripped = strip_korean_suffix(name)
                 if stripped != name:
                     results = await self._client.execute_query(
                         query, {"name": stripped, "limit": limit}
                     )
-                    if not results:
-                        results = await self._client.execute_query(
-                            query_no_space, {"name": stripped, "limit": limit}
-                        )
 
             return [
                 NodeResult(
                     id=r["id"],
                     labels=r["labels"],
-                    properties=r["properties"],
+                    properties=strip_excluded_properties(r["properties"]),
                 )
                 for r in results
             ]
@@ -99,15 +114,114 @@ class Neo4jEntityRepository:
                 f"Failed to find entities: {e}", query=query
             ) from e
 
+    async def find_entities_by_names(
+        self,
+        lookups: list[tuple[str | None, str]],
+        limit: int = 3,
+    ) -> dict[tuple[str | None, str], list[NodeResult]]:
+        """
+        여러 (레이블, 이름) 쌍을 단일 쿼리로 일괄 검색
+
+        find_entities_by_name()과 같은 우선순위(정확 일치 → name_norm 일치 →
+        접미사 제거 후 정확 일치 → 접미사 제거 후 name_norm 일치)를 한 번의
+        UNWIND 쿼리에서 tier로 계산하고, 입력 쌍마다 가장 높은 우선순위 tier의
+        결과만 반환합니다. 후보는 name_norm 인덱스로 조회합니다.
+
+        Args:
+            lookups: (레이블 또는 None, 이름) 튜플 리스트
+            limit: 입력 쌍당 최대 결과 수
+
+        Returns:
+            입력 쌍 → 매칭 노드 리스트 (매칭 없으면 빈 리스트)
+        """
+        matches: dict[tuple[str | None, str], list[NodeResult]] = {}
+        items_by_label: dict[str | None, list[dict[str, Any]]] = {}
+        keys: list[tuple[str | None, str]] = []
+
+        for label, name in lookups:
+            key = (label, name)
+            if key in matches:
+                continue
+            matches[key] = []
+            stripped = strip_korean_suffix(name)
+            items_by_label.setdefault(label, []).append(
+                {
+                    "idx": len(keys),
+                    "name": name,
+                    "norm": normalize_name(name),
+                    "stripped": stripped if stripped != name else None,
+                    "stripped_norm": (
+                        normalize_name(stripped) if stripped != name else None
+                    ),
+                }
+            )
+            keys.append(key)
+
+        if not keys:
+            return matches
+
+        # 레이블별 UNWIND 서브쿼리를 UNION ALL로 결합 (레이블별 name_norm 인덱스 사용)
+        branches = []
+        params: dict[str, Any] = {"limit": limit}
+        for i, (label, items) in enumerate(items_by_label.items()):
+            label_filter = build_label_filter([label] if label else None)
+            params[f"items_{i}"] = items
+            branches.append(
+                f"""
+            UNWIND $items_{i} AS item
+            MATCH (n{label_filter})
+            WHERE n.{NAME_NORM_PROPERTY} IN [item.norm, item.stripped_norm]
+            WITH item, n, CASE
+                WHEN n.{NAME_NORM_PROPERTY} = item.norm
+                     AND toLower(n.name) = toLower(item.name) THEN 0
+                WHEN n.{NAME_NORM_PROPERTY} = item.norm THEN 1
+                WHEN toLower(n.name) = toLower(item.stripped) THEN 2
+                ELSE 3
+            END AS tier
+            RETURN item.idx AS idx, tier, n"""
+            )
+
+        union_branches = "\n            UNION ALL".join(branches)
+        query = f"""
+        CALL {{{union_branches}
+        }}
+        WITH idx, tier, collect({{
+            id: elementId(n), labels: labels(n), properties: {node_properties_expr("n")}
+        }})[..$limit] AS nodes
+        ORDER BY idx, tier
+        WITH idx, collect(nodes)[0] AS best
+        RETURN idx, best
+        """
+
+        try:
+            results = await self._client.execute_query(query, params)
+        except Exception as e:
+            logger.error(f"Failed to find entities by names ({len(keys)} lookups): {e}")
+            raise QueryExecutionError(
+                f"Failed to find entities: {e}", query=query
+            ) from e
+
+        for r in results:
+            matches[keys[r["idx"]]] = [
+                NodeResult(
+                    id=node["id"],
+                    labels=node["labels"],
+                    properties=strip_excluded_properties(node["properties"]),
+                )
+                for node in r["best"]
+            ]
+        return matches
+
     async def find_entity_by_id(
         self,
         entity_id: str,
     ) -> NodeResult:
         """ID로 엔티티 조회"""
-        query = """
+        query = f"""
         MATCH (n)
         WHERE elementId(n) = $entity_id
-        RETURN elementId(n) as id, labels(n) as labels, properties(n) as properties
+        RETURN elementId(n) as id, labels(n) as labels,
+               {node_properties_expr("n")} as properties
         """
 
         results = await self._client.execute_query(query, {"entity_id": entity_id})
@@ -119,7 +233,7 @@ class Neo4jEntityRepository:
         return NodeResult(
             id=r["id"],
             labels=r["labels"],
-            properties=r["properties"],
+            properties=strip_excluded_properties(r["properties"]),
         )
 
     async def get_neighbors(
@@ -147,7 +261,7 @@ class Neo4jEntityRepository:
         RETURN DISTINCT
             elementId(neighbor) as neighbor_id,
             labels(neighbor) as neighbor_labels,
-            properties(neighbor) as neighbor_properties,
+            {node_properties_expr("neighbor")} as neighbor_properties,
             [rel in r | type(rel)] as relationship_types
         LIMIT $limit
         """
@@ -161,7 +275,7 @@ class Neo4jEntityRepository:
                 "node": NodeResult(
                     id=r["neighbor_id"],
                     labels=r["neighbor_labels"],
-                    properties=r["neighbor_properties"],
+                    properties=strip_excluded_properties(r["neighbor_properties"]),
                 ),
                 "relationship_types": r["relationship_types"],
             }
@@ -186,7 +300,8 @@ class Neo4jEntityRepository:
             RETURN
                 elementId(r) as rel_id, type(r) as rel_type, properties(r) as rel_props,
                 elementId(n) as start_id, elementId(other) as end_id,
-                labels(other) as other_labels, properties(other) as other_props
+                labels(other) as other_labels,
+                {node_properties_expr("other")} as other_props
             LIMIT $limit
             """
         elif validated_direction == "in":
@@ -196,7 +311,8 @@ class Neo4jEntityRepository:
             RETURN
                 elementId(r) as rel_id, type(r) as rel_type, properties(r) as rel_props,
                 elementId(other) as start_id, elementId(n) as end_id,
-                labels(other) as other_labels, properties(other) as other_props
+                labels(other) as other_labels,
+                {node_properties_expr("other")} as other_props
             LIMIT $limit
             """
         else:
@@ -206,7 +322,8 @@ class Neo4jEntityRepository:
             RETURN
                 elementId(r) as rel_id, type(r) as rel_type, properties(r) as rel_props,
                 elementId(startNode(r)) as start_id, elementId(endNode(r)) as end_id,
-                labels(other) as other_labels, properties(other) as other_props
+                labels(other) as other_labels,
+                {node_properties_expr("other")} as other_props
             LIMIT $limit
             """
 
@@ -225,7 +342,7 @@ class Neo4jEntityRepository:
                 ),
                 "other_node": {
                     "labels": r["other_labels"],
-                    "properties": r["other_props"],
+                    "properties": strip_excluded_properties(r["other_props"]),
                 },
             }
             for r in results
@@ -238,10 +355,11 @@ class Neo4jEntityRepository:
         limit: int = 10,
     ) -> list[NodeResult]:
         """전문 검색 (Full-text search)"""
-        query = """
+        query = f"""
         CALL db.index.fulltext.queryNodes($index_name, $search_term)
         YIELD node, score
-        RETURN elementId(node) as id, labels(node) as labels, properties(node) as properties, score
+        RETURN elementId(node) as id, labels(node) as labels,
+               {node_properties_expr("node")} as properties, score
         ORDER BY score DESC
         LIMIT $limit
         """
@@ -255,7 +373,7 @@ class Neo4jEntityRepository:
                 NodeResult(
                     id=r["id"],
                     labels=r["labels"],
-                    properties=r["properties"],
+                    properties=strip_excluded_properties(r["properties"]),
                 )
                 for r in results
             ]
@@ -286,7 +404,7 @@ class Neo4jEntityRepository:
             collect(DISTINCT {{
                 id: elementId(node),
                 labels: labels(node),
-                properties: properties(node)
+                properties: {node_properties_expr("node")}
             }}) as nodes,
             collect(DISTINCT {{
                 id: elementId(rel),
@@ -311,7 +429,7 @@ class Neo4jEntityRepository:
                 {
                     "id": n["id"],
                     "labels": n["labels"],
-                    "properties": n["properties"],
+                    "properties": strip_excluded_properties(n["properties"]),
                 }
                 for n in result.get("nodes", [])
             ],
@@ -418,7 +536,8 @@ class Neo4jEntityRepository:
         YIELD node, score
         WITH node as n, score
         {label_where}
-        RETURN elementId(n) as id, labels(n) as labels, properties(n) as properties
+        RETURN elementId(n) as id, labels(n) as labels,
+               {node_properties_expr("n")} as properties
         ORDER BY score DESC
         LIMIT $limit
         """
@@ -427,7 +546,11 @@ class Neo4jEntityRepository:
         if label:
             params["label"] = label
 
-        return await self._client.execute_query(query, params)
+        results = await self._client.execute_query(query, params)
+        return [
+            {**r, "properties": strip_excluded_properties(r["properties"])}
+            for r in results
+        ]
 
     async def _search_nodes_contains(
         self,
@@ -453,20 +576,25 @@ class Neo4jEntityRepository:
         query = f"""
         MATCH (n{label_filter})
         {where_clause}
-        RETURN elementId(n) as id, labels(n) as labels, properties(n) as properties
+        RETURN elementId(n) as id, labels(n) as labels,
+               {node_properties_expr("n")} as properties
         ORDER BY n.name
         LIMIT $limit
         """
 
-        return await self._client.execute_query(query, params)
+        results = await self._client.execute_query(query, params)
+        return [
+            {**r, "properties": strip_excluded_properties(r["properties"])}
+            for r in results
+        ]
 
     async def find_concept_bridge(
         self,
         skill_name: str,
     ) -> dict[str, Any] | None:
         """Skill 이름으로 매칭되는 Concept + IS_A 계층 조회"""
-        query = """
-        MATCH (c:Concept) WHERE toLower(c.name) = toLower($name)
+        query = f"""
+        MATCH (c:Concept) WHERE {name_norm_match("c", "name")}
         OPTIONAL MATCH (c)-[:IS_A*0..5]->(parent:Concept)
         WITH c, collect(DISTINCT parent.name) AS ancestors
         ORDER BY elementId(c) ASC
@@ -481,7 +609,7 @@ class Neo4jEntityRepository:
 
     async def find_relationship_by_id(self, rel_id: str) -> dict[str, Any]:
         """ID로 관계 조회"""
-        query = """
+        query = f"""
         MATCH (src)-[r]->(tgt)
         WHERE elementId(r) = $rel_id
         RETURN
@@ -491,15 +619,20 @@ class Neo4jEntityRepository:
             elementId(tgt) as target_id,
             properties(r) as properties,
             labels(src) as source_labels,
-            properties(src) as source_properties,
+            {node_properties_expr("src")} as source_properties,
             labels(tgt) as target_labels,
-            properties(tgt) as target_properties
+            {node_properties_expr("tgt")} as target_properties
         """
 
         results = await self._client.execute_query(query, {"rel_id": rel_id})
         if not results:
             raise EntityNotFoundError("Edge", rel_id)
-        return results[0]
+        row = results[0]
+        return {
+            **row,
+            "source_properties": strip_excluded_properties(row["source_properties"]),
+            "target_properties": strip_excluded_properties(row["target_properties"]),
+        }
 
     async def get_node_relationships_detailed(
         self,
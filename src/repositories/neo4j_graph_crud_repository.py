@@ -4,6 +4,8 @@ Neo4j Graph CRUD Repository - 노드/엣지 CRUD
 책임:
 - 범용 노드 생성/수정/삭제
 - 범용 관계 생성/삭제
+- HAS_SKILL 생성/삭제 시 같은 쓰기에서 스킬 변경 시각 기록 (증분 커뮤니티 리프레시용)
+  (노드 강제 삭제로 HAS_SKILL이 함께 지워질 때도 보유 직원에 기록)
 - 중복 확인
 - 관계 수 조회
 """
@@ -11,15 +13,36 @@ Neo4j Graph CRUD Repository - 노드/엣지 CRUD
 import logging
 from typing import Any
 
+from src.domain.constants import NAME_NORM_PROPERTY, name_norm_expr, name_norm_match
 from src.domain.exceptions import (
     EntityNotFoundError,
     QueryExecutionError,
 )
 from src.infrastructure.neo4j_client import Neo4jClient
+from src.repositories.neo4j_entity_repository import (
+    node_properties_expr,
+    strip_excluded_properties,
+)
 from src.repositories.neo4j_validators import validate_identifier
 
 logger = logging.getLogger(__name__)
 
+# 강제 삭제(DETACH DELETE) 전에 삭제 대상을 HAS_SKILL로 가리키던 노드에 변경 시각 기록
+# (스킬 노드 삭제로 사라지는 엣지도 증분 커뮤니티 리프레시가 감지하도록)
+_MARK_SKILL_HOLDERS = """
+        OPTIONAL MATCH (holder)-[:HAS_SKILL]->(n)
+        WITH n, collect(holder) as holders
+        FOREACH (h IN holders | SET h.skills_changed_at = datetime())
+"""
+
+
+def _without_embeddings(record: dict[str, Any]) -> dict[str, Any]:
+    """노드 레코드의 properties에서 임베딩 속성 제거 (API 응답용)"""
+    return {
+        **record,
+        "properties": strip_excluded_properties(record.get("properties")),
+    }
+
 
 class Neo4jGraphCrudRepository:
     """Graph CRUD 전담 레포지토리"""
@@ -37,12 +60,14 @@ class Neo4jGraphCrudRepository:
 
         query = f"""
         OPTIONAL MATCH (existing:{validated_label})
-        WHERE toLower(existing.name) = toLower($name)
+        WHERE {name_norm_match("existing", "name")}
         WITH existing
         WHERE existing IS NULL
         CREATE (n:{validated_label} $props)
-        SET n.created_at = datetime()
-        RETURN elementId(n) as id, labels(n) as labels, properties(n) as properties
+        SET n.created_at = datetime(),
+            n.{NAME_NORM_PROPERTY} = {name_norm_expr("n.name")}
+        RETURN elementId(n) as id, labels(n) as labels,
+               {node_properties_expr("n")} as properties
         """
 
         try:
@@ -52,7 +77,7 @@ class Neo4jGraphCrudRepository:
             )
             if not results:
                 return None
-            return results[0]
+            return _without_embeddings(results[0])
         except Exception as e:
             logger.error(f"Failed to create node with label '{label}': {e}")
             raise QueryExecutionError(f"Failed to create node: {e}", query=query) from e
@@ -67,7 +92,7 @@ class Neo4jGraphCrudRepository:
 
         query = f"""
         MATCH (n:{validated_label})
-        WHERE toLower(n.name) = toLower($name)
+        WHERE {name_norm_match("n", "name")}
         RETURN count(n) > 0 as exists
         """
 
@@ -94,7 +119,9 @@ class Neo4jGraphCrudRepository:
         WHERE elementId(n) = $node_id
         SET n += $props, n.updated_at = datetime()
         {remove_clause}
-        RETURN elementId(n) as id, labels(n) as labels, properties(n) as properties
+        SET n.{NAME_NORM_PROPERTY} = {name_norm_expr("n.name")}
+        RETURN elementId(n) as id, labels(n) as labels,
+               {node_properties_expr("n")} as properties
         """
 
         try:
@@ -103,7 +130,7 @@ class Neo4jGraphCrudRepository:
             )
             if not results:
                 raise EntityNotFoundError("Node", node_id)
-            return results[0]
+            return _without_embeddings(results[0])
         except EntityNotFoundError:
             raise
         except Exception as e:
@@ -115,12 +142,12 @@ class Neo4jGraphCrudRepository:
         node_id: str,
         force: bool = False,
     ) -> bool:
-        """노드 삭제"""
-        delete_keyword = "DETACH DELETE" if force else "DELETE"
+        """노드 삭제 (force면 HAS_SKILL 보유 노드의 skills_changed_at도 같은 쓰기에서 갱신)"""
+        delete_clause = f"{_MARK_SKILL_HOLDERS}DETACH DELETE n" if force else "DELETE n"
         query = f"""
         MATCH (n)
         WHERE elementId(n) = $node_id
-        {delete_keyword} n
+        {delete_clause}
         RETURN true as deleted
         """
 
@@ -150,9 +177,10 @@ class Neo4jGraphCrudRepository:
     ) -> dict[str, Any]:
         """노드 삭제 (atomic — 관계 확인과 삭제를 단일 트랜잭션으로 수행)"""
         if force:
-            query = """
+            query = f"""
             MATCH (n)
             WHERE elementId(n) = $node_id
+            {_MARK_SKILL_HOLDERS}
             DETACH DELETE n
             RETURN true as deleted, 0 as rel_count
             """
@@ -191,9 +219,14 @@ class Neo4jGraphCrudRepository:
         rel_type: str,
         properties: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """범용 관계 생성"""
+        """범용 관계 생성 (HAS_SKILL이면 src.skills_changed_at도 같은 쓰기에서 갱신)"""
         validated_type = validate_identifier(rel_type, "relationship_type")
         props = properties or {}
+        mark_skills = (
+            "SET src.skills_changed_at = datetime()"
+            if validated_type == "HAS_SKILL"
+            else ""
+        )
 
         query = f"""
         MATCH (src), (tgt)
@@ -201,6 +234,7 @@ class Neo4jGraphCrudRepository:
         MERGE (src)-[r:{validated_type}]->(tgt)
         ON CREATE SET r += $props, r.created_at = datetime()
         ON MATCH SET r += $props, r.updated_at = datetime()
+        {mark_skills}
         RETURN
             elementId(r) as id,
             type(r) as type,
@@ -229,10 +263,13 @@ class Neo4jGraphCrudRepository:
             ) from e
 
     async def delete_relationship_generic(self, rel_id: str) -> bool:
-        """관계 삭제"""
+        """관계 삭제 (HAS_SKILL이면 src.skills_changed_at도 같은 쓰기에서 갱신)"""
         query = """
-        MATCH ()-[r]->()
+        MATCH (src)-[r]->()
         WHERE elementId(r) = $rel_id
+        FOREACH (_ IN CASE WHEN type(r) = 'HAS_SKILL' THEN [1] ELSE [] END |
+            SET src.skills_changed_at = datetime()
+        )
         DELETE r
         RETURN true as deleted
         """
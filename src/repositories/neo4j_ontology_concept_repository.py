@@ -9,6 +9,7 @@ Neo4j Ontology Concept Repository - 온톨로지 개념 관리
 import logging
 from typing import Any
 
+from src.domain.constants import name_norm_expr, name_norm_match
 from src.domain.exceptions import QueryExecutionError
 from src.infrastructure.neo4j_client import Neo4jClient
 from src.repositories.neo4j_validators import validate_concept_name
@@ -26,9 +27,9 @@ class Neo4jOntologyConceptRepository:
         """Concept 노드 존재 여부 확인"""
         validated_name = validate_concept_name(name)
 
-        query = """
+        query = f"""
         MATCH (c:Concept)
-        WHERE toLower(c.name) = toLower($name)
+        WHERE {name_norm_match("c", "name")}
         RETURN count(c) > 0 as exists
         """
 
@@ -51,11 +52,11 @@ class Neo4jOntologyConceptRepository:
         """Concept 노드 생성 또는 기존 노드 반환 (MERGE 패턴)"""
         validated_name = validate_concept_name(name)
 
-        query = """
+        query = f"""
         OPTIONAL MATCH (existing:Concept)
-        WHERE toLower(existing.name) = toLower($name)
+        WHERE {name_norm_match("existing", "name")}
         WITH existing
-        CALL {
+        CALL {{
             WITH existing
             WITH existing WHERE existing IS NOT NULL
             SET existing.updated_at = datetime()
@@ -63,16 +64,17 @@ class Neo4jOntologyConceptRepository:
           UNION
             WITH existing
             WITH existing WHERE existing IS NULL
-            CREATE (new:Concept {
+            CREATE (new:Concept {{
                 name: $name,
+                name_norm: {name_norm_expr("$name")},
                 type: $type,
                 is_canonical: $is_canonical,
                 description: $description,
                 source: $source,
                 created_at: datetime()
-            })
+            }})
             RETURN new AS c
-        }
+        }}
         RETURN
             elementId(c) as id,
             c.name as name,
@@ -117,11 +119,11 @@ class Neo4jOntologyConceptRepository:
         validated_alias = validate_concept_name(alias_name, "alias_name")
         validated_canonical = validate_concept_name(canonical_name, "canonical_name")
 
-        query = """
+        query = f"""
         MATCH (alias:Concept)
-        WHERE toLower(alias.name) = toLower($alias_name)
+        WHERE {name_norm_match("alias", "alias_name")}
         MATCH (canonical:Concept)
-        WHERE toLower(canonical.name) = toLower($canonical_name)
+        WHERE {name_norm_match("canonical", "canonical_name")}
         MERGE (alias)-[r:SAME_AS]->(canonical)
         ON CREATE SET
             r.weight = $weight,
@@ -165,11 +167,11 @@ class Neo4jOntologyConceptRepository:
         validated_child = validate_concept_name(child_name, "child_name")
         validated_parent = validate_concept_name(parent_name, "parent_name")
 
-        query = """
+        query = f"""
         MATCH (child:Concept)
-        WHERE toLower(child.name) = toLower($child_name)
+        WHERE {name_norm_match("child", "child_name")}
         MATCH (parent:Concept)
-        WHERE toLower(parent.name) = toLower($parent_name)
+        WHERE {name_norm_match("parent", "parent_name")}
         MERGE (child)-[r:IS_A]->(parent)
         ON CREATE SET
             r.depth = $depth,
@@ -212,11 +214,11 @@ class Neo4jOntologyConceptRepository:
         validated_entity = validate_concept_name(entity_name, "entity_name")
         validated_skill = validate_concept_name(skill_name, "skill_name")
 
-        query = """
+        query = f"""
         MATCH (entity:Concept)
-        WHERE toLower(entity.name) = toLower($entity_name)
+        WHERE {name_norm_match("entity", "entity_name")}
         MATCH (skill:Concept)
-        WHERE toLower(skill.name) = toLower($skill_name)
+        WHERE {name_norm_match("skill", "skill_name")}
         MERGE (entity)-[r:REQUIRES]->(skill)
         ON CREATE SET
             r.proposal_id = $proposal_id,
@@ -257,11 +259,11 @@ class Neo4jOntologyConceptRepository:
         validated_part = validate_concept_name(part_name, "part_name")
         validated_whole = validate_concept_name(whole_name, "whole_name")
 
-        query = """
+        query = f"""
         MATCH (part:Concept)
-        WHERE toLower(part.name) = toLower($part_name)
+        WHERE {name_norm_match("part", "part_name")}
         MATCH (whole:Concept)
-        WHERE toLower(whole.name) = toLower($whole_name)
+        WHERE {name_norm_match("whole", "whole_name")}
         MERGE (part)-[r:PART_OF]->(whole)
         ON CREATE SET
             r.proposal_id = $proposal_id,
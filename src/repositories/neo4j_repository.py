@@ -9,12 +9,15 @@ Neo4j Repository — Facade
 - 기존 import, 테스트, 서비스 코드 수정 0건
 """
 
+import asyncio
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from src.domain.adaptive.models import OntologyProposal
+from src.domain.constants import NAME_NORM_INDEXED_LABELS
 from src.domain.exceptions import QueryExecutionError
-from src.domain.types import SubGraphResult
+from src.domain.types import GraphSchema, SubGraphResult
 from src.infrastructure.neo4j_client import Neo4jClient
 from src.repositories.neo4j_entity_repository import Neo4jEntityRepository
 from src.repositories.neo4j_graph_crud_repository import Neo4jGraphCrudRepository
@@ -51,12 +54,12 @@ class Neo4jRepository:
         neighbors = await repo.get_neighbors(entity_id=123, depth=2)
     """
 
-    def __init__(self, client: Neo4jClient):
+    def __init__(self, client: Neo4jClient, schema_snapshot_path: str | None = None):
         self._client = client
 
         # 서브 레포지토리 초기화
         self._entity = Neo4jEntityRepository(client)
-        self._schema = Neo4jSchemaRepository(client)
+        self._schema = Neo4jSchemaRepository(client, schema_snapshot_path)
         self._vector = Neo4jVectorRepository(client)
         self._ontology_proposal = Neo4jOntologyProposalRepository(client)
         self._ontology_concept = Neo4jOntologyConceptRepository(client)
@@ -69,6 +72,11 @@ class Neo4jRepository:
     ) -> list[NodeResult]:
         return await self._entity.find_entities_by_name(name, labels, limit)
 
+    async def find_entities_by_names(
+        self, lookups: list[tuple[str | None, str]], limit: int = 3
+    ) -> dict[tuple[str | None, str], list[NodeResult]]:
+        return await self._entity.find_entities_by_names(lookups, limit)
+
     async def find_entity_by_id(self, entity_id: str) -> NodeResult:
         return await self._entity.find_entity_by_id(entity_id)
 
@@ -163,6 +171,17 @@ class Neo4jRepository:
     def invalidate_schema_cache(self) -> None:
         self._schema.invalidate_schema_cache()
 
+    async def load_schema_snapshot(self) -> dict[str, Any] | None:
+        return await self._schema.load_schema_snapshot()
+
+    def refresh_schema_in_background(
+        self, on_change: Callable[[GraphSchema], None] | None = None
+    ) -> asyncio.Task[None]:
+        return self._schema.refresh_schema_in_background(on_change)
+
+    async def stop_background_schema_refresh(self) -> None:
+        await self._schema.stop_background_refresh()
+
     async def get_node_labels(self) -> list[str]:
         return await self._schema.get_node_labels()
 
@@ -172,6 +191,21 @@ class Neo4jRepository:
     async def get_node_properties(self, label: str) -> list[str]:
         return await self._schema.get_node_properties(label)
 
+    async def ensure_name_norm_indexes(
+        self, labels: tuple[str, ...] = NAME_NORM_INDEXED_LABELS
+    ) -> list[str]:
+        return await self._schema.ensure_name_norm_indexes(labels)
+
+    async def backfill_name_norm(self, label: str, batch_size: int = 10000) -> int:
+        return await self._schema.backfill_name_norm(label, batch_size)
+
+    async def backfill_name_norm_once(
+        self,
+        labels: tuple[str, ...] = NAME_NORM_INDEXED_LABELS,
+        batch_size: int = 10000,
+    ) -> dict[str, int]:
+        return await self._schema.backfill_name_norm_once(labels, batch_size)
+
     # ── Vector Repository 위임 ────────────────────────────────
 
     async def vector_search_nodes(
@@ -181,9 +215,10 @@ class Neo4jRepository:
         labels: list[str] | None = None,
         limit: int = 10,
         threshold: float | None = None,
+        properties: list[str] | None = None,
     ) -> list[tuple[NodeResult, float]]:
         return await self._vector.vector_search_nodes(
-            embedding, index_name, labels, limit, threshold
+            embedding, index_name, labels, limit, threshold, properties
         )
 
     async def ensure_vector_index(
@@ -209,6 +244,19 @@ class Neo4jRepository:
     ) -> int:
         return await self._vector.batch_upsert_node_embeddings(updates, property_name)
 
+    async def find_pending_entity_embeddings(
+        self, label: str, limit: int = 500, exclude_ids: list[str] | None = None
+    ) -> list[dict[str, str]]:
+        return await self._vector.find_pending_entity_embeddings(
+            label, limit, exclude_ids
+        )
+
+    async def count_pending_entity_embeddings(self, label: str) -> int:
+        return await self._vector.count_pending_entity_embeddings(label)
+
+    async def save_entity_embeddings(self, updates: list[dict[str, Any]]) -> int:
+        return await self._vector.save_entity_embeddings(updates)
+
     # ── Ontology Proposal Repository 위임 ─────────────────────
 
     async def save_ontology_proposal(
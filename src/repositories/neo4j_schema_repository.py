@@ -3,30 +3,60 @@ Neo4j Schema Repository - 스키마 캐싱 + 메타데이터
 
 책임:
 - 그래프 스키마 조회 (TTL 기반 캐싱)
+- 스키마 스냅샷 파일 저장/로드 (fingerprint 기반, 워커 즉시 기동용)
 - 노드 레이블/관계 타입/속성 목록
+- name_norm 인덱스 생성 및 백필
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import tempfile
 import time
-from typing import Any
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, cast
 
+from src.domain.constants import (
+    NAME_NORM_INDEXED_LABELS,
+    NAME_NORM_PROPERTY,
+    name_norm_expr,
+)
+from src.domain.types import GraphSchema
 from src.infrastructure.neo4j_client import Neo4jClient
+from src.repositories.neo4j_validators import validate_identifier
 
 logger = logging.getLogger(__name__)
 
+# 1회성 마이그레이션 완료 마커 노드 (레이블별 완료 여부 기록)
+SCHEMA_MIGRATION_LABEL = "SchemaMigration"
+NAME_NORM_MIGRATION_KEY = "name_norm_backfill"
+
+
+def schema_fingerprint(schema: dict[str, Any]) -> str:
+    """스키마 fingerprint (키 순서와 무관한 정규화 JSON의 SHA-256)"""
+    canonical = json.dumps(schema, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
 
 class Neo4jSchemaRepository:
     """스키마 캐싱 전담 레포지토리"""
 
     SCHEMA_CACHE_TTL_SECONDS = 300
 
-    def __init__(self, client: Neo4jClient):
+    def __init__(self, client: Neo4jClient, snapshot_path: str | None = None):
         self._client = client
         self._schema_cache: dict[str, Any] | None = None
         self._schema_cache_time: float = 0.0
         self._schema_fetch_lock = asyncio.Lock()
 
+        # 스키마 스냅샷 파일 (None이면 비활성화)
+        self._snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._snapshot_fingerprint: str | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
     async def get_schema(self, force_refresh: bool = False) -> dict[str, Any]:
         """그래프 스키마 정보 조회 (TTL 기반 캐싱, 동시성 안전)"""
         current_time = time.time()
@@ -47,6 +77,7 @@ class Neo4jSchemaRepository:
                     )
                     self._schema_cache = await self._client.get_schema_info()
                     self._schema_cache_time = time.time()
+                    await self._save_snapshot(self._schema_cache)
                 else:
                     logger.debug("Using cached schema (updated by another task)")
         else:
@@ -60,6 +91,138 @@ class Neo4jSchemaRepository:
         self._schema_cache_time = 0.0
         logger.debug("Schema cache invalidated")
 
+    # ============================================
+    # 스키마 스냅샷 파일
+    # ============================================
+
+    async def load_schema_snapshot(self) -> dict[str, Any] | None:
+        """
+        스냅샷 파일에서 스키마 로드 (DB 인트로스펙션 없이 즉시 기동)
+
+        fingerprint가 내용과 일치하지 않거나 파일을 읽을 수 없으면 None을 반환합니다.
+        로드한 스키마는 캐시에 적재되며 TTL 만료 또는 refresh_schema_in_background()로
+        DB 기준으로 갱신됩니다.
+
+        Returns:
+            스키마 정보 또는 None
+        """
+        if self._snapshot_path is None:
+            return None
+
+        try:
+            payload = await asyncio.to_thread(self._read_snapshot_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read schema snapshot: {e}")
+            return None
+
+        schema = payload.get("schema")
+        fingerprint = payload.get("fingerprint")
+        if not isinstance(schema, dict) or fingerprint != schema_fingerprint(schema):
+            logger.warning("Schema snapshot fingerprint mismatch, ignoring snapshot")
+            return None
+
+        self._schema_cache = schema
+        self._schema_cache_time = time.time()
+        self._snapshot_fingerprint = fingerprint
+        logger.info(
+            f"Schema loaded from snapshot {self._snapshot_path} "
+            f"(fingerprint={fingerprint[:12]})"
+        )
+        return schema
+
+    def refresh_schema_in_background(
+        self,
+        on_change: Callable[[GraphSchema], None] | None = None,
+    ) -> asyncio.Task[None]:
+        """
+        DB 기준 스키마를 백그라운드에서 재조회하고 스냅샷 갱신
+
+        Args:
+            on_change: fingerprint가 바뀐 경우 새 스키마로 호출할 콜백
+
+        Returns:
+            갱신 태스크 (이미 실행 중이면 기존 태스크)
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return self._refresh_task
+
+        previous = self._snapshot_fingerprint
+
+        async def _refresh() -> None:
+            try:
+                schema = await self.get_schema(force_refresh=True)
+            except Exception as e:
+                logger.warning(f"Background schema refresh failed: {e}")
+                return
+            if on_change is not None and schema_fingerprint(schema) != previous:
+                logger.info("Schema changed since snapshot, applying refreshed schema")
+                on_change(cast(GraphSchema, schema))
+
+        self._refresh_task = asyncio.create_task(_refresh())
+        return self._refresh_task
+
+    async def stop_background_refresh(self) -> None:
+        """진행 중인 백그라운드 갱신 취소 (앱 종료 시)"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+
+    async def _save_snapshot(self, schema: dict[str, Any]) -> None:
+        """스키마 스냅샷 저장 (fingerprint 변경 시에만, 실패해도 조회는 계속)"""
+        if self._snapshot_path is None or "error" in schema:
+            return
+
+        fingerprint = schema_fingerprint(schema)
+        if fingerprint == self._snapshot_fingerprint:
+            return
+
+        try:
+            await asyncio.to_thread(self._write_snapshot_file, schema, fingerprint)
+            self._snapshot_fingerprint = fingerprint
+            logger.info(f"Schema snapshot saved (fingerprint={fingerprint[:12]})")
+        except Exception as e:
+            logger.warning(f"Failed to save schema snapshot: {e}")
+
+    def _read_snapshot_file(self) -> dict[str, Any]:
+        assert self._snapshot_path is not None
+        payload: dict[str, Any] = json.loads(
+            self._snapshot_path.read_text(encoding="utf-8")
+        )
+        return payload
+
+    def _write_snapshot_file(self, schema: dict[str, Any], fingerprint: str) -> None:
+        """
+        고유 임시 파일에 쓴 뒤 rename
+
+        다른 워커가 부분 기록을 읽거나, 동시 저장 시 서로의 임시 파일을
+        덮어쓰지 않도록 워커마다 별도 임시 파일을 사용합니다.
+        """
+        assert self._snapshot_path is not None
+        self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "fingerprint": fingerprint,
+            "saved_at": time.time(),
+            "schema": schema,
+        }
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self._snapshot_path.parent,
+            prefix=f".{self._snapshot_path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, default=str)
+            os.replace(tmp_name, self._snapshot_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
     async def get_node_labels(self) -> list[str]:
         """노드 레이블 목록 조회"""
         schema = await self.get_schema()
@@ -82,3 +245,92 @@ class Neo4jSchemaRepository:
 
         results = await self._client.execute_query(query, {"label": label})
         return [r["key"] for r in results]
+
+    async def ensure_name_norm_indexes(
+        self, labels: tuple[str, ...] = NAME_NORM_INDEXED_LABELS
+    ) -> list[str]:
+        """레이블별 name_norm range 인덱스 생성 (IF NOT EXISTS)"""
+        created = []
+        for label in labels:
+            validated_label = validate_identifier(label, "label")
+            index_name = f"{validated_label.lower()}_{NAME_NORM_PROPERTY}_idx"
+            query = f"""
+            CREATE INDEX {index_name} IF NOT EXISTS
+            FOR (n:{validated_label}) ON (n.{NAME_NORM_PROPERTY})
+            """
+            await self._client.execute_write(query)
+            created.append(index_name)
+        logger.info(f"name_norm indexes ensured: {created}")
+        return created
+
+    async def backfill_name_norm(self, label: str, batch_size: int = 10000) -> int:
+        """
+        name_norm 백필 (누락되었거나 name과 불일치하는 노드만 갱신)
+
+        CALL { ... } IN TRANSACTIONS로 배치 커밋하므로 대용량 레이블도
+        단일 트랜잭션 메모리 한도에 걸리지 않고, 중단 후 재실행하면 이어서 진행됩니다.
+
+        Returns:
+            갱신된 노드 수
+        """
+        validated_label = validate_identifier(label, "label")
+        norm = name_norm_expr("n.name")
+        query = f"""
+        MATCH (n:{validated_label})
+        WHERE n.name IS NOT NULL
+          AND coalesce(n.{NAME_NORM_PROPERTY}, '') <> {norm}
+        CALL {{
+            WITH n
+            SET n.{NAME_NORM_PROPERTY} = {norm}
+            RETURN 1 AS updated
+        }} IN TRANSACTIONS OF $batch_size ROWS
+        RETURN count(updated) AS updated
+        """
+
+        results = await self._client.execute_query(query, {"batch_size": batch_size})
+        updated = results[0]["updated"] if results else 0
+        logger.info(f"name_norm backfilled for {validated_label}: {updated} nodes")
+        return updated
+
+    async def backfill_name_norm_once(
+        self,
+        labels: tuple[str, ...] = NAME_NORM_INDEXED_LABELS,
+        batch_size: int = 10000,
+    ) -> dict[str, int]:
+        """
+        마커 노드에 완료로 기록되지 않은 레이블만 name_norm 백필 (기동 시 호출용)
+
+        backfill_name_norm()은 인덱스를 쓸 수 없는 전체 스캔이므로 완료된 레이블은
+        마커로 건너뛰어, 마이그레이션된 DB에서는 마커 조회 1회로 끝납니다.
+        동시에 기동한 워커가 함께 실행해도 백필이 멱등이라 안전합니다.
+
+        Returns:
+            이번에 백필한 레이블별 갱신 노드 수 (모두 완료 상태면 빈 dict)
+        """
+        results = await self._client.execute_query(
+            f"MATCH (m:{SCHEMA_MIGRATION_LABEL} {{key: $key}}) RETURN m.labels AS labels",
+            {"key": NAME_NORM_MIGRATION_KEY},
+        )
+        done = set(results[0]["labels"] or []) if results else set()
+        pending = [label for label in labels if label not in done]
+        if not pending:
+            return {}
+
+        stats = {
+            label: await self.backfill_name_norm(label, batch_size) for label in pending
+        }
+        await self.mark_name_norm_backfilled(tuple(pending))
+        return stats
+
+    async def mark_name_norm_backfilled(self, labels: tuple[str, ...]) -> None:
+        """name_norm 백필 완료 레이블을 마커 노드에 기록 (기존 기록과 합집합)"""
+        await self._client.execute_write(
+            f"""
+            MERGE (m:{SCHEMA_MIGRATION_LABEL} {{key: $key}})
+            SET m.labels = [
+                    label IN coalesce(m.labels, []) WHERE NOT label IN $labels
+                ] + $labels,
+                m.updated_at = datetime()
+            """,
+            {"key": NAME_NORM_MIGRATION_KEY, "labels": list(labels)},
+        )
@@ -5,15 +5,21 @@ Neo4j Vector Repository - 벡터 검색
 - Vector Index 관리
 - 노드 유사도 검색
 - 임베딩 저장/업데이트
+- 엔티티 임베딩 백필 대상 조회/저장
 """
 
 import logging
 from typing import Any
 
+from src.domain.constants import (
+    ENTITY_EMBEDDING_PROPERTY,
+    ENTITY_EMBEDDING_TEXT_PROPERTY,
+    entity_embedding_text_expr,
+)
 from src.domain.exceptions import QueryExecutionError
 from src.infrastructure.neo4j_client import Neo4jClient
 from src.repositories.neo4j_types import NodeResult
-from src.repositories.neo4j_validators import validate_labels
+from src.repositories.neo4j_validators import validate_identifier, validate_labels
 
 logger = logging.getLogger(__name__)
 
@@ -31,24 +37,24 @@ class Neo4jVectorRepository:
         labels: list[str] | None = None,
         limit: int = 10,
         threshold: float | None = None,
+        properties: list[str] | None = None,
     ) -> list[tuple[Any, float]]:
-        """Vector Index를 사용한 노드 유사도 검색"""
+        """
+        Vector Index를 사용한 노드 유사도 검색
+
+        레이블 필터는 Cypher에서 적용되며, 벡터 속성은 결과에서 제외됩니다.
+        properties 지정 시 해당 속성만 반환합니다.
+        """
         try:
             results = await self._client.vector_search(
                 index_name=index_name,
                 embedding=embedding,
                 limit=limit,
                 threshold=threshold,
+                labels=validate_labels(labels) if labels else None,
+                properties=properties,
             )
 
-            if labels:
-                validated_labels = set(validate_labels(labels))
-                results = [
-                    r
-                    for r in results
-                    if validated_labels.intersection(set(r.get("labels", [])))
-                ]
-
             return [
                 (
                     NodeResult(
@@ -104,3 +110,78 @@ class Neo4jVectorRepository:
             updates=updates,
             property_name=property_name,
         )
+
+    async def find_pending_entity_embeddings(
+        self,
+        label: str,
+        limit: int = 500,
+        exclude_ids: list[str] | None = None,
+    ) -> list[dict[str, str]]:
+        """
+        임베딩이 없거나 임베딩 텍스트가 바뀐 노드 조회 (백필 대상)
+
+        Returns:
+            [{"id": elementId, "text": 임베딩 텍스트}, ...]
+        """
+        validated_label = validate_identifier(label, "label")
+        query = f"""
+        MATCH (n:{validated_label})
+        WHERE n.name IS NOT NULL AND NOT elementId(n) IN $exclude_ids
+        WITH n, {entity_embedding_text_expr("n", validated_label)} AS text
+        WHERE n.{ENTITY_EMBEDDING_PROPERTY} IS NULL
+           OR coalesce(n.{ENTITY_EMBEDDING_TEXT_PROPERTY}, '') <> text
+        RETURN elementId(n) AS id, text
+        LIMIT $limit
+        """
+        try:
+            return await self._client.execute_query(
+                query, {"limit": limit, "exclude_ids": exclude_ids or []}
+            )
+        except Exception as e:
+            logger.error(f"Pending embedding lookup failed for '{label}': {e}")
+            raise QueryExecutionError(
+                f"Pending embedding lookup failed: {e}", query=query
+            ) from e
+
+    async def count_pending_entity_embeddings(self, label: str) -> int:
+        """백필 대상 노드 수"""
+        validated_label = validate_identifier(label, "label")
+        query = f"""
+        MATCH (n:{validated_label})
+        WHERE n.name IS NOT NULL
+        WITH n, {entity_embedding_text_expr("n", validated_label)} AS text
+        WHERE n.{ENTITY_EMBEDDING_PROPERTY} IS NULL
+           OR coalesce(n.{ENTITY_EMBEDDING_TEXT_PROPERTY}, '') <> text
+        RETURN count(n) AS pending
+        """
+        results = await self._client.execute_query(query)
+        return results[0]["pending"] if results else 0
+
+    async def save_entity_embeddings(self, updates: list[dict[str, Any]]) -> int:
+        """
+        엔티티 임베딩 + 임베딩 텍스트 일괄 저장 (UNWIND 단일 쓰기)
+
+        Args:
+            updates: [{"node_id": str, "embedding": list[float], "text": str}, ...]
+
+        Returns:
+            업데이트된 노드 수
+        """
+        if not updates:
+            return 0
+        query = f"""
+        UNWIND $updates AS update
+        MATCH (n)
+        WHERE elementId(n) = update.node_id
+        SET n.{ENTITY_EMBEDDING_PROPERTY} = update.embedding,
+            n.{ENTITY_EMBEDDING_TEXT_PROPERTY} = update.text
+        RETURN count(n) AS updated_count
+        """
+        try:
+            result = await self._client.execute_write(query, {"updates": updates})
+            return result[0]["updated_count"] if result else 0
+        except Exception as e:
+            logger.error(f"Entity embedding save failed: {e}")
+            raise QueryExecutionError(
+                f"Entity embedding save failed: {e}", query="save_entity_embeddings"
+            ) from e
@@ -4,9 +4,12 @@ Query Cache Repository - 질문-Cypher 캐싱 관리
 책임:
 - 질문과 생성된 Cypher 쿼리를 Vector Index로 캐싱
 - 유사 질문 검색으로 Cypher 생성 스킵 (성능 최적화)
-- 캐시 TTL 관리 및 무효화
+- 캐시 TTL 관리 및 무효화 (백그라운드 만료 정리 + 히트 카운트 지연 반영)
+- 프로세스 내 L1 캐시(LocalQueryCache)로 Neo4j 왕복 생략
 """
 
+import asyncio
+import contextlib
 import json
 import logging
 from dataclasses import dataclass
@@ -16,6 +19,7 @@ from typing import Any
 from src.config import Settings
 from src.domain.exceptions import QueryExecutionError
 from src.infrastructure.neo4j_client import Neo4jClient
+from src.repositories.local_query_cache import LocalQueryCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,19 @@ logger = logging.getLogger(__name__)
 QUERY_CACHE_INDEX_NAME = "query_cache_embedding"
 QUERY_CACHE_LABEL = "CachedQuery"
 QUERY_CACHE_EMBEDDING_PROPERTY = "embedding"
+QUERY_CACHE_CREATED_AT_INDEX_NAME = "query_cache_created_at_idx"
+
+# 유사 질문 조회 시 반환 속성 (CachedQuery.from_neo4j 사용 필드만, 임베딩 제외)
+QUERY_CACHE_RESULT_PROPERTIES = [
+    "question",
+    "cypher_query",
+    "cypher_parameters",
+    "created_at",
+    "hit_count",
+]
+
+# 만료 항목 삭제 시 트랜잭션당 최대 삭제 수
+EXPIRY_PURGE_BATCH_SIZE = 1000
 
 
 @dataclass
@@ -78,18 +95,24 @@ class QueryCacheRepository:
     질문-Cypher 캐싱 Repository
 
     Neo4j Vector Index를 활용하여 유사 질문에 대한 Cypher 쿼리를 캐싱합니다.
+    L1(프로세스 내) → L2(Neo4j) 순으로 조회하며, L2 히트/저장 결과는 L1에 채워집니다.
 
     사용 예시:
         repo = QueryCacheRepository(neo4j_client, settings)
         await repo.ensure_index()
 
-        # 캐시 조회
-        cached = await repo.find_similar_query(embedding, threshold=0.9)
+        # 캐시 조회 (정확 일치 → 유사 질문)
+        hit = repo.find_cached_question(question)
+        cached = await repo.find_similar_query(embedding, question=question)
         if cached:
             return cached.cypher_query, cached.cypher_parameters
 
         # 캐시 저장
         await repo.cache_query(question, embedding, cypher, params)
+
+        # 히트 카운트 flush + 만료 정리 백그라운드 태스크
+        repo.start_maintenance(interval_seconds=60)
+        await repo.stop_maintenance()
     """
 
     def __init__(self, client: Neo4jClient, settings: Settings):
@@ -97,15 +120,27 @@ class QueryCacheRepository:
         self._settings = settings
         self._index_ensured = False
 
+        # elementId → 누적 히트 수 (요청 경로에서 쓰기 트랜잭션 제거)
+        self._pending_hits: dict[str, int] = {}
+        self._maintenance_task: asyncio.Task[None] | None = None
+
+        self._local: LocalQueryCache | None = None
+        if settings.query_cache_local_enabled:
+            self._local = LocalQueryCache(
+                max_entries=settings.query_cache_local_max_entries,
+                ttl_seconds=settings.query_cache_local_ttl_seconds,
+            )
+
         logger.info(
             f"QueryCacheRepository initialized: "
             f"threshold={settings.vector_similarity_threshold}, "
-            f"ttl={settings.query_cache_ttl_hours}h"
+            f"ttl={settings.query_cache_ttl_hours}h, "
+            f"local={'on' if self._local is not None else 'off'}"
         )
 
     async def ensure_index(self) -> bool:
         """
-        Vector Index 존재 확인 및 생성
+        Vector Index + created_at range 인덱스 존재 확인 및 생성
 
         Returns:
             성공 여부
@@ -120,6 +155,11 @@ class QueryCacheRepository:
                 property_name=QUERY_CACHE_EMBEDDING_PROPERTY,
                 dimensions=self._settings.embedding_dimensions,
             )
+            # 만료 정리(created_at < cutoff)가 레이블 스캔 없이 동작하도록
+            await self._client.execute_write(
+                f"CREATE INDEX {QUERY_CACHE_CREATED_AT_INDEX_NAME} IF NOT EXISTS "
+                f"FOR (c:{QUERY_CACHE_LABEL}) ON (c.created_at)"
+            )
             self._index_ensured = result
             return result
         except Exception as e:
@@ -176,37 +216,85 @@ class QueryCacheRepository:
             if result:
                 node_id = result[0]["id"]
                 logger.info(f"Cached query: '{question[:50]}...' -> {node_id}")
+                if self._local is not None:
+                    cached = CachedQuery(
+                        id=node_id,
+                        question=question,
+                        cypher_query=cypher_query,
+                        cypher_parameters=dict(cypher_parameters or {}),
+                        created_at=datetime.fromisoformat(now),
+                        hit_count=0,
+                        score=1.0,
+                    )
+                    self._local.put(
+                        cached, embedding, expires_at=self._expiry_epoch(cached)
+                    )
                 return node_id
             return None
         except Exception as e:
             logger.error(f"Failed to cache query: {e}")
             return None
 
+    def find_cached_question(
+        self,
+        question: str,
+    ) -> tuple[CachedQuery, list[float]] | None:
+        """
+        L1 정확 일치 조회 (임베딩 생성 전 단계, 히트 시 히트 카운트 기록)
+
+        Args:
+            question: 원본 질문 (공백/대소문자 차이 무시)
+
+        Returns:
+            (캐시된 쿼리, 질문 임베딩) 또는 None
+        """
+        if self._local is None:
+            return None
+        exact = self._local.get_exact(question)
+        if exact is not None:
+            self._record_hit(exact[0].id)
+        return exact
+
     async def find_similar_query(
         self,
         embedding: list[float],
         threshold: float | None = None,
+        question: str | None = None,
     ) -> CachedQuery | None:
         """
-        유사 질문 검색
+        유사 질문 검색 (L1 코사인 검색 → L2 Neo4j 벡터 검색)
 
         Args:
             embedding: 검색할 질문의 임베딩 벡터
             threshold: 최소 유사도 점수 (None이면 설정값 사용)
+            question: 원본 질문 (히트 시 L1 정확 일치 키로 등록)
 
         Returns:
             가장 유사한 캐시된 쿼리 (없으면 None)
         """
-        await self.ensure_index()
-
         min_score = threshold or self._settings.vector_similarity_threshold
 
+        if self._local is not None:
+            local_hit = self._local.find_similar(embedding, min_score)
+            if local_hit:
+                if question:
+                    self._local.put(local_hit, embedding, question=question)
+                self._record_hit(local_hit.id)
+                logger.info(
+                    f"Local cache HIT: '{local_hit.question[:50]}...' "
+                    f"(score={local_hit.score:.3f})"
+                )
+                return local_hit
+
+        await self.ensure_index()
+
         try:
             results = await self._client.vector_search(
                 index_name=QUERY_CACHE_INDEX_NAME,
                 embedding=embedding,
                 limit=1,
                 threshold=min_score,
+                properties=QUERY_CACHE_RESULT_PROPERTIES,
             )
 
             if not results:
@@ -221,13 +309,20 @@ class QueryCacheRepository:
             expiry_time = cached.created_at + timedelta(hours=ttl_hours)
 
             if datetime.now(UTC) > expiry_time:
+                # 삭제는 백그라운드 만료 정리(purge_expired)에 맡기고 미스 처리
                 logger.debug(f"Cache expired for query: {cached.question[:50]}...")
-                # 만료된 캐시 삭제
-                await self._delete_cache(cached.id)
                 return None
 
-            # hit_count 증가
-            await self._increment_hit_count(cached.id)
+            # hit_count 증가 (버퍼링 후 일괄 반영)
+            self._record_hit(cached.id)
+
+            if self._local is not None:
+                self._local.put(
+                    cached,
+                    embedding,
+                    question=question,
+                    expires_at=self._expiry_epoch(cached),
+                )
 
             logger.info(
                 f"Cache HIT: '{cached.question[:50]}...' (score={cached.score:.3f})"
@@ -238,30 +333,65 @@ class QueryCacheRepository:
             logger.error(f"Failed to find similar query: {e}")
             return None
 
-    async def _increment_hit_count(self, node_id: str) -> None:
-        """캐시 히트 카운트 증가"""
-        query = """
-        MATCH (c)
-        WHERE elementId(c) = $node_id
-        SET c.hit_count = c.hit_count + 1
+    def _record_hit(self, node_id: str) -> None:
+        """히트 카운트 버퍼링 (flush_hit_counts()에서 일괄 반영)"""
+        if node_id:
+            self._pending_hits[node_id] = self._pending_hits.get(node_id, 0) + 1
+
+    async def flush_hit_counts(self) -> int:
         """
-        try:
-            await self._client.execute_write(query, {"node_id": node_id})
-        except Exception as e:
-            logger.warning(f"Failed to increment hit count: {e}")
+        버퍼링된 히트 카운트를 UNWIND 단일 쓰기로 반영
 
-    async def _delete_cache(self, node_id: str) -> None:
-        """캐시 삭제"""
-        query = """
-        MATCH (c)
-        WHERE elementId(c) = $node_id
-        DELETE c
+        실패하거나 취소되면 버퍼를 되돌려 다음 flush에서 재시도합니다.
+
+        Returns:
+            갱신 대상 캐시 항목 수
         """
+        if not self._pending_hits:
+            return 0
+
+        pending, self._pending_hits = self._pending_hits, {}
+        query = f"""
+        UNWIND $hits AS hit
+        MATCH (c:{QUERY_CACHE_LABEL})
+        WHERE elementId(c) = hit.id
+        SET c.hit_count = coalesce(c.hit_count, 0) + hit.count
+        """
+        written = False
         try:
-            await self._client.execute_write(query, {"node_id": node_id})
-            logger.debug(f"Deleted expired cache: {node_id}")
+            await self._client.execute_write(
+                query,
+                {"hits": [{"id": k, "count": v} for k, v in pending.items()]},
+            )
+            written = True
         except Exception as e:
-            logger.warning(f"Failed to delete cache: {e}")
+            logger.warning(f"Failed to flush hit counts: {e}")
+            return 0
+        finally:
+            # 예외뿐 아니라 취소(CancelledError)에서도 스냅샷을 버퍼에 병합
+            if not written:
+                for node_id, count in pending.items():
+                    self._pending_hits[node_id] = (
+                        self._pending_hits.get(node_id, 0) + count
+                    )
+        logger.debug(f"Flushed hit counts for {len(pending)} cache entries")
+        return len(pending)
+
+    def _expiry_epoch(self, cached: CachedQuery) -> float:
+        """L2 TTL 기준 만료 시각 (epoch 초, L1 항목이 L2보다 오래 살지 않도록)"""
+        ttl = timedelta(hours=self._settings.query_cache_ttl_hours)
+        return (cached.created_at + ttl).timestamp()
+
+    def invalidate_local(self) -> int:
+        """
+        L1 캐시 전체 무효화 (그래프 편집/온톨로지 변경 훅)
+
+        Returns:
+            제거된 L1 항목 수
+        """
+        if self._local is None:
+            return 0
+        return self._local.clear()
 
     async def invalidate_cache(
         self,
@@ -280,6 +410,9 @@ class QueryCacheRepository:
             ttl_hours = self._settings.query_cache_ttl_hours
             older_than = datetime.now(UTC) - timedelta(hours=ttl_hours)
 
+        # L1은 항목별 L2 만료 시각을 알고 있지만, 명시적 무효화는 보수적으로 전체 삭제
+        self.invalidate_local()
+
         query = f"""
         MATCH (c:{QUERY_CACHE_LABEL})
         WHERE c.created_at < datetime($older_than)
@@ -299,6 +432,69 @@ class QueryCacheRepository:
             logger.error(f"Failed to invalidate cache: {e}")
             raise QueryExecutionError(f"Cache invalidation failed: {e}") from e
 
+    async def purge_expired(self, batch_size: int = EXPIRY_PURGE_BATCH_SIZE) -> int:
+        """
+        TTL 만료 항목 삭제 (created_at 인덱스 사용, batch_size 단위 트랜잭션)
+
+        invalidate_cache()와 달리 L1은 건드리지 않습니다
+        (L1 항목은 자체적으로 L2 만료 시각을 넘지 않음).
+
+        Returns:
+            삭제된 캐시 수
+        """
+        ttl_hours = self._settings.query_cache_ttl_hours
+        cutoff = (datetime.now(UTC) - timedelta(hours=ttl_hours)).isoformat()
+
+        query = f"""
+        MATCH (c:{QUERY_CACHE_LABEL})
+        WHERE c.created_at < datetime($cutoff)
+        WITH c LIMIT $batch_size
+        DETACH DELETE c
+        RETURN count(*) as deleted_count
+        """
+
+        total = 0
+        while True:
+            result = await self._client.execute_write(
+                query, {"cutoff": cutoff, "batch_size": batch_size}
+            )
+            deleted = result[0]["deleted_count"] if result else 0
+            total += deleted
+            if deleted < batch_size:
+                break
+
+        if total:
+            logger.info(f"Purged {total} expired cache entries")
+        return total
+
+    def start_maintenance(self, interval_seconds: float) -> None:
+        """히트 카운트 flush + 만료 정리 백그라운드 태스크 시작 (중복 시작 무시)"""
+        if self._maintenance_task is not None and not self._maintenance_task.done():
+            return
+        self._maintenance_task = asyncio.create_task(
+            self._maintenance_loop(interval_seconds),
+            name="query_cache_maintenance",
+        )
+        logger.info(f"Query cache maintenance started (interval={interval_seconds}s)")
+
+    async def stop_maintenance(self) -> None:
+        """백그라운드 태스크 중지 후 남은 히트 카운트 반영"""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._maintenance_task
+            self._maintenance_task = None
+        await self.flush_hit_counts()
+
+    async def _maintenance_loop(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.flush_hit_counts()
+            try:
+                await self.purge_expired()
+            except Exception as e:
+                logger.warning(f"Query cache expiry purge failed: {e}")
+
     async def clear_all_cache(self) -> int:
         """
         모든 캐시 삭제
@@ -314,6 +510,8 @@ class QueryCacheRepository:
         RETURN size(nodes) as deleted_count
         """
 
+        self.invalidate_local()
+
         try:
             result = await self._client.execute_write(query)
             count = result[0]["deleted_count"] if result else 0
@@ -360,6 +558,8 @@ class QueryCacheRepository:
                 "newest": stats.get("newest"),
                 "ttl_hours": self._settings.query_cache_ttl_hours,
                 "similarity_threshold": self._settings.vector_similarity_threshold,
+                "local": self._local.get_stats() if self._local is not None else None,
+                "pending_hit_entries": len(self._pending_hits),
             }
         except Exception as e:
             logger.error(f"Failed to get cache stats: {e}")
@@ -0,0 +1,165 @@
+"""
+Query Result Cache - 읽기 전용 Cypher 결과 캐시 (프로세스 내)
+
+책임:
+- (정규화 Cypher, 파라미터, 접근 정책 fingerprint) 키 → 결과 레코드
+- 그래프 버전(GraphVersion) 변경 시 항목 무효화
+- 크기(LRU)/TTL/결과 행 수 제한
+
+캐시 대상은 validate_read_only_cypher()를 통과한 쿼리 결과뿐이며,
+접근 제어 필터링이 적용된 결과를 저장하므로 정책 fingerprint가 키에 포함됩니다.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from src.utils.graph_version import GraphVersion
+
+logger = logging.getLogger(__name__)
+
+# 문자열 리터럴 (따옴표 내부 공백은 보존)
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+
+
+def canonicalize_cypher(query: str) -> str:
+    """
+    캐시 키용 Cypher 정규화
+
+    문자열 리터럴 밖의 연속 공백을 하나로 축약하고 양끝 공백/세미콜론을 제거합니다.
+    식별자는 대소문자를 구분하므로 케이스는 변경하지 않습니다.
+    """
+    parts: list[str] = []
+    last = 0
+    for match in _STRING_LITERAL_PATTERN.finditer(query):
+        parts.append(" ".join(query[last : match.start()].split()))
+        parts.append(match.group(0))
+        last = match.end()
+    parts.append(" ".join(query[last:].split()))
+    canonical = " ".join(p for p in parts if p)
+    return canonical.strip().rstrip(";").strip()
+
+
+@dataclass
+class _ResultEntry:
+    results: list[dict[str, Any]]
+    graph_version: int
+    expires_at: float
+
+
+class QueryResultCache:
+    """
+    Cypher 결과 캐시
+
+    사용 예시:
+        cache = QueryResultCache(get_graph_version(), max_entries=256, ttl_seconds=300)
+        key = cache.make_key(cypher, params, policy_fingerprint)
+        results = cache.get(key)
+        if results is None:
+            version = cache.graph_version  # 실행 전 버전 (실행 중 변경 감지용)
+            results = await neo4j.execute_cypher(cypher, params)
+            cache.put(key, results, version)
+    """
+
+    def __init__(
+        self,
+        graph_version: GraphVersion,
+        max_entries: int = 256,
+        ttl_seconds: float = 300.0,
+        max_rows: int = 1000,
+    ):
+        self._graph_version = graph_version
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._max_rows = max_rows
+        self._entries: OrderedDict[str, _ResultEntry] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def graph_version(self) -> int:
+        return self._graph_version.current
+
+    @staticmethod
+    def make_key(
+        query: str,
+        parameters: dict[str, Any] | None,
+        policy_fingerprint: str,
+    ) -> str:
+        """캐시 키 (정규화 Cypher + 정렬된 파라미터 JSON + 정책 fingerprint)"""
+        params_json = json.dumps(
+            parameters or {}, sort_keys=True, ensure_ascii=False, default=str
+        )
+        raw = f"{canonicalize_cypher(query)}\x00{params_json}\x00{policy_fingerprint}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """결과 조회 (그래프 버전 불일치/만료 항목은 제거 후 미스)"""
+        entry = self._entries.get(key)
+        if entry is not None and (
+            entry.graph_version != self._graph_version.current
+            or entry.expires_at <= time.time()
+        ):
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return list(entry.results)
+
+    def put(
+        self,
+        key: str,
+        results: list[dict[str, Any]],
+        graph_version: int | None = None,
+    ) -> bool:
+        """
+        결과 저장 (max_rows 초과 결과는 저장하지 않음)
+
+        Args:
+            key: make_key() 결과
+            results: 쿼리 결과
+            graph_version: 쿼리 실행 전 버전. 실행 중 그래프가 바뀌었으면 저장 생략
+
+        Returns:
+            저장 여부
+        """
+        current = self._graph_version.current
+        if len(results) > self._max_rows:
+            return False
+        if graph_version is not None and graph_version != current:
+            return False
+
+        self._entries[key] = _ResultEntry(
+            results=list(results),
+            graph_version=current,
+            expires_at=time.time() + self._ttl_seconds,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    def clear(self) -> int:
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "graph_version": self._graph_version.current,
+        }
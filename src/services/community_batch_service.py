@@ -5,6 +5,10 @@ GDS 커뮤니티 탐지 배치 파이프라인 오케스트레이션 서비스.
 GDSService의 프리미티브들을 조합하여 원클릭 커뮤니티 리프레시를 제공합니다.
 
 파이프라인: 프로젝션 정리 → 유사도 프로젝션 생성 → 커뮤니티 탐지 → 메타데이터 기록 → 프로젝션 정리
+
+증분 모드는 마지막 리프레시 이후 스킬이 바뀐 직원(skills_changed_at)과
+커뮤니티가 없는 신규 직원만 SIMILAR 관계를 배치 트랜잭션으로 재계산하고,
+기존 communityId를 시드로 커뮤니티 탐지를 다시 실행합니다.
 """
 
 import asyncio
@@ -18,11 +22,18 @@ from typing import Any, Literal
 from src.domain.exceptions import ConcurrentRefreshError
 from src.repositories.neo4j_repository import Neo4jRepository
 from src.services.gds_service import GDSService
+from src.utils.graph_version import GraphVersion, get_graph_version
 
 logger = logging.getLogger(__name__)
 
 STALE_THRESHOLD_HOURS = 24
 
+# 증분 SIMILAR 갱신 시 트랜잭션당 직원 수
+SIMILARITY_BATCH_SIZE = 200
+
+# 커뮤니티 탐지 시드 속성 (이전 리프레시 결과)
+COMMUNITY_SEED_PROPERTY = "communityId"
+
 
 @dataclass
 class CommunityRefreshResult:
@@ -34,6 +45,8 @@ class CommunityRefreshResult:
     modularity: float
     node_count: int  # communityId가 부여된 노드 수
     duration_seconds: float
+    mode: str = "full"  # 실제 실행 모드 (증분 불가 시 full로 대체)
+    changed_employee_count: int = 0  # 증분 모드에서 유사도를 재계산한 직원 수
 
 
 @dataclass
@@ -55,15 +68,20 @@ class CommunityBatchService:
 
     GDSService의 개별 프리미티브(프로젝션 생성, 커뮤니티 탐지, 프로젝션 삭제)를
     하나의 원클릭 파이프라인으로 조합합니다. :CommunityMeta 노드로 상태를 추적합니다.
+
+    SIMILAR/communityId 쓰기 후 그래프 버전을 올려 쿼리 결과 캐시를 무효화합니다
+    (GDS 쓰기는 GDSService, 증분 SIMILAR Cypher 쓰기는 이 서비스가 bump).
     """
 
     def __init__(
         self,
         gds_service: GDSService,
         neo4j_repository: Neo4jRepository,
+        graph_version: GraphVersion | None = None,
     ):
         self._gds = gds_service
         self._neo4j = neo4j_repository
+        self._graph_version = graph_version or get_graph_version()
         self._refresh_lock = asyncio.Lock()
 
     async def refresh(
@@ -71,6 +89,7 @@ class CommunityBatchService:
         algorithm: Literal["leiden", "louvain"] = "leiden",
         gamma: float = 1.0,
         min_shared_skills: int = 2,
+        mode: Literal["full", "incremental"] = "full",
     ) -> CommunityRefreshResult:
         """
         원클릭 커뮤니티 리프레시
@@ -82,10 +101,15 @@ class CommunityBatchService:
         4. :CommunityMeta 노드에 메타데이터 기록
         5. 프로젝션 정리 (메모리 해제)
 
+        mode="incremental"이면 2단계 전에 변경 직원의 SIMILAR만 재계산하고
+        (전체 Node Similarity 생략) 기존 communityId를 시드로 탐지합니다.
+        이전 리프레시가 없거나 알고리즘·파라미터가 다르면 full로 실행합니다.
+
         Args:
             algorithm: 커뮤니티 탐지 알고리즘
             gamma: Resolution 파라미터 (높을수록 작은 커뮤니티)
             min_shared_skills: 유사도 계산 시 최소 공유 스킬 수
+            mode: full(전체 재구축) / incremental(변경분만 재계산)
 
         Returns:
             CommunityRefreshResult with statistics
@@ -94,40 +118,77 @@ class CommunityBatchService:
             raise ConcurrentRefreshError()
 
         async with self._refresh_lock:
-            return await self._run_refresh(algorithm, gamma, min_shared_skills)
+            return await self._run_refresh(algorithm, gamma, min_shared_skills, mode)
 
     async def _run_refresh(
         self,
         algorithm: Literal["leiden", "louvain"],
         gamma: float,
         min_shared_skills: int,
+        mode: Literal["full", "incremental"] = "full",
     ) -> CommunityRefreshResult:
         """실제 리프레시 파이프라인 실행 (lock 내부에서 호출)"""
         start_time = time.monotonic()
         logger.info(
             f"Community refresh started: algorithm={algorithm}, "
-            f"gamma={gamma}, min_shared_skills={min_shared_skills}"
+            f"gamma={gamma}, min_shared_skills={min_shared_skills}, mode={mode}"
         )
 
         try:
+            # 변경 추적 기준 시각 (DB 시계, skills_changed_at과 같은 기준)
+            # 실행 중 발생한 편집은 다음 증분 리프레시에서 반영
+            started_at = await self._db_now()
+            changed_ids: list[str] = []
+            if mode == "incremental":
+                meta = await self._get_metadata()
+                if not self._can_refresh_incrementally(
+                    meta, algorithm, gamma, min_shared_skills
+                ):
+                    logger.info("No compatible previous refresh, running full refresh")
+                    mode = "full"
+                else:
+                    assert meta is not None
+                    changed_ids = await self._find_changed_employees()
+                    if not changed_ids:
+                        return await self._skip_unchanged(meta, started_at, start_time)
+
             # Step 1: 기존 프로젝션 정리
             dropped = await self._gds.cleanup_all_projections()
             logger.info(f"Cleaned up {dropped} existing projections")
 
             # Step 2: 스킬 유사도 프로젝션 생성
-            projection = await self._gds.create_skill_similarity_projection(
-                min_shared_skills=min_shared_skills,
-            )
+            if mode == "incremental":
+                try:
+                    await self._update_similarity(changed_ids, min_shared_skills)
+                finally:
+                    self._graph_version.bump("community_similarity")
+                await self._seed_new_communities(changed_ids)
+                projection = await self._gds.create_skill_similarity_projection(
+                    min_shared_skills=min_shared_skills,
+                    rebuild_similarity=False,
+                    seed_property=COMMUNITY_SEED_PROPERTY,
+                )
+            else:
+                projection = await self._gds.create_skill_similarity_projection(
+                    min_shared_skills=min_shared_skills,
+                )
             logger.info(
                 f"Projection created: {projection['node_count']} nodes, "
                 f"{projection['relationship_count']} relationships"
             )
 
             # Step 3: 커뮤니티 탐지
-            detection = await self._gds.detect_communities(
-                algorithm=algorithm,
-                gamma=gamma,
-            )
+            if mode == "incremental":
+                detection = await self._gds.detect_communities(
+                    algorithm=algorithm,
+                    gamma=gamma,
+                    seed_property=COMMUNITY_SEED_PROPERTY,
+                )
+            else:
+                detection = await self._gds.detect_communities(
+                    algorithm=algorithm,
+                    gamma=gamma,
+                )
             logger.info(
                 f"Communities detected: {detection.community_count} communities, "
                 f"modularity={detection.modularity:.3f}"
@@ -140,6 +201,8 @@ class CommunityBatchService:
                 community_count=detection.community_count,
                 modularity=detection.modularity,
                 node_count=detection.node_count,
+                min_shared_skills=min_shared_skills,
+                refreshed_at=started_at,
             )
 
             # Step 5: 프로젝션 정리 (메모리 해제)
@@ -156,6 +219,8 @@ class CommunityBatchService:
                 modularity=detection.modularity,
                 node_count=detection.node_count,
                 duration_seconds=round(duration, 2),
+                mode=mode,
+                changed_employee_count=len(changed_ids),
             )
 
         except Exception:
@@ -169,6 +234,172 @@ class CommunityBatchService:
                 )
             raise
 
+    @staticmethod
+    def _can_refresh_incrementally(
+        meta: dict[str, Any] | None,
+        algorithm: str,
+        gamma: float,
+        min_shared_skills: int,
+    ) -> bool:
+        """이전 리프레시가 같은 알고리즘·파라미터로 실행됐을 때만 증분 가능"""
+        return (
+            meta is not None
+            and meta.get("refreshed_at") is not None
+            and meta.get("algorithm") == algorithm
+            and meta.get("gamma") == gamma
+            and meta.get("min_shared_skills") == min_shared_skills
+        )
+
+    async def _skip_unchanged(
+        self,
+        meta: dict[str, Any],
+        started_at: str | None,
+        start_time: float,
+    ) -> CommunityRefreshResult:
+        """변경 직원이 없으면 탐지를 생략하고 기준 시각만 갱신"""
+        await self._save_metadata(
+            algorithm=meta["algorithm"],
+            gamma=meta["gamma"],
+            community_count=meta["community_count"],
+            modularity=meta["modularity"],
+            node_count=meta["node_count"],
+            min_shared_skills=meta["min_shared_skills"],
+            refreshed_at=started_at,
+        )
+        logger.info("Community refresh skipped: no employees changed")
+        return CommunityRefreshResult(
+            success=True,
+            algorithm=meta["algorithm"],
+            community_count=meta["community_count"],
+            modularity=meta["modularity"] or 0.0,
+            node_count=meta["node_count"],
+            duration_seconds=round(time.monotonic() - start_time, 2),
+            mode="incremental",
+        )
+
+    async def _db_now(self) -> str | None:
+        """DB 서버 현재 시각 (ISO). 앱 서버와의 시계 차이로 변경분을 놓치지 않도록 사용"""
+        results = await self._neo4j.execute_cypher(
+            "RETURN toString(datetime()) AS now",
+        )
+        return results[0].get("now") if results else None
+
+    async def _find_changed_employees(self) -> list[str]:
+        """마지막 리프레시 이후 스킬이 바뀌었거나 커뮤니티가 없는 직원 ID (DB 시각 비교)"""
+        results = await self._neo4j.execute_cypher(
+            """
+            MATCH (m:CommunityMeta {key: 'last_refresh'})
+            MATCH (e:Employee)
+            WHERE e.communityId IS NULL
+               OR e.skills_changed_at >= m.refreshed_at
+            RETURN elementId(e) AS id
+            """,
+        )
+        return [row["id"] for row in results]
+
+    async def _update_similarity(
+        self,
+        employee_ids: list[str],
+        min_shared_skills: int,
+    ) -> None:
+        """
+        변경 직원의 SIMILAR 관계만 배치 트랜잭션으로 재계산
+
+        전체 Node Similarity와 같은 기준(Jaccard, cutoff, topK, 최소 스킬 수)으로
+        변경 직원 기준 상위 K개를 기록합니다. 변경 직원끼리의 관계가 다음 배치
+        삭제로 지워지지 않도록 삭제를 모두 마친 뒤 기록합니다.
+        """
+        batches = [
+            employee_ids[i : i + SIMILARITY_BATCH_SIZE]
+            for i in range(0, len(employee_ids), SIMILARITY_BATCH_SIZE)
+        ]
+        for batch in batches:
+            await self._neo4j.execute_cypher(
+                """
+                UNWIND $ids AS id
+                MATCH (e:Employee)-[r:SIMILAR]-()
+                WHERE elementId(e) = id
+                WITH DISTINCT r
+                DELETE r
+                """,
+                {"ids": batch},
+            )
+
+        written = 0
+        for batch in batches:
+            results = await self._neo4j.execute_cypher(
+                """
+                UNWIND $ids AS id
+                MATCH (e:Employee)-[:HAS_SKILL]->(s:Skill)
+                WHERE elementId(e) = id
+                WITH e, collect(DISTINCT s) AS skills
+                WHERE size(skills) >= $min_degree
+                UNWIND skills AS s
+                MATCH (s)<-[:HAS_SKILL]-(o:Employee)
+                WHERE o <> e
+                WITH e, size(skills) AS e_degree, o, count(DISTINCT s) AS shared
+                MATCH (o)-[:HAS_SKILL]->(os:Skill)
+                WITH e, e_degree, o, shared, count(DISTINCT os) AS o_degree
+                WHERE o_degree >= $min_degree
+                WITH e, o, toFloat(shared) / (e_degree + o_degree - shared)
+                     AS similarity
+                WHERE similarity >= $cutoff
+                WITH e, o, similarity
+                ORDER BY similarity DESC
+                WITH e, collect({node: o, similarity: similarity})[0..$top_k] AS top
+                UNWIND top AS t
+                WITH e, t.node AS o, t.similarity AS similarity
+                MERGE (e)-[r:SIMILAR]->(o)
+                SET r.similarity = similarity
+                RETURN count(r) AS written
+                """,
+                {
+                    "ids": batch,
+                    "min_degree": min_shared_skills,
+                    "cutoff": GDSService.SIMILARITY_CUTOFF,
+                    "top_k": GDSService.SIMILARITY_TOP_K,
+                },
+            )
+            if results:
+                written += results[0].get("written") or 0
+        logger.info(
+            f"SIMILAR relationships recomputed for {len(employee_ids)} employees "
+            f"({written} written)"
+        )
+
+    async def _seed_new_communities(self, employee_ids: list[str]) -> None:
+        """
+        communityId가 없는 변경 직원에게 시드 커뮤니티 부여
+
+        SIMILAR 이웃의 최빈 communityId를 따르고, 이웃이 없으면 새 ID를 부여합니다.
+        """
+        results = await self._neo4j.execute_cypher(
+            """
+            MATCH (e:Employee)
+            WHERE e.communityId IS NOT NULL
+            RETURN max(e.communityId) AS max_id
+            """,
+        )
+        max_id = results[0].get("max_id") if results else None
+        next_id = (max_id if max_id is not None else -1) + 1
+
+        for i in range(0, len(employee_ids), SIMILARITY_BATCH_SIZE):
+            batch = employee_ids[i : i + SIMILARITY_BATCH_SIZE]
+            await self._neo4j.execute_cypher(
+                """
+                UNWIND range(0, size($ids) - 1) AS idx
+                MATCH (e:Employee)
+                WHERE elementId(e) = $ids[idx] AND e.communityId IS NULL
+                OPTIONAL MATCH (e)-[:SIMILAR]-(n:Employee)
+                WHERE n.communityId IS NOT NULL
+                WITH e, idx, n.communityId AS community, count(n) AS votes
+                ORDER BY votes DESC, community
+                WITH e, idx, collect(community)[0] AS majority
+                SET e.communityId = coalesce(majority, $next_id + idx)
+                """,
+                {"ids": batch, "next_id": next_id + i},
+            )
+
     async def get_status(self) -> CommunityStatusResult:
         """
         커뮤니티 상태 조회
@@ -210,17 +441,20 @@ class CommunityBatchService:
         community_count: int,
         modularity: float,
         node_count: int,
+        min_shared_skills: int | None = None,
+        refreshed_at: str | None = None,
     ) -> None:
-        """CommunityMeta 노드에 리프레시 메타데이터 기록"""
+        """CommunityMeta 노드에 리프레시 메타데이터 기록 (refreshed_at: DB 시각 ISO, 기본 현재)"""
         await self._neo4j.execute_cypher(
             """
             MERGE (m:CommunityMeta {key: 'last_refresh'})
-            SET m.refreshed_at = datetime(),
+            SET m.refreshed_at = coalesce(datetime($refreshed_at), datetime()),
                 m.algorithm = $algorithm,
                 m.gamma = $gamma,
                 m.community_count = $community_count,
                 m.modularity = $modularity,
-                m.node_count = $node_count
+                m.node_count = $node_count,
+                m.min_shared_skills = $min_shared_skills
             """,
             {
                 "algorithm": algorithm,
@@ -228,6 +462,8 @@ class CommunityBatchService:
                 "community_count": community_count,
                 "modularity": modularity,
                 "node_count": node_count,
+                "min_shared_skills": min_shared_skills,
+                "refreshed_at": refreshed_at,
             },
         )
         logger.info("CommunityMeta node updated")
@@ -239,8 +475,11 @@ class CommunityBatchService:
             MATCH (m:CommunityMeta {key: 'last_refresh'})
             RETURN m.refreshed_at AS refreshed_at,
                    m.algorithm AS algorithm,
+                   m.gamma AS gamma,
                    m.community_count AS community_count,
-                   m.modularity AS modularity
+                   m.modularity AS modularity,
+                   m.node_count AS node_count,
+                   m.min_shared_skills AS min_shared_skills
             """,
         )
         if not results:
@@ -255,8 +494,11 @@ class CommunityBatchService:
         return {
             "refreshed_at": refreshed_at,
             "algorithm": row.get("algorithm"),
+            "gamma": row.get("gamma"),
             "community_count": row.get("community_count") or 0,
             "modularity": row.get("modularity"),
+            "node_count": row.get("node_count") or 0,
+            "min_shared_skills": row.get("min_shared_skills"),
         }
 
     async def _count_assigned_nodes(self) -> int:
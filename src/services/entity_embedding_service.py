@@ -0,0 +1,142 @@
+"""
+Entity Embedding Service
+
+Employee/Skill/Project/Department 노드의 name(+ 핵심 속성) 임베딩을 배치로 생성하여
+노드에 저장하고, 레이블별 벡터 인덱스를 관리합니다.
+EntityResolverNode의 벡터 유사도 폴백 tier가 이 인덱스를 사용합니다.
+
+백필은 재개 가능합니다:
+- 배치마다 임베딩과 임베딩 텍스트(embedding_text)를 함께 저장
+- 대상은 임베딩이 없거나 텍스트가 바뀐 노드뿐이므로 중단 후 재실행 시 남은 노드만 처리
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+
+from src.domain.constants import (
+    ENTITY_EMBEDDING_LABELS,
+    ENTITY_EMBEDDING_PROPERTY,
+    entity_embedding_index_name,
+)
+from src.infrastructure.llm import AzureOpenAIGateway
+from src.repositories.neo4j_repository import Neo4jRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EmbeddingBackfillResult:
+    """임베딩 백필 결과"""
+
+    updated_by_label: dict[str, int] = field(default_factory=dict)
+    batches: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def total_updated(self) -> int:
+        return sum(self.updated_by_label.values())
+
+
+class EntityEmbeddingService:
+    """
+    엔티티 임베딩 백필 서비스
+
+    사용 예시:
+        service = EntityEmbeddingService(neo4j_repository, llm_gateway)
+        await service.ensure_indexes()
+        result = await service.backfill(batch_size=500)
+    """
+
+    def __init__(
+        self,
+        neo4j_repository: Neo4jRepository,
+        llm_gateway: AzureOpenAIGateway,
+        dimensions: int = 1536,
+    ):
+        self._neo4j = neo4j_repository
+        self._llm = llm_gateway
+        self._dimensions = dimensions
+
+    async def ensure_indexes(
+        self, labels: tuple[str, ...] = ENTITY_EMBEDDING_LABELS
+    ) -> list[str]:
+        """레이블별 벡터 인덱스 생성 (IF NOT EXISTS)"""
+        created: list[str] = []
+        for label in labels:
+            index_name = entity_embedding_index_name(label)
+            await self._neo4j.ensure_vector_index(
+                index_name=index_name,
+                label=label,
+                property_name=ENTITY_EMBEDDING_PROPERTY,
+                dimensions=self._dimensions,
+            )
+            created.append(index_name)
+        return created
+
+    async def count_pending(
+        self, labels: tuple[str, ...] = ENTITY_EMBEDDING_LABELS
+    ) -> dict[str, int]:
+        """레이블별 백필 대상 노드 수"""
+        return {
+            label: await self._neo4j.count_pending_entity_embeddings(label)
+            for label in labels
+        }
+
+    async def backfill(
+        self,
+        labels: tuple[str, ...] = ENTITY_EMBEDDING_LABELS,
+        batch_size: int = 500,
+        max_batches: int | None = None,
+    ) -> EmbeddingBackfillResult:
+        """
+        레이블별 임베딩 백필
+
+        Args:
+            labels: 대상 레이블
+            batch_size: 배치당 노드 수 (임베딩 API는 embedding_batch_size 단위로 분할 요청)
+            max_batches: 이번 실행의 최대 배치 수 (None이면 전체, 재실행 시 이어서 처리)
+
+        Returns:
+            EmbeddingBackfillResult
+        """
+        start = time.perf_counter()
+        result = EmbeddingBackfillResult()
+
+        for label in labels:
+            result.updated_by_label[label] = 0
+            # 저장되지 않은 노드 (삭제 등) 재조회 방지
+            skipped_ids: list[str] = []
+
+            while max_batches is None or result.batches < max_batches:
+                pending = await self._neo4j.find_pending_entity_embeddings(
+                    label, limit=batch_size, exclude_ids=skipped_ids
+                )
+                if not pending:
+                    break
+
+                embeddings = await self._llm.get_embeddings(
+                    [row["text"] for row in pending]
+                )
+                updated = await self._neo4j.save_entity_embeddings(
+                    [
+                        {"node_id": row["id"], "embedding": vector, "text": row["text"]}
+                        for row, vector in zip(pending, embeddings, strict=True)
+                    ]
+                )
+                if updated < len(pending):
+                    skipped_ids.extend(row["id"] for row in pending)
+
+                result.batches += 1
+                result.updated_by_label[label] += updated
+                logger.info(
+                    f"Embedded {label} batch {result.batches}: "
+                    f"{updated}/{len(pending)} nodes"
+                )
+
+        result.duration_seconds = round(time.perf_counter() - start, 3)
+        logger.info(
+            f"Entity embedding backfill done: {result.total_updated} nodes, "
+            f"{result.batches} batches in {result.duration_seconds}s"
+        )
+        return result
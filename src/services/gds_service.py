@@ -15,10 +15,18 @@ from typing import Any, Literal
 
 from graphdatascience import GraphDataScience
 
+from src.domain.constants import NAME_NORM_PROPERTY, name_norm_expr, name_norm_match
 from src.domain.validators import validate_cypher_identifier
+from src.repositories.neo4j_repository import Neo4jRepository
+from src.services.skill_matrix import SkillMatrixService
+from src.services.team_optimizer import select_team
+from src.utils.graph_version import GraphVersion, get_graph_version
 
 logger = logging.getLogger(__name__)
 
+# 팀 추천 후보 풀 크기 (최적화 엔진이 수천 명 풀에서도 수십 ms 내 선택)
+TEAM_CANDIDATE_POOL = 2000
+
 
 @dataclass
 class CommunityResult:
@@ -47,8 +55,12 @@ class GDSService:
     """
     Neo4j GDS 기반 그래프 분석 서비스
 
-    비동기 FastAPI와 호환되도록 ThreadPoolExecutor 사용
-    (GDS Python 클라이언트가 동기식이므로)
+    GDS 알고리즘(프로젝션/커뮤니티 탐지)은 동기식 GDS Python 클라이언트를
+    전용 ThreadPoolExecutor에서 실행하고, 읽기 전용 분석 쿼리는
+    neo4j_repository(비동기 드라이버)로 실행해 알고리즘 작업 뒤에 대기하지 않습니다.
+
+    skill_matrix가 주입되면 유사 직원 탐색과 팀 추천 후보 점수는
+    인메모리 직원×스킬 행렬로 계산합니다 (Cypher/executor 미경유).
 
     사용 예시:
         async with GDSService(...) as gds:
@@ -59,6 +71,11 @@ class GDSService:
     # 기본 프로젝션 이름
     SKILL_PROJECTION = "employee_skill_graph"
 
+    # SIMILAR 관계 기준 (Node Similarity와 증분 갱신 Cypher가 공유)
+    SIMILARITY_CUTOFF = 0.3  # Jaccard 30% 이상만 저장
+    SIMILARITY_TOP_K = 10  # 직원당 상위 10명
+    SIMILAR_DELETE_BATCH_SIZE = 10_000  # SIMILAR 일괄 삭제 트랜잭션당 관계 수
+
     def __init__(
         self,
         uri: str,
@@ -66,6 +83,10 @@ class GDSService:
         password: str,
         database: str = "neo4j",
         max_workers: int = 2,
+        skill_matrix: SkillMatrixService | None = None,
+        neo4j_repository: Neo4jRepository | None = None,
+        read_workers: int = 4,
+        graph_version: GraphVersion | None = None,
     ):
         """
         GDS 서비스 초기화
@@ -75,14 +96,30 @@ class GDSService:
             user: 사용자명
             password: 비밀번호
             database: 데이터베이스 이름
-            max_workers: 동시 작업 스레드 수
+            max_workers: GDS 알고리즘(프로젝션/커뮤니티 탐지) 전용 스레드 수
+            skill_matrix: 인메모리 직원×스킬 행렬 (None이면 Cypher로 계산)
+            neo4j_repository: 읽기 전용 분석 쿼리용 비동기 레포지토리
+                (None이면 GDS 클라이언트로 읽기 전용 스레드 풀에서 실행)
+            read_workers: 읽기 전용 스레드 풀 크기 (neo4j_repository 미사용 시)
+            graph_version: SIMILAR/communityId 쓰기 후 bump할 그래프 버전
+                (쿼리 결과 캐시 무효화, None이면 프로세스 싱글톤)
         """
         self._uri = uri
         self._user = user
         self._password = password
         self._database = database
         self._gds: GraphDataScience | None = None
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # 알고리즘 실행과 분석 읽기를 분리: 긴 Leiden/프로젝션 작업이
+        # 유사 직원·팀 추천 같은 대화형 조회를 막지 않도록 함
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gds-algo"
+        )
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=read_workers, thread_name_prefix="gds-read"
+        )
+        self._neo4j = neo4j_repository
+        self._skill_matrix = skill_matrix
+        self._graph_version = graph_version or get_graph_version()
 
         logger.info(f"GDSService initialized: database={database}")
 
@@ -108,6 +145,7 @@ class GDSService:
             self._gds = None
         # wait=True로 진행 중인 작업 완료 대기 (리소스 누수 방지)
         self._executor.shutdown(wait=True)
+        self._read_executor.shutdown(wait=True)
         logger.info("GDS service closed")
 
     async def __aenter__(self) -> "GDSService":
@@ -124,6 +162,26 @@ class GDSService:
             raise RuntimeError("GDS not connected. Call connect() first.")
         return self._gds
 
+    async def _run_read(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        읽기 전용 분석 쿼리 실행 (알고리즘 스레드 풀 미경유)
+
+        비동기 레포지토리가 있으면 이벤트 루프에서 직접 실행하고,
+        없으면 GDS 클라이언트로 읽기 전용 스레드 풀에서 실행합니다.
+        """
+        if self._neo4j is not None:
+            return await self._neo4j.execute_cypher(query, parameters)
+
+        def _run() -> list[dict[str, Any]]:
+            return self.gds.run_cypher(query, parameters).to_dict("records")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, _run)
+
     # =========================================================================
     # 그래프 프로젝션
     # =========================================================================
@@ -159,6 +217,8 @@ class GDSService:
         self,
         projection_name: str | None = None,
         min_shared_skills: int = 3,
+        rebuild_similarity: bool = True,
+        seed_property: str | None = None,
     ) -> dict[str, Any]:
         """
         스킬 기반 직원 유사도 그래프 프로젝션 생성
@@ -169,10 +229,16 @@ class GDSService:
         Args:
             projection_name: 프로젝션 이름 (기본: employee_skill_graph)
             min_shared_skills: 최소 공유 스킬 수 (기본: 3, 메모리 최적화)
+            rebuild_similarity: False면 1·2단계를 건너뛰고 DB의 기존 SIMILAR
+                관계로만 프로젝션 (증분 리프레시에서 SIMILAR를 따로 갱신한 경우)
+            seed_property: 프로젝션에 포함할 Employee 노드 속성
+                (커뮤니티 탐지 시드용, 예: communityId)
 
         Returns:
             프로젝션 생성 결과
         """
+        if seed_property is not None:
+            validate_cypher_identifier(seed_property, "seed_property")
         name = projection_name or self.SKILL_PROJECTION
         bipartite_name = f"{name}_bipartite"
 
@@ -186,54 +252,81 @@ class GDSService:
                 except Exception as e:
                     logger.warning(f"Failed to cleanup {proj_name}: {e}")
 
-        def _create():
-            # 기존 프로젝션 삭제
-            _cleanup_projections()
-
-            try:
-                # 기존 SIMILAR 관계 삭제 (이전 실행의 잔여 데이터)
-                self.gds.run_cypher("MATCH ()-[r:SIMILAR]->() DELETE r")
-                logger.info("Cleaned up existing SIMILAR relationships")
-
-                # 1단계: Bipartite 그래프 프로젝션 (Employee-Skill)
-                G_bipartite, bipartite_result = self.gds.graph.project(
-                    bipartite_name,
-                    ["Employee", "Skill"],
-                    {
-                        "HAS_SKILL": {
-                            "orientation": "UNDIRECTED",
-                        }
-                    },
+        def _delete_all_similar() -> int:
+            """기존 SIMILAR 관계 배치 삭제 (트랜잭션당 SIMILAR_DELETE_BATCH_SIZE개)"""
+            total = 0
+            while True:
+                result = self.gds.run_cypher(
+                    """
+                    MATCH ()-[r:SIMILAR]->()
+                    WITH r LIMIT $batch_size
+                    DELETE r
+                    RETURN count(r) AS deleted
+                    """,
+                    {"batch_size": self.SIMILAR_DELETE_BATCH_SIZE},
                 )
+                deleted = int(result["deleted"].iloc[0]) if len(result) else 0
+                total += deleted
+                if deleted < self.SIMILAR_DELETE_BATCH_SIZE:
+                    return total
+
+        def _rebuild_similarity() -> None:
+            # 기존 SIMILAR 관계 삭제 (이전 실행의 잔여 데이터)
+            deleted = _delete_all_similar()
+            logger.info(f"Cleaned up {deleted} existing SIMILAR relationships")
+
+            # 1단계: Bipartite 그래프 프로젝션 (Employee-Skill)
+            G_bipartite, bipartite_result = self.gds.graph.project(  # type: ignore[operator]
+                bipartite_name,
+                ["Employee", "Skill"],
+                {
+                    "HAS_SKILL": {
+                        "orientation": "UNDIRECTED",
+                    }
+                },
+            )
 
-                logger.info(
-                    f"Bipartite projection: {bipartite_result['nodeCount']} nodes, "
-                    f"{bipartite_result['relationshipCount']} relationships"
-                )
+            logger.info(
+                f"Bipartite projection: {bipartite_result['nodeCount']} nodes, "
+                f"{bipartite_result['relationshipCount']} relationships"
+            )
 
-                # 2단계: Node Similarity로 유사도 계산 후 DB에 저장
-                # Jaccard 유사도 기반 (공유 스킬 비율)
-                similarity_result = self.gds.nodeSimilarity.write(
-                    G_bipartite,
-                    writeRelationshipType="SIMILAR",
-                    writeProperty="similarity",
-                    similarityCutoff=0.3,  # 30% 이상 유사한 것만 저장
-                    degreeCutoff=min_shared_skills,  # 최소 공유 스킬
-                    topK=10,  # 상위 10개 유사 노드만
-                )
+            # 2단계: Node Similarity로 유사도 계산 후 DB에 저장
+            # Jaccard 유사도 기반 (공유 스킬 비율)
+            similarity_result = self.gds.nodeSimilarity.write(  # type: ignore[attr-defined]
+                G_bipartite,
+                writeRelationshipType="SIMILAR",
+                writeProperty="similarity",
+                similarityCutoff=self.SIMILARITY_CUTOFF,
+                degreeCutoff=min_shared_skills,  # 최소 공유 스킬
+                topK=self.SIMILARITY_TOP_K,
+            )
 
-                logger.info(
-                    f"Node Similarity: {similarity_result['relationshipsWritten']} "
-                    f"similarity relationships written to DB"
-                )
+            logger.info(
+                f"Node Similarity: {similarity_result['relationshipsWritten']} "
+                f"similarity relationships written to DB"
+            )
+
+            # Bipartite 프로젝션 삭제 (더 이상 필요 없음)
+            self.gds.graph.drop(G_bipartite)
 
-                # Bipartite 프로젝션 삭제 (더 이상 필요 없음)
-                self.gds.graph.drop(G_bipartite)
+        def _create():
+            # 기존 프로젝션 삭제
+            _cleanup_projections()
+
+            try:
+                if rebuild_similarity:
+                    _rebuild_similarity()
 
                 # 3단계: Employee + SIMILAR 관계로 새 프로젝션 생성 (UNDIRECTED)
+                node_spec: Any = (
+                    {"Employee": {"properties": [seed_property]}}
+                    if seed_property
+                    else ["Employee"]
+                )
                 G_final, final_result = self.gds.graph.project(
                     name,
-                    ["Employee"],
+                    node_spec,
                     {
                         "SIMILAR": {
                             "orientation": "UNDIRECTED",
@@ -254,7 +347,12 @@ class GDSService:
                 raise
 
         loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(self._executor, _create)
+        try:
+            result = await loop.run_in_executor(self._executor, _create)
+        finally:
+            # SIMILAR 재구축은 실패해도 일부 삭제/쓰기가 반영됐을 수 있음
+            if rebuild_similarity:
+                self._graph_version.bump("gds_similarity")
 
         logger.info(
             f"Created projection '{name}': "
@@ -317,6 +415,7 @@ class GDSService:
         projection_name: str | None = None,
         gamma: float = 1.0,
         write_property: str = "communityId",
+        seed_property: str | None = None,
     ) -> CommunityResult:
         """
         커뮤니티 탐지 실행
@@ -326,12 +425,15 @@ class GDSService:
             projection_name: 프로젝션 이름
             gamma: Resolution 파라미터 (높을수록 작은 커뮤니티)
             write_property: 결과를 저장할 노드 속성명
+            seed_property: 초기 커뮤니티로 쓸 프로젝션 노드 속성
+                (이전 communityId로 시작하면 변경분 주변만 재배치되어 빠르게 수렴)
 
         Returns:
             커뮤니티 탐지 결과
         """
         name = projection_name or self.SKILL_PROJECTION
         validate_cypher_identifier(write_property, "write_property")
+        seed_config = {"seedProperty": seed_property} if seed_property else {}
 
         def _detect():
             # 프로젝션 존재 확인
@@ -350,36 +452,42 @@ class GDSService:
                     writeProperty=write_property,
                     gamma=gamma,
                     randomSeed=42,
+                    **seed_config,
                 )
             else:  # louvain
                 result = self.gds.louvain.write(
                     G,
                     writeProperty=write_property,
                     randomSeed=42,
+                    **seed_config,
                 )
 
-            # 커뮤니티별 통계 조회
-            communities = self.gds.run_cypher(
-                f"""
-                MATCH (e:Employee)
-                WHERE e.{write_property} IS NOT NULL
-                RETURN e.{write_property} AS community_id,
-                       count(*) AS member_count,
-                       collect(e.name)[0..5] AS sample_members
-                ORDER BY member_count DESC
-                """
-            )
-
             return {
                 "algorithm": algorithm,
                 "node_count": result["nodePropertiesWritten"],
                 "community_count": result["communityCount"],
                 "modularity": result["modularity"],
-                "communities": communities.to_dict("records"),
             }
 
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(self._executor, _detect)
+        self._graph_version.bump("gds_communities")
+
+        # 커뮤니티별 통계 조회
+        result["communities"] = await self._run_read(
+            f"""
+            MATCH (e:Employee)
+            WHERE e.{write_property} IS NOT NULL
+            RETURN e.{write_property} AS community_id,
+                   count(*) AS member_count,
+                   collect(e.name)[0..5] AS sample_members
+            ORDER BY member_count DESC
+            """
+        )
+
+        # communityId가 바뀌었으므로 행렬 메타데이터 재적재
+        if self._skill_matrix is not None:
+            self._skill_matrix.invalidate()
 
         logger.info(
             f"Community detection ({algorithm}): "
@@ -408,41 +516,41 @@ class GDSService:
         Returns:
             유사 직원 목록 (유사도 점수 포함)
         """
-
-        def _find():
-            # Jaccard 유사도 기반 검색
-            result = self.gds.run_cypher(
-                """
-                MATCH (target:Employee)-[:HAS_SKILL]->(s:Skill)
-                WHERE toLower(target.name) = toLower($name)
-                WITH target, collect(s) AS targetSkills
-                MATCH (other:Employee)-[:HAS_SKILL]->(s2:Skill)
-                WHERE other <> target
-                WITH target, targetSkills, other, collect(s2) AS otherSkills
-                WITH target, other,
-                     [s IN targetSkills WHERE s IN otherSkills] AS intersection,
-                     targetSkills + [s IN otherSkills WHERE NOT s IN targetSkills] AS union_
-                WITH other,
-                     size(intersection) AS shared,
-                     size(union_) AS total,
-                     [s IN intersection | s.name] AS sharedSkillNames
-                WHERE shared > 0
-                RETURN other.name AS name,
-                       other.job_type AS job_type,
-                       other.years_experience AS experience,
-                       other.communityId AS community_id,
-                       shared AS shared_skills,
-                       round(1.0 * shared / total, 3) AS similarity,
-                       sharedSkillNames[0..5] AS common_skills
-                ORDER BY similarity DESC, shared DESC
-                LIMIT $top_k
-                """,
-                {"name": employee_name, "top_k": top_k},
-            )
-            return result.to_dict("records")
-
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(self._executor, _find)
+        if self._skill_matrix is not None:
+            await self._skill_matrix.ensure_loaded()
+            result = self._skill_matrix.similar_employees(employee_name, top_k)
+            logger.info(f"Found {len(result)} similar employees for '{employee_name}'")
+            return result
+
+        # Jaccard 유사도 기반 검색
+        result = await self._run_read(
+            f"""
+            MATCH (target:Employee)-[:HAS_SKILL]->(s:Skill)
+            WHERE {name_norm_match("target", "name")}
+            WITH target, collect(s) AS targetSkills
+            MATCH (other:Employee)-[:HAS_SKILL]->(s2:Skill)
+            WHERE other <> target
+            WITH target, targetSkills, other, collect(s2) AS otherSkills
+            WITH target, other,
+                 [s IN targetSkills WHERE s IN otherSkills] AS intersection,
+                 targetSkills + [s IN otherSkills WHERE NOT s IN targetSkills] AS union_
+            WITH other,
+                 size(intersection) AS shared,
+                 size(union_) AS total,
+                 [s IN intersection | s.name] AS sharedSkillNames
+            WHERE shared > 0
+            RETURN other.name AS name,
+                   other.job_type AS job_type,
+                   other.years_experience AS experience,
+                   other.communityId AS community_id,
+                   shared AS shared_skills,
+                   round(1.0 * shared / total, 3) AS similarity,
+                   sharedSkillNames[0..5] AS common_skills
+            ORDER BY similarity DESC, shared DESC
+            LIMIT $top_k
+            """,
+            {"name": employee_name, "top_k": top_k},
+        )
 
         logger.info(f"Found {len(result)} similar employees for '{employee_name}'")
         return result
@@ -468,14 +576,18 @@ class GDSService:
         Returns:
             팀 추천 결과
         """
-
-        def _recommend():
+        if self._skill_matrix is not None:
+            await self._skill_matrix.ensure_loaded()
+            candidates_list = self._skill_matrix.score_candidates(
+                required_skills, limit=TEAM_CANDIDATE_POOL
+            )
+        else:
             # 1. 스킬 보유자 후보 조회 (스킬 커버리지 점수)
-            candidates = self.gds.run_cypher(
-                """
+            candidates_list = await self._run_read(
+                f"""
                 UNWIND $skills AS skillName
                 MATCH (e:Employee)-[r:HAS_SKILL]->(s:Skill)
-                WHERE toLower(s.name) = toLower(skillName)
+                WHERE s.{NAME_NORM_PROPERTY} = {name_norm_expr("skillName")}
                 WITH e, collect(DISTINCT s.name) AS matchedSkills,
                      count(DISTINCT s) AS skillCount
                 RETURN e.employee_id AS id,
@@ -486,82 +598,20 @@ class GDSService:
                        matchedSkills,
                        skillCount,
                        1.0 * skillCount / $totalSkills AS skill_score
-                ORDER BY skillCount DESC
+                ORDER BY skillCount DESC, id
                 LIMIT $limit
                 """,
                 {
                     "skills": required_skills,
                     "totalSkills": len(required_skills),
-                    "limit": team_size * 3,  # 후보 풀
+                    "limit": TEAM_CANDIDATE_POOL,
                 },
             )
-            candidates_list = candidates.to_dict("records")
-
-            if not candidates_list:
-                return {
-                    "members": [],
-                    "skill_coverage": 0.0,
-                    "covered_skills": [],
-                    "missing_skills": required_skills.copy(),
-                    "community_diversity": 0,
-                    "total_score": 0.0,
-                }
-
-            # 2. 그리디 선택: 스킬 커버리지 + 커뮤니티 다양성 최적화
-            selected = []
-            covered_skills: set[str] = set()
-            used_communities: set[int] = set()
-
-            for candidate in candidates_list:
-                if len(selected) >= team_size:
-                    break
-
-                # 스킬 기여도
-                new_skills = set(candidate["matchedSkills"]) - covered_skills
-                skill_contribution = len(new_skills) / len(required_skills)
-
-                # 커뮤니티 다양성 기여도
-                comm_id = candidate.get("community_id")
-                diversity_contribution = (
-                    1.0 if comm_id and comm_id not in used_communities else 0.0
-                )
-
-                # 종합 점수
-                score = (1 - diversity_weight) * skill_contribution + (
-                    diversity_weight * diversity_contribution
-                )
-
-                # 새로운 스킬을 제공하거나, 충분한 스킬 기여도와 함께 다양성을 높이면 선택
-                # (스킬 기여 없이 커뮤니티 다양성만으로는 선택하지 않음)
-                should_select = new_skills or (
-                    skill_contribution >= 0.2  # 최소 20% 스킬 기여도 필요
-                    and comm_id
-                    and comm_id not in used_communities
-                )
-                if should_select:
-                    candidate["selection_score"] = round(score, 3)
-                    selected.append(candidate)
-                    covered_skills.update(new_skills)
-                    if comm_id:
-                        used_communities.add(comm_id)
-
-            skill_coverage = len(covered_skills) / len(required_skills)
-            total_score = sum(m.get("selection_score", 0) for m in selected) / max(
-                len(selected), 1
-            )
 
-            missing = [s for s in required_skills if s not in covered_skills]
-            return {
-                "members": selected,
-                "skill_coverage": round(skill_coverage, 3),
-                "covered_skills": list(covered_skills),
-                "missing_skills": missing,
-                "community_diversity": len(used_communities),
-                "total_score": round(total_score, 3),
-            }
-
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(self._executor, _recommend)
+        # 2. 커버리지 + 커뮤니티 다양성 최적 팀 선택
+        result = select_team(
+            candidates_list, required_skills, team_size, diversity_weight
+        )
 
         logger.info(
             f"Team recommendation: {len(result['members'])} members, "
@@ -590,46 +640,41 @@ class GDSService:
         Returns:
             커뮤니티 상세 정보 (멤버, 주요 스킬 등)
         """
+        # 멤버 조회
+        members = await self._run_read(
+            """
+            MATCH (e:Employee {communityId: $community_id})
+            OPTIONAL MATCH (e)-[:HAS_SKILL]->(s:Skill)
+            WITH e, collect(s.name) AS skills
+            RETURN e.employee_id AS id,
+                   e.name AS name,
+                   e.job_type AS job_type,
+                   e.years_experience AS experience,
+                   skills[0..5] AS top_skills
+            LIMIT $limit
+            """,
+            {"community_id": community_id, "limit": limit},
+        )
 
-        def _get_details():
-            # 멤버 조회
-            members = self.gds.run_cypher(
-                """
-                MATCH (e:Employee {communityId: $community_id})
-                OPTIONAL MATCH (e)-[:HAS_SKILL]->(s:Skill)
-                WITH e, collect(s.name) AS skills
-                RETURN e.employee_id AS id,
-                       e.name AS name,
-                       e.job_type AS job_type,
-                       e.years_experience AS experience,
-                       skills[0..5] AS top_skills
-                LIMIT $limit
-                """,
-                {"community_id": community_id, "limit": limit},
-            )
-
-            # 주요 스킬 통계
-            skill_stats = self.gds.run_cypher(
-                """
-                MATCH (e:Employee {communityId: $community_id})-[:HAS_SKILL]->(s:Skill)
-                RETURN s.name AS skill,
-                       count(*) AS count,
-                       round(100.0 * count(*) / $member_count, 1) AS percentage
-                ORDER BY count DESC
-                LIMIT 10
-                """,
-                {"community_id": community_id, "member_count": len(members)},
-            )
-
-            return {
-                "community_id": community_id,
-                "member_count": len(members),
-                "members": members.to_dict("records"),
-                "top_skills": skill_stats.to_dict("records"),
-            }
+        # 주요 스킬 통계
+        skill_stats = await self._run_read(
+            """
+            MATCH (e:Employee {communityId: $community_id})-[:HAS_SKILL]->(s:Skill)
+            RETURN s.name AS skill,
+                   count(*) AS count,
+                   round(100.0 * count(*) / $member_count, 1) AS percentage
+            ORDER BY count DESC
+            LIMIT 10
+            """,
+            {"community_id": community_id, "member_count": len(members)},
+        )
 
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(self._executor, _get_details)
+        result = {
+            "community_id": community_id,
+            "member_count": len(members),
+            "members": members,
+            "top_skills": skill_stats,
+        }
 
         logger.info(f"Community {community_id}: {result['member_count']} members")
         return result
@@ -6,11 +6,15 @@ GraphEditService - 그래프 편집 비즈니스 로직
 """
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from src.domain.constants import ALLOWED_LABELS, VALID_RELATIONSHIP_COMBINATIONS
 from src.domain.exceptions import EntityNotFoundError, GraphRAGError, ValidationError
 from src.repositories.neo4j_repository import Neo4jRepository
+from src.repositories.query_cache_repository import QueryCacheRepository
+from src.services.skill_matrix import SkillMatrixService
+from src.utils.graph_version import GraphVersion, get_graph_version
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +50,32 @@ class GraphEditService:
 
     Neo4jRepository를 통해 노드/엣지 CRUD를 수행하며,
     화이트리스트 기반 비즈니스 검증을 적용합니다.
+    변경 성공 시 그래프 버전을 올리고 프로세스 내 질문 캐시(L1)를 무효화하며,
+    직원×스킬 행렬에는 변경분만 반영합니다.
     """
 
-    def __init__(self, neo4j_repository: Neo4jRepository):
+    def __init__(
+        self,
+        neo4j_repository: Neo4jRepository,
+        query_cache: QueryCacheRepository | None = None,
+        graph_version: GraphVersion | None = None,
+        skill_matrix: SkillMatrixService | None = None,
+    ):
         self._neo4j = neo4j_repository
+        self._query_cache = query_cache
+        self._graph_version = graph_version or get_graph_version()
+        self._skill_matrix = skill_matrix
+
+    def _notify_graph_changed(
+        self,
+        matrix_update: Callable[[SkillMatrixService], None] | None = None,
+    ) -> None:
+        """그래프 변경 후 파생 캐시 무효화 (matrix_update: 스킬 행렬 증분 반영)"""
+        version = self._graph_version.bump("graph_edit")
+        if self._query_cache:
+            self._query_cache.invalidate_local()
+        if self._skill_matrix:
+            self._skill_matrix.apply_edit(version, matrix_update)
 
     # ============================================
     # 노드 CRUD
@@ -97,10 +123,12 @@ class GraphEditService:
 
         result = await self._neo4j.create_node_generic(label, properties)
         if result is None:
+            self._notify_graph_changed()
             # 두 요청이 동시에 1단계를 통과했지만 repository atomic 패턴이 차단
             raise GraphEditConflictError(
                 f"Node with name '{name}' already exists in label '{label}'"
             )
+        self._notify_graph_changed(lambda m: m.upsert_node(result))
         logger.info(f"Node created: {label} '{name}' by {ANONYMOUS_ADMIN}")
         return result
 
@@ -155,6 +183,7 @@ class GraphEditService:
         result = await self._neo4j.update_node_properties(
             node_id, update_props, remove_keys or None
         )
+        self._notify_graph_changed(lambda m: m.upsert_node(result))
         logger.info(f"Node updated: {node_id}")
         return result
 
@@ -232,6 +261,7 @@ class GraphEditService:
                 f"Use force=true to delete with relationships."
             )
 
+        self._notify_graph_changed(lambda m: m.remove_node(node_id))
         logger.info(f"Node deleted: {node_id} (force={force})")
 
     # ============================================
@@ -286,6 +316,17 @@ class GraphEditService:
         result = await self._neo4j.create_relationship_generic(
             source_id, target_id, relationship_type, edge_props
         )
+        if relationship_type == "HAS_SKILL":
+            self._notify_graph_changed(
+                lambda m: m.set_skill(
+                    source_id,
+                    target_id,
+                    present=True,
+                    skill_name=target.properties.get("name", ""),
+                )
+            )
+        else:
+            self._notify_graph_changed()
         logger.info(
             f"Edge created: {relationship_type} "
             f"({source_id} -> {target_id}) by {ANONYMOUS_ADMIN}"
@@ -298,9 +339,21 @@ class GraphEditService:
 
     async def delete_edge(self, edge_id: str) -> None:
         """엣지 삭제"""
+        # 스킬 행렬 증분 반영을 위해 삭제 전 관계 정보 조회
+        edge = await self.get_edge(edge_id) if self._skill_matrix else None
+
         deleted = await self._neo4j.delete_relationship_generic(edge_id)
         if not deleted:
             raise EntityNotFoundError("Edge", edge_id)
+
+        if edge is not None and edge.get("type") == "HAS_SKILL":
+            self._notify_graph_changed(
+                lambda m: m.set_skill(
+                    edge["source_id"], edge["target_id"], present=False
+                )
+            )
+        else:
+            self._notify_graph_changed()
         logger.info(f"Edge deleted: {edge_id}")
 
     # ============================================
@@ -8,7 +8,10 @@ Project Staffing Service
 """
 
 import logging
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, cast
 
 from src.api.schemas.staffing import (
     BudgetAnalysisResponse,
@@ -24,14 +27,18 @@ from src.api.schemas.staffing import (
     TeamMemberCost,
 )
 from src.domain.constants import (
+    NAME_NORM_PROPERTY,
     PROFICIENCY_MAP,
     PROJECT_STATUS_ACTIVE,
     PROJECT_STATUS_PLANNED,
     active_statuses_literal,
     build_proficiency_case_cypher,
-    tolower_match,
+    name_norm_expr,
+    name_norm_match,
+    normalize_name,
 )
 from src.repositories.neo4j_repository import Neo4jRepository
+from src.utils.graph_version import GraphVersion, get_graph_version
 
 logger = logging.getLogger(__name__)
 
@@ -49,12 +56,31 @@ CATEGORY_COLORS: dict[str, str] = {
 
 DEFAULT_COLOR = "#6B7280"
 
+# 프로젝트 단위 조회 결과 메모 TTL (초) — find-candidates → plan 연속 호출 재사용
+DEFAULT_MEMO_TTL_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class _Unmemoized[T]:
+    """메모하지 않고 반환할 결과 (일부 조회 실패로 불완전한 값)"""
+
+    value: T
+
 
 class ProjectStaffingService:
     """비용 기반 프로젝트 인력 배치 서비스"""
 
-    def __init__(self, neo4j_repository: Neo4jRepository):
+    def __init__(
+        self,
+        neo4j_repository: Neo4jRepository,
+        memo_ttl_seconds: float = DEFAULT_MEMO_TTL_SECONDS,
+        graph_version: GraphVersion | None = None,
+    ):
         self._neo4j = neo4j_repository
+        self._memo_ttl_seconds = memo_ttl_seconds
+        self._graph_version = graph_version or get_graph_version()
+        # key → (만료 시각, 저장 시점 그래프 버전, 값)
+        self._memo: dict[tuple[Any, ...], tuple[float, int, Any]] = {}
 
     # =========================================================================
     # 프로젝트 목록 조회
@@ -118,44 +144,66 @@ class ProjectStaffingService:
         Raises:
             ValueError: 프로젝트가 존재하지 않는 경우
         """
+        key = (
+            "candidates",
+            normalize_name(project_name),
+            normalize_name(skill_name) if skill_name else None,
+            min_proficiency,
+        )
+        return await self._memoized(
+            key,
+            lambda: self._find_candidates(project_name, skill_name, min_proficiency),
+        )
+
+    async def _find_candidates(
+        self,
+        project_name: str,
+        skill_name: str | None,
+        min_proficiency: int | None,
+    ) -> FindCandidatesResponse | _Unmemoized[FindCandidatesResponse]:
+        """find_candidates() 본체 (메모 미적용, 후보 조회 실패 시 _Unmemoized)"""
         # 1. 프로젝트 상세 조회
         project = await self._get_project_info(project_name)
 
         # 2. REQUIRES 스킬 목록 조회
         requirements = await self._get_project_requirements(project_name, skill_name)
 
-        # 3. 스킬별 후보자 탐색
+        # 요구 숙련도: DB에 한글 문자열("초급"~"전문가")로 저장됨 → 숫자로 변환
+        for req in requirements:
+            raw = req.get("required_proficiency")
+            req["required_proficiency"] = (
+                PROFICIENCY_MAP.get(raw, 0) if isinstance(raw, str) else raw
+            )
+
+        # 3. 전체 스킬 후보자 일괄 탐색 (min_proficiency 파라미터가 있으면 우선 사용)
+        found = await self._find_requirement_candidates(
+            [
+                {
+                    "skill_name": req["skill_name"],
+                    "min_proficiency": (
+                        min_proficiency
+                        if min_proficiency is not None
+                        else req["required_proficiency"]
+                    ),
+                    "max_hourly_rate": req.get("max_hourly_rate"),
+                }
+                for req in requirements
+            ]
+        )
+        candidates_by_skill = found or {}
+
         skill_candidates_list: list[SkillCandidates] = []
         all_candidate_names: set[str] = set()
 
         for req in requirements:
             req_skill = req["skill_name"]
-            req_proficiency_raw = req.get("required_proficiency")
+            req_proficiency = req["required_proficiency"]
             max_rate = req.get("max_hourly_rate")
-            headcount = req.get("required_headcount")
-            importance = req.get("importance")
-
-            # DB에 한글 문자열("초급"~"전문가")로 저장됨 → 숫자로 변환
-            if isinstance(req_proficiency_raw, str):
-                req_proficiency = PROFICIENCY_MAP.get(req_proficiency_raw, 0)
-            else:
-                req_proficiency = req_proficiency_raw
-
-            # min_proficiency 파라미터가 있으면 우선 사용
-            effective_min_prof = (
-                min_proficiency if min_proficiency is not None else req_proficiency
-            )
-
-            candidates = await self._find_skill_candidates(
-                skill_name=req_skill,
-                min_proficiency=effective_min_prof,
-                max_hourly_rate=max_rate,
-            )
 
             # 매칭 점수 계산 및 점수 DESC 정렬
             candidates = [
                 self._compute_match_context(c, req_proficiency, max_rate)
-                for c in candidates
+                for c in candidates_by_skill.get(req_skill, [])
             ]
             candidates.sort(key=lambda c: (-c.match_score, c.effective_rate))
 
@@ -167,13 +215,13 @@ class ProjectStaffingService:
                     skill_name=req_skill,
                     required_proficiency=req_proficiency,
                     max_hourly_rate=max_rate,
-                    required_headcount=headcount,
-                    importance=importance,
+                    required_headcount=req.get("required_headcount"),
+                    importance=req.get("importance"),
                     candidates=candidates,
                 )
             )
 
-        return FindCandidatesResponse(
+        response = FindCandidatesResponse(
             project_name=project_name,
             project_budget=project.get("budget_million"),
             estimated_hours=project.get("estimated_hours"),
@@ -182,6 +230,8 @@ class ProjectStaffingService:
             total_skills=len(skill_candidates_list),
             total_candidates=len(all_candidate_names),
         )
+        # 일시 장애로 빈 후보가 된 결과는 메모하지 않음 (다음 호출에서 재조회)
+        return response if found is not None else _Unmemoized(response)
 
     # =========================================================================
     # Scenario 2: 스태핑 플랜 + 예상 비용
@@ -294,7 +344,7 @@ class ProjectStaffingService:
 
         query = f"""
         MATCH (e:Employee)-[w:WORKS_ON]->(p:Project)
-        WHERE {tolower_match("p.name", "project_name")}
+        WHERE {name_norm_match("p", "project_name")}
         WITH e.name AS emp_name,
              max(w.role) AS role,
              max(w.agreed_rate) AS agreed_rate,
@@ -368,7 +418,7 @@ class ProjectStaffingService:
         if project_name:
             query = f"""
             MATCH (p:Project)-[:REQUIRES]->(s:Skill)
-            WHERE {tolower_match("p.name", "project_name")}
+            WHERE {name_norm_match("p", "project_name")}
               AND s.category IS NOT NULL
             WITH s.category AS cat, collect(DISTINCT s.name) AS skills
             RETURN cat AS category, skills
@@ -402,11 +452,51 @@ class ProjectStaffingService:
     # Private Methods
     # =========================================================================
 
+    async def _memoized[T](
+        self,
+        key: tuple[Any, ...],
+        factory: Callable[[], Awaitable[T | _Unmemoized[T]]],
+    ) -> T:
+        """
+        프로젝트 단위 조회 결과 메모 (짧은 TTL + 그래프 버전 일치 시에만 재사용)
+
+        후보 탐색 → 스태핑 플랜 → 예산 분석처럼 같은 프로젝트를 연이어 조회할 때
+        동일 집계 쿼리를 다시 실행하지 않도록 합니다.
+        예외와 _Unmemoized로 감싼 결과는 메모하지 않습니다.
+        """
+        if self._memo_ttl_seconds <= 0:
+            value = await factory()
+            return value.value if isinstance(value, _Unmemoized) else value
+
+        now = time.monotonic()
+        version = self._graph_version.current
+        entry = self._memo.get(key)
+        if entry is not None and entry[0] > now and entry[1] == version:
+            return cast(T, entry[2])
+
+        value = await factory()
+        if isinstance(value, _Unmemoized):
+            return value.value
+        # 만료·이전 버전 항목 정리 후 저장
+        self._memo = {
+            k: v for k, v in self._memo.items() if v[0] > now and v[1] == version
+        }
+        self._memo[key] = (now + self._memo_ttl_seconds, version, value)
+        return value
+
     async def _get_project_info(self, project_name: str) -> dict[str, Any]:
-        """프로젝트 기본 정보 조회"""
+        """프로젝트 기본 정보 조회 (메모 적용, 호출자별 사본 반환)"""
+        info = await self._memoized(
+            ("project", normalize_name(project_name)),
+            lambda: self._fetch_project_info(project_name),
+        )
+        return dict(info)
+
+    async def _fetch_project_info(self, project_name: str) -> dict[str, Any]:
+        """프로젝트 기본 정보 DB 조회"""
         query = f"""
         MATCH (p:Project)
-        WHERE {tolower_match("p.name", "project_name")}
+        WHERE {name_norm_match("p", "project_name")}
         RETURN p.name AS name,
                p.budget_million AS budget_million,
                p.estimated_hours AS estimated_hours,
@@ -436,12 +526,12 @@ class ProjectStaffingService:
         params: dict[str, Any] = {"project_name": project_name}
 
         if skill_filter:
-            skill_clause = f"AND {tolower_match('s.name', 'skill_filter')}"
+            skill_clause = f"AND {name_norm_match('s', 'skill_filter')}"
             params["skill_filter"] = skill_filter
 
         query = f"""
         MATCH (p:Project)-[r:REQUIRES]->(s:Skill)
-        WHERE {tolower_match("p.name", "project_name")}
+        WHERE {name_norm_match("p", "project_name")}
         {skill_clause}
         // Project 중복 노드 대응: 스킬명 기반 그룹핑
         WITH s.name AS skill_name,
@@ -613,41 +703,44 @@ class ProjectStaffingService:
             }
         )
 
-    async def _find_skill_candidates(
+    async def _find_requirement_candidates(
         self,
-        skill_name: str,
-        min_proficiency: int | None = None,
-        max_hourly_rate: float | None = None,
-    ) -> list[CandidateInfo]:
+        requirements: list[dict[str, Any]],
+    ) -> dict[str, list[CandidateInfo]] | None:
         """
-        특정 스킬의 적격 후보자를 탐색합니다.
+        전체 REQUIRES 스킬의 적격 후보자를 단일 쿼리로 탐색합니다.
 
-        Employee 중복 노드를 e.name 기반으로 그룹핑하여 통합합니다.
-        """
-        proficiency_clause = ""
-        rate_clause = ""
-        params: dict[str, Any] = {"skill_name": skill_name}
+        요구사항을 UNWIND하여 스킬별 숙련도·단가 필터를 적용하고,
+        진행중 프로젝트 집계(워크로드)는 직원당 1회만 수행해 스킬 간에 공유합니다.
+        Employee 중복 노드는 e.name 기반으로 그룹핑하여 통합합니다.
 
-        if min_proficiency is not None:
-            proficiency_clause = "AND proficiency >= $min_proficiency"
-            params["min_proficiency"] = min_proficiency
+        Args:
+            requirements: [{skill_name, min_proficiency, max_hourly_rate}]
+                (min_proficiency/max_hourly_rate가 None이면 해당 필터 없음)
 
-        if max_hourly_rate is not None:
-            rate_clause = "AND effective_rate <= $max_hourly_rate"
-            params["max_hourly_rate"] = max_hourly_rate
+        Returns:
+            스킬명 → 후보자 리스트 (단가 ASC, 숙련도 DESC).
+            쿼리 실패 시 None (호출자는 빈 후보로 진행하되 메모하지 않음)
+        """
+        if not requirements:
+            return {}
 
         proficiency_case = build_proficiency_case_cypher("hs.proficiency")
         active_statuses = active_statuses_literal()
 
         query = f"""
-        // 스킬 보유자 조회 (Employee 중복 노드 통합)
+        // 요구 스킬별 보유자 조회 (Employee 중복 노드 통합)
+        UNWIND $requirements AS req
         MATCH (e:Employee)-[hs:HAS_SKILL]->(s:Skill)
-        WHERE {tolower_match("s.name", "skill_name")}
+        WHERE s.{NAME_NORM_PROPERTY} = {name_norm_expr("req.skill_name")}
 
-        // Employee name 기반 그룹핑 (중복 노드 대응)
+        // (스킬, Employee name) 기반 그룹핑 (중복 노드 대응)
         // proficiency: 한글 문자열("초급"~"전문가") → 숫자 변환 후 max
         // availability: min()으로 최적(available) 상태 우선
-        WITH e.name AS emp_name,
+        WITH req.skill_name AS skill_name,
+             req.min_proficiency AS min_proficiency,
+             req.max_hourly_rate AS max_hourly_rate,
+             e.name AS emp_name,
              max({proficiency_case}) AS proficiency,
              min(hs.effective_rate) AS effective_rate,
              max(coalesce(hs.years_used, 0)) AS years_used,
@@ -655,16 +748,26 @@ class ProjectStaffingService:
              max(e.department) AS department,
              max(e.max_projects) AS max_projects
 
-        // 숙련도·단가 필터 (availability 필터 제거 — 프로젝트 수 기반으로 대체)
-        WHERE true
-        {proficiency_clause}
-        {rate_clause}
+        // 스킬별 숙련도·단가 필터 (availability 필터 없음 — 프로젝트 수 기반으로 대체)
+        WHERE (min_proficiency IS NULL OR proficiency >= min_proficiency)
+          AND (max_hourly_rate IS NULL OR effective_rate <= max_hourly_rate)
+
+        // 직원 단위로 접어 프로젝트 집계를 1회만 수행
+        WITH emp_name,
+             collect({{
+               skill_name: skill_name,
+               proficiency: proficiency,
+               effective_rate: effective_rate,
+               years_used: years_used
+             }}) AS matches,
+             min(availability) AS availability,
+             max(department) AS department,
+             max(max_projects) AS max_projects
 
         // 진행중 프로젝트 상세 (프로젝트별 그룹핑, 중복 노드 대응)
         OPTIONAL MATCH (e2:Employee)-[w2:WORKS_ON]->(proj:Project)
         WHERE e2.name = emp_name AND proj.status IN {active_statuses}
-        WITH emp_name, proficiency, effective_rate, years_used,
-             availability, department, max_projects,
+        WITH emp_name, matches, availability, department, max_projects,
              proj.name AS proj_name,
              max(proj.status) AS proj_status,
              max(w2.contribution_percent) AS proj_contrib,
@@ -672,8 +775,7 @@ class ProjectStaffingService:
              max(w2.actual_hours) AS proj_actual
 
         // 프로젝트별 정보를 리스트로 수집
-        WITH emp_name, proficiency, effective_rate, years_used,
-             availability, department, max_projects,
+        WITH emp_name, matches, availability, department, max_projects,
              count(proj_name) AS current_projects,
              [x IN collect(CASE WHEN proj_name IS NOT NULL THEN {{
                name: proj_name,
@@ -683,42 +785,61 @@ class ProjectStaffingService:
                actual: proj_actual
              }} END) WHERE x IS NOT NULL] AS project_details
 
-        RETURN emp_name, department, proficiency, effective_rate,
-               years_used, availability, current_projects, max_projects,
-               project_details
-        ORDER BY effective_rate ASC, proficiency DESC
+        UNWIND matches AS m
+        RETURN m.skill_name AS skill_name, emp_name, department,
+               m.proficiency AS proficiency, m.effective_rate AS effective_rate,
+               m.years_used AS years_used, availability, current_projects,
+               max_projects, project_details
+        ORDER BY skill_name, effective_rate ASC, proficiency DESC
         """
 
         try:
-            results = await self._neo4j.execute_cypher(query, params)
-            candidates = []
-            for row in results:
+            results = await self._neo4j.execute_cypher(
+                query, {"requirements": requirements}
+            )
+        except Exception as e:
+            skills = [req["skill_name"] for req in requirements]
+            logger.error(f"Failed to find candidates for skills {skills}: {e}")
+            return None
+
+        candidates_by_skill: dict[str, list[CandidateInfo]] = {}
+        # 직원별 워크로드·참여 정보 (스킬 간 공유)
+        employee_cache: dict[
+            str, tuple[float, int, list[ProjectParticipation]] | None
+        ] = {}
+
+        for row in results:
+            emp_name = row["emp_name"]
+            if emp_name not in employee_cache:
                 project_details = row.get("project_details") or []
                 workload = self._compute_workload(project_details)
                 raw_max = row.get("max_projects")
                 max_proj = raw_max if raw_max is not None and raw_max > 0 else 5
 
                 # 가중 워크로드 기반 필터 (워크로드 < 최대 프로젝트)
-                if workload >= max_proj:
-                    continue
-
-                participations = self._build_participations(project_details)
-
-                candidates.append(
-                    CandidateInfo(
-                        employee_name=row["emp_name"],
-                        department=row.get("department"),
-                        proficiency=row.get("proficiency") or 0,
-                        effective_rate=row.get("effective_rate") or 0.0,
-                        years_used=row.get("years_used") or 0,
-                        availability=row.get("availability"),
-                        current_projects=row.get("current_projects", 0),
-                        max_projects=max_proj,
-                        effective_workload=workload,
-                        project_participations=participations,
-                    )
+                employee_cache[emp_name] = (
+                    (workload, max_proj, self._build_participations(project_details))
+                    if workload < max_proj
+                    else None
                 )
-            return candidates
-        except Exception as e:
-            logger.error(f"Failed to find candidates for skill '{skill_name}': {e}")
-            return []
+
+            employee = employee_cache[emp_name]
+            if employee is None:
+                continue
+            workload, max_proj, participations = employee
+
+            candidates_by_skill.setdefault(row["skill_name"], []).append(
+                CandidateInfo(
+                    employee_name=emp_name,
+                    department=row.get("department"),
+                    proficiency=row.get("proficiency") or 0,
+                    effective_rate=row.get("effective_rate") or 0.0,
+                    years_used=row.get("years_used") or 0,
+                    availability=row.get("availability"),
+                    current_projects=row.get("current_projects", 0),
+                    max_projects=max_proj,
+                    effective_workload=workload,
+                    project_participations=participations,
+                )
+            )
+        return candidates_by_skill
@@ -0,0 +1,397 @@
+"""
+Skill Matrix Service
+
+직원 × 스킬 이진 행렬을 프로세스 메모리에 유지하고
+유사 직원 탐색 / 팀 추천 후보 점수를 NumPy 벡터 연산으로 계산합니다.
+
+- 적재: Employee-HAS_SKILL-Skill 전체를 Cypher 1회로 읽어 행렬 구성 (첫 조회 시 lazy)
+- 갱신: GraphEditService 편집은 증분 반영, 그 외 쓰기(적재 파이프라인, 커뮤니티 탐지 등)로
+  그래프 버전이 바뀌면 다음 조회 시 전체 재적재
+- 그래프 버전은 프로세스 로컬이므로 다른 워커·DB 직접 쓰기는 max_age_seconds 경과 후
+  다음 조회에서 전체 재적재로 반영
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from src.domain.constants import normalize_name
+from src.repositories.neo4j_repository import Neo4jRepository
+from src.utils.graph_version import GraphVersion, get_graph_version
+
+logger = logging.getLogger(__name__)
+
+# 유사 직원 결과에 포함할 공통 스킬 수
+COMMON_SKILLS_LIMIT = 5
+
+# 적재 후 최대 유지 시간 (초, 다른 프로세스의 쓰기 반영 최대 지연)
+DEFAULT_MAX_AGE_SECONDS = 300.0
+
+
+@dataclass
+class _EmployeeRow:
+    """행렬 행 메타데이터"""
+
+    node_id: str  # elementId
+    employee_id: Any
+    name: str
+    job_type: str | None
+    experience: Any
+    community_id: Any
+    active: bool = True
+
+
+class SkillMatrixService:
+    """
+    직원 × 스킬 인메모리 행렬
+
+    행렬은 float32 0/1 dense 배열입니다. 직원 수천 × 스킬 수백 규모에서
+    수 MB 이하이며, Jaccard 교집합은 행렬-벡터 곱 1회로 계산됩니다.
+
+    사용 예시:
+        matrix = SkillMatrixService(neo4j_repo)
+        await matrix.ensure_loaded()
+        similar = matrix.similar_employees("홍길동", top_k=10)
+        candidates = matrix.score_candidates(["Python", "AWS"], limit=15)
+    """
+
+    def __init__(
+        self,
+        neo4j_repository: Neo4jRepository,
+        graph_version: GraphVersion | None = None,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        self._neo4j = neo4j_repository
+        self._graph_version = graph_version or get_graph_version()
+        self._max_age_seconds = max_age_seconds
+        self._load_lock = asyncio.Lock()
+        self._loaded_version: int | None = None
+        self._loaded_at = 0.0  # time.monotonic() 기준 마지막 전체 적재 시각
+
+        self._employees: list[_EmployeeRow] = []
+        self._employee_index: dict[str, int] = {}
+        self._skill_ids: list[str] = []
+        self._skill_names: list[str] = []
+        self._skill_index: dict[str, int] = {}
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._row_counts = np.zeros(0, dtype=np.float32)
+
+        # name_norm → 행/열 인덱스 (동명이인·중복 노드 대비 리스트)
+        self._employee_names: dict[str, list[int]] = {}
+        self._skill_name_index: dict[str, list[int]] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_version is not None
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._matrix.shape
+
+    # ============================================
+    # 적재 / 무효화
+    # ============================================
+
+    def _is_fresh(self) -> bool:
+        """현재 그래프 버전 기준 적재 + max_age_seconds 이내"""
+        return (
+            self._loaded_version == self._graph_version.current
+            and time.monotonic() - self._loaded_at < self._max_age_seconds
+        )
+
+    async def ensure_loaded(self) -> None:
+        """그래프 버전이 바뀌었거나 적재 후 max_age_seconds가 지났으면 전체 재적재"""
+        if self._is_fresh():
+            return
+        async with self._load_lock:
+            if not self._is_fresh():
+                await self.reload()
+
+    async def reload(self) -> None:
+        """Employee-HAS_SKILL-Skill 전체를 1회 조회해 행렬 재구성"""
+        version = self._graph_version.current
+        rows = await self._neo4j.execute_cypher(
+            """
+            MATCH (e:Employee)
+            OPTIONAL MATCH (e)-[:HAS_SKILL]->(s:Skill)
+            RETURN elementId(e) AS id,
+                   e.employee_id AS employee_id,
+                   e.name AS name,
+                   e.job_type AS job_type,
+                   e.years_experience AS experience,
+                   e.communityId AS community_id,
+                   collect({id: elementId(s), name: s.name}) AS skills
+            """
+        )
+
+        employees: list[_EmployeeRow] = []
+        skill_ids: list[str] = []
+        skill_names: list[str] = []
+        skill_index: dict[str, int] = {}
+        row_idx: list[int] = []
+        col_idx: list[int] = []
+
+        for i, row in enumerate(rows):
+            employees.append(
+                _EmployeeRow(
+                    node_id=row["id"],
+                    employee_id=row.get("employee_id"),
+                    name=row.get("name") or "",
+                    job_type=row.get("job_type"),
+                    experience=row.get("experience"),
+                    community_id=row.get("community_id"),
+                )
+            )
+            for skill in row.get("skills") or []:
+                skill_id = skill.get("id")
+                if skill_id is None:
+                    continue
+                if skill_id not in skill_index:
+                    skill_index[skill_id] = len(skill_ids)
+                    skill_ids.append(skill_id)
+                    skill_names.append(skill.get("name") or "")
+                row_idx.append(i)
+                col_idx.append(skill_index[skill_id])
+
+        matrix = np.zeros((len(employees), len(skill_ids)), dtype=np.float32)
+        matrix[row_idx, col_idx] = 1.0
+
+        self._employees = employees
+        self._employee_index = {e.node_id: i for i, e in enumerate(employees)}
+        self._skill_ids = skill_ids
+        self._skill_names = skill_names
+        self._skill_index = skill_index
+        self._matrix = matrix
+        self._row_counts = matrix.sum(axis=1)
+        self._rebuild_name_indexes()
+        self._loaded_version = version
+        self._loaded_at = time.monotonic()
+
+        logger.info(
+            f"Skill matrix loaded: {matrix.shape[0]} employees x "
+            f"{matrix.shape[1]} skills (graph_version={version})"
+        )
+
+    def invalidate(self) -> None:
+        """다음 조회 시 전체 재적재"""
+        self._loaded_version = None
+
+    def _rebuild_name_indexes(self) -> None:
+        self._employee_names = {}
+        for i, employee in enumerate(self._employees):
+            if employee.active:
+                self._employee_names.setdefault(
+                    normalize_name(employee.name), []
+                ).append(i)
+        self._skill_name_index = {}
+        for j, name in enumerate(self._skill_names):
+            self._skill_name_index.setdefault(normalize_name(name), []).append(j)
+
+    # ============================================
+    # 증분 갱신 (GraphEditService)
+    # ============================================
+
+    def apply_edit(
+        self,
+        version: int,
+        update: Callable[["SkillMatrixService"], None] | None = None,
+    ) -> None:
+        """
+        그래프 편집 1건 반영
+
+        직전 버전까지 반영된 상태일 때만 update를 적용하고 버전을 따라갑니다.
+        그 사이 다른 쓰기가 있었다면 이미 stale이므로 다음 조회의 전체 재적재에 맡깁니다.
+
+        Args:
+            version: 편집 후 bump된 그래프 버전
+            update: 행렬 변경 함수 (Skill/Employee와 무관한 편집이면 None)
+        """
+        if self._loaded_version is None or self._loaded_version != version - 1:
+            return
+        if update is not None:
+            update(self)
+        self._loaded_version = version
+
+    def upsert_node(self, node: dict[str, Any]) -> None:
+        """Employee/Skill 노드 생성·수정 반영 (node: {"id", "labels", "properties"})"""
+        labels = set(node.get("labels") or [])
+        props = node.get("properties") or {}
+
+        if "Employee" in labels:
+            row = _EmployeeRow(
+                node_id=node["id"],
+                employee_id=props.get("employee_id"),
+                name=props.get("name") or "",
+                job_type=props.get("job_type"),
+                experience=props.get("years_experience"),
+                community_id=props.get("communityId"),
+            )
+            index = self._employee_index.get(node["id"])
+            if index is None:
+                self._employee_index[node["id"]] = len(self._employees)
+                self._employees.append(row)
+                self._matrix = np.vstack(
+                    [self._matrix, np.zeros((1, self._matrix.shape[1]), np.float32)]
+                )
+                self._row_counts = np.append(self._row_counts, np.float32(0))
+            else:
+                self._employees[index] = row
+        if "Skill" in labels:
+            self._ensure_skill_column(node["id"], props.get("name") or "")
+            self._skill_names[self._skill_index[node["id"]]] = props.get("name") or ""
+        self._rebuild_name_indexes()
+
+    def remove_node(self, node_id: str) -> None:
+        """노드 삭제 반영 (행/열을 비활성화 — 인덱스는 다음 전체 재적재 때 정리)"""
+        if (index := self._employee_index.get(node_id)) is not None:
+            self._employees[index].active = False
+            self._matrix[index, :] = 0.0
+            self._row_counts[index] = 0.0
+        if (column := self._skill_index.get(node_id)) is not None:
+            self._row_counts -= self._matrix[:, column]
+            self._matrix[:, column] = 0.0
+        self._rebuild_name_indexes()
+
+    def set_skill(
+        self,
+        employee_node_id: str,
+        skill_node_id: str,
+        present: bool,
+        skill_name: str = "",
+    ) -> None:
+        """HAS_SKILL 관계 생성/삭제 반영"""
+        index = self._employee_index.get(employee_node_id)
+        if index is None:
+            return
+        column = self._ensure_skill_column(skill_node_id, skill_name)
+        value = 1.0 if present else 0.0
+        self._row_counts[index] += value - self._matrix[index, column]
+        self._matrix[index, column] = value
+
+    def _ensure_skill_column(self, skill_node_id: str, name: str) -> int:
+        if (column := self._skill_index.get(skill_node_id)) is not None:
+            return column
+        column = len(self._skill_ids)
+        self._skill_index[skill_node_id] = column
+        self._skill_ids.append(skill_node_id)
+        self._skill_names.append(name)
+        self._skill_name_index.setdefault(normalize_name(name), []).append(column)
+        self._matrix = np.hstack(
+            [self._matrix, np.zeros((self._matrix.shape[0], 1), np.float32)]
+        )
+        return column
+
+    # ============================================
+    # 조회 (벡터 연산)
+    # ============================================
+
+    def _employee_dict(self, index: int) -> dict[str, Any]:
+        employee = self._employees[index]
+        return {
+            "name": employee.name,
+            "job_type": employee.job_type,
+            "experience": employee.experience,
+            "community_id": employee.community_id,
+        }
+
+    def jaccard_scores(self, target_rows: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        대상 직원(동일 인물 중복 노드는 스킬 합집합)과 전 직원 간 Jaccard 유사도
+
+        Returns:
+            (similarity[N], shared_count[N])
+        """
+        target = self._matrix[target_rows].max(axis=0)
+        shared = self._matrix @ target
+        union = self._row_counts + target.sum() - shared
+        similarity = np.divide(
+            shared, union, out=np.zeros_like(shared), where=union > 0
+        )
+        return similarity, shared
+
+    def similar_employees(
+        self, employee_name: str, top_k: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        스킬 Jaccard 유사도 top-k 직원
+
+        GDSService.find_similar_employees의 Cypher 버전과 같은 결과 형식입니다.
+        """
+        target_rows = self._employee_names.get(normalize_name(employee_name), [])
+        if not target_rows or top_k <= 0:
+            return []
+
+        similarity, shared = self.jaccard_scores(target_rows)
+        similarity = np.round(similarity, 3)
+        candidates = np.flatnonzero(shared > 0)
+        candidates = candidates[~np.isin(candidates, target_rows)]
+        if candidates.size == 0:
+            return []
+
+        # 정렬: similarity DESC, shared DESC
+        order = np.lexsort((-shared[candidates], -similarity[candidates]))
+        top = candidates[order[:top_k]]
+
+        target = self._matrix[target_rows].max(axis=0)
+        results = []
+        for index in top:
+            common = np.flatnonzero(self._matrix[index] * target)[:COMMON_SKILLS_LIMIT]
+            results.append(
+                {
+                    **self._employee_dict(int(index)),
+                    "shared_skills": int(shared[index]),
+                    "similarity": float(similarity[index]),
+                    "common_skills": [self._skill_names[c] for c in common],
+                }
+            )
+        return results
+
+    def skill_columns(self, skill_names: list[str]) -> list[int]:
+        """스킬 이름(name_norm 기준)에 해당하는 열 인덱스"""
+        columns: list[int] = []
+        for name in skill_names:
+            for column in self._skill_name_index.get(normalize_name(name), []):
+                if column not in columns:
+                    columns.append(column)
+        return columns
+
+    def score_candidates(
+        self,
+        required_skills: list[str],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """
+        필요 스킬 보유 수 기준 팀 후보 (skillCount DESC, 상위 limit명)
+
+        GDSService.recommend_team 후보 Cypher와 같은 결과 형식입니다.
+        """
+        columns = self.skill_columns(required_skills)
+        if not columns or not required_skills:
+            return []
+
+        sub = self._matrix[:, columns]
+        counts = sub.sum(axis=1)
+        candidates = np.flatnonzero(counts > 0)
+        order = np.argsort(-counts[candidates], kind="stable")[:limit]
+
+        results = []
+        for index in candidates[order]:
+            matched = [
+                self._skill_names[columns[c]] for c in np.flatnonzero(sub[index])
+            ]
+            count = int(counts[index])
+            results.append(
+                {
+                    "id": self._employees[index].employee_id,
+                    **self._employee_dict(int(index)),
+                    "matchedSkills": list(dict.fromkeys(matched)),
+                    "skillCount": count,
+                    "skill_score": count / len(required_skills),
+                }
+            )
+        return results
@@ -0,0 +1,337 @@
+"""
+Team Optimizer
+
+필요 스킬 커버리지 + 커뮤니티 다양성을 최대화하는 팀 선택 엔진
+
+목적 함수 (멤버별 기여의 합):
+    F(S) = (1 - w) * |S가 커버한 필요 스킬| / |필요 스킬| + w * |S의 서로 다른 커뮤니티 수|
+
+두 항 모두 커버리지 함수(단조·submodular)이므로
+- lazy greedy (우선순위 큐): (1 - 1/e) 근사, 후보 수천 명에서도 수 ms
+- 작은 팀: 분기 한정(branch-and-bound)으로 정확해 탐색 (노드 수 상한으로 시간 제한)
+
+후보의 스킬은 필요 스킬 인덱스 기준 비트셋(int)으로 표현하고,
+(비트셋, 커뮤니티)가 같은 후보는 목적 함수에 동일하게 기여하므로 하나로 합칩니다.
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.constants import normalize_name
+
+logger = logging.getLogger(__name__)
+
+# 정확해 탐색을 시도할 최대 팀 크기
+EXACT_SEARCH_MAX_TEAM_SIZE = 4
+
+# 분기 한정 탐색 노드 상한 (초과 시 그때까지의 최선해 사용)
+EXACT_SEARCH_NODE_BUDGET = 5_000
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    """중복 제거된 후보 (대표 후보의 원본 인덱스 보관)"""
+
+    index: int
+    mask: int
+    community: Any
+
+
+def _skill_masks(
+    candidates: list[dict[str, Any]],
+    required_skills: list[str],
+) -> list[int]:
+    """후보별 matchedSkills → 필요 스킬 비트셋 (name_norm 기준 매칭)"""
+    bits: dict[str, int] = {}
+    for i, skill in enumerate(required_skills):
+        key = normalize_name(skill)
+        bits[key] = bits.get(key, 0) | (1 << i)
+    return [
+        _or_all(
+            bits.get(normalize_name(name), 0) for name in c.get("matchedSkills") or []
+        )
+        for c in candidates
+    ]
+
+
+def _or_all(values: Any) -> int:
+    mask = 0
+    for value in values:
+        mask |= value
+    return mask
+
+
+class _Objective:
+    """F(S) 증분 계산 도우미"""
+
+    def __init__(self, skill_count: int, diversity_weight: float):
+        self.skill_count = skill_count
+        self.skill_weight = (1 - diversity_weight) / skill_count
+        self.diversity_weight = diversity_weight
+
+    def gain(
+        self,
+        candidate: _Candidate,
+        covered: int,
+        communities: set[Any],
+    ) -> tuple[float, int]:
+        """(목적 함수 증가량, 새로 커버하는 스킬 비트셋)"""
+        new_bits = candidate.mask & ~covered
+        gain = self.skill_weight * new_bits.bit_count()
+        if candidate.community is not None and candidate.community not in communities:
+            gain += self.diversity_weight
+        return gain, new_bits
+
+
+def _lazy_greedy(
+    pool: list[_Candidate],
+    objective: _Objective,
+    team_size: int,
+) -> list[_Candidate]:
+    """
+    lazy greedy: 캐시된 증가량(상한)이 큰 순으로 꺼내 재계산하고,
+    재계산 값이 다음 상한 이상이면 즉시 선택 (submodular라 증가량은 줄기만 함)
+
+    새 스킬을 하나도 추가하지 못하는 후보는 선택하지 않습니다
+    (커뮤니티 다양성만으로 팀원을 늘리지 않음).
+    """
+    selected: list[_Candidate] = []
+    covered = 0
+    communities: set[Any] = set()
+
+    # (-gain, -popcount, 원본 순서) — 동률이면 스킬 많은 후보, 원래 순위 우선
+    heap = [
+        (-objective.gain(c, 0, set())[0], -c.mask.bit_count(), c.index, c) for c in pool
+    ]
+    heapq.heapify(heap)
+
+    while heap and len(selected) < team_size:
+        _, tie, order, candidate = heapq.heappop(heap)
+        gain, new_bits = objective.gain(candidate, covered, communities)
+        if not new_bits:
+            continue  # 이후로도 새 스킬 기여 불가 → 영구 제외
+        if heap and -heap[0][0] > gain:
+            heapq.heappush(heap, (-gain, tie, order, candidate))
+            continue
+
+        selected.append(candidate)
+        covered |= candidate.mask
+        if candidate.community is not None:
+            communities.add(candidate.community)
+
+    return selected
+
+
+def _team_value(team: list[_Candidate], objective: _Objective) -> float:
+    covered = _or_all(c.mask for c in team)
+    communities = {c.community for c in team if c.community is not None}
+    return (
+        objective.skill_weight * covered.bit_count()
+        + objective.diversity_weight * len(communities)
+    )
+
+
+def _shortlist(
+    pool: list[_Candidate], skill_count: int, per_skill: int
+) -> list[_Candidate]:
+    """
+    정확해 탐색용 후보 축약: 스킬별로 해당 스킬 보유 후보 중
+    스킬 수가 많은 순으로 서로 다른 커뮤니티 per_skill명씩 (희소 스킬 보유자 보존)
+    """
+    chosen: dict[int, _Candidate] = {}
+    for bit in range(skill_count):
+        holders = sorted(
+            (c for c in pool if c.mask >> bit & 1),
+            key=lambda c: (-c.mask.bit_count(), c.index),
+        )
+        communities: set[Any] = set()
+        for candidate in holders:
+            if candidate.community in communities:
+                continue
+            communities.add(candidate.community)
+            chosen[candidate.index] = candidate
+            if len(communities) >= per_skill:
+                break
+    return sorted(chosen.values(), key=lambda c: c.index)
+
+
+def _max_value(objective: _Objective, team_size: int) -> float:
+    """F(S)의 이론적 최댓값"""
+    return (
+        objective.skill_weight * objective.skill_count
+        + objective.diversity_weight * team_size
+    )
+
+
+def _is_irredundant(team: list[_Candidate]) -> bool:
+    """모든 멤버가 다른 멤버들이 커버하지 않는 스킬을 최소 1개 보유"""
+    for i, member in enumerate(team):
+        others = _or_all(c.mask for j, c in enumerate(team) if j != i)
+        if not member.mask & ~others:
+            return False
+    return True
+
+
+def _branch_and_bound(
+    pool: list[_Candidate],
+    objective: _Objective,
+    team_size: int,
+    incumbent: list[_Candidate],
+    node_budget: int,
+) -> list[_Candidate]:
+    """
+    팀 크기 team_size 이하에서 F(S) 최대 팀 정확 탐색
+
+    상한: F(S) + 남은 자리 수만큼의 (S 기준) 최대 증가량 합 — submodular 성질로 유효.
+    greedy 해를 초기 최선해로 사용하며 노드 수가 node_budget을 넘으면 중단합니다.
+    동률이면 인원이 적은 팀을 유지합니다.
+    """
+    best = list(incumbent)
+    best_value = _team_value(best, objective)
+    skill_count = objective.skill_count
+    # 전체 커버 + 전원 다른 커뮤니티면 더 나은 해가 없음
+    if best_value >= _max_value(objective, team_size) - 1e-12:
+        return best
+    expanded = 0
+
+    def search(
+        start: int, team: list[_Candidate], covered: int, communities: set[Any]
+    ) -> None:
+        nonlocal best, best_value, expanded
+        expanded += 1
+        if expanded > node_budget:
+            return
+
+        value = _team_value(team, objective)
+        if value > best_value + 1e-12 or (
+            abs(value - best_value) <= 1e-12 and team and len(team) < len(best)
+        ):
+            best, best_value = list(team), value
+
+        slots = team_size - len(team)
+        if slots == 0:
+            return
+
+        gains = []
+        new_counts = []
+        new_communities = set()
+        for i in range(start, len(pool)):
+            gain, new_bits = objective.gain(pool[i], covered, communities)
+            if new_bits:
+                gains.append((gain, i))
+                new_counts.append(new_bits.bit_count())
+                if (
+                    pool[i].community is not None
+                    and pool[i].community not in communities
+                ):
+                    new_communities.add(pool[i].community)
+        if not gains:
+            return
+
+        # 스킬 항: 남은 미커버 스킬 수와 상위 slots명의 신규 스킬 합 중 작은 값
+        # 다양성 항: 남은 자리 수와 새 커뮤니티 수 중 작은 값
+        uncovered = skill_count - covered.bit_count()
+        skill_bound = min(uncovered, sum(sorted(new_counts, reverse=True)[:slots]))
+        bound = (
+            value
+            + objective.skill_weight * skill_bound
+            + objective.diversity_weight * min(slots, len(new_communities))
+        )
+        if bound <= best_value + 1e-12:
+            return
+
+        for _, i in sorted(gains, reverse=True):
+            candidate = pool[i]
+            next_team = team + [candidate]
+            if not _is_irredundant(next_team):
+                continue
+            next_communities = set(communities)
+            if candidate.community is not None:
+                next_communities.add(candidate.community)
+            search(i + 1, next_team, covered | candidate.mask, next_communities)
+
+    search(0, [], 0, set())
+    if expanded > node_budget:
+        logger.debug(
+            f"Team exact search hit node budget ({node_budget}), using best so far"
+        )
+    return best
+
+
+def select_team(
+    candidates: list[dict[str, Any]],
+    required_skills: list[str],
+    team_size: int,
+    diversity_weight: float,
+    *,
+    exact_max_team_size: int = EXACT_SEARCH_MAX_TEAM_SIZE,
+    node_budget: int = EXACT_SEARCH_NODE_BUDGET,
+) -> dict[str, Any]:
+    """
+    후보 풀에서 최적 팀 선택
+
+    Args:
+        candidates: 후보 목록 (matchedSkills, community_id 포함, 우선순위 순)
+        required_skills: 필요 스킬 목록
+        team_size: 최대 팀 크기
+        diversity_weight: 커뮤니티 다양성 가중치 (0~1)
+        exact_max_team_size: 이 크기 이하 팀은 분기 한정으로 정확해 탐색
+        node_budget: 분기 한정 탐색 노드 상한
+
+    Returns:
+        TeamRecommendation 필드 dict (members에는 selection_score 추가)
+    """
+    if not candidates or not required_skills or team_size <= 0:
+        return {
+            "members": [],
+            "skill_coverage": 0.0,
+            "covered_skills": [],
+            "missing_skills": required_skills.copy(),
+            "community_diversity": 0,
+            "total_score": 0.0,
+        }
+
+    # 비트셋 변환 + (비트셋, 커뮤니티) 중복 제거 (첫 후보가 대표)
+    pool: list[_Candidate] = []
+    seen: set[tuple[int, Any]] = set()
+    for i, (candidate, mask) in enumerate(
+        zip(candidates, _skill_masks(candidates, required_skills), strict=True)
+    ):
+        key = (mask, candidate.get("community_id"))
+        if mask and key not in seen:
+            seen.add(key)
+            pool.append(_Candidate(index=i, mask=mask, community=key[1]))
+
+    objective = _Objective(len(required_skills), diversity_weight)
+    team = _lazy_greedy(pool, objective, team_size)
+    if team_size <= exact_max_team_size and team:
+        shortlist = _shortlist(pool, len(required_skills), team_size)
+        team = _branch_and_bound(shortlist, objective, team_size, team, node_budget)
+        # 결과 표시 순서: greedy 기여 순
+        team = _lazy_greedy(team, objective, team_size)
+
+    # 멤버별 기여 점수 (선택 순서 기준 증가량, 합 = F(S))
+    members = []
+    covered = 0
+    communities: set[Any] = set()
+    for member in team:
+        gain, _ = objective.gain(member, covered, communities)
+        covered |= member.mask
+        if member.community is not None:
+            communities.add(member.community)
+        members.append({**candidates[member.index], "selection_score": round(gain, 3)})
+
+    covered_skills = [s for i, s in enumerate(required_skills) if covered >> i & 1]
+    missing = [s for i, s in enumerate(required_skills) if not covered >> i & 1]
+    total_score = sum(m["selection_score"] for m in members) / max(len(members), 1)
+
+    return {
+        "members": members,
+        "skill_coverage": round(len(covered_skills) / len(required_skills), 3),
+        "covered_skills": covered_skills,
+        "missing_skills": missing,
+        "community_diversity": len(communities),
+        "total_score": round(total_score, 3),
+    }
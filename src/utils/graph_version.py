@@ -0,0 +1,50 @@
+"""
+그래프 데이터 버전 (프로세스 내 단조 증가 카운터)
+
+그래프/온톨로지 쓰기 경로(GraphEditService, IngestionPipeline, 온톨로지 적용,
+커뮤니티 리프레시의 SIMILAR/communityId 쓰기)가 변경 후 bump()하고,
+쿼리 결과 캐시는 저장 시점 버전과 현재 버전이 다르면 항목을 버립니다.
+
+버전은 워커 프로세스별로 독립적입니다. 다른 프로세스(배치 스크립트, 다른 워커)의
+쓰기는 전파되지 않으므로 결과 캐시는 짧은 TTL을 함께 사용합니다.
+"""
+
+import logging
+import threading
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+
+class GraphVersion:
+    """그래프 데이터 버전 카운터 (thread-safe)"""
+
+    def __init__(self) -> None:
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> int:
+        return self._version
+
+    def bump(self, reason: str = "unknown") -> int:
+        """
+        버전 증가
+
+        Args:
+            reason: 로그용 변경 사유 (예: "graph_edit", "ingestion")
+
+        Returns:
+            증가된 버전
+        """
+        with self._lock:
+            self._version += 1
+            version = self._version
+        logger.debug(f"Graph version bumped to {version} ({reason})")
+        return version
+
+
+@lru_cache(maxsize=1)
+def get_graph_version() -> GraphVersion:
+    """프로세스 공유 GraphVersion 싱글톤"""
+    return GraphVersion()
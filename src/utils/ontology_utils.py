@@ -9,6 +9,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from src.utils.graph_version import get_graph_version
+
 if TYPE_CHECKING:
     from src.domain.ontology.registry import OntologyRegistry
 
@@ -32,6 +34,9 @@ async def safe_refresh_ontology_cache(
     Returns:
         True if refresh succeeded, False otherwise
     """
+    # 온톨로지(Concept) 변경은 registry 유무와 무관하게 쿼리 결과에 영향
+    get_graph_version().bump(f"ontology:{context}")
+
     if registry is None:
         logger.debug(
             f"OntologyRegistry not available, skipping cache refresh ({context})"
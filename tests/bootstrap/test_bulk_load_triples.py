@@ -0,0 +1,37 @@
+"""
+트리플 벌크 로딩 스트리밍 파서 테스트
+
+버퍼 경계에 걸친 항목(숫자/문자열/객체)도 온전히 디코딩되는지 확인합니다.
+"""
+
+import io
+import json
+
+import pytest
+
+from scripts import bulk_load_triples
+from scripts.bulk_load_triples import _iter_json_array
+
+
+@pytest.fixture(params=[1, 2, 3, 7, 1 << 16])
+def read_size(request, monkeypatch):
+    """작은 읽기 단위로 모든 경계 위치를 통과시킴"""
+    monkeypatch.setattr(bulk_load_triples, "_READ_SIZE", request.param)
+    return request.param
+
+
+class TestIterJsonArray:
+    def test_values_split_at_buffer_edges(self, read_size):
+        """숫자·리터럴·문자열·객체가 버퍼 끝에서 잘려도 원본과 같은 값"""
+        items = [12345, -6.25e3, True, None, "a, b", {"subject": "홍길동", "n": 10}]
+        text = json.dumps({"meta": {"count": 6}, "triples": items}, ensure_ascii=False)
+
+        assert list(_iter_json_array(io.StringIO(text), "triples")) == items
+
+    def test_unterminated_after_number(self, read_size):
+        """숫자로 끝나고 닫는 괄호가 없는 입력은 오류"""
+        with pytest.raises(ValueError, match="Unterminated"):
+            list(_iter_json_array(io.StringIO('{"triples": [1, 23'), "triples"))
+
+    def test_missing_key_yields_nothing(self, read_size):
+        assert list(_iter_json_array(io.StringIO('{"other": [1]}'), "triples")) == []
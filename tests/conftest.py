@@ -23,6 +23,9 @@ def mock_settings():
     """Mock Settings"""
     settings = MagicMock(spec=Settings)
     settings.vector_search_enabled = False
+    settings.result_cache_enabled = False
+    settings.entity_vector_fallback_enabled = False
+    settings.entity_vector_match_threshold = 0.88
     settings.ontology_mode = "yaml"  # Multi-hop 테스트용
     settings.adaptive_ontology = MagicMock()
     settings.adaptive_ontology.enabled = False
@@ -32,6 +35,8 @@ def mock_settings():
     # Cypher Self-Correction (MagicMock 속성은 int 비교가 안 되므로 명시 세팅)
     settings.cypher_self_correction_enabled = True
     settings.cypher_max_retries = 1
+    settings.multi_hop_parallel_enabled = True
+    settings.multi_hop_max_concurrency = 3
     return settings
 
 
@@ -77,7 +82,7 @@ def mock_neo4j():
 
     neo4j = MagicMock(spec=Neo4jRepository)
 
-    # find_entities_by_name: 엔티티가 발견되면 resolved로 처리됨
+    # find_entities_by_name(s): 엔티티가 발견되면 resolved로 처리됨
     # 빈 리스트를 반환하면 unresolved로 분류되어 clarification_handler로 라우팅됨
     async def mock_find_entities(name: str, labels=None, limit=10):
         # 테스트에서 사용하는 일반적인 엔티티 이름에 대해 매칭 결과 반환
@@ -89,7 +94,16 @@ def mock_neo4j():
             )
         ]
 
+    async def mock_find_entities_bulk(lookups, limit=3):
+        return {
+            (label, name): await mock_find_entities(
+                name, [label] if label else None, limit
+            )
+            for label, name in lookups
+        }
+
     neo4j.find_entities_by_name = AsyncMock(side_effect=mock_find_entities)
+    neo4j.find_entities_by_names = AsyncMock(side_effect=mock_find_entities_bulk)
     neo4j.execute_cypher = AsyncMock(return_value=[])
     return neo4j
 
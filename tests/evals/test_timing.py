@@ -0,0 +1,137 @@
+"""
+Eval 레이턴시 집계 및 동시 실행 러너 단위 테스트
+
+timing.py는 순수 함수, run_cases는 run_case를 대체해 라이브 의존 없이 검증.
+
+실행 방법:
+    pytest tests/evals/test_timing.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from evals import runner
+from evals.models import CaseResult, GoldenCase
+from evals.timing import (
+    aggregate_node_timings,
+    latency_regressions,
+    percentile,
+    summarize_latency,
+)
+
+
+def _case(case_id: str) -> GoldenCase:
+    return GoldenCase(
+        id=case_id, question="q", category="org_analysis", expected_intent=("x",)
+    )
+
+
+def _report_case(elapsed: float, timings: dict[str, float]) -> dict:
+    return {"elapsed_seconds": elapsed, "metadata": {"node_timings": timings}}
+
+
+class TestPercentile:
+    def test_interpolates(self):
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == pytest.approx(2.5)
+        assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+
+    def test_single_and_empty(self):
+        assert percentile([7.0], 95) == 7.0
+        assert percentile([], 95) == 0.0
+
+    def test_summary(self):
+        summary = summarize_latency([1.0, 2.0, 3.0])
+        assert summary["n"] == 3
+        assert summary["avg"] == pytest.approx(2.0)
+        assert summary["p50"] == pytest.approx(2.0)
+        assert summary["max"] == 3.0
+
+
+class TestAggregateNodeTimings:
+    def test_groups_by_node_sorted_by_avg(self):
+        result = aggregate_node_timings([{"a": 1.0, "b": 3.0}, {"a": 2.0}, None, {}])
+        assert list(result) == ["b", "a"]
+        assert result["a"]["n"] == 2
+        assert result["a"]["avg"] == pytest.approx(1.5)
+
+
+class TestLatencyRegressions:
+    def test_flags_large_slowdowns(self):
+        baseline = [_report_case(2.0, {"gen": 1.0}) for _ in range(5)]
+        current = [_report_case(4.0, {"gen": 2.0}) for _ in range(5)]
+
+        regressions = latency_regressions(current, baseline)
+
+        assert any(r.startswith("case p50") for r in regressions)
+        assert any(r.startswith("gen p50") for r in regressions)
+
+    def test_ignores_small_absolute_delta(self):
+        """상대 증가율이 커도 절대 증가량이 작으면 회귀 아님 (지터)"""
+        baseline = [_report_case(0.2, {"fast": 0.1})]
+        current = [_report_case(0.4, {"fast": 0.3})]
+        assert latency_regressions(current, baseline) == []
+
+    def test_new_nodes_not_compared(self):
+        baseline = [_report_case(2.0, {})]
+        current = [_report_case(2.0, {"new_node": 5.0})]
+        assert latency_regressions(current, baseline) == []
+
+
+class TestRunCases:
+    async def test_preserves_order_and_bounds_concurrency(self, monkeypatch):
+        running = 0
+        peak = 0
+
+        async def fake_run_case(*, case, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # 뒤 케이스가 먼저 끝나도록 지연
+            await asyncio.sleep(0.01 * (5 - int(case.id[1:])))
+            running -= 1
+            return CaseResult(case_id=case.id, category=case.category, passed=True)
+
+        monkeypatch.setattr(runner, "run_case", fake_run_case)
+        cases = [_case(f"q{i}") for i in range(5)]
+
+        results = await runner.run_cases(cases, concurrency=2)
+
+        assert [r.case_id for r in results] == ["q0", "q1", "q2", "q3", "q4"]
+        assert peak == 2
+
+    async def test_case_exception_becomes_failed_result(self, monkeypatch):
+        async def fake_run_case(*, case, **kwargs):
+            if case.id == "q1":
+                raise RuntimeError("boom")
+            return CaseResult(case_id=case.id, category=case.category, passed=True)
+
+        monkeypatch.setattr(runner, "run_case", fake_run_case)
+
+        results = await runner.run_cases([_case("q0"), _case("q1")], concurrency=4)
+
+        assert results[0].passed
+        assert not results[1].passed
+        assert "boom" in results[1].metadata["error"]
+
+
+class TestBuildReport:
+    def test_includes_latency_summaries(self):
+        results = [
+            CaseResult(
+                case_id=f"q{i}",
+                category="c",
+                passed=True,
+                metadata={"node_timings": {"gen": float(i)}},
+                elapsed_seconds=float(i + 1),
+            )
+            for i in range(3)
+        ]
+
+        report = runner.build_report(results, "ts", concurrency=3, wall_seconds=1.234)
+        data = report.to_dict()
+
+        assert data["concurrency"] == 3
+        assert data["wall_seconds"] == 1.23
+        assert data["latency"]["p50"] == pytest.approx(2.0)
+        assert data["node_latency"]["gen"]["n"] == 3
@@ -5,6 +5,7 @@ AzureOpenAIGateway 단위 테스트 (전송 계층)
     pytest tests/infrastructure/test_llm_gateway.py -v
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -755,3 +756,146 @@ class TestGPT5TemperatureRegression:
 
         call_kwargs = mock_client.chat.completions.create.call_args.kwargs
         assert "temperature" not in call_kwargs
+
+
+class TestEmbeddings:
+    """임베딩 배치/캐시/중복 제거 테스트"""
+
+    @pytest.fixture
+    def mock_settings(self):
+        settings = MagicMock()
+        settings.embedding_model_deployment = "text-embedding-3-small"
+        settings.embedding_dimensions = 2
+        settings.embedding_batch_size = 2
+        settings.embedding_cache_enabled = True
+        settings.embedding_cache_max_entries = 100
+        settings.embedding_cache_db_path = None
+        return settings
+
+    @staticmethod
+    def _embedding_client(calls: list[list[str]] | None = None, delay: float = 0.0):
+        """입력 텍스트 길이로 벡터를 만드는 mock client (역순 응답)"""
+
+        async def create(model, input, dimensions):
+            if calls is not None:
+                calls.append(list(input))
+            if delay:
+                await asyncio.sleep(delay)
+            data = [
+                MagicMock(index=i, embedding=[float(len(text)), 1.0])
+                for i, text in enumerate(input)
+            ]
+            return MagicMock(data=list(reversed(data)))
+
+        client = MagicMock()
+        client.embeddings.create = AsyncMock(side_effect=create)
+        client.close = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_get_embeddings_batches_and_preserves_order(self, mock_settings):
+        """batch_size 단위 분할 + 중복 입력 1회 요청 + 입력 순서 유지"""
+        gateway = AzureOpenAIGateway(mock_settings)
+        calls: list[list[str]] = []
+        gateway._client = self._embedding_client(calls)
+
+        result = await gateway.get_embeddings(["a", "bbb", "a", "cc"])
+
+        assert calls == [["a", "bbb"], ["cc"]]
+        assert result == [[1.0, 1.0], [3.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_api(self, mock_settings):
+        """캐시된 텍스트는 API 호출 생략"""
+        gateway = AzureOpenAIGateway(mock_settings)
+        calls: list[list[str]] = []
+        gateway._client = self._embedding_client(calls)
+
+        await gateway.get_embedding("Python 개발자")
+        again = await gateway.get_embeddings(["Python 개발자", "Java"])
+
+        assert calls == [["Python 개발자"], ["Java"]]
+        assert again[0] == [10.0, 1.0]
+        assert gateway._embedding_cache.get_stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self, mock_settings):
+        """동시 동일 요청은 하나의 API 호출 결과를 공유"""
+        gateway = AzureOpenAIGateway(mock_settings)
+        calls: list[list[str]] = []
+        gateway._client = self._embedding_client(calls, delay=0.01)
+
+        results = await asyncio.gather(
+            *(gateway.get_embedding("같은 질문") for _ in range(5))
+        )
+
+        assert calls == [["같은 질문"]]
+        assert all(r == results[0] for r in results)
+        assert gateway._embedding_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_waiters(self, mock_settings):
+        """요청 실패 시 대기 중인 코루틴도 같은 예외를 받고 캐시되지 않음"""
+        from openai import APIConnectionError
+
+        gateway = AzureOpenAIGateway(mock_settings)
+
+        async def fail(**kwargs):
+            await asyncio.sleep(0.01)
+            raise APIConnectionError(request=MagicMock())
+
+        gateway._client = MagicMock()
+        gateway._client.embeddings.create = AsyncMock(side_effect=fail)
+
+        results = await asyncio.gather(
+            gateway.get_embedding("q"),
+            gateway.get_embedding("q"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, LLMConnectionError) for r in results)
+        assert gateway._client.embeddings.create.await_count == 1
+        assert gateway._embedding_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_count_mismatch_fails_all_waiters(self, mock_settings):
+        """응답 개수가 요청과 다르면 소유자·대기자 모두 예외 (멈추지 않음)"""
+        gateway = AzureOpenAIGateway(mock_settings)
+
+        async def short(model, input, dimensions):
+            await asyncio.sleep(0.01)
+            return MagicMock(data=[MagicMock(index=0, embedding=[1.0, 1.0])])
+
+        gateway._client = MagicMock()
+        gateway._client.embeddings.create = AsyncMock(side_effect=short)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                gateway.get_embeddings(["a", "b"]),
+                gateway.get_embedding("b"),
+                return_exceptions=True,
+            ),
+            timeout=1.0,
+        )
+
+        assert all(isinstance(r, LLMResponseError) for r in results)
+        assert gateway._embedding_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_new_gateway(self, mock_settings, tmp_path):
+        """SQLite 디스크 캐시는 새 게이트웨이 인스턴스에서도 재사용"""
+        mock_settings.embedding_cache_db_path = str(tmp_path / "emb.db")
+
+        first = AzureOpenAIGateway(mock_settings)
+        first._client = self._embedding_client()
+        await first.get_embedding("persisted")
+        await first.close()
+
+        second = AzureOpenAIGateway(mock_settings)
+        calls: list[list[str]] = []
+        second._client = self._embedding_client(calls)
+        result = await second.get_embedding("persisted")
+
+        assert calls == []
+        assert result == [9.0, 1.0]
+        await second.close()
@@ -25,6 +25,7 @@ class TestCacheCheckerNode:
     @pytest.fixture
     def mock_cache(self):
         cache = MagicMock()
+        cache.find_cached_question = MagicMock(return_value=None)
         cache.find_similar_query = AsyncMock(return_value=None)
         return cache
 
@@ -61,6 +62,26 @@ class TestCacheCheckerNode:
         assert result["question_embedding"] == [0.1, 0.2, 0.3]
         assert "cache_checker_hit" in result["execution_path"]
 
+    async def test_local_exact_hit_skips_embedding(
+        self, node, mock_llm, mock_cache, base_state
+    ):
+        """L1 정확 일치 히트 시 임베딩/벡터 검색 없이 캐싱된 Cypher 반환"""
+        cached = MagicMock()
+        cached.score = 1.0
+        cached.question = "Python 잘하는 사람은?"
+        cached.cypher_query = "MATCH (e:Employee) RETURN e"
+        cached.cypher_parameters = {}
+        mock_cache.find_cached_question.return_value = (cached, [0.4, 0.5, 0.6])
+
+        result = await node(base_state)
+
+        assert result["cache_hit"] is True
+        assert result["skip_generation"] is True
+        assert result["question_embedding"] == [0.4, 0.5, 0.6]
+        assert "cache_checker_hit" in result["execution_path"]
+        mock_llm.get_embedding.assert_not_awaited()
+        mock_cache.find_similar_query.assert_not_awaited()
+
     async def test_cache_miss(self, node, mock_cache, base_state):
         """캐시 미스 시 임베딩만 반환, skip_generation=False"""
         mock_cache.find_similar_query.return_value = None
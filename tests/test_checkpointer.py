@@ -0,0 +1,186 @@
+"""
+CompactCheckpointSaver 테스트
+
+일시 필드 제외, 메시지 윈도우/요약, TTL 기반 thread 정리를 검증합니다.
+"""
+
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from src.graph.checkpointer import (
+    SUMMARY_MESSAGE_ID,
+    CompactCheckpointSaver,
+    compact_messages,
+    create_checkpointer,
+)
+from src.graph.state import GraphRAGState
+from src.graph.utils import format_chat_history
+
+
+def _build_graph(saver: CompactCheckpointSaver):
+    """질문마다 결과/임베딩을 채우고 답변 메시지를 추가하는 최소 그래프"""
+
+    async def answer(state: GraphRAGState) -> dict:
+        return {
+            "graph_results": [{"n": "row"}] * 3,
+            "question_embedding": [0.1] * 8,
+            "response": f"answer:{state['question']}",
+            "messages": [AIMessage(content=f"answer:{state['question']}")],
+        }
+
+    workflow = StateGraph(GraphRAGState)
+    workflow.add_node("answer", answer)
+    workflow.add_edge(START, "answer")
+    workflow.add_edge("answer", END)
+    return workflow.compile(checkpointer=saver)
+
+
+async def _run(graph, question: str, thread_id: str) -> dict:
+    return await graph.ainvoke(
+        {
+            "question": question,
+            "messages": [HumanMessage(content=question)],
+            "schema": {"node_labels": ["Employee"]},
+        },
+        config={"configurable": {"thread_id": thread_id}},
+    )
+
+
+class TestCompactMessages:
+    def test_no_window_keeps_all(self):
+        messages = [HumanMessage(content=f"q{i}") for i in range(5)]
+        assert compact_messages(messages, window=0) == messages
+
+    def test_window_folds_dropped_questions_into_summary(self):
+        messages = [
+            HumanMessage(content="q1", id="1"),
+            AIMessage(content="a1", id="2"),
+            HumanMessage(content="q2", id="3"),
+            AIMessage(content="a2", id="4"),
+        ]
+
+        result = compact_messages(messages, window=2)
+
+        assert len(result) == 3
+        assert result[0].id == SUMMARY_MESSAGE_ID
+        assert "q1" in result[0].content
+        assert [m.content for m in result[1:]] == ["q2", "a2"]
+
+    def test_existing_summary_is_merged(self):
+        first = compact_messages(
+            [
+                HumanMessage(content="q1", id="1"),
+                AIMessage(content="a1", id="2"),
+                HumanMessage(content="q2", id="3"),
+            ],
+            window=1,
+        )
+        second = compact_messages(
+            [
+                *first,
+                AIMessage(content="a2", id="4"),
+                HumanMessage(content="q3", id="5"),
+            ],
+            window=1,
+        )
+
+        summary = second[0].content
+        assert second[0].id == SUMMARY_MESSAGE_ID
+        assert "q1" in summary and "q2" in summary
+        assert second[-1].content == "q3"
+
+    def test_summary_disabled_drops_messages(self):
+        messages = [HumanMessage(content=f"q{i}", id=str(i)) for i in range(4)]
+        result = compact_messages(messages, window=2, summarize=False)
+        assert [m.content for m in result] == ["q2", "q3"]
+
+    def test_summary_rendered_in_chat_history(self):
+        messages = compact_messages(
+            [
+                HumanMessage(content="q1", id="1"),
+                AIMessage(content="a1", id="2"),
+                HumanMessage(content="q2", id="3"),
+            ],
+            window=1,
+        )
+        history = format_chat_history(messages, exclude_last=False)
+        assert "q1" in history
+        assert history.endswith("User: q2")
+
+
+class TestCompactCheckpointSaver:
+    @pytest.mark.asyncio
+    async def test_transient_fields_not_persisted(self):
+        saver = CompactCheckpointSaver(MemorySaver())
+        graph = _build_graph(saver)
+
+        final_state = await _run(graph, "질문", "t1")
+
+        # 실행 결과에는 그대로 남아있음
+        assert final_state["graph_results"]
+        # 체크포인트에는 저장되지 않음
+        snapshot = await saver.aget_tuple({"configurable": {"thread_id": "t1"}})
+        values = snapshot.checkpoint["channel_values"]
+        assert "graph_results" not in values
+        assert "question_embedding" not in values
+        assert "schema" not in values
+        assert values["response"] == "answer:질문"
+
+    @pytest.mark.asyncio
+    async def test_message_window_applied_across_turns(self):
+        saver = CompactCheckpointSaver(MemorySaver(), message_window=2)
+        graph = _build_graph(saver)
+
+        for i in range(3):
+            await _run(graph, f"q{i}", "t1")
+
+        snapshot = await saver.aget_tuple({"configurable": {"thread_id": "t1"}})
+        messages = snapshot.checkpoint["channel_values"]["messages"]
+        assert messages[0].id == SUMMARY_MESSAGE_ID
+        assert [m.content for m in messages[1:]] == ["q2", "answer:q2"]
+
+    @pytest.mark.asyncio
+    async def test_prune_threads_removes_idle_threads(self, monkeypatch):
+        saver = CompactCheckpointSaver(MemorySaver())
+        graph = _build_graph(saver)
+        await _run(graph, "old", "idle")
+
+        # 최초 정리에서 저장소 ts로 시딩 (ttl 내라 삭제 없음)
+        assert await saver.prune_threads(ttl_seconds=3600) == 0
+
+        # 2시간 경과: idle은 로컬·저장소 모두 만료, active는 방금 저장
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 7200)
+        await _run(graph, "new", "active")
+        saver._last_seen["idle"] = time.monotonic() - 7200
+
+        assert await saver.prune_threads(ttl_seconds=3600) == 1
+        assert await saver.aget_tuple({"configurable": {"thread_id": "idle"}}) is None
+        assert await saver.aget_tuple({"configurable": {"thread_id": "active"}})
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_thread_active_on_other_worker(self):
+        """로컬에서는 idle이어도 저장소에 최근 체크포인트가 있으면 유지"""
+        store = MemorySaver()
+        worker_a = CompactCheckpointSaver(store)
+        worker_b = CompactCheckpointSaver(store)
+        await _run(_build_graph(worker_a), "q1", "shared")
+        assert await worker_a.prune_threads(ttl_seconds=3600) == 0
+
+        # 이후 대화는 worker B에서 이어짐 → A의 로컬 시각만 오래됨
+        await _run(_build_graph(worker_b), "q2", "shared")
+        worker_a._last_seen["shared"] = time.monotonic() - 7200
+
+        assert await worker_a.prune_threads(ttl_seconds=3600) == 0
+        assert await store.aget_tuple({"configurable": {"thread_id": "shared"}})
+        assert worker_a._last_seen["shared"] > time.monotonic() - 3600
+
+    @pytest.mark.asyncio
+    async def test_create_checkpointer_wraps_memory_saver(self):
+        saver = await create_checkpointer(":memory:", message_window=10)
+        assert isinstance(saver, CompactCheckpointSaver)
+        assert isinstance(saver.inner, MemorySaver)
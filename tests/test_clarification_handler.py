@@ -223,7 +223,7 @@ class TestPipelineRouting:
                 "relationship_types": ["WORKS_IN"],
             }
         )
-        neo4j.find_entities_by_name = AsyncMock(return_value=[])  # 미해결
+        neo4j.find_entities_by_names = AsyncMock(return_value={})  # 미해결
 
         return llm, neo4j
 
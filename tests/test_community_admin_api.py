@@ -86,6 +86,27 @@ class TestCommunityRefreshAPI:
         assert data["community_count"] == 5
         assert data["modularity"] == 0.72
 
+    def test_refresh_incremental_mode(self, client, mock_service):
+        """증분 모드 전달 및 응답 필드"""
+        mock_service.refresh = AsyncMock(
+            return_value=CommunityRefreshResult(
+                success=True,
+                algorithm="leiden",
+                community_count=5,
+                modularity=0.7,
+                node_count=50,
+                duration_seconds=0.5,
+                mode="incremental",
+                changed_employee_count=3,
+            )
+        )
+        resp = client.post("/api/v1/communities/refresh", json={"mode": "incremental"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["mode"] == "incremental"
+        assert data["changed_employee_count"] == 3
+        assert mock_service.refresh.call_args.kwargs["mode"] == "incremental"
+
     def test_refresh_concurrent_409(self, client, mock_service):
         """동시 실행 시 409"""
         mock_service.refresh = AsyncMock(side_effect=ConcurrentRefreshError())
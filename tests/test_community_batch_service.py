@@ -17,6 +17,7 @@ from src.services.community_batch_service import (
     CommunityStatusResult,
 )
 from src.services.gds_service import CommunityResult, GDSService
+from src.utils.graph_version import GraphVersion
 
 
 @pytest.fixture
@@ -97,7 +98,8 @@ async def test_refresh_success(service, mock_gds, mock_neo4j_repo):
         algorithm="leiden",
         gamma=1.0,
     )
-    mock_neo4j_repo.execute_cypher.assert_called_once()  # metadata save
+    # DB 기준 시작 시각 조회 + metadata save
+    assert mock_neo4j_repo.execute_cypher.call_count == 2
     mock_gds.drop_projection.assert_called_once()
 
     # 호출 순서 검증 (GDS 호출만)
@@ -137,8 +139,8 @@ async def test_refresh_records_metadata(service, mock_neo4j_repo):
     """refresh 후 CommunityMeta 노드에 MERGE 쿼리 실행 확인"""
     await service.refresh()
 
-    # execute_cypher 호출 확인
-    mock_neo4j_repo.execute_cypher.assert_called_once()
+    # execute_cypher 호출 확인 (시작 시각 조회 → 메타데이터 저장)
+    assert mock_neo4j_repo.execute_cypher.call_count == 2
     cypher_call = mock_neo4j_repo.execute_cypher.call_args
 
     # Cypher 쿼리에 MERGE와 CommunityMeta 포함 확인
@@ -197,7 +199,7 @@ async def test_refresh_cleans_up_on_metadata_save_error(
 ):
     """Step 4 메타데이터 저장 실패 시에도 프로젝션 정리"""
     mock_neo4j_repo.execute_cypher = AsyncMock(
-        side_effect=RuntimeError("DB write failed")
+        side_effect=[[], RuntimeError("DB write failed")]
     )
 
     with pytest.raises(RuntimeError, match="DB write failed"):
@@ -238,6 +240,160 @@ async def test_refresh_rejects_concurrent_call(service, mock_gds):
     assert len(errors) == 1
 
 
+# ============================================
+# refresh(mode="incremental") 테스트
+# ============================================
+
+
+def _incremental_cypher(meta: dict | None, changed_ids: list[str], max_id: int = 4):
+    """쿼리 종류별 응답을 돌려주는 execute_cypher mock"""
+    calls: list[tuple[str, dict]] = []
+
+    async def execute(query, params=None):
+        calls.append((query, params or {}))
+        if "toString(datetime())" in query:
+            return [{"now": "2026-02-20T10:00:00.123456789Z"}]
+        if "RETURN m.refreshed_at" in query:
+            return [meta] if meta else []
+        if "skills_changed_at" in query:
+            return [{"id": i} for i in changed_ids]
+        if "max(e.communityId)" in query:
+            return [{"max_id": max_id}]
+        if "MERGE (e)-[r:SIMILAR]" in query:
+            return [{"written": 10 * len(params["ids"])}]
+        return []
+
+    return AsyncMock(side_effect=execute), calls
+
+
+PREVIOUS_META = {
+    "refreshed_at": "2026-02-19T10:00:00+00:00",
+    "algorithm": "leiden",
+    "gamma": 1.0,
+    "community_count": 5,
+    "modularity": 0.72,
+    "node_count": 95,
+    "min_shared_skills": 2,
+}
+
+
+async def test_incremental_refresh_recomputes_changed_only(
+    service, mock_gds, mock_neo4j_repo
+):
+    """변경 직원만 SIMILAR 재계산 후 이전 communityId 시드로 탐지"""
+    mock_neo4j_repo.execute_cypher, calls = _incremental_cypher(
+        PREVIOUS_META, ["e1", "e2"]
+    )
+
+    result = await service.refresh(mode="incremental")
+
+    assert result.mode == "incremental"
+    assert result.changed_employee_count == 2
+    mock_gds.create_skill_similarity_projection.assert_called_once_with(
+        min_shared_skills=2,
+        rebuild_similarity=False,
+        seed_property="communityId",
+    )
+    mock_gds.detect_communities.assert_called_once_with(
+        algorithm="leiden",
+        gamma=1.0,
+        seed_property="communityId",
+    )
+
+    queries = [q for q, _ in calls]
+    delete_idx = next(i for i, q in enumerate(queries) if "DELETE r" in q)
+    write_idx = next(i for i, q in enumerate(queries) if "MERGE (e)-[r:SIMILAR]" in q)
+    assert delete_idx < write_idx
+    assert calls[write_idx][1]["ids"] == ["e1", "e2"]
+    assert calls[write_idx][1]["top_k"] == GDSService.SIMILARITY_TOP_K
+
+    seed_params = next(p for q, p in calls if "SET e.communityId" in q)
+    assert seed_params["next_id"] == 5
+
+    changed_query = next(q for q, _ in calls if "skills_changed_at" in q)
+    assert "e.skills_changed_at >= m.refreshed_at" in changed_query
+
+    # 기준 시각은 앱 시계가 아닌 DB 시각
+    meta_params = next(p for q, p in calls if "MERGE (m:CommunityMeta" in q)
+    assert meta_params["min_shared_skills"] == 2
+    assert meta_params["refreshed_at"] == "2026-02-20T10:00:00.123456789Z"
+
+
+async def test_incremental_similarity_write_bumps_graph_version(
+    mock_gds, mock_neo4j_repo
+):
+    """증분 SIMILAR Cypher 쓰기 후 그래프 버전 증가 (결과 캐시 무효화)"""
+    version = GraphVersion()
+    service = CommunityBatchService(
+        gds_service=mock_gds,
+        neo4j_repository=mock_neo4j_repo,
+        graph_version=version,
+    )
+    mock_neo4j_repo.execute_cypher, _ = _incremental_cypher(PREVIOUS_META, ["e1"])
+
+    await service.refresh(mode="incremental")
+
+    assert version.current == 1
+
+
+async def test_incremental_refresh_batches_changed_employees(
+    service, mock_neo4j_repo, monkeypatch
+):
+    """변경 직원은 배치 단위 트랜잭션으로 삭제/기록"""
+    monkeypatch.setattr("src.services.community_batch_service.SIMILARITY_BATCH_SIZE", 2)
+    mock_neo4j_repo.execute_cypher, calls = _incremental_cypher(
+        PREVIOUS_META, ["e1", "e2", "e3"]
+    )
+
+    await service.refresh(mode="incremental")
+
+    write_batches = [p["ids"] for q, p in calls if "MERGE (e)-[r:SIMILAR]" in q]
+    assert write_batches == [["e1", "e2"], ["e3"]]
+    seed_offsets = [p["next_id"] for q, p in calls if "SET e.communityId" in q]
+    assert seed_offsets == [5, 7]
+
+
+async def test_incremental_refresh_without_changes_skips_detection(
+    service, mock_gds, mock_neo4j_repo
+):
+    """변경 직원이 없으면 GDS 호출 없이 기존 결과 반환"""
+    mock_neo4j_repo.execute_cypher, calls = _incremental_cypher(PREVIOUS_META, [])
+
+    result = await service.refresh(mode="incremental")
+
+    assert result.mode == "incremental"
+    assert result.changed_employee_count == 0
+    assert result.community_count == 5
+    mock_gds.cleanup_all_projections.assert_not_called()
+    mock_gds.detect_communities.assert_not_called()
+    assert any("MERGE (m:CommunityMeta" in q for q, _ in calls)
+
+
+@pytest.mark.parametrize(
+    "meta",
+    [
+        None,
+        {**PREVIOUS_META, "min_shared_skills": None},
+        {**PREVIOUS_META, "algorithm": "louvain"},
+        {**PREVIOUS_META, "gamma": 2.0},
+    ],
+)
+async def test_incremental_refresh_falls_back_to_full(
+    service, mock_gds, mock_neo4j_repo, meta
+):
+    """이전 리프레시가 없거나 파라미터가 다르면 전체 리프레시"""
+    mock_neo4j_repo.execute_cypher, calls = _incremental_cypher(meta, ["e1"])
+
+    result = await service.refresh(mode="incremental")
+
+    assert result.mode == "full"
+    assert result.changed_employee_count == 0
+    mock_gds.create_skill_similarity_projection.assert_called_once_with(
+        min_shared_skills=2,
+    )
+    assert not any("SIMILAR" in q for q, _ in calls)
+
+
 # ============================================
 # get_status() 테스트
 # ============================================
@@ -4,9 +4,14 @@ ConceptExpanderNode 테스트
 Neo4j 의존성 없이 독립적으로 테스트 가능하도록 설계
 """
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from src.domain.ontology.loader import ExpansionConfig, OntologyLoader
+from src.graph.nodes.concept_expander import ConceptExpanderNode
+from src.graph.state import GraphRAGState
 
 # ConceptExpanderNode의 ENTITY_TO_CATEGORY 매핑 (직접 정의)
 ENTITY_TO_CATEGORY: dict[str, str] = {
@@ -194,3 +199,62 @@ class TestConceptExpander:
             expanded_entities[entity_type] = list(expanded_values)
 
         return expanded_entities
+
+
+class TestConceptExpanderNodeConcurrency:
+    """ConceptExpanderNode 동시/일괄 확장 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batch_loader_called_once_per_category(self):
+        """expand_concepts 지원 로더는 카테고리당 1회 호출"""
+        loader = MagicMock()
+        loader.expand_concept = AsyncMock()
+        loader.expand_concepts = AsyncMock(
+            side_effect=lambda values, category, config: {
+                v: [v, f"{v}-syn"] for v in values
+            }
+        )
+        node = ConceptExpanderNode(loader)
+
+        result = await node._process(
+            GraphRAGState(
+                entities={
+                    "Skill": ["Python", "Java"],
+                    "Position": ["백엔드"],
+                    "Employee": ["홍길동"],
+                }
+            )
+        )
+
+        assert loader.expand_concepts.await_count == 2
+        loader.expand_concept.assert_not_awaited()
+        assert result["expanded_entities_by_original"]["Skill"]["Java"] == [
+            "Java",
+            "Java-syn",
+        ]
+        assert result["expanded_entities"]["Employee"] == ["홍길동"]
+
+    @pytest.mark.asyncio
+    async def test_async_loader_expands_values_concurrently(self):
+        """expand_concept만 있는 비동기 로더는 값별 호출을 동시에 실행"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def expand_concept(value, category, config):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [value]
+
+        loader = MagicMock(spec=["expand_concept"])
+        loader.expand_concept = expand_concept
+        node = ConceptExpanderNode(loader)
+
+        result = await node._process(
+            GraphRAGState(entities={"Skill": ["Python", "Java"], "Position": ["PM"]})
+        )
+
+        assert max_in_flight == 3
+        assert sorted(result["expanded_entities"]["Skill"]) == ["Java", "Python"]
@@ -0,0 +1,100 @@
+"""
+EntityEmbeddingService 단위 테스트
+
+실행: pytest tests/test_entity_embedding_service.py -v
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.constants import entity_embedding_text_expr
+from src.repositories.neo4j_repository import Neo4jRepository
+from src.services.entity_embedding_service import EntityEmbeddingService
+
+
+class TestEntityEmbeddingService:
+    @pytest.fixture
+    def mock_neo4j(self):
+        neo4j = MagicMock(spec=Neo4jRepository)
+        neo4j.ensure_vector_index = AsyncMock(return_value=True)
+        neo4j.find_pending_entity_embeddings = AsyncMock(return_value=[])
+        neo4j.save_entity_embeddings = AsyncMock(
+            side_effect=lambda updates: len(updates)
+        )
+        return neo4j
+
+    @pytest.fixture
+    def llm(self):
+        llm = MagicMock()
+        llm.get_embeddings = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] for t in texts]
+        )
+        return llm
+
+    @pytest.fixture
+    def service(self, mock_neo4j, llm):
+        return EntityEmbeddingService(mock_neo4j, llm, dimensions=256)
+
+    async def test_ensure_indexes_per_label(self, service, mock_neo4j):
+        created = await service.ensure_indexes(("Employee", "Skill"))
+
+        assert created == ["employee_embedding", "skill_embedding"]
+        assert mock_neo4j.ensure_vector_index.call_args.kwargs == {
+            "index_name": "skill_embedding",
+            "label": "Skill",
+            "property_name": "embedding",
+            "dimensions": 256,
+        }
+
+    async def test_backfill_until_no_pending(self, service, mock_neo4j, llm):
+        """대상이 없을 때까지 배치 반복, 임베딩 텍스트도 함께 저장"""
+        mock_neo4j.find_pending_entity_embeddings.side_effect = [
+            [{"id": "s1", "text": "Python | 언어"}, {"id": "s2", "text": "Go"}],
+            [{"id": "s3", "text": "Rust"}],
+            [],
+        ]
+
+        result = await service.backfill(("Skill",), batch_size=2)
+
+        assert result.updated_by_label == {"Skill": 3}
+        assert result.batches == 2
+        assert llm.get_embeddings.await_count == 2
+        first_updates = mock_neo4j.save_entity_embeddings.call_args_list[0].args[0]
+        assert first_updates[0] == {
+            "node_id": "s1",
+            "embedding": [11.0],
+            "text": "Python | 언어",
+        }
+
+    async def test_max_batches_stops_early(self, service, mock_neo4j):
+        """max_batches 도달 시 중단 (재실행 시 남은 노드부터 처리)"""
+        mock_neo4j.find_pending_entity_embeddings.return_value = [
+            {"id": "e1", "text": "홍길동"}
+        ]
+
+        result = await service.backfill(("Employee", "Skill"), max_batches=3)
+
+        assert result.batches == 3
+        assert result.updated_by_label == {"Employee": 3, "Skill": 0}
+
+    async def test_unsaved_nodes_are_excluded(self, service, mock_neo4j):
+        """저장되지 않은 노드(삭제됨)는 다음 조회에서 제외"""
+        mock_neo4j.find_pending_entity_embeddings.side_effect = [
+            [{"id": "gone", "text": "X"}],
+            [],
+        ]
+        mock_neo4j.save_entity_embeddings.side_effect = None
+        mock_neo4j.save_entity_embeddings.return_value = 0
+
+        await service.backfill(("Project",))
+
+        last_call = mock_neo4j.find_pending_entity_embeddings.call_args
+        assert last_call.kwargs["exclude_ids"] == ["gone"]
+
+
+def test_embedding_text_expr_appends_key_properties():
+    assert entity_embedding_text_expr("n", "Skill") == (
+        "n.name + coalesce(' | ' + toString(n.`category`), '')"
+    )
+    assert entity_embedding_text_expr("n", "Employee") == "n.name"
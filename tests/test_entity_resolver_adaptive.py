@@ -25,8 +25,8 @@ async def test_collect_unresolved_when_no_match(
         "question": "Find someone with NonExistentSkill",
     }
 
-    # Mock find_entities_by_name to return empty list (no match)
-    mock_neo4j_repository.find_entities_by_name.return_value = []
+    # Mock find_entities_by_names to return no matches
+    mock_neo4j_repository.find_entities_by_names.return_value = {}
 
     # When
     result = await entity_resolver_node._process(state)
@@ -53,16 +53,20 @@ async def test_mixed_resolved_and_unresolved(
     }
 
     # Mock behavior: Python exists, UnknownSkill does not
-    async def side_effect(name, labels=None, limit=None):
-        if name == "Python":
-            mock_node = MagicMock()
-            mock_node.id = 1
-            mock_node.labels = ["Skill"]
-            mock_node.properties = {"name": "Python"}
-            return [mock_node]
-        return []
-
-    mock_neo4j_repository.find_entities_by_name.side_effect = side_effect
+    async def side_effect(lookups, limit=None):
+        matches = {}
+        for label, name in lookups:
+            if name == "Python":
+                mock_node = MagicMock()
+                mock_node.id = 1
+                mock_node.labels = ["Skill"]
+                mock_node.properties = {"name": "Python"}
+                matches[(label, name)] = [mock_node]
+            else:
+                matches[(label, name)] = []
+        return matches
+
+    mock_neo4j_repository.find_entities_by_names.side_effect = side_effect
 
     # When
     result = await entity_resolver_node._process(state)
@@ -96,7 +100,7 @@ async def test_error_handling_adds_to_unresolved(
     state = {"entities": {"Skill": ["ErrorSkill"]}, "question": "Error case"}
 
     # Mock exception
-    mock_neo4j_repository.find_entities_by_name.side_effect = Exception("DB Error")
+    mock_neo4j_repository.find_entities_by_names.side_effect = Exception("DB Error")
 
     # When
     result = await entity_resolver_node._process(state)
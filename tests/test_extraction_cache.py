@@ -0,0 +1,125 @@
+"""
+추출 캐시 / 적재 체크포인트 테스트
+
+캐시 키 구성, SQLite 저장/조회, GraphExtractor 캐시 히트 시 LLM 생략을 검증합니다.
+"""
+
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.ingestion.extraction_cache import (
+    ExtractionCache,
+    IngestionCheckpoint,
+    extraction_cache_key,
+    source_key_for_file,
+)
+from src.ingestion.extractor import GraphExtractor
+from src.ingestion.models import Document, ExtractedGraph, Node
+from src.ingestion.schema import NodeType
+
+
+class TestExtractionCacheKey:
+    def test_key_depends_on_text_prompt_and_model(self):
+        base = extraction_cache_key("row", "v1", "gpt-4o")
+        assert base == extraction_cache_key("row", "v1", "gpt-4o")
+        assert base != extraction_cache_key("row2", "v1", "gpt-4o")
+        assert base != extraction_cache_key("row", "v2", "gpt-4o")
+        assert base != extraction_cache_key("row", "v1", "gpt-4o-mini")
+
+
+class TestExtractionCache:
+    def test_put_get_and_counters(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache.db")
+        assert cache.get("k") is None
+
+        cache.put("k", '{"nodes": [], "edges": []}')
+
+        assert cache.get("k") == '{"nodes": [], "edges": []}'
+        assert (cache.hits, cache.misses) == (1, 1)
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        ExtractionCache(tmp_path / "cache.db").put("k", "payload")
+        assert ExtractionCache(tmp_path / "cache.db").get("k") == "payload"
+
+
+class TestIngestionCheckpoint:
+    def test_offset_roundtrip_and_clear(self, tmp_path):
+        checkpoint = IngestionCheckpoint(tmp_path / "cache.db")
+        assert checkpoint.get_offset("src") == 0
+
+        checkpoint.save_offset("src", 120)
+        assert checkpoint.get_offset("src") == 120
+
+        checkpoint.clear("src")
+        assert checkpoint.get_offset("src") == 0
+
+    def test_source_key_changes_with_content(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("name\nA\n")
+        before = source_key_for_file(path)
+        path.write_text("name\nA\nB\n")
+        assert source_key_for_file(path) != before
+
+
+@patch("src.ingestion.extractor.get_settings")
+@patch("src.ingestion.extractor.AsyncAzureOpenAI")
+class TestGraphExtractorCache:
+    def _make_extractor(self, mock_settings, cache):
+        settings = MagicMock()
+        settings.heavy_model_deployment = "gpt-4o"
+        mock_settings.return_value = settings
+        extractor = GraphExtractor(cache=cache)
+        extractor._run_llm = AsyncMock(
+            return_value=ExtractedGraph(
+                nodes=[Node(id="a", label=NodeType.PERSON, properties={"name": "A"})],
+                edges=[],
+            )
+        )
+        return extractor
+
+    async def test_unchanged_row_skips_llm(self, MockOpenAI, mock_settings, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache.db")
+        extractor = self._make_extractor(mock_settings, cache)
+        doc = Document(page_content="name: A", metadata={"row_index": 2})
+
+        first = await extractor.extract(doc)
+        second = await extractor.extract(doc)
+
+        assert extractor._run_llm.await_count == 1
+        assert [n.id for n in first.nodes] == [n.id for n in second.nodes]
+        assert second.nodes[0].source_metadata == {"row_index": 2}
+
+    async def test_empty_result_not_cached(self, MockOpenAI, mock_settings, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache.db")
+        extractor = self._make_extractor(mock_settings, cache)
+        extractor._run_llm.return_value = ExtractedGraph(nodes=[], edges=[])
+        doc = Document(page_content="empty", metadata={})
+
+        await extractor.extract(doc)
+        await extractor.extract(doc)
+
+        assert extractor._run_llm.await_count == 2
+
+    async def test_cache_io_runs_off_event_loop(
+        self, MockOpenAI, mock_settings, tmp_path
+    ):
+        """캐시 get/put은 이벤트 루프 스레드가 아닌 워커 스레드에서 실행"""
+        io_threads: list[int] = []
+
+        class _RecordingCache(ExtractionCache):
+            def get(self, key):
+                io_threads.append(threading.get_ident())
+                return super().get(key)
+
+            def put(self, key, payload):
+                io_threads.append(threading.get_ident())
+                super().put(key, payload)
+
+        cache = _RecordingCache(tmp_path / "cache.db")
+        extractor = self._make_extractor(mock_settings, cache)
+
+        await extractor.extract(Document(page_content="name: A", metadata={}))
+
+        assert len(io_threads) == 2
+        assert threading.get_ident() not in io_threads
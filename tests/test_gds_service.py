@@ -7,16 +7,21 @@ ThreadPoolExecutor 브릿지, 프로젝션 관리, 커뮤니티 탐지,
 실행: pytest tests/test_gds_service.py -v
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pandas as pd
 import pytest
 
+from src.repositories.neo4j_repository import Neo4jRepository
 from src.services.gds_service import (
+    TEAM_CANDIDATE_POOL,
     CommunityResult,
     GDSService,
     TeamRecommendation,
 )
+from src.utils.graph_version import GraphVersion
 
 
 @pytest.fixture
@@ -181,6 +186,73 @@ class TestProjectionManagement:
         assert count == 2
         assert mock_gds.graph.drop.call_count == 2
 
+    async def test_similarity_projection_deletes_similar_in_batches(self, gds_service):
+        """기존 SIMILAR 관계는 배치 크기 단위로 반복 삭제"""
+        mock_gds = gds_service._gds
+        mock_gds.graph.exists.return_value = MagicMock(exists=False)
+        mock_gds.graph.project.return_value = (
+            MagicMock(),
+            {"nodeCount": 10, "relationshipCount": 20},
+        )
+        mock_gds.nodeSimilarity.write.return_value = {"relationshipsWritten": 5}
+        batch = GDSService.SIMILAR_DELETE_BATCH_SIZE
+        mock_gds.run_cypher.side_effect = [
+            pd.DataFrame([{"deleted": batch}]),
+            pd.DataFrame([{"deleted": 3}]),
+        ]
+
+        await gds_service.create_skill_similarity_projection(min_shared_skills=2)
+
+        assert mock_gds.run_cypher.call_count == 2
+        assert mock_gds.run_cypher.call_args.args[1] == {"batch_size": batch}
+        mock_gds.nodeSimilarity.write.assert_called_once()
+
+    async def test_similarity_projection_reuses_similar_with_seed(self, gds_service):
+        """rebuild_similarity=False면 Node Similarity 생략, 시드 속성 포함 프로젝션"""
+        mock_gds = gds_service._gds
+        mock_gds.graph.exists.return_value = MagicMock(exists=False)
+        mock_gds.graph.project.return_value = (
+            MagicMock(),
+            {"nodeCount": 10, "relationshipCount": 20},
+        )
+
+        result = await gds_service.create_skill_similarity_projection(
+            rebuild_similarity=False,
+            seed_property="communityId",
+        )
+
+        assert result["node_count"] == 10
+        mock_gds.run_cypher.assert_not_called()
+        mock_gds.nodeSimilarity.write.assert_not_called()
+        mock_gds.graph.project.assert_called_once()
+        node_spec = mock_gds.graph.project.call_args.args[1]
+        assert node_spec == {"Employee": {"properties": ["communityId"]}}
+
+    async def test_similarity_rebuild_bumps_graph_version(self, gds_service):
+        """SIMILAR 재구축 시에만 그래프 버전 증가 (결과 캐시 무효화)"""
+        gds_service._graph_version = GraphVersion()
+        mock_gds = gds_service._gds
+        mock_gds.graph.exists.return_value = MagicMock(exists=False)
+        mock_gds.graph.project.return_value = (
+            MagicMock(),
+            {"nodeCount": 10, "relationshipCount": 20},
+        )
+        mock_gds.nodeSimilarity.write.return_value = {"relationshipsWritten": 5}
+        mock_gds.run_cypher.return_value = pd.DataFrame([{"deleted": 0}])
+
+        await gds_service.create_skill_similarity_projection(rebuild_similarity=False)
+        assert gds_service._graph_version.current == 0
+
+        await gds_service.create_skill_similarity_projection()
+        assert gds_service._graph_version.current == 1
+
+    async def test_similarity_projection_validates_seed_property(self, gds_service):
+        """시드 속성명은 Cypher 식별자 검증"""
+        with pytest.raises(ValueError, match="Invalid seed_property"):
+            await gds_service.create_skill_similarity_projection(
+                seed_property="communityId; DROP"
+            )
+
 
 # ── Community Detection ──────────────────────────────────
 
@@ -242,6 +314,22 @@ class TestCommunityDetection:
         mock_gds.louvain.write.assert_called_once()
         mock_gds.leiden.write.assert_not_called()
 
+    async def test_detect_communities_bumps_graph_version(self, gds_service):
+        """communityId 쓰기 후 그래프 버전 증가 (결과 캐시 무효화)"""
+        gds_service._graph_version = GraphVersion()
+        mock_gds = gds_service._gds
+        mock_gds.graph.exists.return_value = MagicMock(exists=True)
+        mock_gds.leiden.write.return_value = {
+            "nodePropertiesWritten": 5,
+            "communityCount": 1,
+            "modularity": 0.5,
+        }
+        mock_gds.run_cypher.return_value = pd.DataFrame([])
+
+        await gds_service.detect_communities()
+
+        assert gds_service._graph_version.current == 1
+
     async def test_detect_communities_projection_missing(self, gds_service):
         """프로젝션이 없으면 ValueError"""
         mock_gds = gds_service._gds
@@ -250,6 +338,22 @@ class TestCommunityDetection:
         with pytest.raises(ValueError, match="not found"):
             await gds_service.detect_communities()
 
+    async def test_detect_communities_with_seed(self, gds_service):
+        """seed_property 지정 시 seedProperty로 전달"""
+        mock_gds = gds_service._gds
+        mock_gds.graph.exists.return_value = MagicMock(exists=True)
+        mock_gds.graph.get.return_value = MagicMock()
+        mock_gds.leiden.write.return_value = {
+            "nodePropertiesWritten": 50,
+            "communityCount": 5,
+            "modularity": 0.72,
+        }
+        mock_gds.run_cypher.return_value = pd.DataFrame([])
+
+        await gds_service.detect_communities(seed_property="communityId")
+
+        assert mock_gds.leiden.write.call_args.kwargs["seedProperty"] == "communityId"
+
     async def test_detect_communities_validates_write_property(self, gds_service):
         """write_property 인젝션 방지"""
         with pytest.raises(ValueError, match="Invalid write_property"):
@@ -313,6 +417,127 @@ class TestFindSimilarEmployees:
         assert results == []
 
 
+class TestSkillMatrixPath:
+    """skill_matrix 주입 시 Cypher/executor 미경유"""
+
+    @pytest.fixture
+    def matrix_service(self, gds_service):
+        matrix = MagicMock()
+        matrix.ensure_loaded = AsyncMock()
+        gds_service._skill_matrix = matrix
+        return gds_service, matrix
+
+    async def test_find_similar_employees_uses_matrix(self, matrix_service):
+        service, matrix = matrix_service
+        matrix.similar_employees.return_value = [{"name": "이영희", "similarity": 0.5}]
+
+        results = await service.find_similar_employees("김철수", top_k=3)
+
+        assert results == [{"name": "이영희", "similarity": 0.5}]
+        matrix.ensure_loaded.assert_awaited_once()
+        matrix.similar_employees.assert_called_once_with("김철수", 3)
+        service._gds.run_cypher.assert_not_called()
+
+    async def test_recommend_team_scores_candidates_from_matrix(self, matrix_service):
+        service, matrix = matrix_service
+        matrix.score_candidates.return_value = [
+            {
+                "id": "1",
+                "name": "김철수",
+                "community_id": 1,
+                "matchedSkills": ["Python", "AWS"],
+                "skillCount": 2,
+                "skill_score": 1.0,
+            }
+        ]
+
+        result = await service.recommend_team(["Python", "AWS"], team_size=2)
+
+        matrix.score_candidates.assert_called_once_with(
+            ["Python", "AWS"], limit=TEAM_CANDIDATE_POOL
+        )
+        assert result.skill_coverage == 1.0
+        assert [m["name"] for m in result.members] == ["김철수"]
+        service._gds.run_cypher.assert_not_called()
+
+
+class TestAsyncReadPath:
+    """읽기 전용 분석 쿼리: 비동기 레포지토리 / 알고리즘 executor 분리"""
+
+    @pytest.fixture
+    def repo_service(self, gds_service):
+        repo = MagicMock(spec=Neo4jRepository)
+        repo.execute_cypher = AsyncMock(return_value=[])
+        gds_service._neo4j = repo
+        return gds_service, repo
+
+    async def test_find_similar_employees_uses_repository(self, repo_service):
+        service, repo = repo_service
+        repo.execute_cypher.return_value = [{"name": "이영희", "similarity": 0.5}]
+
+        results = await service.find_similar_employees("김철수", top_k=3)
+
+        assert results == [{"name": "이영희", "similarity": 0.5}]
+        params = repo.execute_cypher.call_args[0][1]
+        assert params == {"name": "김철수", "top_k": 3}
+        service._gds.run_cypher.assert_not_called()
+
+    async def test_community_details_uses_repository(self, repo_service):
+        service, repo = repo_service
+        repo.execute_cypher.side_effect = [
+            [{"id": "E1", "name": "김철수"}, {"id": "E2", "name": "이영희"}],
+            [{"skill": "Python", "count": 2, "percentage": 100.0}],
+        ]
+
+        result = await service.get_community_details(community_id=0)
+
+        assert result["member_count"] == 2
+        assert result["top_skills"][0]["skill"] == "Python"
+        assert repo.execute_cypher.call_args[0][1]["member_count"] == 2
+        service._gds.run_cypher.assert_not_called()
+
+    async def test_detect_communities_reads_stats_from_repository(self, repo_service):
+        service, repo = repo_service
+        service._gds.graph.exists.return_value = MagicMock(exists=True)
+        service._gds.leiden.write.return_value = {
+            "nodePropertiesWritten": 2,
+            "communityCount": 1,
+            "modularity": 0.4,
+        }
+        repo.execute_cypher.return_value = [
+            {"community_id": 0, "member_count": 2, "sample_members": ["김철수"]}
+        ]
+
+        result = await service.detect_communities()
+
+        assert result.communities[0]["member_count"] == 2
+        service._gds.run_cypher.assert_not_called()
+
+    async def test_reads_not_blocked_by_running_algorithm(self):
+        """알고리즘 스레드가 모두 점유돼도 읽기 쿼리는 별도 풀에서 진행"""
+        service = GDSService(
+            uri="bolt://localhost:7687",
+            user="neo4j",
+            password="password",
+            max_workers=1,
+        )
+        service._gds = MagicMock()
+        service._gds.run_cypher.return_value = pd.DataFrame([{"name": "이영희"}])
+
+        release = threading.Event()
+        blocker = service._executor.submit(release.wait, 5)
+        try:
+            results = await asyncio.wait_for(
+                service.find_similar_employees("김철수"), timeout=2
+            )
+        finally:
+            release.set()
+            blocker.result()
+            await service.close()
+
+        assert results == [{"name": "이영희"}]
+
+
 # ── Team Recommendation ──────────────────────────────────
 
 
@@ -265,6 +265,31 @@ class TestDeleteNode:
         mock_repo.delete_node_atomic.assert_awaited_once_with("4:abc:0", force=True)
 
 
+# =============================================================================
+# 캐시 무효화 훅
+# =============================================================================
+
+
+class TestQueryCacheInvalidation:
+    async def test_mutations_invalidate_local_cache(self, mock_repo):
+        query_cache = MagicMock()
+        service = GraphEditService(mock_repo, query_cache=query_cache)
+
+        await service.create_node("Skill", {"name": "Rust"})
+        await service.delete_edge("5:abc:0")
+
+        assert query_cache.invalidate_local.call_count == 2
+
+    async def test_failed_mutation_keeps_cache(self, mock_repo):
+        query_cache = MagicMock()
+        service = GraphEditService(mock_repo, query_cache=query_cache)
+        mock_repo.delete_relationship_generic.return_value = False
+
+        with pytest.raises(EntityNotFoundError):
+            await service.delete_edge("invalid")
+        query_cache.invalidate_local.assert_not_called()
+
+
 # =============================================================================
 # 엣지 생성
 # =============================================================================
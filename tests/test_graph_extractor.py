@@ -9,7 +9,11 @@ LLM 기반 그래프 추출의 후처리 로직과 Ingestion 파이프라인의
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
+from src.ingestion.extraction_cache import IngestionCheckpoint
 from src.ingestion.extractor import EDGE_CONFIDENCE_THRESHOLD, GraphExtractor
+from src.ingestion.loaders.base import BaseLoader
 from src.ingestion.models import Document, Edge, ExtractedGraph, Node
 from src.ingestion.pipeline import IngestionPipeline
 from src.ingestion.schema import NodeType, RelationType
@@ -357,7 +361,9 @@ class TestIngestionPipeline:
 
     @patch("src.ingestion.pipeline.get_settings")
     @patch("src.ingestion.pipeline.GraphExtractor")
-    async def test_process_batch_extraction_failure(self, MockExtractor, mock_settings):
+    async def test_write_results_counts_extraction_failure(
+        self, MockExtractor, mock_settings
+    ):
         """배치 내 추출 실패 시 failed_docs 카운트"""
         mock_settings.return_value = MagicMock(
             neo4j_uri="bolt://localhost:7687",
@@ -381,15 +387,16 @@ class TestIngestionPipeline:
         mock_client = MagicMock()
         mock_client.execute_write = AsyncMock()
         docs = [_make_document("doc1"), _make_document("doc2")]
+        results = [await pipeline._extract_safe(doc) for doc in docs]
 
-        stats = await pipeline._process_batch(mock_client, docs)
+        stats = await pipeline._write_results(mock_client, results)
 
         assert stats["failed_docs"] == 1
         assert stats["total_nodes"] == 1
 
     @patch("src.ingestion.pipeline.get_settings")
     @patch("src.ingestion.pipeline.GraphExtractor")
-    async def test_process_batch_empty_results(self, MockExtractor, mock_settings):
+    async def test_write_results_empty_results(self, MockExtractor, mock_settings):
         """모든 추출 결과가 빈 경우"""
         mock_settings.return_value = MagicMock(
             neo4j_uri="bolt://localhost:7687",
@@ -405,10 +412,213 @@ class TestIngestionPipeline:
 
         mock_client = MagicMock()
         mock_client.execute_write = AsyncMock()
-        docs = [_make_document()]
+        results = [await pipeline._extract_safe(_make_document())]
 
-        stats = await pipeline._process_batch(mock_client, docs)
+        stats = await pipeline._write_results(mock_client, results)
 
         assert stats["total_nodes"] == 0
         assert stats["total_edges"] == 0
         mock_client.execute_write.assert_not_awaited()  # 저장하지 않음
+
+
+class _ListLoader(BaseLoader):
+    """테스트용 고정 Document 로더"""
+
+    def __init__(self, docs: list[Document]) -> None:
+        self._docs = docs
+
+    def load(self):
+        yield from self._docs
+
+
+def _settings_mock() -> MagicMock:
+    return MagicMock(
+        neo4j_uri="bolt://localhost:7687",
+        neo4j_user="neo4j",
+        neo4j_password="password",
+        neo4j_database="neo4j",
+    )
+
+
+class TestIngestionPipelineStreaming:
+    """load → extract → write 스트리밍 실행 테스트"""
+
+    @patch("src.ingestion.pipeline.Neo4jClient")
+    @patch("src.ingestion.pipeline.get_settings")
+    @patch("src.ingestion.pipeline.GraphExtractor")
+    async def test_run_coalesces_writes_by_batch_size(
+        self, MockExtractor, mock_settings, MockClient
+    ):
+        """문서별 추출 결과를 batch_size 단위로 모아 저장"""
+        mock_settings.return_value = _settings_mock()
+        client = MockClient.return_value
+        client.connect = AsyncMock()
+        client.close = AsyncMock()
+        client.execute_write = AsyncMock()
+
+        pipeline = IngestionPipeline(batch_size=4, concurrency=3)
+        pipeline.extractor.extract = AsyncMock(
+            side_effect=lambda doc, **_: ExtractedGraph(
+                nodes=[_make_node(doc.page_content, NodeType.PERSON, name="A")],
+                edges=[],
+            )
+        )
+        docs = [_make_document(f"doc{i}") for i in range(10)]
+        batches: list[dict[str, int]] = []
+
+        stats = await pipeline.run(_ListLoader(docs), on_batch=batches.append)
+
+        assert stats["total_docs"] == 10
+        assert stats["total_nodes"] == 10
+        assert [b["docs"] for b in batches] == [4, 4, 2]
+        # 배치마다 Person 라벨 UNWIND 1회
+        assert client.execute_write.await_count == 3
+        client.close.assert_awaited_once()
+
+    @patch("src.ingestion.pipeline.Neo4jClient")
+    @patch("src.ingestion.pipeline.get_settings")
+    @patch("src.ingestion.pipeline.GraphExtractor")
+    async def test_run_propagates_write_failure(
+        self, MockExtractor, mock_settings, MockClient
+    ):
+        """저장 실패 시 나머지 단계를 취소하고 예외 전파"""
+        mock_settings.return_value = _settings_mock()
+        client = MockClient.return_value
+        client.connect = AsyncMock()
+        client.close = AsyncMock()
+        client.execute_write = AsyncMock(side_effect=RuntimeError("neo4j down"))
+
+        pipeline = IngestionPipeline(batch_size=1, concurrency=2)
+        pipeline.extractor.extract = AsyncMock(
+            return_value=ExtractedGraph(
+                nodes=[_make_node("p", NodeType.PERSON, name="A")], edges=[]
+            )
+        )
+        docs = [_make_document(f"doc{i}") for i in range(20)]
+
+        with pytest.raises(RuntimeError, match="neo4j down"):
+            await pipeline.run(_ListLoader(docs))
+        client.close.assert_awaited_once()
+
+    @patch("src.ingestion.pipeline.Neo4jClient")
+    @patch("src.ingestion.pipeline.get_settings")
+    @patch("src.ingestion.pipeline.GraphExtractor")
+    async def test_run_resumes_from_committed_offset(
+        self, MockExtractor, mock_settings, MockClient, tmp_path
+    ):
+        """체크포인트 오프셋 이후 문서만 처리하고 성공 시 체크포인트 삭제"""
+        mock_settings.return_value = _settings_mock()
+        client = MockClient.return_value
+        client.connect = AsyncMock()
+        client.close = AsyncMock()
+        client.execute_write = AsyncMock()
+
+        checkpoint = IngestionCheckpoint(tmp_path / "state.db")
+        checkpoint.save_offset("src", 6)
+
+        pipeline = IngestionPipeline(batch_size=2, concurrency=2, checkpoint=checkpoint)
+        seen: list[str] = []
+
+        async def extract(doc, **_):
+            seen.append(doc.page_content)
+            return ExtractedGraph(nodes=[], edges=[])
+
+        pipeline.extractor.extract = AsyncMock(side_effect=extract)
+        docs = [_make_document(f"doc{i}") for i in range(10)]
+
+        stats = await pipeline.run(_ListLoader(docs), resume_key="src")
+
+        assert sorted(seen) == ["doc6", "doc7", "doc8", "doc9"]
+        assert stats["skipped_docs"] == 6
+        assert stats["total_docs"] == 4
+        assert checkpoint.get_offset("src") == 0
+
+    @patch("src.ingestion.pipeline.Neo4jClient")
+    @patch("src.ingestion.pipeline.get_settings")
+    @patch("src.ingestion.pipeline.GraphExtractor")
+    async def test_run_failure_keeps_committed_offset(
+        self, MockExtractor, mock_settings, MockClient, tmp_path
+    ):
+        """저장 실패 시 마지막으로 커밋된 연속 오프셋이 남음"""
+        mock_settings.return_value = _settings_mock()
+        client = MockClient.return_value
+        client.connect = AsyncMock()
+        client.close = AsyncMock()
+        client.execute_write = AsyncMock(side_effect=[None, RuntimeError("neo4j down")])
+
+        checkpoint = IngestionCheckpoint(tmp_path / "state.db")
+        pipeline = IngestionPipeline(batch_size=2, concurrency=1, checkpoint=checkpoint)
+        pipeline.extractor.extract = AsyncMock(
+            return_value=ExtractedGraph(
+                nodes=[_make_node("p", NodeType.PERSON, name="A")], edges=[]
+            )
+        )
+        docs = [_make_document(f"doc{i}") for i in range(6)]
+
+        with pytest.raises(RuntimeError):
+            await pipeline.run(_ListLoader(docs), resume_key="src")
+
+        assert checkpoint.get_offset("src") == 2
+
+    @patch("src.ingestion.pipeline.Neo4jClient")
+    @patch("src.ingestion.pipeline.get_settings")
+    @patch("src.ingestion.pipeline.GraphExtractor")
+    async def test_run_failed_extraction_holds_watermark(
+        self, MockExtractor, mock_settings, MockClient, tmp_path
+    ):
+        """추출 실패 문서는 커밋 오프셋을 넘기지 않고 체크포인트도 유지"""
+        mock_settings.return_value = _settings_mock()
+        client = MockClient.return_value
+        client.connect = AsyncMock()
+        client.close = AsyncMock()
+        client.execute_write = AsyncMock()
+
+        checkpoint = IngestionCheckpoint(tmp_path / "state.db")
+        pipeline = IngestionPipeline(batch_size=2, concurrency=1, checkpoint=checkpoint)
+
+        async def extract(doc, **_):
+            if doc.page_content == "doc3":
+                raise RuntimeError("LLM error")
+            return ExtractedGraph(nodes=[], edges=[])
+
+        pipeline.extractor.extract = AsyncMock(side_effect=extract)
+        docs = [_make_document(f"doc{i}") for i in range(6)]
+
+        stats = await pipeline.run(_ListLoader(docs), resume_key="src")
+
+        assert stats["failed_docs"] == 1
+        assert checkpoint.get_offset("src") == 3
+
+    @patch("src.ingestion.pipeline.Neo4jClient")
+    @patch("src.ingestion.pipeline.get_settings")
+    @patch("src.ingestion.pipeline.GraphExtractor")
+    async def test_run_llm_failure_counts_as_failed_doc(
+        self, MockExtractor, mock_settings, MockClient, tmp_path
+    ):
+        """LLM 호출 실패(빈 그래프로 삼키지 않음)도 실패 문서로 집계되어 재개 대상에 남음"""
+        mock_settings.return_value = _settings_mock()
+        client = MockClient.return_value
+        client.connect = AsyncMock()
+        client.close = AsyncMock()
+        client.execute_write = AsyncMock()
+
+        checkpoint = IngestionCheckpoint(tmp_path / "state.db")
+        pipeline = IngestionPipeline(batch_size=2, concurrency=1, checkpoint=checkpoint)
+        with (
+            patch("src.ingestion.extractor.get_settings"),
+            patch("src.ingestion.extractor.AsyncAzureOpenAI"),
+        ):
+            pipeline.extractor = GraphExtractor()
+
+        async def run_llm(text):
+            if text == "doc1":
+                raise RuntimeError("429 Too Many Requests")
+            return ExtractedGraph(nodes=[], edges=[])
+
+        pipeline.extractor._run_llm = AsyncMock(side_effect=run_llm)
+        docs = [_make_document(f"doc{i}") for i in range(4)]
+
+        stats = await pipeline.run(_ListLoader(docs), resume_key="src")
+
+        assert stats["failed_docs"] == 1
+        assert checkpoint.get_offset("src") == 1
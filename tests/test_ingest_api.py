@@ -6,13 +6,15 @@ Ingest API 엔드포인트 테스트
 
 import io
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.api.job_store import JobStatus, job_store
-from src.api.routes.ingest import UPLOAD_DIR, router
+from src.api.routes.ingest import UPLOAD_DIR, _run_ingestion_job, router
+from src.api.schemas import IngestRequest
 
 
 @pytest.fixture(autouse=True)
@@ -103,6 +105,43 @@ class TestIngestAPI:
                 test_file.unlink()
 
 
+class TestIngestionJob:
+    @patch("src.api.routes.ingest.IngestionPipeline")
+    @patch("src.api.routes.ingest.get_settings")
+    async def test_failed_job_keeps_buffered_progress(
+        self, mock_settings, MockPipeline, tmp_path
+    ):
+        """파이프라인 실패 시에도 버퍼링된 진행 카운터가 저장소에 반영"""
+        settings = MagicMock()
+        settings.extraction_cache_enabled = False
+        settings.ingest_resume_enabled = False
+        settings.job_progress_flush_interval_seconds = 3600
+        mock_settings.return_value = settings
+
+        async def run(loader, on_batch, resume_key):
+            await on_batch(
+                {"docs": 4, "total_nodes": 7, "total_edges": 3, "failed_docs": 1}
+            )
+            raise RuntimeError("neo4j down")
+
+        MockPipeline.return_value.run = AsyncMock(side_effect=run)
+        test_file = tmp_path / "employees.csv"
+        test_file.write_text("name\nAlice")
+        job_id = job_store.create_job()
+
+        await _run_ingestion_job(
+            job_id,
+            IngestRequest(source_type="csv", file_path=str(test_file)),
+            test_file,
+        )
+
+        job = job_store.get_job(job_id)
+        assert job.status == JobStatus.FAILED
+        assert job.total_documents == 4
+        assert job.total_nodes == 7
+        assert job.failed_documents == 1
+
+
 # =============================================================================
 # GET /ingest/{job_id}
 # =============================================================================
@@ -0,0 +1,164 @@
+"""
+Job Store 테스트
+
+InMemory/SQLite 백엔드 공통 동작, 완료 작업 정리, 버려진 작업 실패 처리,
+진행 카운터 배치 반영을 검증합니다.
+"""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.api.job_store import (
+    InMemoryJobStore,
+    JobProgressReporter,
+    JobStatus,
+    SQLiteJobStore,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteJobStore(tmp_path / "jobs.db", max_finished_jobs=2)
+    return InMemoryJobStore(max_finished_jobs=2)
+
+
+class TestJobStoreBackends:
+    def test_create_get_update(self, store):
+        job_id = store.create_job()
+        store.update_job(job_id, status=JobStatus.RUNNING, progress=0.5, total_nodes=3)
+
+        job = store.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.RUNNING
+        assert job.progress == 0.5
+        assert job.total_nodes == 3
+        assert job.error is None
+
+    def test_get_missing_returns_none(self, store):
+        assert store.get_job("missing") is None
+
+    def test_list_jobs_newest_first(self, store):
+        first = store.create_job()
+        second = store.create_job()
+
+        jobs = store.list_jobs(limit=10)
+        assert [j.job_id for j in jobs] == [second, first]
+        assert len(store.list_jobs(limit=1)) == 1
+
+    def test_delete_job(self, store):
+        job_id = store.create_job()
+        store.delete_job(job_id)
+        assert store.get_job(job_id) is None
+
+    def test_evicts_finished_beyond_max(self, store):
+        finished = []
+        for _ in range(3):
+            job_id = store.create_job()
+            store.update_job(job_id, status=JobStatus.COMPLETED)
+            finished.append(job_id)
+        running = store.create_job()
+        store.update_job(running, status=JobStatus.RUNNING)
+
+        store.evict_finished()
+
+        # 가장 오래된 완료 작업만 삭제, 진행 중 작업은 보존
+        assert store.get_job(finished[0]) is None
+        assert store.get_job(finished[2]) is not None
+        assert store.get_job(running) is not None
+
+
+class TestRetention:
+    def test_memory_evicts_expired(self):
+        store = InMemoryJobStore(retention_seconds=60)
+        job_id = store.create_job()
+        store.update_job(job_id, status=JobStatus.FAILED, error="boom")
+        store._jobs[job_id].updated_at = datetime.now() - timedelta(seconds=120)
+
+        assert store.evict_finished() == 1
+        assert store.get_job(job_id) is None
+
+    def test_sqlite_shared_across_instances(self, tmp_path):
+        """같은 파일을 쓰는 다른 인스턴스(워커)에서 상태 조회"""
+        writer = SQLiteJobStore(tmp_path / "jobs.db")
+        reader = SQLiteJobStore(tmp_path / "jobs.db")
+
+        job_id = writer.create_job()
+        writer.update_job(job_id, status=JobStatus.COMPLETED, progress=1.0)
+
+        job = reader.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.COMPLETED
+
+
+class TestStaleJobs:
+    def test_memory_fails_abandoned_running_job(self):
+        store = InMemoryJobStore(stale_seconds=60)
+        stale = store.create_job()
+        store.update_job(stale, status=JobStatus.RUNNING)
+        store._jobs[stale].updated_at = datetime.now() - timedelta(seconds=120)
+        active = store.create_job()
+        store.update_job(active, status=JobStatus.RUNNING)
+
+        store.evict_finished()
+
+        job = store.get_job(stale)
+        assert job.status == JobStatus.FAILED
+        assert "abandoned" in job.error
+        assert store.get_job(active).status == JobStatus.RUNNING
+
+    def test_sqlite_fails_abandoned_jobs_on_startup(self, tmp_path):
+        """이전 프로세스에서 진행 중이던 작업은 재기동 시 실패로 전환"""
+        old = SQLiteJobStore(tmp_path / "jobs.db", stale_seconds=60)
+        stale = old.create_job()
+        old.update_job(stale, status=JobStatus.RUNNING)
+        active = old.create_job()
+        with closing(sqlite3.connect(tmp_path / "jobs.db")) as conn, conn:
+            conn.execute(
+                "UPDATE ingest_jobs SET updated_at = ? WHERE job_id = ?",
+                ((datetime.now() - timedelta(seconds=120)).isoformat(), stale),
+            )
+
+        restarted = SQLiteJobStore(tmp_path / "jobs.db", stale_seconds=60)
+
+        assert restarted.get_job(stale).status == JobStatus.FAILED
+        assert restarted.get_job(active).status == JobStatus.PENDING
+
+
+class TestJobProgressReporter:
+    async def test_accumulates_until_interval(self):
+        store = MagicMock()
+        reporter = JobProgressReporter(store, "job-1", flush_interval_seconds=3600)
+
+        await reporter.record(
+            {"docs": 10, "total_nodes": 5, "total_edges": 2, "failed_docs": 1}
+        )
+        await reporter.record(
+            {"docs": 10, "total_nodes": 3, "total_edges": 1, "failed_docs": 0}
+        )
+        store.update_job.assert_not_called()
+
+        await reporter.flush()
+        store.update_job.assert_called_once_with(
+            "job-1",
+            total_documents=20,
+            total_nodes=8,
+            total_edges=3,
+            failed_documents=1,
+        )
+
+    async def test_flushes_each_batch_with_zero_interval(self):
+        store = MagicMock()
+        reporter = JobProgressReporter(store, "job-1", flush_interval_seconds=0)
+
+        batch = {"docs": 1, "total_nodes": 1, "total_edges": 0, "failed_docs": 0}
+        await reporter.record(batch)
+        await reporter.record(batch)
+
+        assert store.update_job.call_count == 2
+        await reporter.flush()  # 변경 없으면 쓰지 않음
+        assert store.update_job.call_count == 2
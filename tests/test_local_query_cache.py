@@ -0,0 +1,301 @@
+"""
+LocalQueryCache (L1) 및 QueryCacheRepository 연동/유지보수 단위 테스트
+
+실행: pytest tests/test_local_query_cache.py -v
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.repositories.local_query_cache import LocalQueryCache
+from src.repositories.query_cache_repository import CachedQuery, QueryCacheRepository
+
+
+def _cached(node_id: str, question: str = "Python 잘하는 사람은?") -> CachedQuery:
+    return CachedQuery(
+        id=node_id,
+        question=question,
+        cypher_query="MATCH (e:Employee) RETURN e",
+        cypher_parameters={},
+        created_at=datetime.now(UTC),
+        hit_count=0,
+        score=1.0,
+    )
+
+
+class TestLocalQueryCache:
+    """LocalQueryCache 테스트"""
+
+    def test_exact_match_ignores_case_and_spacing(self):
+        """정확 일치 키는 대소문자/연속 공백 무시"""
+        cache = LocalQueryCache()
+        cache.put(_cached("4:c:1", "Python  잘하는 사람은?"), [1.0, 0.0])
+
+        hit = cache.get_exact("python 잘하는 사람은?")
+
+        assert hit is not None
+        cached, embedding = hit
+        assert cached.id == "4:c:1"
+        assert embedding == [1.0, 0.0]
+
+    def test_find_similar_top1_with_threshold(self):
+        """코사인 top-1 검색 + 임계값 미만은 미스"""
+        cache = LocalQueryCache()
+        cache.put(_cached("4:c:1", "a"), [1.0, 0.0])
+        cache.put(_cached("4:c:2", "b"), [0.0, 1.0])
+
+        hit = cache.find_similar([0.1, 0.9], threshold=0.9)
+        assert hit is not None
+        assert hit.id == "4:c:2"
+        assert hit.score == pytest.approx(0.9939, abs=1e-3)
+
+        assert cache.find_similar([1.0, 1.0], threshold=0.9) is None
+        assert cache.get_stats()["vector_hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_lru_eviction_drops_question_keys(self):
+        """최대 크기 초과 시 가장 오래 사용하지 않은 항목 퇴출"""
+        cache = LocalQueryCache(max_entries=2)
+        cache.put(_cached("4:c:1", "a"), [1.0, 0.0])
+        cache.put(_cached("4:c:2", "b"), [0.0, 1.0])
+        cache.get_exact("a")  # 1번 최근 사용
+        cache.put(_cached("4:c:3", "c"), [1.0, 1.0])
+
+        assert len(cache) == 2
+        assert cache.get_exact("b") is None
+        assert cache.get_exact("a") is not None
+
+    def test_ttl_expiry(self):
+        """L2 만료 시각이 지난 항목은 조회되지 않음"""
+        cache = LocalQueryCache(ttl_seconds=600)
+        cache.put(_cached("4:c:1", "a"), [1.0, 0.0], expires_at=time.time() - 1)
+
+        assert cache.get_exact("a") is None
+        assert cache.find_similar([1.0, 0.0], threshold=0.5) is None
+        assert len(cache) == 0
+
+    def test_clear_and_discard(self):
+        """전체/단일 무효화"""
+        cache = LocalQueryCache()
+        cache.put(_cached("4:c:1", "a"), [1.0, 0.0])
+        cache.put(_cached("4:c:2", "b"), [0.0, 1.0])
+
+        cache.discard("4:c:1")
+        assert cache.get_exact("a") is None
+        assert cache.find_similar([1.0, 0.0], threshold=0.9) is None
+
+        assert cache.clear() == 1
+        assert len(cache) == 0
+
+
+class TestQueryCacheRepositoryLocal:
+    """QueryCacheRepository L1 연동 테스트"""
+
+    @pytest.fixture
+    def mock_client(self):
+        client = MagicMock()
+        client.create_vector_index = AsyncMock(return_value=True)
+        client.vector_search = AsyncMock(return_value=[])
+        client.execute_write = AsyncMock(return_value=[{"id": "4:c:1"}])
+        return client
+
+    @pytest.fixture
+    def settings(self):
+        settings = MagicMock()
+        settings.vector_similarity_threshold = 0.9
+        settings.query_cache_ttl_hours = 24
+        settings.embedding_dimensions = 2
+        settings.query_cache_local_enabled = True
+        settings.query_cache_local_max_entries = 16
+        settings.query_cache_local_ttl_seconds = 600
+        return settings
+
+    @pytest.fixture
+    def repo(self, mock_client, settings):
+        return QueryCacheRepository(mock_client, settings)
+
+    async def test_cache_query_populates_local(self, repo, mock_client):
+        """저장한 질문은 Neo4j 조회 없이 L1에서 히트"""
+        await repo.cache_query(
+            "Python 잘하는 사람은?", [1.0, 0.0], "MATCH (n) RETURN n"
+        )
+
+        exact = repo.find_cached_question("python 잘하는 사람은?")
+        similar = await repo.find_similar_query([0.99, 0.01])
+
+        assert exact is not None and exact[0].id == "4:c:1"
+        assert similar is not None and similar.id == "4:c:1"
+        mock_client.vector_search.assert_not_awaited()
+
+    async def test_exact_hit_records_hit_count(self, repo):
+        """L1 정확 일치 히트도 히트 카운트에 반영 (미스는 기록 안 함)"""
+        await repo.cache_query("질문", [1.0, 0.0], "MATCH (n) RETURN n")
+
+        assert repo.find_cached_question("질문") is not None
+        assert repo.find_cached_question("다른 질문") is None
+        assert repo._pending_hits == {"4:c:1": 1}
+
+    async def test_l2_hit_fills_local(self, repo, mock_client):
+        """L2 히트 결과는 L1에 채워져 다음 조회는 Neo4j 생략"""
+        mock_client.vector_search.return_value = [
+            {
+                "id": "4:c:9",
+                "score": 0.95,
+                "properties": {
+                    "question": "파이썬 전문가",
+                    "cypher_query": "MATCH (n) RETURN n",
+                    "cypher_parameters": "{}",
+                    "created_at": datetime.now(UTC).isoformat(),
+                },
+            }
+        ]
+
+        first = await repo.find_similar_query([1.0, 0.0], question="파이썬 고수")
+        second = repo.find_cached_question("파이썬 고수")
+
+        assert first is not None and first.id == "4:c:9"
+        assert second is not None and second[0].id == "4:c:9"
+        assert mock_client.vector_search.await_count == 1
+        # 임베딩 벡터는 반환받지 않음
+        projected = mock_client.vector_search.call_args.kwargs["properties"]
+        assert "embedding" not in projected
+
+    async def test_invalidate_cache_clears_local(self, repo, mock_client):
+        """invalidate_cache / invalidate_local 호출 시 L1 비움"""
+        await repo.cache_query("질문", [1.0, 0.0], "MATCH (n) RETURN n")
+        mock_client.execute_write.return_value = [{"deleted_count": 0}]
+
+        await repo.invalidate_cache()
+
+        assert repo.find_cached_question("질문") is None
+        assert repo.invalidate_local() == 0
+
+    async def test_local_disabled(self, mock_client, settings):
+        """L1 비활성화 시 항상 Neo4j 조회"""
+        settings.query_cache_local_enabled = False
+        repo = QueryCacheRepository(mock_client, settings)
+        await repo.cache_query("질문", [1.0, 0.0], "MATCH (n) RETURN n")
+
+        assert repo.find_cached_question("질문") is None
+        await repo.find_similar_query([1.0, 0.0])
+        mock_client.vector_search.assert_awaited_once()
+
+
+class TestQueryCacheMaintenance:
+    """히트 카운트 지연 반영 + 만료 정리 테스트"""
+
+    @pytest.fixture
+    def mock_client(self):
+        client = MagicMock()
+        client.create_vector_index = AsyncMock(return_value=True)
+        client.vector_search = AsyncMock(return_value=[])
+        client.execute_write = AsyncMock(return_value=[])
+        return client
+
+    @pytest.fixture
+    def repo(self, mock_client):
+        settings = MagicMock()
+        settings.vector_similarity_threshold = 0.9
+        settings.query_cache_ttl_hours = 24
+        settings.embedding_dimensions = 2
+        settings.query_cache_local_enabled = False
+        return QueryCacheRepository(mock_client, settings)
+
+    @staticmethod
+    def _vector_hit(created_at: datetime) -> list[dict]:
+        return [
+            {
+                "id": "4:c:1",
+                "score": 0.95,
+                "properties": {
+                    "question": "q",
+                    "cypher_query": "MATCH (n) RETURN n",
+                    "cypher_parameters": "{}",
+                    "created_at": created_at.isoformat(),
+                },
+            }
+        ]
+
+    async def test_hits_are_buffered_and_flushed_with_unwind(self, repo, mock_client):
+        """히트는 요청 경로에서 쓰지 않고 flush 시 UNWIND 1회로 반영"""
+        mock_client.vector_search.return_value = self._vector_hit(datetime.now(UTC))
+        await repo.find_similar_query([1.0, 0.0])
+        await repo.find_similar_query([1.0, 0.0])
+        writes_before_flush = mock_client.execute_write.await_count
+
+        flushed = await repo.flush_hit_counts()
+
+        assert flushed == 1
+        assert mock_client.execute_write.await_count == writes_before_flush + 1
+        query, params = mock_client.execute_write.call_args[0]
+        assert "UNWIND $hits" in query
+        assert params == {"hits": [{"id": "4:c:1", "count": 2}]}
+        assert await repo.flush_hit_counts() == 0
+
+    async def test_flush_failure_keeps_counts(self, repo, mock_client):
+        """flush 실패 시 다음 flush에서 재시도"""
+        repo._record_hit("4:c:1")
+        mock_client.execute_write.side_effect = Exception("write failed")
+        assert await repo.flush_hit_counts() == 0
+
+        mock_client.execute_write.side_effect = None
+        repo._record_hit("4:c:1")
+        await repo.flush_hit_counts()
+
+        _, params = mock_client.execute_write.call_args[0]
+        assert params == {"hits": [{"id": "4:c:1", "count": 2}]}
+
+    async def test_flush_cancel_keeps_counts(self, repo, mock_client):
+        """flush 중 취소되어도 스냅샷이 버퍼로 돌아와 다음 flush에서 반영"""
+        repo._record_hit("4:c:1")
+        mock_client.execute_write.side_effect = asyncio.CancelledError()
+        with pytest.raises(asyncio.CancelledError):
+            await repo.flush_hit_counts()
+
+        mock_client.execute_write.side_effect = None
+        repo._record_hit("4:c:1")
+        assert await repo.flush_hit_counts() == 1
+
+        _, params = mock_client.execute_write.call_args[0]
+        assert params == {"hits": [{"id": "4:c:1", "count": 2}]}
+
+    async def test_expired_hit_is_miss_without_write(self, repo, mock_client):
+        """만료 항목은 미스 처리만 하고 삭제는 백그라운드에 맡김"""
+        mock_client.vector_search.return_value = self._vector_hit(
+            datetime(2000, 1, 1, tzinfo=UTC)
+        )
+        await repo.ensure_index()
+        writes_after_index = mock_client.execute_write.await_count
+
+        assert await repo.find_similar_query([1.0, 0.0]) is None
+        assert mock_client.execute_write.await_count == writes_after_index
+        assert repo._pending_hits == {}
+
+    async def test_purge_expired_deletes_in_batches(self, repo, mock_client):
+        """배치가 가득 차면 다음 배치를 이어서 삭제"""
+        mock_client.execute_write.side_effect = [
+            [{"deleted_count": 2}],
+            [{"deleted_count": 1}],
+        ]
+
+        deleted = await repo.purge_expired(batch_size=2)
+
+        assert deleted == 3
+        query, params = mock_client.execute_write.call_args[0]
+        assert "c.created_at < datetime($cutoff)" in query
+        assert params["batch_size"] == 2
+
+    async def test_stop_maintenance_flushes_pending_hits(self, repo, mock_client):
+        """유지보수 태스크 중지 시 남은 히트 카운트 반영"""
+        repo.start_maintenance(interval_seconds=3600)
+        repo._record_hit("4:c:1")
+
+        await repo.stop_maintenance()
+
+        assert repo._maintenance_task is None
+        assert repo._pending_hits == {}
+        assert "UNWIND $hits" in mock_client.execute_write.call_args[0][0]
@@ -5,6 +5,7 @@ Neo4j 클라이언트 테스트
     pytest tests/test_neo4j_client.py -v
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -141,6 +142,111 @@ class TestGetSchemaInfoUnit:
         # 인트로스펙션 실패 시 nodes/relationships 없음
         assert "nodes" not in schema
 
+    @pytest.mark.asyncio
+    async def test_schema_info_uses_schema_procedures_with_bounded_concurrency(self):
+        """db.schema 프로시저로 속성 조회 + 동시 실행 쿼리 수 제한"""
+        client = Neo4jClient(
+            uri="bolt://localhost:7687",
+            user="neo4j",
+            password="test",
+        )
+
+        in_flight = 0
+        max_in_flight = 0
+        queries: list[str] = []
+
+        async def mock_execute_query(query, parameters=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            queries.append(query)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "db.labels" in query:
+                return [{"label": "Employee"}, {"label": "Project"}]
+            if "db.relationshipTypes" in query:
+                return [{"relationshipType": "WORKS_ON"}]
+            if "nodeTypeProperties" in query:
+                return [
+                    {"nodeLabels": ["Employee"], "propertyName": "name"},
+                    {"nodeLabels": ["Employee"], "propertyName": "job_type"},
+                    {"nodeLabels": ["Project"], "propertyName": "status"},
+                ]
+            if "relTypeProperties" in query:
+                return [{"relType": ":`WORKS_ON`", "propertyName": "role"}]
+            if "job_type" in query:
+                return [{"vals": ["개발", "기획"], "cnt": 2}]
+            return []
+
+        client.execute_query = mock_execute_query
+
+        schema = await client.get_schema_info(max_concurrency=2)
+
+        employee = next(n for n in schema["nodes"] if n["label"] == "Employee")
+        assert employee["properties"] == [
+            {"name": "name"},
+            {"name": "job_type", "sample_values": ["개발", "기획"]},
+        ]
+        assert schema["relationships"][0]["properties"] == [{"name": "role"}]
+        # 레이블별 keys() 스캔 생략, 값 샘플링은 LIMIT 스캔
+        assert not any("keys(" in q for q in queries)
+        assert all("LIMIT" in q for q in queries if "IS NOT NULL" in q)
+        assert max_in_flight <= 2
+
+
+class TestVectorSearchUnit:
+    """vector_search 속성 프로젝션 / 레이블 필터 단위 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        client = Neo4jClient(uri="bolt://localhost:7687", user="neo4j", password="t")
+        client.execute_query = AsyncMock(
+            return_value=[
+                {
+                    "id": "4:x:1",
+                    "labels": ["Skill"],
+                    "properties": {"name": "Python", "embedding": None},
+                    "score": 0.95,
+                }
+            ]
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_excludes_vector_properties_by_default(self, client):
+        results = await client.vector_search("idx", [0.1, 0.2], limit=3)
+
+        query, params = client.execute_query.call_args.args
+        assert "properties(node)" not in query
+        assert "node {.*, `embedding`: null}" in query
+        assert params["candidate_limit"] == params["limit"] == 3
+        assert results[0]["properties"] == {"name": "Python"}
+
+    @pytest.mark.asyncio
+    async def test_property_projection(self, client):
+        await client.vector_search("idx", [0.1], properties=["question", "hit_count"])
+
+        query = client.execute_query.call_args.args[0]
+        assert "node {.`question`, .`hit_count`}" in query
+
+    @pytest.mark.asyncio
+    async def test_label_filter_pushed_into_cypher(self, client):
+        await client.vector_search(
+            "idx", [0.1], limit=2, threshold=0.8, labels=["Skill", "Concept"]
+        )
+
+        query, params = client.execute_query.call_args.args
+        assert "score >= $threshold AND any(label IN labels(node)" in query
+        assert "LIMIT $limit" in query
+        assert params["labels"] == ["Skill", "Concept"]
+        assert params["candidate_limit"] > params["limit"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_identifier_rejected(self, client):
+        with pytest.raises(ValueError):
+            await client.vector_search("idx", [0.1], labels=["Skill`) DETACH"])
+        client.execute_query.assert_not_awaited()
+
 
 class TestTransactionScope:
     """TransactionScope 단위 테스트"""
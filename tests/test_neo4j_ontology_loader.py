@@ -150,45 +150,84 @@ class TestNeo4jOntologyLoader:
 
     @pytest.mark.asyncio
     async def test_expand_concept_success(self, loader, mock_client):
-        """개념 확장 성공"""
-        # expand_concept은 내부적으로 여러 쿼리를 호출함:
-        # 1. get_canonical -> canonical_name 반환
-        # 2. get_synonyms_with_weights -> canonical, synonyms 반환
-        # 3. get_children -> children 반환
-        mock_client.execute_query.side_effect = [
-            # get_canonical 응답
-            [{"canonical_name": "Python"}],
-            # get_synonyms_with_weights 응답
-            [
-                {
-                    "canonical": "Python",
-                    "synonyms": [
-                        {"name": "파이썬", "weight": 1.0},
-                        {"name": "Python3", "weight": 0.8},
-                    ],
-                }
-            ],
-            # get_children 응답
-            [{"children": ["Django", "FastAPI"]}],
+        """개념 확장 성공 - canonical/동의어/하위 개념을 쿼리 1회로 조회"""
+        mock_client.execute_query.return_value = [
+            {
+                "term": "파이썬",
+                "canonical": "Python",
+                "synonyms": ["Python", "파이썬", "Python3"],
+                "children": ["Django", "FastAPI"],
+            }
         ]
 
         result = await loader.expand_concept("파이썬", "skills")
 
-        assert "파이썬" in result
-        assert "Python" in result
-        assert len(result) <= 15  # default max_total
+        assert result == ["파이썬", "Python", "Python3", "Django", "FastAPI"]
+        mock_client.execute_query.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_expand_concept_with_config(self, loader, mock_client):
         """config 적용 확장"""
         mock_client.execute_query.return_value = [
-            {"expanded": ["파이썬", "Python", "Python3"]}
+            {
+                "term": "파이썬",
+                "canonical": "Python",
+                "synonyms": ["Python", "Python3", "Py"],
+                "children": ["Django"],
+            }
         ]
 
         config = ExpansionConfig(max_synonyms=2, max_children=0, max_total=3)
         result = await loader.expand_concept("파이썬", "skills", config)
 
-        assert len(result) <= 3
+        assert result == ["파이썬", "Python", "Python3"]
+
+    @pytest.mark.asyncio
+    async def test_expand_concepts_single_query_and_cache(self, loader, mock_client):
+        """여러 용어 일괄 확장 - 미스 용어만 UNWIND 1회 조회, 이후 캐시 히트"""
+        mock_client.execute_query.return_value = [
+            {"term": "파이썬", "canonical": "Python", "synonyms": [], "children": []},
+            {"term": "Backend", "canonical": None, "synonyms": [], "children": ["Go"]},
+        ]
+
+        first = await loader.expand_concepts(["파이썬", "Backend"], "skills")
+        second = await loader.expand_concepts(["Backend", "파이썬"], "skills")
+
+        assert first == {"파이썬": ["파이썬", "Python"], "Backend": ["Backend", "Go"]}
+        assert second == first
+        query, params = mock_client.execute_query.call_args[0]
+        assert "UNWIND $terms AS term" in query
+        assert params == {"terms": ["파이썬", "Backend"]}
+        mock_client.execute_query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_bumps_version(self, loader, mock_client):
+        """clear_cache() 후에는 재조회"""
+        mock_client.execute_query.return_value = [
+            {"term": "Go", "canonical": "Go", "synonyms": ["Go"], "children": []}
+        ]
+        await loader.expand_concept("Go", "skills")
+
+        await loader.clear_cache()
+        await loader.expand_concept("Go", "skills")
+
+        assert loader.cache_version == 1
+        assert mock_client.execute_query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_during_query_skips_caching(self, loader, mock_client):
+        """조회 중 캐시가 무효화되면 이전 결과를 저장하지 않음"""
+
+        async def execute_and_refresh(*args, **kwargs):
+            await loader.clear_cache()
+            return [{"term": "Go", "canonical": "Go", "synonyms": [], "children": []}]
+
+        mock_client.execute_query.side_effect = execute_and_refresh
+
+        await loader.expand_concept("Go", "skills")
+        await loader.expand_concept("Go", "skills")
+
+        assert mock_client.execute_query.call_count == 2
 
     @pytest.mark.asyncio
     async def test_expand_concept_query_error(self, loader, mock_client):
@@ -378,14 +417,13 @@ class TestHybridOntologyLoader:
         """Neo4j 모드 - expand_concept"""
         from src.domain.ontology.hybrid_loader import HybridOntologyLoader
 
-        # expand_concept은 내부적으로 여러 쿼리를 호출함
-        mock_neo4j_client.execute_query.side_effect = [
-            # get_canonical 응답
-            [{"canonical_name": "Python"}],
-            # get_synonyms_with_weights 응답
-            [{"canonical": "Python", "synonyms": [{"name": "파이썬", "weight": 1.0}]}],
-            # get_children 응답
-            [{"children": []}],
+        mock_neo4j_client.execute_query.return_value = [
+            {
+                "term": "파이썬",
+                "canonical": "Python",
+                "synonyms": ["Python", "파이썬"],
+                "children": [],
+            }
         ]
 
         loader = HybridOntologyLoader(neo4j_client=mock_neo4j_client, mode="neo4j")
@@ -424,6 +462,30 @@ class TestHybridOntologyLoader:
         # YAML 폴백으로 정상 결과
         assert result == "Python"
 
+    @pytest.mark.asyncio
+    async def test_hybrid_mode_expand_concepts_partial_fallback(
+        self, mock_neo4j_client
+    ):
+        """하이브리드 모드 - 확장 결과 없는 용어만 YAML로 폴백"""
+        from src.domain.ontology.hybrid_loader import HybridOntologyLoader
+
+        mock_neo4j_client.execute_query.return_value = [
+            {
+                "term": "Go",
+                "canonical": "Go",
+                "synonyms": ["Go", "Golang"],
+                "children": [],
+            },
+            {"term": "파이썬", "canonical": None, "synonyms": [], "children": []},
+        ]
+
+        loader = HybridOntologyLoader(neo4j_client=mock_neo4j_client, mode="hybrid")
+        result = await loader.expand_concepts(["Go", "파이썬"], "skills")
+
+        assert result["Go"] == ["Go", "Golang"]
+        assert "Python" in result["파이썬"]  # YAML 폴백
+        mock_neo4j_client.execute_query.assert_called_once()
+
     # -------------------------------------------------------------------------
     # health_check 테스트
     # -------------------------------------------------------------------------
@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.domain.constants import name_norm_match, normalize_name
 from src.domain.exceptions import (
     EntityNotFoundError,
     QueryExecutionError,
@@ -121,6 +122,104 @@ class TestSchemaCaching:
         assert mock_client.get_schema_info.call_count == 2
 
 
+class TestSchemaSnapshot:
+    """스키마 스냅샷 파일 저장/로드 테스트"""
+
+    @pytest.fixture
+    def mock_client(self):
+        client = MagicMock()
+        client.get_schema_info = AsyncMock(
+            return_value={"node_labels": ["Employee"], "relationship_types": []}
+        )
+        return client
+
+    @pytest.fixture
+    def snapshot_path(self, tmp_path):
+        return str(tmp_path / "schema_snapshot.json")
+
+    def _repo(self, client, path):
+        from src.repositories.neo4j_schema_repository import Neo4jSchemaRepository
+
+        return Neo4jSchemaRepository(client, snapshot_path=path)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_round_trip_skips_introspection(
+        self, mock_client, snapshot_path
+    ):
+        """DB 조회 결과가 스냅샷으로 저장되고 다음 기동은 DB 조회 없이 로드"""
+        await self._repo(mock_client, snapshot_path).get_schema()
+
+        restarted = self._repo(mock_client, snapshot_path)
+        schema = await restarted.load_schema_snapshot()
+        await restarted.get_schema()
+
+        assert schema == {"node_labels": ["Employee"], "relationship_types": []}
+        assert mock_client.get_schema_info.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_tampered_snapshot_is_ignored(self, mock_client, snapshot_path):
+        """fingerprint 불일치 스냅샷은 무시"""
+        import json
+        from pathlib import Path
+
+        await self._repo(mock_client, snapshot_path).get_schema()
+        payload = json.loads(Path(snapshot_path).read_text(encoding="utf-8"))
+        payload["schema"]["node_labels"] = ["Tampered"]
+        Path(snapshot_path).write_text(json.dumps(payload), encoding="utf-8")
+
+        assert (
+            await self._repo(mock_client, snapshot_path).load_schema_snapshot() is None
+        )
+
+    def test_concurrent_snapshot_writes_stay_valid(self, mock_client, snapshot_path):
+        """동시 저장 시 워커별 임시 파일 사용 → 스냅샷은 항상 완전한 JSON"""
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+        from pathlib import Path
+
+        repos = [self._repo(mock_client, snapshot_path) for _ in range(8)]
+        schemas = [{"node_labels": [f"L{i}"] * 2000} for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(5):
+                list(
+                    pool.map(
+                        lambda args: args[0]._write_snapshot_file(args[1], "fp"),
+                        zip(repos, schemas, strict=True),
+                    )
+                )
+
+        payload = json.loads(Path(snapshot_path).read_text(encoding="utf-8"))
+        assert payload["schema"] in schemas
+        assert list(Path(snapshot_path).parent.iterdir()) == [Path(snapshot_path)]
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_reports_changes(self, mock_client, snapshot_path):
+        """백그라운드 갱신 시 스키마가 바뀌었으면 콜백 호출 + 스냅샷 갱신"""
+        await self._repo(mock_client, snapshot_path).get_schema()
+        repo = self._repo(mock_client, snapshot_path)
+        await repo.load_schema_snapshot()
+
+        changed = {"node_labels": ["Employee", "Skill"], "relationship_types": []}
+        mock_client.get_schema_info.return_value = changed
+        on_change = MagicMock()
+        await repo.refresh_schema_in_background(on_change)
+
+        on_change.assert_called_once_with(changed)
+        reloaded = await self._repo(mock_client, snapshot_path).load_schema_snapshot()
+        assert reloaded == changed
+
+    @pytest.mark.asyncio
+    async def test_unchanged_schema_does_not_notify(self, mock_client, snapshot_path):
+        await self._repo(mock_client, snapshot_path).get_schema()
+        repo = self._repo(mock_client, snapshot_path)
+        await repo.load_schema_snapshot()
+
+        on_change = MagicMock()
+        await repo.refresh_schema_in_background(on_change)
+
+        on_change.assert_not_called()
+
+
 class TestEntityOperations:
     """엔티티 조회 연산 테스트"""
 
@@ -196,6 +295,84 @@ class TestEntityOperations:
         with pytest.raises(ValidationError):
             await repo.find_entities_by_name("test", labels=["Employee; DROP DATABASE"])
 
+    @pytest.mark.asyncio
+    async def test_find_entities_by_names_single_round_trip(self, repo, mock_client):
+        """일괄 이름 검색 - 레이블이 달라도 쿼리 1회"""
+        mock_client.execute_query.return_value = [
+            {
+                "idx": 1,
+                "best": [
+                    {
+                        "id": "4:abc123:2",
+                        "labels": ["Skill"],
+                        "properties": {"name": "Python"},
+                    }
+                ],
+            }
+        ]
+
+        results = await repo.find_entities_by_names(
+            [("Employee", "홍길동"), ("Skill", "python"), (None, "AI 연구소")]
+        )
+
+        assert mock_client.execute_query.await_count == 1
+        query, params = mock_client.execute_query.call_args[0]
+        assert "UNWIND $items_0" in query
+        assert "UNION ALL" in query
+        assert ":Employee" in query and ":Skill" in query
+        assert {"items_0", "items_1", "items_2"} <= params.keys()
+
+        assert results[("Employee", "홍길동")] == []
+        assert results[(None, "AI 연구소")] == []
+        assert results[("Skill", "python")][0].properties["name"] == "Python"
+
+    @pytest.mark.asyncio
+    async def test_find_entities_by_names_dedup_and_empty(self, repo, mock_client):
+        """일괄 이름 검색 - 중복 입력 제거, 빈 입력은 쿼리 생략"""
+        mock_client.execute_query.return_value = []
+
+        assert await repo.find_entities_by_names([]) == {}
+        mock_client.execute_query.assert_not_awaited()
+
+        results = await repo.find_entities_by_names(
+            [("Skill", "Python"), ("Skill", "Python")]
+        )
+        _, params = mock_client.execute_query.call_args[0]
+        assert len(params["items_0"]) == 1
+        assert list(results) == [("Skill", "Python")]
+
+    @pytest.mark.asyncio
+    async def test_find_entities_by_names_injection_blocked(self, repo, mock_client):
+        """일괄 이름 검색 시 레이블 Injection 차단"""
+        with pytest.raises(ValidationError):
+            await repo.find_entities_by_names([("Employee; DROP DATABASE", "test")])
+
+    @pytest.mark.asyncio
+    async def test_entity_lookups_exclude_embeddings(self, repo, mock_client):
+        """조회 결과에 임베딩 벡터/텍스트 미포함 (DB 프로젝션 + 키 제거)"""
+        mock_client.execute_query.return_value = [
+            {
+                "id": "4:abc123:1",
+                "labels": ["Skill"],
+                "properties": {
+                    "name": "Python",
+                    "embedding": None,
+                    "embedding_text": None,
+                },
+            }
+        ]
+
+        by_id = await repo.find_entity_by_id("4:abc123:1")
+        by_name = await repo.find_entities_by_name("Python")
+
+        query = mock_client.execute_query.call_args[0][0]
+        assert "properties(n)" not in query
+        assert "`embedding`: null" in query
+        for node in (by_id, by_name[0]):
+            assert "embedding" not in node.properties
+            assert "embedding_text" not in node.properties
+            assert node.properties["name"] == "Python"
+
 
 class TestCypherExecution:
     """Cypher 쿼리 실행 테스트"""
@@ -286,3 +463,175 @@ class TestNeighborOperations:
         """유효하지 않은 방향 값"""
         with pytest.raises(ValidationError):
             await repo.get_neighbors(entity_id="4:abc123:1", direction="invalid")
+
+
+class TestNameNorm:
+    """name_norm 정규화/인덱스/백필 테스트"""
+
+    @pytest.fixture
+    def mock_client(self):
+        client = MagicMock()
+        client.execute_query = AsyncMock(return_value=[{"updated": 3}])
+        client.execute_write = AsyncMock(return_value=[])
+        return client
+
+    @pytest.fixture
+    def repo(self, mock_client):
+        return Neo4jRepository(mock_client)
+
+    def test_normalize_name(self):
+        """소문자 + 공백 제거 (trim 포함)"""
+        assert normalize_name("  AI 연구소 ") == "ai연구소"
+        assert normalize_name("React Native") == normalize_name("reactnative")
+
+    def test_name_norm_match_uses_property(self):
+        """조회 조건이 name_norm 속성을 직접 비교 (인덱스 사용 가능)"""
+        clause = name_norm_match("s", "skill_name")
+        assert clause.startswith("s.name_norm = ")
+        assert "$skill_name" in clause
+
+    @pytest.mark.asyncio
+    async def test_ensure_name_norm_indexes(self, repo, mock_client):
+        """레이블별 range 인덱스 생성"""
+        created = await repo.ensure_name_norm_indexes(("Employee", "Concept"))
+
+        assert created == ["employee_name_norm_idx", "concept_name_norm_idx"]
+        queries = [c[0][0] for c in mock_client.execute_write.call_args_list]
+        assert "FOR (n:Employee) ON (n.name_norm)" in queries[0]
+        assert "IF NOT EXISTS" in queries[1]
+
+    @pytest.mark.asyncio
+    async def test_backfill_name_norm(self, repo, mock_client):
+        """불일치 노드만 배치 트랜잭션으로 갱신"""
+        updated = await repo.backfill_name_norm("Skill", batch_size=500)
+
+        assert updated == 3
+        query, params = mock_client.execute_query.call_args[0]
+        assert "MATCH (n:Skill)" in query
+        assert "IN TRANSACTIONS OF $batch_size ROWS" in query
+        assert params == {"batch_size": 500}
+
+    @pytest.mark.asyncio
+    async def test_backfill_once_skips_completed_labels(self, repo, mock_client):
+        """마커에 완료 기록된 레이블은 전체 스캔 백필을 건너뜀"""
+        mock_client.execute_query.return_value = [{"labels": ["Employee", "Skill"]}]
+
+        stats = await repo.backfill_name_norm_once(("Employee", "Skill"))
+
+        assert stats == {}
+        assert mock_client.execute_query.await_count == 1
+        mock_client.execute_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_backfill_once_runs_pending_labels_and_marks(self, repo, mock_client):
+        """미완료 레이블만 백필 후 마커에 기록"""
+        mock_client.execute_query.side_effect = [
+            [{"labels": ["Employee"]}],
+            [{"updated": 7}],
+        ]
+
+        stats = await repo.backfill_name_norm_once(("Employee", "Skill"))
+
+        assert stats == {"Skill": 7}
+        backfill_query = mock_client.execute_query.call_args_list[1][0][0]
+        assert "MATCH (n:Skill)" in backfill_query
+        marker_query, params = mock_client.execute_write.call_args[0]
+        assert "MERGE (m:SchemaMigration" in marker_query
+        assert params["labels"] == ["Skill"]
+
+    @pytest.mark.asyncio
+    async def test_backfill_name_norm_injection_blocked(self, repo):
+        """백필 레이블 Injection 차단"""
+        with pytest.raises(ValidationError):
+            await repo.backfill_name_norm("Skill) DETACH DELETE (n")
+
+    @pytest.mark.asyncio
+    async def test_create_and_update_node_maintain_name_norm(self, repo, mock_client):
+        """그래프 편집 시 name_norm 유지"""
+        mock_client.execute_write.return_value = [{"id": "4:abc:1"}]
+
+        await repo.create_node_generic("Skill", {"name": "Python"})
+        await repo.update_node_properties("4:abc:1", {"name": "Python 3"})
+
+        create_query = mock_client.execute_write.call_args_list[0][0][0]
+        update_query = mock_client.execute_write.call_args_list[1][0][0]
+        assert "n.name_norm = replace(toLower(trim(n.name))" in create_query
+        assert "n.name_norm = replace(toLower(trim(n.name))" in update_query
+
+    @pytest.mark.asyncio
+    async def test_create_and_update_node_exclude_embeddings(self, repo, mock_client):
+        """그래프 편집 응답에 임베딩 벡터/텍스트 미포함"""
+        mock_client.execute_write.return_value = [
+            {
+                "id": "4:abc:1",
+                "labels": ["Skill"],
+                "properties": {
+                    "name": "Python",
+                    "embedding": None,
+                    "embedding_text": None,
+                },
+            }
+        ]
+
+        created = await repo.create_node_generic("Skill", {"name": "Python"})
+        updated = await repo.update_node_properties("4:abc:1", {"name": "Python"})
+
+        for call in mock_client.execute_write.call_args_list:
+            assert "properties(n)" not in call[0][0]
+            assert "`embedding_text`: null" in call[0][0]
+        for node in (created, updated):
+            assert node["properties"] == {"name": "Python"}
+
+
+class TestSkillChangeMarker:
+    """HAS_SKILL 편집 시 skills_changed_at 기록 (증분 커뮤니티 리프레시용)"""
+
+    @pytest.fixture
+    def mock_client(self):
+        client = MagicMock()
+        client.execute_write = AsyncMock(return_value=[{"id": "5:abc:1"}])
+        return client
+
+    @pytest.fixture
+    def repo(self, mock_client):
+        return Neo4jRepository(mock_client)
+
+    @pytest.mark.asyncio
+    async def test_has_skill_edge_marks_in_same_write(self, repo, mock_client):
+        """HAS_SKILL 생성은 관계 쓰기와 같은 쿼리에서 마커 갱신"""
+        await repo.create_relationship_generic("4:abc:0", "4:abc:1", "HAS_SKILL")
+        await repo.create_relationship_generic("4:abc:0", "4:abc:2", "WORKS_ON")
+
+        skill_query = mock_client.execute_write.call_args_list[0][0][0]
+        other_query = mock_client.execute_write.call_args_list[1][0][0]
+        assert mock_client.execute_write.await_count == 2
+        assert "SET src.skills_changed_at = datetime()" in skill_query
+        assert "skills_changed_at" not in other_query
+
+    @pytest.mark.asyncio
+    async def test_delete_relationship_marks_has_skill_source(self, repo, mock_client):
+        """삭제 쿼리는 HAS_SKILL일 때만 소스 노드 마커 갱신 (단일 쓰기)"""
+        assert await repo.delete_relationship_generic("5:abc:1") is True
+
+        query = mock_client.execute_write.call_args[0][0]
+        assert mock_client.execute_write.await_count == 1
+        assert "type(r) = 'HAS_SKILL'" in query
+        assert "SET src.skills_changed_at = datetime()" in query
+        assert query.index("skills_changed_at") < query.index("DELETE r")
+
+    @pytest.mark.asyncio
+    async def test_force_delete_marks_skill_holders(self, repo, mock_client):
+        """강제 삭제는 DETACH 전에 HAS_SKILL 보유 노드 마커 갱신 (일반 삭제는 그대로)"""
+        mock_client.execute_write.return_value = [{"deleted": True, "rel_count": 0}]
+
+        await repo.delete_node_generic("4:abc:1", force=True)
+        await repo.delete_node_atomic("4:abc:1", force=True)
+        await repo.delete_node_generic("4:abc:1")
+
+        calls = mock_client.execute_write.call_args_list
+        for call in calls[:2]:
+            query = call[0][0]
+            assert "(holder)-[:HAS_SKILL]->(n)" in query
+            assert "SET h.skills_changed_at = datetime()" in query
+            assert query.index("skills_changed_at") < query.index("DETACH DELETE n")
+        assert "skills_changed_at" not in calls[2][0][0]
@@ -9,6 +9,7 @@ from src.graph.nodes.graph_executor import GraphExecutorNode
 from src.graph.nodes.response_generator import ResponseGeneratorNode
 from src.graph.state import GraphRAGState
 from src.repositories.neo4j_repository import Neo4jRepository
+from src.repositories.neo4j_types import NodeResult
 
 
 class TestEntityResolverNode:
@@ -18,7 +19,7 @@ class TestEntityResolverNode:
     def mock_neo4j(self):
         """Mock Neo4j Repository"""
         neo4j = MagicMock(spec=Neo4jRepository)
-        neo4j.find_entities_by_name = AsyncMock()
+        neo4j.find_entities_by_names = AsyncMock()
         return neo4j
 
     @pytest.fixture
@@ -33,7 +34,9 @@ class TestEntityResolverNode:
         mock_match.id = 123
         mock_match.labels = ["Employee"]
         mock_match.properties = {"name": "홍길동", "dept": "IT"}
-        mock_neo4j.find_entities_by_name.return_value = [mock_match]
+        mock_neo4j.find_entities_by_names.return_value = {
+            ("Employee", "홍길동"): [mock_match]
+        }
 
         state: GraphRAGState = {
             "entities": {"Employee": ["홍길동"]},
@@ -58,7 +61,7 @@ class TestEntityResolverNode:
     @pytest.mark.asyncio
     async def test_resolve_not_found(self, node, mock_neo4j):
         """엔티티 못 찾음"""
-        mock_neo4j.find_entities_by_name.return_value = []
+        mock_neo4j.find_entities_by_names.return_value = {}
 
         state: GraphRAGState = {
             "entities": {"Employee": ["없는사람"]},
@@ -84,7 +87,7 @@ class TestEntityResolverNode:
     @pytest.mark.asyncio
     async def test_resolve_error(self, node, mock_neo4j):
         """리졸브 에러"""
-        mock_neo4j.find_entities_by_name.side_effect = Exception("DB Error")
+        mock_neo4j.find_entities_by_names.side_effect = Exception("DB Error")
 
         state: GraphRAGState = {
             "entities": {"Employee": ["에러유발"]},
@@ -98,6 +101,103 @@ class TestEntityResolverNode:
         assert "entity_resolver" in result["execution_path"]
 
 
+class TestEntityResolverVectorFallback:
+    """문자열 매칭 실패 시 벡터 유사도 폴백 테스트"""
+
+    @pytest.fixture
+    def mock_neo4j(self):
+        neo4j = MagicMock(spec=Neo4jRepository)
+        neo4j.find_entities_by_names = AsyncMock(return_value={})
+        neo4j.vector_search_nodes = AsyncMock(return_value=[])
+        return neo4j
+
+    @pytest.fixture
+    def embedder(self):
+        embedder = MagicMock()
+        embedder.get_embeddings = AsyncMock(
+            side_effect=lambda texts: [[0.1, 0.2] for _ in texts]
+        )
+        return embedder
+
+    @pytest.fixture
+    def node(self, mock_neo4j, embedder):
+        return EntityResolverNode(mock_neo4j, embedder=embedder, vector_threshold=0.9)
+
+    @staticmethod
+    def _match(node_id: str, name: str, label: str = "Employee") -> NodeResult:
+        return NodeResult(id=node_id, labels=[label], properties={"name": name})
+
+    @pytest.mark.asyncio
+    async def test_misspelled_name_resolved_by_vector(self, node, mock_neo4j):
+        mock_neo4j.vector_search_nodes.return_value = [
+            (self._match("e1", "홍길동"), 0.95)
+        ]
+
+        result = await node(
+            GraphRAGState(question="홍길도 스킬", entities={"Employee": ["홍길도"]})
+        )
+
+        assert result["unresolved_entities"] == []
+        assert result["resolved_entities"][0]["match_score"] == 0.95
+        assert result["entities"] == {"Employee": ["홍길동"]}
+        args, kwargs = mock_neo4j.vector_search_nodes.call_args
+        assert args[1] == "employee_embedding"
+        assert kwargs["threshold"] == 0.9
+
+    @pytest.mark.asyncio
+    async def test_string_match_skips_vector_tier(self, node, mock_neo4j, embedder):
+        mock_neo4j.find_entities_by_names.return_value = {
+            ("Employee", "홍길동"): [self._match("e1", "홍길동")]
+        }
+
+        await node(GraphRAGState(entities={"Employee": ["홍길동"]}))
+
+        embedder.get_embeddings.assert_not_awaited()
+        mock_neo4j.vector_search_nodes.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_type_searches_all_indexes(self, node, mock_neo4j):
+        """Unknown 타입은 모든 엔티티 인덱스 중 최고 점수 사용"""
+
+        async def search(embedding, index_name, **kwargs):
+            if index_name == "skill_embedding":
+                return [(self._match("s1", "Kubernetes", "Skill"), 0.93)]
+            if index_name == "project_embedding":
+                return [(self._match("p1", "K8s 전환", "Project"), 0.91)]
+            return []
+
+        mock_neo4j.vector_search_nodes.side_effect = search
+
+        result = await node(GraphRAGState(entities={"Unknown": ["쿠버네티스"]}))
+
+        assert mock_neo4j.vector_search_nodes.await_count == 4
+        assert result["resolved_entities"][0]["id"] == "s1"
+
+    @pytest.mark.asyncio
+    async def test_vector_failure_keeps_unresolved(self, node, mock_neo4j):
+        mock_neo4j.vector_search_nodes.side_effect = Exception("no such index")
+
+        result = await node(GraphRAGState(entities={"Skill": ["파이선"]}))
+
+        assert result["resolved_entities"] == []
+        assert result["unresolved_entities"][0]["term"] == "파이선"
+
+    @pytest.mark.asyncio
+    async def test_only_original_values_use_vector(self, node, mock_neo4j, embedder):
+        """개념 확장 값은 폴백 대상이 아니며, 원본당 1회만 임베딩"""
+        await node(
+            GraphRAGState(
+                entities={"Skill": ["파이선"]},
+                original_entities={"Skill": ["파이선"]},
+                expanded_entities_by_original={
+                    "Skill": {"파이선": ["파이선", "Python3", "Py"]}
+                },
+            )
+        )
+
+        embedder.get_embeddings.assert_awaited_once_with(["파이선"])
+
+
 class TestCypherGeneratorNode:
     """CypherGeneratorNode 테스트"""
 
@@ -166,6 +166,28 @@ class TestOntologyRegistryHybridRefresh:
         assert result is True
         neo4j_loader.clear_cache.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_refresh_invalidates_expansion_cache(self, hybrid_registry):
+        """refresh 후 Neo4j 개념 확장 캐시 버전 증가 + 비움"""
+        neo4j_loader = hybrid_registry.get_loader()._neo4j_loader
+        neo4j_loader._client.execute_query = AsyncMock(
+            return_value=[
+                {
+                    "term": "Go",
+                    "canonical": "Go",
+                    "synonyms": ["Golang"],
+                    "children": [],
+                }
+            ]
+        )
+        await neo4j_loader.expand_concept("Go", "skills")
+        assert neo4j_loader._expansion_cache
+
+        await hybrid_registry.refresh()
+
+        assert neo4j_loader.cache_version == 1
+        assert not neo4j_loader._expansion_cache
+
 
 class TestOntologyRegistryThreadSafety:
     """스레드 안전성 테스트"""
@@ -0,0 +1,143 @@
+"""
+OntologySnapshot 및 스냅샷 기반 Neo4jOntologyLoader/OntologyRegistry 테스트
+
+실행: pytest tests/test_ontology_snapshot.py -v
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.ontology.neo4j_loader import Neo4jOntologyLoader
+from src.domain.ontology.registry import OntologyRegistry
+from src.domain.ontology.snapshot import OntologySnapshot
+
+CONCEPTS = [
+    {"id": "c1", "name": "Python", "type": "skill", "is_canonical": True},
+    {"id": "c2", "name": "파이썬", "type": "skill", "is_canonical": False},
+    {"id": "c3", "name": "Python3", "type": "skill", "is_canonical": False},
+    {"id": "c4", "name": "Django", "type": "skill", "is_canonical": True},
+    {"id": "c5", "name": "Backend", "type": "subcategory", "is_canonical": False},
+    {"id": "c6", "name": "Programming", "type": "category", "is_canonical": False},
+]
+
+RELATIONSHIPS = [
+    {"source": "c2", "rel_type": "SAME_AS", "target": "c1"},
+    {"source": "c3", "rel_type": "SAME_AS", "target": "c1"},
+    {"source": "c4", "rel_type": "IS_A", "target": "c1"},
+    {"source": "c1", "rel_type": "IS_A", "target": "c5"},
+    {"source": "c5", "rel_type": "IS_A", "target": "c6"},
+]
+
+
+class TestOntologySnapshot:
+    """스냅샷 컴파일/조회 테스트"""
+
+    @pytest.fixture
+    def snapshot(self):
+        return OntologySnapshot.from_records(CONCEPTS, RELATIONSHIPS)
+
+    def test_alias_to_canonical(self, snapshot):
+        """alias → canonical, 대소문자/공백 무시, 미등록 용어는 원본"""
+        assert snapshot.get_canonical("파이썬") == "Python"
+        assert snapshot.get_canonical(" python 3 ") == "Python"
+        assert snapshot.get_canonical("Python") == "Python"
+        assert snapshot.get_canonical("Rust") == "Rust"
+
+    def test_synonyms_group(self, snapshot):
+        """canonical 기준 양방향 동의어 그룹"""
+        assert snapshot.get_synonyms("파이썬") == ["Python", "파이썬", "Python3"]
+        assert snapshot.get_synonyms("Rust") == ["Rust"]
+
+    def test_children_multi_level(self, snapshot):
+        """IS_A 1~3단계 하위 스킬 (카테고리 노드 제외)"""
+        assert snapshot.get_children("Programming") == ["Python", "Django"]
+        assert snapshot.get_children("Backend") == ["Python", "Django"]
+        assert snapshot.get_children("Django") == []
+
+    def test_lookup_matches_expansion_rules(self, snapshot):
+        lookup = snapshot.lookup("파이썬")
+
+        assert lookup.canonical == "Python"
+        assert lookup.children == ("Django",)
+
+    def test_names_are_interned(self, snapshot):
+        """동일 문자열은 스냅샷 내에서 공유"""
+        canonical = snapshot.get_canonical("파이썬")
+        assert canonical is snapshot.get_synonyms("Python")[0]
+
+
+class TestSnapshotBackedLoader:
+    """스냅샷 적재 후 Neo4jOntologyLoader 조회 테스트"""
+
+    @pytest.fixture
+    def mock_client(self):
+        client = MagicMock()
+        client.execute_query = AsyncMock(side_effect=[CONCEPTS, RELATIONSHIPS])
+        return client
+
+    @pytest.fixture
+    def loader(self, mock_client):
+        return Neo4jOntologyLoader(mock_client)
+
+    @pytest.mark.asyncio
+    async def test_lookups_without_db_traffic(self, loader, mock_client):
+        """적재 이후 조회/확장은 DB 접근 없음"""
+        await loader.load_snapshot()
+        calls_after_load = mock_client.execute_query.call_count
+
+        assert await loader.get_canonical("파이썬") == "Python"
+        assert "Python3" in await loader.get_synonyms("Python")
+        assert await loader.get_children("Backend") == ["Python", "Django"]
+        expanded = await loader.expand_concepts(["파이썬", "Rust"], "skills")
+
+        assert expanded["파이썬"][:2] == ["파이썬", "Python"]
+        assert expanded["Rust"] == ["Rust"]
+        assert mock_client.execute_query.call_count == calls_after_load == 2
+
+    @pytest.mark.asyncio
+    async def test_load_failure_falls_back_to_queries(self, loader, mock_client):
+        """적재 실패 시 스냅샷 해제 → 쿼리 기반 조회"""
+        await loader.load_snapshot()
+        mock_client.execute_query.side_effect = Exception("Connection failed")
+
+        assert await loader.load_snapshot() is None
+        assert loader.snapshot is None
+
+
+class TestRegistrySnapshot:
+    """OntologyRegistry 스냅샷 적재/교체 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_swaps_snapshot(self):
+        client = MagicMock()
+        client.execute_query = AsyncMock(
+            side_effect=[CONCEPTS, RELATIONSHIPS, CONCEPTS[:1], []]
+        )
+        registry = OntologyRegistry(neo4j_client=client, mode="neo4j")
+        neo4j_loader = registry.get_loader()._neo4j_loader
+
+        assert await registry.load_snapshot() is True
+        first = neo4j_loader.snapshot
+
+        assert await registry.refresh() is True
+
+        assert neo4j_loader.snapshot is not first
+        assert await registry.get_loader().get_canonical("파이썬") == "파이썬"
+
+    @pytest.mark.asyncio
+    async def test_yaml_mode_skips_snapshot(self):
+        registry = OntologyRegistry(mode="yaml")
+        assert await registry.load_snapshot() is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_settings(self):
+        settings = MagicMock()
+        settings.ontology_mode = "neo4j"
+        settings.ontology_snapshot_enabled = False
+        client = MagicMock()
+        client.execute_query = AsyncMock()
+        registry = OntologyRegistry(neo4j_client=client, settings=settings)
+
+        assert await registry.load_snapshot() is False
+        client.execute_query.assert_not_called()
@@ -0,0 +1,172 @@
+"""
+ParallelHopExecutorNode 단위 테스트
+
+실행: pytest tests/test_parallel_hop_executor.py -v
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.graph.nodes.parallel_hop_executor import (
+    HOP_RESULT_KEY,
+    ParallelHopExecutorNode,
+    has_independent_hops,
+)
+from src.graph.state import GraphRAGState
+
+HOPS = [
+    {"step": 1, "description": "A팀 스킬", "sub_question": "A팀 스킬은?"},
+    {"step": 2, "description": "B팀 스킬", "sub_question": "B팀 스킬은?"},
+    {"step": 3, "description": "C팀 스킬", "sub_question": "C팀 스킬은?"},
+]
+
+
+def _state(hops=HOPS, independent=True) -> GraphRAGState:
+    return GraphRAGState(
+        question="A, B, C팀 스킬 비교",
+        intent="relationship_search",
+        query_plan={
+            "is_multi_hop": True,
+            "hop_count": len(hops),
+            "hops": hops,
+            "final_return": "skills",
+            "explanation": "",
+            "independent_hops": independent,
+        },
+    )
+
+
+class TestHasIndependentHops:
+    def test_requires_flag_and_multiple_hops(self):
+        assert has_independent_hops(_state()) is True
+        assert has_independent_hops(_state(independent=False)) is False
+        assert has_independent_hops(_state(hops=HOPS[:1])) is False
+        assert has_independent_hops(GraphRAGState(question="q")) is False
+
+
+class TestParallelHopExecutorNode:
+    """홉별 생성/실행 병렬화 테스트"""
+
+    @pytest.fixture
+    def generator(self):
+        async def generate(state):
+            return {"cypher_query": f"RETURN '{state['question']}' AS q"}
+
+        return AsyncMock(side_effect=generate)
+
+    @pytest.fixture
+    def executor(self):
+        async def execute(state):
+            await asyncio.sleep(0)
+            return {"graph_results": [{"q": state["question"]}]}
+
+        return AsyncMock(side_effect=execute)
+
+    async def test_hops_run_concurrently_and_merge(self, generator, executor):
+        """모든 홉이 동시에 진행되고 결과는 _hop 키와 함께 병합"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def execute(state):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"graph_results": [{"q": state["question"]}]}
+
+        executor.side_effect = execute
+        node = ParallelHopExecutorNode(generator, executor, max_concurrency=3)
+
+        result = await node(_state())
+
+        assert max_in_flight == 3
+        assert result["graph_results"] == [
+            {HOP_RESULT_KEY: 1, "q": "A팀 스킬은?"},
+            {HOP_RESULT_KEY: 2, "q": "B팀 스킬은?"},
+            {HOP_RESULT_KEY: 3, "q": "C팀 스킬은?"},
+        ]
+        assert result["result_count"] == 3
+        assert "// hop 2" in result["cypher_query"]
+        assert {
+            "parallel_hop_executor.hop_1",
+            "parallel_hop_executor.hop_3",
+            "parallel_hop_executor",
+        } <= set(result["node_timings"])
+
+    async def test_concurrency_is_bounded(self, generator):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def execute(state):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"graph_results": []}
+
+        node = ParallelHopExecutorNode(
+            generator, AsyncMock(side_effect=execute), max_concurrency=2
+        )
+
+        await node(_state())
+
+        assert max_in_flight == 2
+
+    async def test_hop_state_is_isolated(self, generator, executor):
+        """홉 상태는 원 질문의 plan/Cypher를 물려받지 않음"""
+        node = ParallelHopExecutorNode(generator, executor)
+
+        await node(_state())
+
+        hop_state = generator.call_args_list[0].args[0]
+        assert hop_state["query_plan"] is None
+        assert hop_state["cypher_query"] == ""
+
+    async def test_partial_failure_keeps_other_hops(self, generator, executor):
+        async def execute(state):
+            if state["question"] == "B팀 스킬은?":
+                return {"error": "Query execution failed"}
+            return {"graph_results": [{"q": state["question"]}]}
+
+        executor.side_effect = execute
+        node = ParallelHopExecutorNode(generator, executor)
+
+        result = await node(_state())
+
+        assert "error" not in result
+        assert [row[HOP_RESULT_KEY] for row in result["graph_results"]] == [1, 3]
+
+    async def test_syntax_error_regenerates_hop(self, generator, executor):
+        """cypher_error는 max_retries까지 해당 홉만 재생성"""
+        calls = 0
+
+        async def execute(state):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return {"cypher_error": "SyntaxError"}
+            return {"graph_results": [{"q": state["question"]}]}
+
+        executor.side_effect = execute
+        node = ParallelHopExecutorNode(
+            generator, executor, max_concurrency=1, max_retries=1
+        )
+
+        result = await node(_state(hops=HOPS[:2]))
+
+        assert result["result_count"] == 2
+        assert generator.await_count == 3
+
+    async def test_all_hops_failed_sets_error(self, executor):
+        generator = AsyncMock(return_value={"error": "Cypher generation failed"})
+        node = ParallelHopExecutorNode(generator, executor)
+
+        result = await node(_state())
+
+        assert result["error"].startswith("All hops failed")
+        assert result["graph_results"] == []
+        executor.assert_not_awaited()
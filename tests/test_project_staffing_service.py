@@ -16,6 +16,7 @@ import pytest
 
 from src.repositories.neo4j_repository import Neo4jRepository
 from src.services.project_staffing_service import ProjectStaffingService
+from src.utils.graph_version import GraphVersion
 
 # =============================================================================
 # Fixtures
@@ -125,6 +126,15 @@ def _candidate_rows():
     ]
 
 
+def _per_requirement(params, rows):
+    """단일 후보 쿼리 mock: 요구 스킬마다 동일 후보 행을 skill_name과 함께 반환"""
+    return [
+        {**row, "skill_name": req["skill_name"]}
+        for req in params["requirements"]
+        for row in rows
+    ]
+
+
 def _simple_project_details(count: int, status: str = "진행중") -> list:
     """간단한 project_details mock (프로젝트당 절반 진행 상태)"""
     return [
@@ -152,7 +162,7 @@ class TestFindCandidates:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]  # Python만
             elif "HAS_SKILL" in query:
-                return _candidate_rows()
+                return _per_requirement(params, _candidate_rows())
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -184,7 +194,7 @@ class TestFindCandidates:
                     ]
                 return _requirements_rows()
             elif "HAS_SKILL" in query:
-                return _candidate_rows()
+                return _per_requirement(params, _candidate_rows())
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -207,9 +217,9 @@ class TestFindCandidates:
             elif "HAS_SKILL" in query:
                 # min_proficiency 파라미터가 쿼리에 반영되어야 함
                 assert params is not None
-                if "min_proficiency" in (params or {}):
-                    assert params["min_proficiency"] == 4
-                return [_candidate_rows()[1]]  # proficiency=4인 홍길동만
+                assert params["requirements"][0]["min_proficiency"] == 4
+                # proficiency=4인 홍길동만
+                return _per_requirement(params, [_candidate_rows()[1]])
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -268,26 +278,29 @@ class TestMatchScore:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]  # Python, 고급(3), max=80000
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "최고수",
-                        "department": "AI팀",
-                        "proficiency": 4,  # 요구(3)보다 높음
-                        "effective_rate": 40000.0,  # max(80000)보다 훨씬 낮음
-                        "years_used": 8,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": [
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 400,
-                            },
-                        ],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "최고수",
+                            "department": "AI팀",
+                            "proficiency": 4,  # 요구(3)보다 높음
+                            "effective_rate": 40000.0,  # max(80000)보다 훨씬 낮음
+                            "years_used": 8,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": [
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 400,
+                                },
+                            ],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -310,30 +323,33 @@ class TestMatchScore:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "저점수",
-                        "department": "팀A",
-                        "proficiency": 3,
-                        "effective_rate": 75000.0,
-                        "years_used": 1,
-                        "availability": "partial",
-                        "current_projects": 3,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(3),
-                    },
-                    {
-                        "emp_name": "고점수",
-                        "department": "팀B",
-                        "proficiency": 4,
-                        "effective_rate": 40000.0,
-                        "years_used": 7,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "저점수",
+                            "department": "팀A",
+                            "proficiency": 3,
+                            "effective_rate": 75000.0,
+                            "years_used": 1,
+                            "availability": "partial",
+                            "current_projects": 3,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(3),
+                        },
+                        {
+                            "emp_name": "고점수",
+                            "department": "팀B",
+                            "proficiency": 4,
+                            "effective_rate": 40000.0,
+                            "years_used": 7,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -355,19 +371,22 @@ class TestMatchScore:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "테스터",
-                        "department": "팀C",
-                        "proficiency": 4,
-                        "effective_rate": 50000.0,
-                        "years_used": 5,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "테스터",
+                            "department": "팀C",
+                            "proficiency": 4,
+                            "effective_rate": 50000.0,
+                            "years_used": 5,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -399,19 +418,22 @@ class TestMatchScore:
                     },
                 ]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "고개발자",
-                        "department": "팀D",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 4,
-                        "availability": "available",
-                        "current_projects": 0,
-                        "max_projects": 5,
-                        "project_details": [],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "고개발자",
+                            "department": "팀D",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 4,
+                            "availability": "available",
+                            "current_projects": 0,
+                            "max_projects": 5,
+                            "project_details": [],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -431,30 +453,33 @@ class TestMatchScore:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]  # Python, 고급(3), max=80000
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "신입고급",
-                        "department": "팀F",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 1,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                    {
-                        "emp_name": "베테랑고급",
-                        "department": "팀G",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 10,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "신입고급",
+                            "department": "팀F",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 1,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                        {
+                            "emp_name": "베테랑고급",
+                            "department": "팀G",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 10,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -478,30 +503,33 @@ class TestMatchScore:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "중급10년",
-                        "department": "팀H",
-                        "proficiency": 2,  # 중급
-                        "effective_rate": 50000.0,
-                        "years_used": 10,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                    {
-                        "emp_name": "고급1년",
-                        "department": "팀I",
-                        "proficiency": 3,  # 고급
-                        "effective_rate": 50000.0,
-                        "years_used": 1,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "중급10년",
+                            "department": "팀H",
+                            "proficiency": 2,  # 중급
+                            "effective_rate": 50000.0,
+                            "years_used": 10,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                        {
+                            "emp_name": "고급1년",
+                            "department": "팀I",
+                            "proficiency": 3,  # 고급
+                            "effective_rate": 50000.0,
+                            "years_used": 1,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -523,30 +551,33 @@ class TestMatchScore:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]  # max=80000
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "비싼사람",
-                        "department": "팀J",
-                        "proficiency": 3,
-                        "effective_rate": 75000.0,
-                        "years_used": 3,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                    {
-                        "emp_name": "저렴한사람",
-                        "department": "팀K",
-                        "proficiency": 3,
-                        "effective_rate": 40000.0,
-                        "years_used": 3,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "비싼사람",
+                            "department": "팀J",
+                            "proficiency": 3,
+                            "effective_rate": 75000.0,
+                            "years_used": 3,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                        {
+                            "emp_name": "저렴한사람",
+                            "department": "팀K",
+                            "proficiency": 3,
+                            "effective_rate": 40000.0,
+                            "years_used": 3,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -568,19 +599,22 @@ class TestMatchScore:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "플랜후보",
-                        "department": "팀E",
-                        "proficiency": 4,
-                        "effective_rate": 50000.0,
-                        "years_used": 6,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "플랜후보",
+                            "department": "팀E",
+                            "proficiency": 4,
+                            "effective_rate": 50000.0,
+                            "years_used": 6,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -689,56 +723,59 @@ class TestWeightedWorkload:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "거의완료",
-                        "department": "팀L",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 5,
-                        "availability": "available",
-                        "current_projects": 3,
-                        "max_projects": 5,
-                        "project_details": [
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 475,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 300,
-                                "actual": 285,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 400,
-                                "actual": 390,
-                            },
-                        ],
-                    },
-                    {
-                        "emp_name": "막시작",
-                        "department": "팀M",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 5,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": [
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 10,
-                            },
-                        ],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "거의완료",
+                            "department": "팀L",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 5,
+                            "availability": "available",
+                            "current_projects": 3,
+                            "max_projects": 5,
+                            "project_details": [
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 475,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 300,
+                                    "actual": 285,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 400,
+                                    "actual": 390,
+                                },
+                            ],
+                        },
+                        {
+                            "emp_name": "막시작",
+                            "department": "팀M",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 5,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": [
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 10,
+                                },
+                            ],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -763,61 +800,64 @@ class TestWeightedWorkload:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "과부하",
-                        "department": "팀N",
-                        "proficiency": 4,
-                        "effective_rate": 50000.0,
-                        "years_used": 8,
-                        "availability": "available",
-                        "current_projects": 5,
-                        "max_projects": 5,
-                        "project_details": [
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                        ],
-                    },
-                    {
-                        "emp_name": "여유있는사람",
-                        "department": "팀O",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 3,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "과부하",
+                            "department": "팀N",
+                            "proficiency": 4,
+                            "effective_rate": 50000.0,
+                            "years_used": 8,
+                            "availability": "available",
+                            "current_projects": 5,
+                            "max_projects": 5,
+                            "project_details": [
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                            ],
+                        },
+                        {
+                            "emp_name": "여유있는사람",
+                            "department": "팀O",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 3,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -846,7 +886,7 @@ class TestStaffingPlan:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]  # Python only
             elif "HAS_SKILL" in query:
-                return _candidate_rows()
+                return _per_requirement(params, _candidate_rows())
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -871,7 +911,7 @@ class TestStaffingPlan:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return _candidate_rows()  # 2명
+                return _per_requirement(params, _candidate_rows())  # 2명
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -892,7 +932,7 @@ class TestStaffingPlan:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return _candidate_rows()
+                return _per_requirement(params, _candidate_rows())
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1066,7 +1106,9 @@ class TestGetCategories:
         # Cypher에 project_name 파라미터가 바인딩되었는지 확인
         call_args = mock_neo4j.execute_cypher.call_args
         query = call_args[0][0]
-        params = call_args[0][1] if len(call_args[0]) > 1 else call_args[1].get("params", {})
+        params = (
+            call_args[0][1] if len(call_args[0]) > 1 else call_args[1].get("params", {})
+        )
         assert "REQUIRES" in query
         assert params["project_name"] == "챗봇 리뉴얼"
 
@@ -1123,8 +1165,10 @@ class TestErrorHandling:
         with pytest.raises(Exception, match="Connection failed"):
             await service.find_candidates("ETL파이프라인 구축")
 
-    async def test_find_skill_candidates_error_returns_empty(self, service, mock_neo4j):
-        """_find_skill_candidates 내부 에러 시 빈 리스트"""
+    async def test_find_requirement_candidates_error_returns_empty(
+        self, service, mock_neo4j
+    ):
+        """_find_requirement_candidates 내부 에러 시 빈 리스트"""
 
         call_count = 0
 
@@ -1146,6 +1190,30 @@ class TestErrorHandling:
         assert result.total_candidates == 0
         assert result.skill_candidates[0].candidates == []
 
+    async def test_candidate_query_failure_is_not_memoized(self, service, mock_neo4j):
+        """후보 조회 일시 실패 결과는 메모하지 않고 다음 호출에서 재조회"""
+        fail = True
+
+        async def mock_execute(query, params=None):
+            if "p.budget_million" in query:
+                return [_project_info_row()]
+            elif "REQUIRES" in query:
+                return [_requirements_rows()[0]]
+            elif "HAS_SKILL" in query:
+                if fail:
+                    raise Exception("Transient failure")
+                return _per_requirement(params, _candidate_rows())
+            return []
+
+        mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
+
+        first = await service.find_candidates("ETL파이프라인 구축")
+        assert first.total_candidates == 0
+
+        fail = False
+        second = await service.find_candidates("ETL파이프라인 구축")
+        assert second.total_candidates > 0
+
     async def test_budget_analysis_null_values_handled(self, service, mock_neo4j):
         """agreed_rate 등이 None일 때 0으로 처리"""
 
@@ -1289,19 +1357,22 @@ class TestMatchContextEdgeCases:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "1건전담",
-                        "department": "팀P",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 5,
-                        "availability": "available",
-                        "current_projects": 0,
-                        "max_projects": 1,
-                        "project_details": [],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "1건전담",
+                            "department": "팀P",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 5,
+                            "availability": "available",
+                            "current_projects": 0,
+                            "max_projects": 1,
+                            "project_details": [],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1323,19 +1394,22 @@ class TestMatchContextEdgeCases:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "신입",
-                        "department": "팀Q",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 1,
-                        "availability": "available",
-                        "current_projects": 0,
-                        "max_projects": 5,
-                        "project_details": [],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "신입",
+                            "department": "팀Q",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 1,
+                            "availability": "available",
+                            "current_projects": 0,
+                            "max_projects": 5,
+                            "project_details": [],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1355,44 +1429,47 @@ class TestMatchContextEdgeCases:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "경계인",
-                        "department": "팀R",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 5,
-                        "availability": "partial",
-                        "current_projects": 4,
-                        "max_projects": 5,
-                        "project_details": [
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 250,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 250,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 250,
-                            },
-                            {
-                                "status": "계획",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                        ],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "경계인",
+                            "department": "팀R",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 5,
+                            "availability": "partial",
+                            "current_projects": 4,
+                            "max_projects": 5,
+                            "project_details": [
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 250,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 250,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 250,
+                                },
+                                {
+                                    "status": "계획",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                            ],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1416,19 +1493,22 @@ class TestMatchContextEdgeCases:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "미숙련",
-                        "department": "팀S",
-                        "proficiency": 0,  # 정보 없음
-                        "effective_rate": 60000.0,
-                        "years_used": 0,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": _simple_project_details(1),
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "미숙련",
+                            "department": "팀S",
+                            "proficiency": 0,  # 정보 없음
+                            "effective_rate": 60000.0,
+                            "years_used": 0,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": _simple_project_details(1),
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1449,26 +1529,29 @@ class TestMatchContextEdgeCases:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "불완전정보",
-                        "department": "팀T",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 3,
-                        "availability": "available",
-                        "current_projects": 1,
-                        "max_projects": 5,
-                        "project_details": [
-                            {
-                                "status": None,
-                                "contribution_pct": None,
-                                "allocated": None,
-                                "actual": None,
-                            },
-                        ],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "불완전정보",
+                            "department": "팀T",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 3,
+                            "availability": "available",
+                            "current_projects": 1,
+                            "max_projects": 5,
+                            "project_details": [
+                                {
+                                    "status": None,
+                                    "contribution_pct": None,
+                                    "allocated": None,
+                                    "actual": None,
+                                },
+                            ],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1489,19 +1572,22 @@ class TestMatchContextEdgeCases:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "제로맥스",
-                        "department": "팀V",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 3,
-                        "availability": "available",
-                        "current_projects": 0,
-                        "max_projects": 0,  # 0이면 기본값 5로 대체
-                        "project_details": [],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "제로맥스",
+                            "department": "팀V",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 3,
+                            "availability": "available",
+                            "current_projects": 0,
+                            "max_projects": 0,  # 0이면 기본값 5로 대체
+                            "project_details": [],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1522,38 +1608,41 @@ class TestMatchContextEdgeCases:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "정확히맥스",
-                        "department": "팀U",
-                        "proficiency": 4,
-                        "effective_rate": 50000.0,
-                        "years_used": 7,
-                        "availability": "available",
-                        "current_projects": 3,
-                        "max_projects": 3,
-                        "project_details": [
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                            {
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                        ],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "정확히맥스",
+                            "department": "팀U",
+                            "proficiency": 4,
+                            "effective_rate": 50000.0,
+                            "years_used": 7,
+                            "availability": "available",
+                            "current_projects": 3,
+                            "max_projects": 3,
+                            "project_details": [
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                                {
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                            ],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1654,7 +1743,7 @@ class TestProjectParticipations:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return _candidate_rows()
+                return _per_requirement(params, _candidate_rows())
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1683,59 +1772,62 @@ class TestProjectParticipations:
             elif "REQUIRES" in query:
                 return [_requirements_rows()[0]]
             elif "HAS_SKILL" in query:
-                return [
-                    {
-                        "emp_name": "여유인",
-                        "department": "팀A",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 3,
-                        "availability": "available",
-                        "current_projects": 0,
-                        "max_projects": 5,
-                        "project_details": [],
-                    },
-                    {
-                        "emp_name": "빠듯인",
-                        "department": "팀B",
-                        "proficiency": 3,
-                        "effective_rate": 60000.0,
-                        "years_used": 3,
-                        "availability": "partial",
-                        "current_projects": 4,
-                        "max_projects": 5,
-                        "project_details": [
-                            {
-                                "name": "P1",
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                            {
-                                "name": "P2",
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                            {
-                                "name": "P3",
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                            {
-                                "name": "P4",
-                                "status": "진행중",
-                                "contribution_pct": None,
-                                "allocated": 500,
-                                "actual": 0,
-                            },
-                        ],
-                    },
-                ]
+                return _per_requirement(
+                    params,
+                    [
+                        {
+                            "emp_name": "여유인",
+                            "department": "팀A",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 3,
+                            "availability": "available",
+                            "current_projects": 0,
+                            "max_projects": 5,
+                            "project_details": [],
+                        },
+                        {
+                            "emp_name": "빠듯인",
+                            "department": "팀B",
+                            "proficiency": 3,
+                            "effective_rate": 60000.0,
+                            "years_used": 3,
+                            "availability": "partial",
+                            "current_projects": 4,
+                            "max_projects": 5,
+                            "project_details": [
+                                {
+                                    "name": "P1",
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                                {
+                                    "name": "P2",
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                                {
+                                    "name": "P3",
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                                {
+                                    "name": "P4",
+                                    "status": "진행중",
+                                    "contribution_pct": None,
+                                    "allocated": 500,
+                                    "actual": 0,
+                                },
+                            ],
+                        },
+                    ],
+                )
             return []
 
         mock_neo4j.execute_cypher = AsyncMock(side_effect=mock_execute)
@@ -1750,3 +1842,112 @@ class TestProjectParticipations:
         assert free.availability_label == "가능"
         # 빠듯인: workload=4.0, max=5, remaining=1.0 → "애매"
         assert busy.availability_label in ("애매", "빠듯")
+
+
+# =============================================================================
+# TestBatchedCandidateSearch
+# =============================================================================
+
+
+class TestBatchedCandidateSearch:
+    """요구 스킬 일괄 후보 탐색 + 프로젝트 단위 메모 테스트"""
+
+    @staticmethod
+    def _mock_execute(skill_rows):
+        async def mock_execute(query, params=None):
+            if "p.budget_million" in query:
+                return [_project_info_row()]
+            elif "REQUIRES" in query:
+                return _requirements_rows()
+            elif "HAS_SKILL" in query:
+                return skill_rows
+            elif "WORKS_ON" in query:
+                return []
+            return []
+
+        return AsyncMock(side_effect=mock_execute)
+
+    def _has_skill_calls(self, mock_neo4j):
+        return [
+            c
+            for c in mock_neo4j.execute_cypher.call_args_list
+            if "HAS_SKILL" in c[0][0]
+        ]
+
+    async def test_single_query_for_all_requirements(self, service, mock_neo4j):
+        """요구 스킬 수와 무관하게 후보 쿼리는 1회, 스킬별 필터 파라미터 전달"""
+        kim, hong = _candidate_rows()
+        mock_neo4j.execute_cypher = self._mock_execute(
+            [
+                {**kim, "skill_name": "Docker"},
+                {**hong, "skill_name": "Python"},
+                {**kim, "skill_name": "Python"},
+            ]
+        )
+
+        result = await service.find_candidates("ETL파이프라인 구축")
+
+        calls = self._has_skill_calls(mock_neo4j)
+        assert len(calls) == 1
+        assert calls[0][0][1]["requirements"] == [
+            {"skill_name": "Python", "min_proficiency": 3, "max_hourly_rate": 80000.0},
+            {"skill_name": "Docker", "min_proficiency": 2, "max_hourly_rate": 70000.0},
+        ]
+
+        by_skill = {
+            sc.skill_name: {c.employee_name for c in sc.candidates}
+            for sc in result.skill_candidates
+        }
+        assert by_skill == {"Python": {"김철수", "홍길동"}, "Docker": {"김철수"}}
+        assert result.total_candidates == 2
+
+        # 같은 직원의 워크로드는 스킬 간 동일
+        kim_workloads = {
+            c.effective_workload
+            for sc in result.skill_candidates
+            for c in sc.candidates
+            if c.employee_name == "김철수"
+        }
+        assert len(kim_workloads) == 1
+
+    async def test_min_proficiency_overrides_all_requirements(
+        self, service, mock_neo4j
+    ):
+        mock_neo4j.execute_cypher = self._mock_execute([])
+
+        await service.find_candidates("ETL파이프라인 구축", min_proficiency=1)
+
+        params = self._has_skill_calls(mock_neo4j)[0][0][1]
+        assert {r["min_proficiency"] for r in params["requirements"]} == {1}
+
+    async def test_plan_reuses_memoized_candidates(self, service, mock_neo4j):
+        """find_candidates → generate_staffing_plan 연속 호출 시 쿼리 재실행 없음"""
+        mock_neo4j.execute_cypher = self._mock_execute([])
+
+        await service.find_candidates("ETL파이프라인 구축")
+        calls_after_find = mock_neo4j.execute_cypher.await_count
+        await service.generate_staffing_plan("ETL파이프라인 구축")
+        await service.analyze_budget("ETL파이프라인 구축")
+
+        # 예산 분석은 팀원 비용 쿼리 1회만 추가 (프로젝트 정보는 메모 재사용)
+        assert mock_neo4j.execute_cypher.await_count == calls_after_find + 1
+
+    async def test_memo_invalidated_by_graph_version(self, mock_neo4j):
+        version = GraphVersion()
+        service = ProjectStaffingService(mock_neo4j, graph_version=version)
+        mock_neo4j.execute_cypher = self._mock_execute([])
+
+        await service.find_candidates("ETL파이프라인 구축")
+        version.bump("test")
+        await service.find_candidates("ETL파이프라인 구축")
+
+        assert len(self._has_skill_calls(mock_neo4j)) == 2
+
+    async def test_memo_disabled_with_zero_ttl(self, mock_neo4j):
+        service = ProjectStaffingService(mock_neo4j, memo_ttl_seconds=0)
+        mock_neo4j.execute_cypher = self._mock_execute([])
+
+        await service.find_candidates("ETL파이프라인 구축")
+        await service.find_candidates("ETL파이프라인 구축")
+
+        assert len(self._has_skill_calls(mock_neo4j)) == 2
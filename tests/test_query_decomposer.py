@@ -173,3 +173,36 @@ class TestQueryDecomposerNode:
 
         call_kwargs = mock_llm.decompose_query.call_args.kwargs
         assert call_kwargs["schema"] == schema
+
+    async def test_independent_hops_flag(self, node, mock_llm):
+        """비교형 질문의 independent_hops 및 홉별 sub_question 전달"""
+        mock_llm.decompose_query.return_value = {
+            "is_multi_hop": True,
+            "hop_count": 2,
+            "hops": [
+                {"step": 1, "description": "A팀 스킬", "sub_question": "A팀 스킬은?"},
+                {"step": 2, "description": "B팀 스킬", "sub_question": "B팀 스킬은?"},
+            ],
+            "final_return": "skills per team",
+            "explanation": "comparison",
+            "independent_hops": True,
+        }
+
+        state = GraphRAGState(
+            question="A팀과 B팀의 스킬 비교",
+            intent="relationship_search",
+        )
+
+        result = await node(state)
+
+        assert result["query_plan"]["independent_hops"] is True
+        assert result["query_plan"]["hops"][1]["sub_question"] == "B팀 스킬은?"
+
+    async def test_independent_hops_defaults_false(self, node, mock_llm):
+        mock_llm.decompose_query.return_value = {"is_multi_hop": True}
+
+        state = GraphRAGState(question="경로 분석", intent="path_analysis")
+
+        result = await node(state)
+
+        assert result["query_plan"]["independent_hops"] is False
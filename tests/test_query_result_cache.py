@@ -0,0 +1,151 @@
+"""
+QueryResultCache / GraphVersion 및 GraphExecutorNode 결과 캐시 연동 단위 테스트
+
+실행: pytest tests/test_query_result_cache.py -v
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.auth.models import UserContext
+from src.graph.nodes.graph_executor import GraphExecutorNode
+from src.graph.state import GraphRAGState
+from src.repositories.query_result_cache import QueryResultCache, canonicalize_cypher
+from src.services.graph_edit_service import GraphEditService
+from src.utils.graph_version import GraphVersion
+
+
+class TestCanonicalizeCypher:
+    """캐시 키 정규화 테스트"""
+
+    def test_collapses_whitespace_outside_literals(self):
+        query = "MATCH  (n:Employee)\n   WHERE n.name = 'A  B'\nRETURN n ;"
+        assert (
+            canonicalize_cypher(query)
+            == "MATCH (n:Employee) WHERE n.name = 'A  B' RETURN n"
+        )
+
+    def test_equivalent_queries_share_key(self):
+        key1 = QueryResultCache.make_key("MATCH (n)\nRETURN n", {"a": 1, "b": 2}, "p")
+        key2 = QueryResultCache.make_key("MATCH (n) RETURN n;", {"b": 2, "a": 1}, "p")
+        key3 = QueryResultCache.make_key("MATCH (n) RETURN n", {"a": 1, "b": 2}, "q")
+
+        assert key1 == key2
+        assert key1 != key3
+
+
+class TestQueryResultCache:
+    """결과 캐시 저장/무효화 테스트"""
+
+    @pytest.fixture
+    def version(self):
+        return GraphVersion()
+
+    @pytest.fixture
+    def cache(self, version):
+        return QueryResultCache(version, max_entries=2, ttl_seconds=300, max_rows=3)
+
+    def test_hit_until_graph_version_changes(self, cache, version):
+        """그래프 버전이 바뀌면 기존 항목은 미스"""
+        assert cache.put("k", [{"n": 1}])
+        assert cache.get("k") == [{"n": 1}]
+
+        version.bump("test")
+
+        assert cache.get("k") is None
+        assert cache.get_stats()["size"] == 0
+        assert cache.get_stats()["hits"] == 1
+
+    def test_put_skipped_when_version_changed_during_execution(self, cache, version):
+        """실행 전 버전과 현재 버전이 다르면 저장 생략"""
+        before = cache.graph_version
+        version.bump("test")
+
+        assert cache.put("k", [{"n": 1}], before) is False
+        assert cache.get("k") is None
+
+    def test_large_results_not_cached(self, cache):
+        """max_rows 초과 결과는 저장하지 않음"""
+        assert cache.put("k", [{"n": i} for i in range(4)]) is False
+
+    def test_ttl_expiry(self, version):
+        cache = QueryResultCache(version, ttl_seconds=0)
+        cache.put("k", [{"n": 1}])
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self, cache):
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a")
+        cache.put("c", [])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == []
+
+
+class TestGraphExecutorResultCache:
+    """GraphExecutorNode 결과 캐시 연동 테스트"""
+
+    @pytest.fixture
+    def version(self):
+        return GraphVersion()
+
+    @pytest.fixture
+    def mock_neo4j(self):
+        neo4j = MagicMock()
+        neo4j.execute_cypher = AsyncMock(return_value=[{"name": "홍길동"}])
+        return neo4j
+
+    @pytest.fixture
+    def node(self, mock_neo4j, version):
+        return GraphExecutorNode(mock_neo4j, result_cache=QueryResultCache(version))
+
+    @staticmethod
+    def _state(**kwargs) -> GraphRAGState:
+        return GraphRAGState(
+            cypher_query="MATCH (e:Employee) RETURN e.name AS name",
+            cypher_parameters={},
+            **kwargs,
+        )
+
+    async def test_second_call_served_from_cache(self, node, mock_neo4j):
+        first = await node(self._state())
+        second = await node(self._state())
+
+        assert first["result_cache_hit"] is False
+        assert second["result_cache_hit"] is True
+        assert second["graph_results"] == [{"name": "홍길동"}]
+        mock_neo4j.execute_cypher.assert_awaited_once()
+
+    async def test_graph_edit_invalidates(self, node, mock_neo4j, version):
+        """GraphEditService 변경 후에는 재실행"""
+        await node(self._state())
+        GraphEditService(MagicMock(), graph_version=version)._notify_graph_changed()
+        result = await node(self._state())
+
+        assert result["result_cache_hit"] is False
+        assert mock_neo4j.execute_cypher.await_count == 2
+
+    async def test_policy_is_part_of_key(self, node, mock_neo4j):
+        """접근 정책이 다르면 캐시 공유하지 않음"""
+        admin = UserContext(
+            user_id="a",
+            username="admin",
+            roles=["admin"],
+            permissions=[],
+            is_admin=True,
+        )
+        viewer = UserContext(
+            user_id="v",
+            username="viewer",
+            roles=["viewer"],
+            permissions=[],
+            is_admin=False,
+        )
+
+        await node(self._state(user_context=admin))
+        result = await node(self._state(user_context=viewer))
+
+        assert result["result_cache_hit"] is False
+        assert mock_neo4j.execute_cypher.await_count == 2
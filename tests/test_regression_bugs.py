@@ -5,7 +5,7 @@
 
 커버리지:
   - Korean suffix stripping (strip_korean_suffix)
-  - 3-step entity name fallback (find_entities_by_name)
+  - 2-step entity name fallback (find_entities_by_name)
   - Employee 중복 노드 name-based grouping (Cypher 패턴 검증)
 """
 
@@ -89,7 +89,7 @@ class TestStripKoreanSuffix:
 
 
 class TestFindEntitiesByNameFallback:
-    """find_entities_by_name() 3단계 폴백 regression 테스트"""
+    """find_entities_by_name() 2단계 폴백 regression 테스트"""
 
     @pytest.fixture
     def mock_client(self):
@@ -102,7 +102,7 @@ class TestFindEntitiesByNameFallback:
         return Neo4jEntityRepository(mock_client)
 
     async def test_exact_match_found(self, repo, mock_client):
-        """1단계: toLower 정확 일치 성공"""
+        """1단계: name_norm 일치 성공"""
         mock_client.execute_query.return_value = [
             {"id": "1", "labels": ["Employee"], "properties": {"name": "홍길동"}}
         ]
@@ -115,7 +115,7 @@ class TestFindEntitiesByNameFallback:
         assert mock_client.execute_query.await_count == 1
 
     async def test_case_insensitive_match(self, repo, mock_client):
-        """대소문자 무시 매칭 (toLower)"""
+        """대소문자 무시 매칭 (name_norm 인덱스)"""
         mock_client.execute_query.return_value = [
             {"id": "1", "labels": ["Skill"], "properties": {"name": "Python"}}
         ]
@@ -123,35 +123,33 @@ class TestFindEntitiesByNameFallback:
         results = await repo.find_entities_by_name("python")
 
         assert len(results) == 1
-        # Cypher에서 toLower로 비교하므로 서버에서 매칭됨
+        # 파라미터를 Cypher에서 정규화해 name_norm 인덱스와 비교
         call_args = mock_client.execute_query.call_args_list[0]
-        assert "toLower" in call_args[0][0]
+        assert "n.name_norm = replace(toLower(trim($name))" in call_args[0][0]
 
-    async def test_space_removed_fallback(self, repo, mock_client):
-        """2단계: 공백 제거 매칭 폴백"""
-        # 1단계 실패, 2단계 성공
-        mock_client.execute_query.side_effect = [
-            [],  # 1단계: 정확 일치 실패
-            [{"id": "2", "labels": ["Skill"], "properties": {"name": "React Native"}}],
+    async def test_space_insensitive_single_query(self, repo, mock_client):
+        """공백 차이는 name_norm 비교로 1단계에서 처리"""
+        mock_client.execute_query.return_value = [
+            {"id": "2", "labels": ["Skill"], "properties": {"name": "React Native"}}
         ]
 
         results = await repo.find_entities_by_name("ReactNative")
 
         assert len(results) == 1
-        assert mock_client.execute_query.await_count == 2
-        # 2번째 쿼리에 replace(..., ' ', '') 포함
-        second_query = mock_client.execute_query.call_args_list[1][0][0]
-        assert "replace" in second_query
+        assert mock_client.execute_query.await_count == 1
+        # 정규화 식에 replace(..., ' ', '') 포함, 정확 일치 우선 정렬
+        query = mock_client.execute_query.call_args_list[0][0][0]
+        assert "replace" in query
+        assert "ORDER BY CASE WHEN toLower(n.name) = toLower($name)" in query
 
     @patch("src.repositories.neo4j_entity_repository.strip_korean_suffix")
     async def test_korean_suffix_fallback(self, mock_strip, repo, mock_client):
-        """3단계: 한국어 접미사 제거 폴백"""
+        """2단계: 한국어 접미사 제거 폴백"""
         mock_strip.return_value = "챗봇 리뉴얼"
 
-        # 1, 2단계 실패 → 3단계 suffix strip 후 성공
+        # 1단계 실패 → 2단계 suffix strip 후 성공
         mock_client.execute_query.side_effect = [
             [],  # 1단계 실패
-            [],  # 2단계 실패
             [{"id": "3", "labels": ["Project"], "properties": {"name": "챗봇 리뉴얼"}}],
         ]
 
@@ -159,25 +157,26 @@ class TestFindEntitiesByNameFallback:
 
         assert len(results) == 1
         mock_strip.assert_called_once_with("챗봇 리뉴얼 프로젝트")
-        # 3번 호출: exact fail → space fail → suffix exact success
-        assert mock_client.execute_query.await_count == 3
+        # 2번 호출: name_norm fail → suffix name_norm success
+        assert mock_client.execute_query.await_count == 2
+        assert (
+            mock_client.execute_query.call_args_list[1][0][1]["name"] == "챗봇 리뉴얼"
+        )
 
     @patch("src.repositories.neo4j_entity_repository.strip_korean_suffix")
     async def test_all_fallbacks_exhausted(self, mock_strip, repo, mock_client):
-        """3단계 모두 실패 시 빈 리스트 반환"""
+        """2단계 모두 실패 시 빈 리스트 반환"""
         mock_strip.return_value = "AI 개발"
 
         mock_client.execute_query.side_effect = [
             [],  # 1단계 실패
-            [],  # 2단계 실패
-            [],  # 3단계 suffix exact 실패
-            [],  # 3단계 suffix space-removed 실패
+            [],  # 2단계 suffix 실패
         ]
 
         results = await repo.find_entities_by_name("AI 개발팀")
 
         assert len(results) == 0
-        assert mock_client.execute_query.await_count == 4
+        assert mock_client.execute_query.await_count == 2
 
     @patch("src.repositories.neo4j_entity_repository.strip_korean_suffix")
     async def test_suffix_same_as_original_skips_retry(
@@ -188,14 +187,13 @@ class TestFindEntitiesByNameFallback:
 
         mock_client.execute_query.side_effect = [
             [],  # 1단계 실패
-            [],  # 2단계 실패
         ]
 
         results = await repo.find_entities_by_name("Python")
 
         assert len(results) == 0
-        # suffix가 같으므로 3단계 쿼리 호출하지 않음 → 2번만 호출
-        assert mock_client.execute_query.await_count == 2
+        # suffix가 같으므로 2단계 쿼리 호출하지 않음 → 1번만 호출
+        assert mock_client.execute_query.await_count == 1
 
 
 # ── Employee Duplication Name-Based Grouping ─────────────────
@@ -204,17 +202,20 @@ class TestFindEntitiesByNameFallback:
 class TestEmployeeDuplicationGrouping:
     """Employee 중복 노드 name-based grouping Cypher 패턴 검증"""
 
-    def test_find_skill_candidates_uses_name_grouping(self):
-        """_find_skill_candidates Cypher에 e.name 기반 그룹핑이 있는지 검증"""
+    def test_find_requirement_candidates_uses_name_grouping(self):
+        """_find_requirement_candidates Cypher에 e.name 기반 그룹핑이 있는지 검증"""
         import inspect
 
         from src.services.project_staffing_service import ProjectStaffingService
 
-        source = inspect.getsource(ProjectStaffingService._find_skill_candidates)
+        source = inspect.getsource(
+            ProjectStaffingService._find_requirement_candidates
+        )
 
         # e.name 기반 그룹핑 존재 확인 (중복 노드 대응)
         assert "e.name AS emp_name" in source, (
-            "_find_skill_candidates must group by e.name to handle duplicate Employee nodes"
+            "_find_requirement_candidates must group by e.name "
+            "to handle duplicate Employee nodes"
         )
         assert (
             "WITH e.name" in source
@@ -234,14 +235,18 @@ class TestEmployeeDuplicationGrouping:
             "analyze_budget must group by e.name to handle duplicate Employee nodes"
         )
 
-    def test_cypher_uses_tolower_for_skill_matching(self):
-        """스킬 매칭에 tolower_match 헬퍼 사용 여부 확인"""
+    def test_cypher_uses_name_norm_for_skill_matching(self):
+        """스킬 매칭에 name_norm_match 헬퍼 사용 여부 확인"""
         import inspect
 
         from src.services.project_staffing_service import ProjectStaffingService
 
-        source = inspect.getsource(ProjectStaffingService._find_skill_candidates)
+        source = inspect.getsource(
+            ProjectStaffingService._find_requirement_candidates
+        )
 
-        assert "tolower_match" in source, (
-            "_find_skill_candidates must use tolower_match for case-insensitive skill matching"
+        # UNWIND된 요구 스킬명은 파라미터가 아니므로 name_norm_expr로 정규화
+        assert "name_norm_expr" in source, (
+            "_find_requirement_candidates must normalize skill names "
+            "for case-insensitive skill matching"
         )
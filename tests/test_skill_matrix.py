@@ -0,0 +1,206 @@
+"""
+SkillMatrixService 단위 테스트
+
+벌크 적재 → 행렬 구성, Jaccard 유사도/팀 후보 점수(벡터 연산),
+그래프 버전 기반 재적재와 GraphEditService 증분 반영을 검증합니다.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.repositories.neo4j_repository import Neo4jRepository, NodeResult
+from src.services.graph_edit_service import GraphEditService
+from src.services.skill_matrix import SkillMatrixService
+from src.utils.graph_version import GraphVersion
+
+
+def _employee(node_id, name, skills, community_id=None):
+    return {
+        "id": node_id,
+        "employee_id": f"E{node_id}",
+        "name": name,
+        "job_type": "개발자",
+        "experience": 5,
+        "community_id": community_id,
+        "skills": [{"id": f"s:{s}", "name": s} for s in skills]
+        or [{"id": None, "name": None}],
+    }
+
+
+ROWS = [
+    _employee("e1", "홍길동", ["Python", "AWS", "Docker"], community_id=1),
+    _employee("e2", "김철수", ["Python", "AWS"], community_id=1),
+    _employee("e3", "이영희", ["Python", "Java", "Spring", "Kafka"], community_id=2),
+    _employee("e4", "박민수", ["Figma"], community_id=3),
+    _employee("e5", "최지우", []),
+]
+
+
+@pytest.fixture
+def repo():
+    repo = MagicMock(spec=Neo4jRepository)
+    repo.execute_cypher = AsyncMock(return_value=ROWS)
+    return repo
+
+
+@pytest.fixture
+def version():
+    return GraphVersion()
+
+
+@pytest.fixture
+async def matrix(repo, version):
+    service = SkillMatrixService(repo, graph_version=version)
+    await service.ensure_loaded()
+    return service
+
+
+class TestLoading:
+    async def test_bulk_read_builds_matrix(self, matrix, repo):
+        assert matrix.shape == (5, 7)
+        assert repo.execute_cypher.await_count == 1
+
+    async def test_ensure_loaded_is_cached_until_version_changes(
+        self, matrix, repo, version
+    ):
+        await matrix.ensure_loaded()
+        assert repo.execute_cypher.await_count == 1
+
+        version.bump("ingestion")
+        await matrix.ensure_loaded()
+        assert repo.execute_cypher.await_count == 2
+
+    async def test_invalidate_forces_reload(self, matrix, repo):
+        matrix.invalidate()
+        await matrix.ensure_loaded()
+        assert repo.execute_cypher.await_count == 2
+
+    async def test_reloads_after_max_age(self, repo, version, monkeypatch):
+        """다른 워커의 쓰기 대비: 버전이 같아도 max_age 경과 시 재적재"""
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "src.services.skill_matrix.time.monotonic", lambda: clock[0]
+        )
+        service = SkillMatrixService(repo, graph_version=version, max_age_seconds=60)
+        await service.ensure_loaded()
+
+        clock[0] += 59
+        await service.ensure_loaded()
+        assert repo.execute_cypher.await_count == 1
+
+        clock[0] += 2
+        await service.ensure_loaded()
+        assert repo.execute_cypher.await_count == 2
+
+
+class TestSimilarEmployees:
+    async def test_jaccard_ranking(self, matrix):
+        result = matrix.similar_employees("홍길동", top_k=10)
+
+        # 김철수: 2/3, 이영희: 1/6, 박민수·최지우: 공통 스킬 없음 → 제외
+        assert [r["name"] for r in result] == ["김철수", "이영희"]
+        assert result[0]["similarity"] == pytest.approx(0.667)
+        assert result[0]["shared_skills"] == 2
+        assert set(result[0]["common_skills"]) == {"Python", "AWS"}
+        assert result[1]["similarity"] == pytest.approx(0.167)
+        assert result[0]["community_id"] == 1
+
+    async def test_name_normalized_lookup_and_top_k(self, matrix):
+        result = matrix.similar_employees(" 홍 길동 ", top_k=1)
+        assert [r["name"] for r in result] == ["김철수"]
+
+    async def test_unknown_employee(self, matrix):
+        assert matrix.similar_employees("없는사람") == []
+
+
+class TestScoreCandidates:
+    async def test_orders_by_matched_skill_count(self, matrix):
+        result = matrix.score_candidates(["python", "AWS", "Kafka"], limit=10)
+
+        assert [r["name"] for r in result] == ["홍길동", "김철수", "이영희"]
+        assert result[0]["skillCount"] == 2
+        assert result[0]["skill_score"] == pytest.approx(2 / 3)
+        assert set(result[2]["matchedSkills"]) == {"Python", "Kafka"}
+        assert result[0]["id"] == "Ee1"
+
+    async def test_limit_and_unknown_skills(self, matrix):
+        assert len(matrix.score_candidates(["Python"], limit=2)) == 2
+        assert matrix.score_candidates(["Cobol"], limit=5) == []
+
+
+class TestIncrementalUpdates:
+    async def test_apply_edit_advances_version_without_reload(
+        self, matrix, repo, version
+    ):
+        new_version = version.bump("graph_edit")
+        matrix.apply_edit(
+            new_version, lambda m: m.set_skill("e4", "s:Python", present=True)
+        )
+        await matrix.ensure_loaded()
+
+        assert repo.execute_cypher.await_count == 1
+        names = [r["name"] for r in matrix.score_candidates(["Python"], limit=10)]
+        assert "박민수" in names
+
+    async def test_apply_edit_skipped_when_already_stale(self, matrix, repo, version):
+        version.bump("ingestion")
+        new_version = version.bump("graph_edit")
+        matrix.apply_edit(new_version, lambda m: m.remove_node("e2"))
+
+        await matrix.ensure_loaded()
+        assert repo.execute_cypher.await_count == 2
+
+    async def test_remove_skill_edge_and_employee(self, matrix):
+        matrix.set_skill("e2", "s:AWS", present=False)
+        result = matrix.similar_employees("홍길동")
+        assert result[0]["name"] == "김철수"
+        assert result[0]["similarity"] == pytest.approx(0.333)
+
+        matrix.remove_node("e2")
+        assert "김철수" not in [r["name"] for r in matrix.similar_employees("홍길동")]
+
+    async def test_new_employee_and_skill(self, matrix):
+        matrix.upsert_node(
+            {"id": "e9", "labels": ["Employee"], "properties": {"name": "신입"}}
+        )
+        matrix.set_skill("e9", "s:Rust", present=True, skill_name="Rust")
+
+        result = matrix.score_candidates(["Rust"], limit=5)
+        assert [r["name"] for r in result] == ["신입"]
+
+
+class TestGraphEditServiceIntegration:
+    async def test_has_skill_edge_applied_incrementally(self, matrix, repo, version):
+        repo.find_entity_by_id = AsyncMock(
+            side_effect=[
+                NodeResult(id="e4", labels=["Employee"], properties={"name": "박민수"}),
+                NodeResult(id="s:Go", labels=["Skill"], properties={"name": "Go"}),
+            ]
+        )
+        repo.create_relationship_generic = AsyncMock(return_value={"id": "r1"})
+        service = GraphEditService(repo, graph_version=version, skill_matrix=matrix)
+
+        await service.create_edge("e4", "s:Go", "HAS_SKILL")
+        await matrix.ensure_loaded()
+
+        assert repo.execute_cypher.await_count == 1
+        assert [r["name"] for r in matrix.score_candidates(["Go"], limit=5)] == [
+            "박민수"
+        ]
+
+    async def test_has_skill_edge_delete_applied(self, matrix, repo, version):
+        repo.find_relationship_by_id = AsyncMock(
+            return_value={
+                "id": "r1",
+                "type": "HAS_SKILL",
+                "source_id": "e1",
+                "target_id": "s:Docker",
+            }
+        )
+        repo.delete_relationship_generic = AsyncMock(return_value=True)
+        service = GraphEditService(repo, graph_version=version, skill_matrix=matrix)
+
+        await service.delete_edge("r1")
+
+        assert matrix.score_candidates(["Docker"], limit=5) == []
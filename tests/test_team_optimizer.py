@@ -0,0 +1,110 @@
+"""
+team_optimizer 단위 테스트
+
+비트셋 커버리지 목적 함수, lazy greedy / 분기 한정 선택,
+커뮤니티 다양성 가중치와 대규모 후보 풀 성능을 검증합니다.
+"""
+
+import random
+import time
+
+from src.services.team_optimizer import select_team
+
+
+def _candidate(name, skills, community_id=None):
+    return {
+        "id": name,
+        "name": name,
+        "community_id": community_id,
+        "matchedSkills": skills,
+        "skillCount": len(skills),
+    }
+
+
+class TestSelectTeam:
+    def test_empty_candidates(self):
+        result = select_team([], ["Rust", "Zig"], team_size=3, diversity_weight=0.3)
+
+        assert result["members"] == []
+        assert result["missing_skills"] == ["Rust", "Zig"]
+        assert result["total_score"] == 0.0
+
+    def test_exact_search_beats_greedy(self):
+        """greedy는 최다 스킬 보유자를 먼저 골라 2명으로 전체 커버에 실패"""
+        candidates = [
+            _candidate("G", ["S1", "S2", "S4", "S5"]),
+            _candidate("X", ["S1", "S2", "S3"]),
+            _candidate("Y", ["S4", "S5", "S6"]),
+        ]
+        skills = ["S1", "S2", "S3", "S4", "S5", "S6"]
+
+        greedy = select_team(candidates, skills, 2, 0.0, exact_max_team_size=0)
+        exact = select_team(candidates, skills, 2, 0.0)
+
+        assert greedy["skill_coverage"] == 0.833
+        assert exact["skill_coverage"] == 1.0
+        assert exact["missing_skills"] == []
+        assert {m["name"] for m in exact["members"]} == {"X", "Y"}
+
+    def test_diversity_prefers_new_community(self):
+        candidates = [
+            _candidate("A", ["Python"], community_id=1),
+            _candidate("B", ["AWS"], community_id=1),
+            _candidate("C", ["AWS"], community_id=2),
+        ]
+
+        result = select_team(candidates, ["Python", "AWS"], 2, 0.5)
+
+        assert [m["name"] for m in result["members"]] == ["A", "C"]
+        assert result["community_diversity"] == 2
+
+    def test_community_zero_counts_as_community(self):
+        candidates = [_candidate("A", ["Python"], community_id=0)]
+
+        result = select_team(candidates, ["Python"], 1, 0.3)
+
+        assert result["community_diversity"] == 1
+
+    def test_skill_names_matched_by_normalized_name(self):
+        candidates = [_candidate("A", ["python", "aws"])]
+
+        result = select_team(candidates, ["Python", "AWS"], 2, 0.3)
+
+        assert result["covered_skills"] == ["Python", "AWS"]
+        assert result["skill_coverage"] == 1.0
+
+    def test_no_member_without_new_skill(self):
+        candidates = [
+            _candidate("A", ["Python", "AWS"], community_id=1),
+            _candidate("B", ["Python"], community_id=2),
+        ]
+
+        result = select_team(candidates, ["Python", "AWS"], 3, 0.9)
+
+        assert [m["name"] for m in result["members"]] == ["A"]
+
+    def test_respects_team_size(self):
+        candidates = [_candidate(f"E{i}", [f"S{i}"], community_id=i) for i in range(6)]
+
+        result = select_team(candidates, [f"S{i}" for i in range(6)], 2, 0.3)
+
+        assert len(result["members"]) == 2
+        assert result["skill_coverage"] == 0.333
+
+    def test_large_pool_is_fast(self):
+        rng = random.Random(7)
+        skills = [f"S{i}" for i in range(12)]
+        candidates = [
+            _candidate(
+                f"E{i}", rng.sample(skills, rng.randint(1, 4)), rng.randint(0, 50)
+            )
+            for i in range(3000)
+        ]
+
+        start = time.perf_counter()
+        result = select_team(candidates, skills, 4, 0.3)
+        elapsed = time.perf_counter() - start
+
+        assert len(result["members"]) <= 4
+        assert result["skill_coverage"] >= 0.75
+        assert elapsed < 1.0